@@ -38,6 +38,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw, Gio, GLib, Gtk
 
 from .core.notification_manager import NotificationManager
+from .core.scan_eta import format_eta
 from .core.settings_manager import SettingsManager
 from .profiles.models import ScanProfile
 from .profiles.profile_manager import ProfileManager
@@ -111,6 +112,9 @@ class ClamUIApp(Adw.Application):
         # Scan state tracking (for close confirmation)
         self._is_scan_active = False
 
+        # Last scan progress (percentage, time left) sent to the tray
+        self._tray_progress: tuple[int, str] | None = None
+
     @property
     def app_name(self) -> str:
         """Get the application name."""
@@ -177,6 +181,8 @@ class ClamUIApp(Adw.Application):
             self._scan_view = ScanView(settings_manager=self._settings_manager)
             # Connect scan state callback for tray integration
             self._scan_view.set_scan_state_changed_callback(self._on_scan_state_changed)
+            self._scan_view.set_on_scan_progress(self._on_scan_progress)
+            self._scan_view.set_on_scan_paused(self._on_scan_paused)
         return self._scan_view
 
     @property
@@ -512,6 +518,9 @@ class ClamUIApp(Adw.Application):
             # Set window toggle callback
             self._tray_indicator.set_window_toggle_callback(on_toggle=self._on_tray_window_toggle)
 
+            # Connect pause/resume of the running scan
+            self._tray_indicator.set_pause_toggle_callback(self._on_tray_pause_toggle)
+
             # Set profile selection callback
             self._tray_indicator.set_profile_select_callback(on_select=self._on_tray_profile_select)
 
@@ -937,6 +946,15 @@ class ClamUIApp(Adw.Application):
             if self._tray_indicator:
                 self._tray_indicator.update_window_menu_label(visible=True)
 
+    def _on_tray_pause_toggle(self) -> None:
+        """
+        Handle Pause/Resume Scan action from tray menu.
+
+        Pauses the running scan, or resumes it if it is paused.
+        """
+        if self._scan_view is not None:
+            self._scan_view.toggle_pause()
+
     def _on_tray_profile_select(self, profile_id: str) -> None:
         """
         Handle profile selection from tray menu.
@@ -991,11 +1009,14 @@ class ClamUIApp(Adw.Application):
         if self._tray_indicator is None:
             return
 
+        # Show the Pause/Resume Scan item while scanning
+        self._tray_indicator.update_scan_state(is_scanning)
+
         if is_scanning:
             # Update tray to scanning state
             self._tray_indicator.update_status("scanning")
-            # Show indeterminate progress (tray doesn't get real-time %)
-            # Clear any previous label, icon change indicates scanning
+            # Clear any previous label until live progress arrives
+            self._tray_progress = None
             self._tray_indicator.update_scan_progress(0)
             logger.debug("Tray updated to scanning state")
         else:
@@ -1021,6 +1042,38 @@ class ClamUIApp(Adw.Application):
                 self._tray_indicator.update_status("protected")
                 logger.debug("Tray updated to protected state (no result)")
 
+    def _on_scan_paused(self, paused: bool) -> None:
+        """
+        Show whether the running scan is paused in the tray menu and tooltip.
+
+        Called by ScanView when the scan is paused or resumed.
+
+        Args:
+            paused: True when the scan was paused, False when it was resumed
+        """
+        if self._tray_indicator is not None:
+            self._tray_indicator.update_scan_state(True, paused)
+
+    def _on_scan_progress(self, progress, eta: float | None = None) -> None:
+        """
+        Show live scan progress and the estimated time left in the tray.
+
+        Called by ScanView with the ScanProgressState it rebuilt from the
+        scanner's progress events. The tray is only messaged when the whole
+        percentage or the displayed time left changes.
+
+        Args:
+            progress: ScanProgressState of the target being scanned
+            eta: Estimated seconds left in the target, if known
+        """
+        if self._tray_indicator is None or progress.percentage is None:
+            return
+
+        tray_progress = (int(progress.percentage), format_eta(eta) if eta is not None else "")
+        if tray_progress != self._tray_progress:
+            self._tray_progress = tray_progress
+            self._tray_indicator.update_scan_progress(*tray_progress)
+
     def do_shutdown(self):
         """
         Handle application shutdown.
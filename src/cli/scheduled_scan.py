@@ -16,6 +16,9 @@ Options:
     --skip-on-battery     Skip scan if running on battery power
     --auto-quarantine     Automatically quarantine detected threats
     --target PATH         Path to scan (can be specified multiple times)
+    --force-full-scan     Scan every file, ignoring cached clean verdicts
+    --resume              Continue interrupted scans from their checkpoints
+    --no-resume           Start interrupted scans over
     --dry-run             Show what would be done without executing
     --verbose             Enable verbose output
     --help                Show this help message
@@ -36,6 +39,7 @@ import os
 import subprocess
 import sys
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -43,7 +47,9 @@ from ..core.battery_manager import BatteryManager
 from ..core.i18n import _
 from ..core.log_manager import LogEntry, LogManager
 from ..core.quarantine import QuarantineManager
-from ..core.scanner import Scanner, ScanResult, ScanStatus
+from ..core.scan_checkpoint import find_checkpoint
+from ..core.scan_executor import MultiTargetScan
+from ..core.scanner import Scanner, ScanProgress, ScanProgressState, ScanResult, ScanStatus
 from ..core.settings_manager import SettingsManager
 
 
@@ -56,6 +62,8 @@ class ScanContext:
     auto_quarantine: bool
     dry_run: bool
     verbose: bool
+    force_full_scan: bool = False
+    resume: bool = False
     settings: SettingsManager | None = None
     battery_manager: BatteryManager | None = None
     log_manager: LogManager | None = None
@@ -70,7 +78,7 @@ class ScanContext:
         if self.log_manager is None:
             self.log_manager = LogManager()
         if self.scanner is None:
-            self.scanner = Scanner(log_manager=self.log_manager)
+            self.scanner = Scanner(log_manager=self.log_manager, settings_manager=self.settings)
 
 
 @dataclass
@@ -79,6 +87,7 @@ class ScanAggregateResult:
 
     total_scanned: int = 0
     total_infected: int = 0
+    total_cached: int = 0
     all_infected_files: list[str] = field(default_factory=list)
     all_results: list[ScanResult] = field(default_factory=list)
     has_errors: bool = False
@@ -135,6 +144,27 @@ def parse_arguments() -> argparse.Namespace:
         help=_("Path to scan (can be specified multiple times)"),
     )
 
+    parser.add_argument(
+        "--force-full-scan",
+        action="store_true",
+        help=_("Scan every file, ignoring cached results from previous scans"),
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=None,
+        help=_("Continue interrupted scans from their last checkpoint"),
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        default=None,
+        help=_("Start interrupted scans over instead of resuming them"),
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -299,6 +329,8 @@ def _handle_dry_run(ctx: ScanContext, valid_targets: list[str]) -> int:
     log_message(_("Dry run mode - scan not executed"), ctx.verbose)
     log_message(_("  Skip on battery: {value}").format(value=ctx.skip_on_battery), ctx.verbose)
     log_message(_("  Auto quarantine: {value}").format(value=ctx.auto_quarantine), ctx.verbose)
+    log_message(_("  Force full scan: {value}").format(value=ctx.force_full_scan), ctx.verbose)
+    log_message(_("  Resume: {value}").format(value=ctx.resume), ctx.verbose)
     log_message(_("  Targets: {targets}").format(targets=valid_targets), ctx.verbose)
     return 0
 
@@ -349,6 +381,64 @@ def _check_clamav_availability(
     return None, 2
 
 
+def _create_progress_logger(verbose: bool) -> Callable[[ScanProgress], None]:
+    """
+    Create a progress callback that reports a running scan in verbose mode.
+
+    The scan state is rebuilt from the scanner's progress events; each threat
+    is reported as soon as it is found, along with every 10% of progress.
+
+    Args:
+        verbose: Whether verbose mode is enabled
+
+    Returns:
+        Progress callback for a single scan target
+    """
+    state = ScanProgressState()
+    last_step = 0
+
+    def on_progress(progress: ScanProgress) -> None:
+        nonlocal last_step
+        reported = state.infected_count
+        state.apply(progress)
+
+        for file_path in state.infected_files[reported:]:
+            log_message(
+                _("  Threat found: {path}").format(path=file_path), verbose, is_verbose=True
+            )
+
+        if state.percentage is not None and int(state.percentage) // 10 > last_step:
+            last_step = int(state.percentage) // 10
+            log_message(
+                _("  {pct}% ({count} files scanned)").format(
+                    pct=last_step * 10, count=state.files_scanned
+                ),
+                verbose,
+                is_verbose=True,
+            )
+
+    return on_progress
+
+
+def _report_checkpoints(ctx: ScanContext, valid_targets: list[str]) -> None:
+    """
+    Report the targets whose interrupted scan can be resumed.
+
+    Args:
+        ctx: Scan context with configuration
+        valid_targets: List of validated target paths
+    """
+    for target in valid_targets:
+        checkpoint = find_checkpoint(target)
+        if checkpoint is None:
+            continue
+        if ctx.resume:
+            message = _("Resuming interrupted scan of {target} ({count} files scanned)")
+        else:
+            message = _("Starting over interrupted scan of {target}; use --resume to continue it")
+        log_message(message.format(target=target, count=checkpoint.scanned_files), ctx.verbose)
+
+
 def _execute_scans(ctx: ScanContext, valid_targets: list[str]) -> ScanAggregateResult:
     """
     Execute scans on all valid targets.
@@ -363,32 +453,51 @@ def _execute_scans(ctx: ScanContext, valid_targets: list[str]) -> ScanAggregateR
     log_message(_("Scanning {count} target(s)...").format(count=len(valid_targets)), ctx.verbose)
     for target in valid_targets:
         log_message(f"  - {target}", ctx.verbose, is_verbose=True)
+    _report_checkpoints(ctx, valid_targets)
 
     agg = ScanAggregateResult(valid_targets=valid_targets)
     start_time = time.monotonic()
 
-    for target in valid_targets:
+    scan = MultiTargetScan(
+        ctx.scanner,
+        valid_targets,
+        ctx.settings,
+        force_full_scan=ctx.force_full_scan,
+        resume=ctx.resume,
+    )
+    if scan.parallel:
+        log_message(
+            _("Scanning up to {count} targets in parallel").format(count=scan.workers),
+            ctx.verbose,
+            is_verbose=True,
+        )
+
+    def on_target_started(index: int, target: str) -> None:
         log_message(_("Scanning: {target}").format(target=target), ctx.verbose)
-        result = ctx.scanner.scan_sync(target, recursive=True)
+
+    def on_target_finished(index: int, target: str, result: ScanResult) -> None:
+        if result.status == ScanStatus.ERROR:
+            message = _("  Error: {error}").format(error=result.error_message)
+        elif result.status == ScanStatus.INFECTED:
+            message = _("  Found {count} threat(s)").format(count=result.infected_count)
+        else:
+            message = _("  Clean ({count} files scanned)").format(count=result.scanned_files)
+        if scan.parallel:
+            # Parallel targets finish in any order, so name the target
+            message = f"  {target}: {message.lstrip()}"
+        log_message(message, ctx.verbose)
+
+    progress_factory = (lambda: _create_progress_logger(ctx.verbose)) if ctx.verbose else None
+    for _target, result in scan.run(progress_factory, on_target_started, on_target_finished):
         agg.all_results.append(result)
 
         agg.total_scanned += result.scanned_files
         agg.total_infected += result.infected_count
+        agg.total_cached += result.cached_count
         agg.all_infected_files.extend(result.infected_files)
 
         if result.status == ScanStatus.ERROR:
             agg.has_errors = True
-            log_message(_("  Error: {error}").format(error=result.error_message), ctx.verbose)
-        elif result.status == ScanStatus.INFECTED:
-            log_message(
-                _("  Found {count} threat(s)").format(count=result.infected_count),
-                ctx.verbose,
-            )
-        else:
-            log_message(
-                _("  Clean ({count} files scanned)").format(count=result.scanned_files),
-                ctx.verbose,
-            )
 
     agg.duration = time.monotonic() - start_time
     return agg
@@ -422,14 +531,16 @@ def _process_quarantine(ctx: ScanContext, agg: ScanAggregateResult) -> Quarantin
     for result in agg.all_results:
         all_threat_details.extend(result.threat_details)
 
-    # Quarantine each infected file with its threat name
+    # Quarantine each infected file with its threat name, including the
+    # hardlinks and copies that were not scanned separately
     for threat in all_threat_details:
-        quarantine_result = quarantine_manager.quarantine_file(threat.file_path, threat.threat_name)
-        if quarantine_result.is_success:
-            qr.quarantined_count += 1
-        else:
-            error_msg = quarantine_result.error_message or str(quarantine_result.status.value)
-            qr.failed.append((threat.file_path, error_msg))
+        for file_path in [threat.file_path, *threat.aliases]:
+            quarantine_result = quarantine_manager.quarantine_file(file_path, threat.threat_name)
+            if quarantine_result.is_success:
+                qr.quarantined_count += 1
+            else:
+                error_msg = quarantine_result.error_message or str(quarantine_result.status.value)
+                qr.failed.append((file_path, error_msg))
 
     if qr.quarantined_count > 0:
         log_message(
@@ -505,6 +616,12 @@ def _build_log_details(
         _("Targets: {targets}").format(targets=", ".join(agg.valid_targets)),
     ]
 
+    if agg.total_cached > 0:
+        details_parts.insert(
+            2,
+            _("Unchanged Since Last Clean Scan: {count}").format(count=agg.total_cached),
+        )
+
     if auto_quarantine and agg.all_infected_files:
         details_parts.append(_("Quarantined: {count}").format(count=qr.quarantined_count))
         if qr.failed:
@@ -519,6 +636,7 @@ def _build_log_details(
                     f"  {threat.file_path}: {threat.threat_name} "
                     f"[{threat.category}/{threat.severity}]"
                 )
+                details_parts.extend(f"    {_('also at')} {alias}" for alias in threat.aliases)
 
     # Combine stdout from all scan results
     for i, result in enumerate(agg.all_results):
@@ -561,6 +679,10 @@ def _save_scan_log(
         path=", ".join(agg.valid_targets),
         duration=agg.duration,
         scheduled=True,
+        scanned_files=agg.total_scanned,
+        scanned_dirs=sum(result.scanned_dirs for result in agg.all_results),
+        infected_count=agg.total_infected,
+        skipped_count=sum(result.skipped_count for result in agg.all_results),
     )
     ctx.log_manager.save_log(log_entry)
 
@@ -626,6 +748,8 @@ def run_scheduled_scan(
     auto_quarantine: bool,
     dry_run: bool = False,
     verbose: bool = False,
+    force_full_scan: bool = False,
+    resume: bool = False,
 ) -> int:
     """
     Execute a scheduled scan.
@@ -639,6 +763,8 @@ def run_scheduled_scan(
         auto_quarantine: Whether to quarantine detected threats
         dry_run: If True, show what would be done without executing
         verbose: Enable verbose output
+        force_full_scan: Scan every file, ignoring cached clean verdicts
+        resume: Continue interrupted scans of the targets from their checkpoints
 
     Returns:
         Exit code (0 for success/clean, 1 for threats found, 2 for error)
@@ -650,6 +776,8 @@ def run_scheduled_scan(
         auto_quarantine=auto_quarantine,
         dry_run=dry_run,
         verbose=verbose,
+        force_full_scan=force_full_scan,
+        resume=resume,
     )
 
     log_message(_("ClamUI scheduled scan starting..."), verbose)
@@ -719,6 +847,11 @@ def main() -> int:
     else:
         auto_quarantine = settings.get("schedule_auto_quarantine", False)
 
+    if args.resume is not None:
+        resume = args.resume
+    else:
+        resume = settings.get("schedule_resume_scans", True)
+
     # Determine targets (CLI args override config)
     if args.targets:
         targets = args.targets
@@ -735,6 +868,8 @@ def main() -> int:
         auto_quarantine=auto_quarantine,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        force_full_scan=args.force_full_scan,
+        resume=resume,
     )
 
 
@@ -0,0 +1,224 @@
+# ClamUI Backend Probe Module
+"""
+Cached availability checks for the ClamAV scan backends.
+
+The checks in clamav_detection spawn processes (which, clamscan --version,
+clamdscan --ping), which made every scan start, backend label and component
+refresh cost several process launches. The functions here answer the same
+questions from a shared cache:
+
+- Results are kept for a time-to-live (INSTALL_TTL for installed binaries,
+  CONNECTION_TTL for the daemon connection)
+- Every lookup stats the files a result depends on (the binary, clamd's
+  sockets and configuration files) and probes again as soon as one of them
+  was replaced, created or removed, e.g. when clamd restarts or ClamAV is
+  upgraded
+- The daemon connection is checked with a PING over clamd's socket where it
+  is visible, and with clamdscan --ping only otherwise (e.g. in Flatpak)
+
+The functions take the same arguments and return the same tuples as their
+clamav_detection counterparts, so callers can switch between them freely.
+Use invalidate_backend_probes() where fresh results are required, such as
+an explicit refresh by the user.
+
+Usage:
+    is_connected, message = check_clamd_connection(settings_manager=settings)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from . import clamav_detection
+from .clamd_client import CLAMD_CONFIG_PATHS, ClamdClient, parse_address, resolve_clamd_address
+from .flatpak import which_host_command
+
+logger = logging.getLogger(__name__)
+
+# Seconds a binary check stays valid while the binary itself is unchanged
+INSTALL_TTL = 300.0
+
+# Seconds a daemon connection check stays valid while its socket is unchanged
+CONNECTION_TTL = 30.0
+
+# (inode, modification time) of a file, or None if it does not exist
+_FileState = tuple[int, int] | None
+
+
+def _file_states(paths: tuple[str, ...]) -> tuple[_FileState, ...]:
+    """Stat the files a probe result depends on."""
+    states: list[_FileState] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            states.append(None)
+        else:
+            states.append((stat.st_ino, stat.st_mtime_ns))
+    return tuple(states)
+
+
+@dataclass
+class _ProbeEntry:
+    """A cached probe result and what it depends on."""
+
+    result: tuple[bool, str | None]
+    expires_at: float
+    paths: tuple[str, ...]
+    states: tuple[_FileState, ...]
+
+
+class ProbeCache:
+    """
+    Thread-safe cache of probe results, validated by TTL and file states.
+
+    Concurrent misses for the same key may probe twice; the last result wins.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty cache.
+
+        Args:
+            clock: Monotonic clock, replaceable for tests
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, _ProbeEntry] = {}
+
+    def get(
+        self,
+        key: str,
+        probe: Callable[[], tuple[tuple[bool, str | None], tuple[str, ...]]],
+        ttl: float,
+    ) -> tuple[bool, str | None]:
+        """
+        Get a probe result, probing again if the cached one is stale.
+
+        Args:
+            key: Identifies the probe and its parameters
+            probe: Returns the result and the paths of the files it depends on
+            ttl: Seconds a result stays valid
+
+        Returns:
+            The probe's (is_available, version_or_message) tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry is not None
+            and self._clock() < entry.expires_at
+            and _file_states(entry.paths) == entry.states
+        ):
+            return entry.result
+
+        result, paths = probe()
+        paths = tuple(dict.fromkeys(path for path in paths if path))
+        with self._lock:
+            self._entries[key] = _ProbeEntry(
+                result, self._clock() + ttl, paths, _file_states(paths)
+            )
+        return result
+
+    def invalidate(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = ProbeCache()
+
+
+def invalidate_backend_probes() -> None:
+    """Make the next check of every backend probe again."""
+    _cache.invalidate()
+
+
+def _check_binary(
+    binary: str, check: Callable[[], tuple[bool, str | None]]
+) -> tuple[bool, str | None]:
+    """Cache a binary check, keyed on the binary found."""
+
+    def probe():
+        return check(), (which_host_command(binary) or "",)
+
+    return _cache.get(binary, probe, INSTALL_TTL)
+
+
+def check_clamav_installed() -> tuple[bool, str | None]:
+    """
+    Check if clamscan is installed; cached clamav_detection.check_clamav_installed().
+
+    Returns:
+        Tuple of (is_installed, version_or_error)
+    """
+    return _check_binary("clamscan", clamav_detection.check_clamav_installed)
+
+
+def check_clamdscan_installed() -> tuple[bool, str | None]:
+    """
+    Check if clamdscan is installed; cached clamav_detection.check_clamdscan_installed().
+
+    Returns:
+        Tuple of (is_installed, version_or_error)
+    """
+    return _check_binary("clamdscan", clamav_detection.check_clamdscan_installed)
+
+
+def check_freshclam_installed() -> tuple[bool, str | None]:
+    """
+    Check if freshclam is installed; cached clamav_detection.check_freshclam_installed().
+
+    Returns:
+        Tuple of (is_installed, version_or_error)
+    """
+    return _check_binary("freshclam", clamav_detection.check_freshclam_installed)
+
+
+def check_clamd_connection(
+    socket_path: str | None = None, settings_manager=None
+) -> tuple[bool, str | None]:
+    """
+    Check if clamd is accessible and responding.
+
+    Pings clamd over its socket when one is found, which needs no clamdscan,
+    and falls back to clamav_detection.check_clamd_connection() otherwise.
+
+    Args:
+        socket_path: Optional socket path. If not provided, uses auto-detection.
+        settings_manager: Optional settings providing daemon_socket_path
+
+    Returns:
+        Tuple of (is_connected, message):
+        - (True, "PONG") if daemon is responding
+        - (False, error_message) if daemon is not accessible
+    """
+    configured = socket_path
+    if not configured and settings_manager is not None:
+        configured = settings_manager.get("daemon_socket_path", "")
+    if not isinstance(configured, str):
+        configured = ""
+
+    def probe():
+        # Any of these appearing, disappearing or being replaced changes
+        # where clamd can be reached
+        paths = [configured, *clamav_detection.CLAMD_SOCKET_PATHS, *CLAMD_CONFIG_PATHS]
+
+        address = parse_address(configured)
+        if address is not None and address.is_unix and not os.path.exists(address.socket_path):
+            address = None
+        if address is None:
+            address = resolve_clamd_address()
+        if address is not None:
+            if address.is_unix:
+                paths.append(address.socket_path)
+            if ClamdClient(address).ping():
+                return (True, "PONG"), paths
+
+        paths.append(which_host_command("clamdscan") or "")
+        return clamav_detection.check_clamd_connection(socket_path), paths
+
+    return _cache.get(f"clamd:{configured}", probe, CONNECTION_TTL)
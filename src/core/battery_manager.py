@@ -2,7 +2,9 @@
 """
 Battery manager module for ClamUI providing system battery status detection.
 Uses psutil for cross-platform battery status checking to support
-battery-aware scheduled scanning (skip scans when on battery power).
+battery-aware scanning: scheduled scans are skipped on battery power, and
+running scans can be paused when the system switches to battery and resumed
+when it is plugged in again (see poll_power_change()).
 """
 
 from dataclasses import dataclass
@@ -49,6 +51,7 @@ class BatteryManager:
         No configuration required - psutil handles detection automatically.
         """
         self._psutil_available = PSUTIL_AVAILABLE
+        self._last_on_battery: bool | None = None
 
     def get_status(self) -> BatteryStatus:
         """
@@ -114,6 +117,24 @@ class BatteryManager:
             return False
         return self.is_on_battery()
 
+    def poll_power_change(self) -> bool | None:
+        """
+        Check whether the power source changed since the previous call.
+
+        Meant to be polled periodically, e.g. while a scan is running. The
+        first call only records the current power source.
+
+        Returns:
+            True if the system switched to battery power, False if it
+            switched to AC power, None if nothing changed.
+        """
+        on_battery = self.is_on_battery()
+        previous = self._last_on_battery
+        self._last_on_battery = on_battery
+        if previous is None or previous == on_battery:
+            return None
+        return on_battery
+
     @property
     def has_battery(self) -> bool:
         """
@@ -24,6 +24,13 @@ from .i18n import _
 # Database file extensions that ClamAV uses
 _DATABASE_EXTENSIONS = {".cvd", ".cld", ".cud"}
 
+# Common clamd socket locations (Ubuntu/Debian, alternative, Fedora)
+CLAMD_SOCKET_PATHS = [
+    "/var/run/clamav/clamd.ctl",
+    "/run/clamav/clamd.ctl",
+    "/var/run/clamd.scan/clamd.sock",
+]
+
 
 def check_clamav_installed() -> tuple[bool, str | None]:
     """
@@ -203,13 +210,7 @@ def get_clamd_socket_path() -> str | None:
     Returns:
         Socket path if found, None otherwise
     """
-    socket_paths = [
-        "/var/run/clamav/clamd.ctl",
-        "/run/clamav/clamd.ctl",
-        "/var/run/clamd.scan/clamd.sock",
-    ]
-
-    for path in socket_paths:
+    for path in CLAMD_SOCKET_PATHS:
         if os.path.exists(path):
             return path
 
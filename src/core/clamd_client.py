@@ -0,0 +1,881 @@
+# ClamUI Clamd Client Module
+"""
+Native clamd protocol client for ClamUI.
+
+Talks to the ClamAV daemon directly over its Unix or TCP socket instead of
+spawning clamdscan for every operation. Supports the commands ClamUI needs:
+
+- PING, VERSION, STATS: health checks and daemon information
+- FILDES: pass an open file descriptor (Unix socket only, no data copy)
+- INSTREAM: stream file contents in chunks (works over TCP)
+- MULTISCAN, CONTSCAN: let clamd walk a path itself
+- IDSESSION: pipeline many FILDES (or, over TCP, SCAN) requests over a
+  single connection
+
+All commands use the null-terminated "z" form so replies are delimited by
+NUL bytes and file names containing newlines cannot split a reply.
+"""
+
+import logging
+import os
+import queue
+import re
+import select
+import socket
+import struct
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+
+from .clamav_config import parse_config
+from .clamav_detection import get_clamd_socket_path
+
+logger = logging.getLogger(__name__)
+
+# Candidate clamd configuration files (Debian/Ubuntu, Fedora, generic)
+CLAMD_CONFIG_PATHS = [
+    "/etc/clamav/clamd.conf",
+    "/etc/clamd.d/scan.conf",
+    "/etc/clamd.conf",
+]
+
+# Timeout for short control commands (PING, VERSION, STATS) in seconds
+COMMAND_TIMEOUT = 5.0
+
+# select() timeout for checking cancellation while waiting for scan replies
+REPLY_POLL_TIMEOUT = 0.1
+
+# Chunk size for INSTREAM uploads (clamd's default StreamMaxLength is 25 MB)
+INSTREAM_CHUNK_SIZE = 64 * 1024
+
+# Maximum FILDES requests in flight on one IDSESSION connection. clamd requires
+# clients to read replies before queueing more work, so the window is bounded.
+DEFAULT_MAX_PENDING = 16
+
+# clamd's built-in defaults when clamd.conf does not set MaxThreads / MaxQueue
+DEFAULT_CLAMD_MAX_THREADS = 10
+DEFAULT_CLAMD_MAX_QUEUE = 100
+
+# Upper bound on concurrent sessions regardless of MaxThreads
+MAX_POOL_SESSIONS = 32
+
+# Session replies are prefixed with the request number: "<id>: <reply>"
+_SESSION_REPLY_PATTERN = re.compile(r"^(\d+): (.*)$", re.DOTALL)
+
+# Flags used to open files before passing them to clamd
+_FILDES_OPEN_FLAGS = os.O_RDONLY | os.O_NOFOLLOW | os.O_NOCTTY | os.O_CLOEXEC
+
+
+class ClamdError(OSError):
+    """Raised when clamd cannot be reached or violates the protocol."""
+
+
+class ClamdReplyStatus(Enum):
+    """Verdict reported by clamd for a single scanned object."""
+
+    OK = "OK"  # No signature matched
+    FOUND = "FOUND"  # A signature matched
+    ERROR = "ERROR"  # The object could not be scanned
+
+
+@dataclass(frozen=True)
+class ClamdAddress:
+    """
+    Location of a clamd socket.
+
+    Exactly one of socket_path (Unix socket) or host/port (TCP) is set.
+    """
+
+    socket_path: str | None = None
+    host: str | None = None
+    port: int | None = None
+
+    @property
+    def is_unix(self) -> bool:
+        """Whether this address refers to a Unix domain socket."""
+        return self.socket_path is not None
+
+    def __str__(self) -> str:
+        if self.socket_path is not None:
+            return self.socket_path
+        return f"{self.host}:{self.port}"
+
+
+@dataclass
+class ClamdFileResult:
+    """Structured verdict for a single file returned by clamd."""
+
+    path: str
+    status: ClamdReplyStatus
+    signature: str | None = None
+    error: str | None = None
+
+    @property
+    def is_infected(self) -> bool:
+        """Whether clamd matched a signature for this file."""
+        return self.status == ClamdReplyStatus.FOUND
+
+    @property
+    def is_error(self) -> bool:
+        """Whether the file could not be scanned."""
+        return self.status == ClamdReplyStatus.ERROR
+
+    def to_output_line(self) -> str:
+        """Format the result the way clamdscan prints it."""
+        if self.status == ClamdReplyStatus.FOUND:
+            return f"{self.path}: {self.signature} FOUND"
+        if self.status == ClamdReplyStatus.ERROR:
+            return f"{self.path}: {self.error} ERROR"
+        return f"{self.path}: OK"
+
+
+def parse_address(value: str) -> ClamdAddress | None:
+    """
+    Parse a user-supplied clamd address.
+
+    Accepts an absolute Unix socket path, "host:port", or "tcp://host:port".
+
+    Args:
+        value: The address string (e.g. from the daemon_socket_path setting)
+
+    Returns:
+        ClamdAddress, or None if the value is empty or malformed
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+
+    if value.startswith("unix://"):
+        value = value[len("unix://") :]
+    if value.startswith("/"):
+        return ClamdAddress(socket_path=value)
+
+    if value.startswith("tcp://"):
+        value = value[len("tcp://") :]
+    host, sep, port = value.rpartition(":")
+    if not sep or not port.isdigit():
+        return None
+    return ClamdAddress(host=host.strip("[]") or "localhost", port=int(port))
+
+
+def _address_from_config(config_path: str) -> ClamdAddress | None:
+    """Read LocalSocket / TCPSocket from a clamd.conf file."""
+    config, _error = parse_config(config_path)
+    if config is None:
+        return None
+
+    local_socket = config.get_value("LocalSocket")
+    if local_socket and os.path.exists(local_socket):
+        return ClamdAddress(socket_path=local_socket)
+
+    tcp_port = config.get_value("TCPSocket")
+    if tcp_port and tcp_port.strip().isdigit():
+        host = config.get_value("TCPAddr") or "localhost"
+        return ClamdAddress(host=host.strip(), port=int(tcp_port))
+
+    return None
+
+
+def resolve_clamd_address(settings_manager=None) -> ClamdAddress | None:
+    """
+    Determine where clamd is listening.
+
+    Resolution order:
+    1. The "daemon_socket_path" setting, if configured
+    2. LocalSocket / TCPSocket from the first readable clamd.conf
+    3. Well-known socket locations (see get_clamd_socket_path)
+
+    Inside Flatpak the host's socket is usually not visible, in which case
+    None is returned and callers fall back to clamdscan via flatpak-spawn.
+
+    Args:
+        settings_manager: Optional SettingsManager for the configured address
+
+    Returns:
+        ClamdAddress if a usable socket was found, None otherwise
+    """
+    if settings_manager is not None:
+        configured = parse_address(settings_manager.get("daemon_socket_path", ""))
+        if configured is not None:
+            if configured.is_unix and not os.path.exists(configured.socket_path):
+                logger.debug("Configured clamd socket %s does not exist", configured)
+            else:
+                return configured
+
+    for config_path in CLAMD_CONFIG_PATHS:
+        address = _address_from_config(config_path)
+        if address is not None:
+            return address
+
+    socket_path = get_clamd_socket_path()
+    if socket_path is not None:
+        return ClamdAddress(socket_path=socket_path)
+
+    return None
+
+
+def _config_int(config, key: str, default: int) -> int:
+    """Read a positive integer option from a parsed clamd.conf."""
+    value = config.get_value(key) if config is not None else None
+    if value and value.strip().isdigit() and int(value) > 0:
+        return int(value)
+    return default
+
+
+def get_clamd_thread_limits() -> tuple[int, int]:
+    """
+    Get clamd's worker thread and queue limits from clamd.conf.
+
+    Returns:
+        Tuple of (MaxThreads, MaxQueue), using clamd's defaults for values
+        that are not configured or when no clamd.conf is readable
+    """
+    for config_path in CLAMD_CONFIG_PATHS:
+        config, _error = parse_config(config_path)
+        if config is not None:
+            return (
+                _config_int(config, "MaxThreads", DEFAULT_CLAMD_MAX_THREADS),
+                _config_int(config, "MaxQueue", DEFAULT_CLAMD_MAX_QUEUE),
+            )
+    return (DEFAULT_CLAMD_MAX_THREADS, DEFAULT_CLAMD_MAX_QUEUE)
+
+
+def parse_clamd_reply(reply: str, path: str | None = None) -> ClamdFileResult:
+    """
+    Parse a single clamd scan reply into a ClamdFileResult.
+
+    Reply formats:
+    - "<name>: OK"
+    - "<name>: <signature> FOUND"
+    - "<name>: <message> ERROR"
+
+    Args:
+        reply: The reply text with delimiter and session id removed
+        path: Real file path to report; defaults to the name in the reply
+              (which is "fd[N]" or "stream" for FILDES/INSTREAM)
+
+    Returns:
+        Parsed ClamdFileResult
+    """
+    reply = reply.strip()
+
+    if reply.endswith(" FOUND"):
+        subject, _sep, signature = reply[:-6].rpartition(": ")
+        return ClamdFileResult(
+            path=path or subject,
+            status=ClamdReplyStatus.FOUND,
+            signature=signature.strip(),
+        )
+
+    if reply.endswith(": OK"):
+        return ClamdFileResult(path=path or reply[:-4], status=ClamdReplyStatus.OK)
+
+    # ERROR replies and anything unexpected (e.g. "UNKNOWN COMMAND")
+    message = reply[:-6] if reply.endswith(" ERROR") else reply
+    if path and message.startswith(f"{path}: "):
+        # SCAN replies name the path, which may itself contain ": "
+        subject, sep, detail = path, ": ", message[len(path) + 2 :]
+    else:
+        subject, sep, detail = message.partition(": ")
+    if not sep:
+        subject, detail = "", message
+    return ClamdFileResult(
+        path=path or subject,
+        status=ClamdReplyStatus.ERROR,
+        error=detail.strip() or "Unknown error",
+    )
+
+
+class _ReplyReader:
+    """Splits NUL-delimited replies from a clamd socket."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._buffer = b""
+
+    def read(self, is_cancelled: Callable[[], bool] | None = None) -> str | None:
+        """
+        Read the next reply.
+
+        Returns:
+            The reply text, or None if the connection was closed cleanly
+            with no pending data or the operation was cancelled.
+
+        Raises:
+            ClamdError: If the connection fails mid-reply
+        """
+        while b"\0" not in self._buffer:
+            if is_cancelled is not None:
+                if is_cancelled():
+                    return None
+                readable, _, _ = select.select([self._sock], [], [], REPLY_POLL_TIMEOUT)
+                if not readable:
+                    continue
+            try:
+                data = self._sock.recv(65536)
+            except OSError as e:
+                raise ClamdError(f"Error reading from clamd: {e}") from e
+            if not data:
+                if self._buffer.strip():
+                    # Some replies (e.g. after a fatal error) lack the delimiter
+                    reply, self._buffer = self._buffer, b""
+                    return reply.decode("utf-8", errors="replace").strip()
+                return None
+            self._buffer += data
+
+        reply, _, self._buffer = self._buffer.partition(b"\0")
+        return reply.decode("utf-8", errors="replace")
+
+
+class ClamdClient:
+    """
+    Client for the clamd socket protocol.
+
+    Each one-shot command opens its own connection, mirroring how clamd
+    closes the socket after answering a non-session command. Use session()
+    to pipeline many scans over one connection.
+    """
+
+    def __init__(self, address: ClamdAddress, timeout: float = COMMAND_TIMEOUT):
+        """
+        Initialize the client.
+
+        Args:
+            address: Where clamd is listening
+            timeout: Timeout in seconds for connecting and control commands
+        """
+        self._address = address
+        self._timeout = timeout
+
+    @property
+    def address(self) -> ClamdAddress:
+        """The clamd address this client connects to."""
+        return self._address
+
+    @property
+    def supports_fd_passing(self) -> bool:
+        """FILDES requires a Unix socket shared with the daemon."""
+        return self._address.is_unix
+
+    def connect(self) -> socket.socket:
+        """
+        Open a new connection to clamd.
+
+        Raises:
+            ClamdError: If the connection cannot be established
+        """
+        try:
+            if self._address.is_unix:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                target: str | tuple[str, int] = self._address.socket_path
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                target = (self._address.host, self._address.port)
+        except OSError as e:
+            raise ClamdError(f"Cannot create socket: {e}") from e
+
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(target)
+        except OSError as e:
+            sock.close()
+            raise ClamdError(f"Cannot connect to clamd at {self._address}: {e}") from e
+        return sock
+
+    def _command(self, command: str) -> str:
+        """Send a one-shot command and return its single reply."""
+        sock = self.connect()
+        try:
+            sock.sendall(f"z{command}\0".encode())
+            reply = _ReplyReader(sock).read()
+        except OSError as e:
+            raise ClamdError(f"clamd command {command} failed: {e}") from e
+        finally:
+            sock.close()
+        if reply is None:
+            raise ClamdError(f"clamd closed the connection without replying to {command}")
+        return reply.strip()
+
+    def ping(self) -> bool:
+        """
+        Check that clamd is alive.
+
+        Returns:
+            True if clamd answered PONG, False on any failure
+        """
+        try:
+            return self._command("PING") == "PONG"
+        except ClamdError as e:
+            logger.debug("clamd PING failed: %s", e)
+            return False
+
+    def version(self) -> str:
+        """Return clamd's version string (e.g. "ClamAV 1.3.1/27300/...")."""
+        return self._command("VERSION")
+
+    def stats(self) -> str:
+        """Return clamd's STATS report (thread pool and queue state)."""
+        reply = self._command("STATS")
+        return reply.removesuffix("END").rstrip()
+
+    def reload(self) -> None:
+        """
+        Make clamd reload its signature database.
+
+        Raises:
+            ClamdError: If clamd did not acknowledge the reload
+        """
+        reply = self._command("RELOAD")
+        if reply != "RELOADING":
+            raise ClamdError(f"Unexpected reply to RELOAD: {reply}")
+
+    def shutdown(self) -> None:
+        """
+        Make clamd exit; it closes the connection without replying.
+
+        Raises:
+            ClamdError: If the command cannot be sent
+        """
+        sock = self.connect()
+        try:
+            sock.sendall(b"zSHUTDOWN\0")
+        except OSError as e:
+            raise ClamdError(f"clamd command SHUTDOWN failed: {e}") from e
+        finally:
+            sock.close()
+
+    def scan_fd(self, fd: int, path: str | None = None) -> ClamdFileResult:
+        """
+        Scan an open file descriptor with FILDES.
+
+        Args:
+            fd: Readable file descriptor; it is duplicated into clamd
+            path: Path to report in the result
+
+        Raises:
+            ClamdError: If the address is not a Unix socket or clamd fails
+        """
+        if not self.supports_fd_passing:
+            raise ClamdError("FILDES requires a Unix socket connection")
+        sock = self.connect()
+        try:
+            _send_fildes(sock, fd)
+            reply = _ReplyReader(sock).read()
+        except OSError as e:
+            raise ClamdError(f"FILDES scan failed: {e}") from e
+        finally:
+            sock.close()
+        if reply is None:
+            raise ClamdError("clamd closed the connection during FILDES")
+        return parse_clamd_reply(reply, path)
+
+    def instream(self, path: str, chunk_size: int = INSTREAM_CHUNK_SIZE) -> ClamdFileResult:
+        """
+        Scan a file by streaming its contents with INSTREAM.
+
+        Works over TCP where clamd cannot open the file itself.
+
+        Raises:
+            ClamdError: If clamd cannot be reached
+            OSError: If the file cannot be read
+        """
+        with open(path, "rb") as f:
+            sock = self.connect()
+            try:
+                sock.sendall(b"zINSTREAM\0")
+                while chunk := f.read(chunk_size):
+                    sock.sendall(struct.pack("!L", len(chunk)) + chunk)
+                sock.sendall(struct.pack("!L", 0))
+                reply = _ReplyReader(sock).read()
+            except OSError as e:
+                raise ClamdError(f"INSTREAM scan failed: {e}") from e
+            finally:
+                sock.close()
+        if reply is None:
+            raise ClamdError("clamd closed the connection during INSTREAM")
+        return parse_clamd_reply(reply, path)
+
+    def multiscan(
+        self, path: str, is_cancelled: Callable[[], bool] | None = None
+    ) -> Iterator[ClamdFileResult]:
+        """
+        Ask clamd to scan a path with its own thread pool (MULTISCAN).
+
+        clamd must be able to read the path itself. Only infected files,
+        errors and a final OK for clean trees are reported.
+        """
+        return self._scan_path("MULTISCAN", path, is_cancelled)
+
+    def contscan(
+        self, path: str, is_cancelled: Callable[[], bool] | None = None
+    ) -> Iterator[ClamdFileResult]:
+        """Ask clamd to scan a path, continuing after matches (CONTSCAN)."""
+        return self._scan_path("CONTSCAN", path, is_cancelled)
+
+    def _scan_path(
+        self,
+        command: str,
+        path: str,
+        is_cancelled: Callable[[], bool] | None,
+    ) -> Iterator[ClamdFileResult]:
+        sock = self.connect()
+        try:
+            sock.sendall(f"z{command} {path}\0".encode())
+            reader = _ReplyReader(sock)
+            while True:
+                reply = reader.read(is_cancelled or (lambda: False))
+                if reply is None:
+                    return
+                yield parse_clamd_reply(reply)
+        except OSError as e:
+            raise ClamdError(f"clamd {command} failed: {e}") from e
+        finally:
+            sock.close()
+
+    def session(self) -> "ClamdSession":
+        """Open an IDSESSION connection for pipelined scanning."""
+        return ClamdSession(self.connect())
+
+
+def _send_fildes(sock: socket.socket, fd: int) -> None:
+    """Send a FILDES command followed by the descriptor as ancillary data."""
+    sock.sendall(b"zFILDES\0")
+    # clamd expects exactly one byte of payload carrying the SCM_RIGHTS message
+    socket.send_fds(sock, [b"\0"], [fd])
+
+
+class ClamdSession:
+    """
+    A clamd IDSESSION connection.
+
+    Commands sent within a session are processed concurrently by clamd's
+    thread pool and answered as "<id>: <reply>" in completion order, so
+    many files can be in flight on one connection.
+
+    Use as a context manager; END is sent and the socket closed on exit.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._reader = _ReplyReader(sock)
+        self._next_id = 1
+        self._closed = False
+        try:
+            self._sock.sendall(b"zIDSESSION\0")
+        except OSError as e:
+            self._sock.close()
+            raise ClamdError(f"Cannot start clamd session: {e}") from e
+
+    def __enter__(self) -> "ClamdSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """End the session and close the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._sock.sendall(b"zEND\0")
+        except OSError:
+            pass  # Connection already gone
+        finally:
+            self._sock.close()
+
+    def _read_reply(self, is_cancelled: Callable[[], bool]) -> tuple[int, str] | None:
+        """Read the next "<id>: <reply>" pair, or None if cancelled."""
+        reply = self._reader.read(is_cancelled)
+        if reply is None:
+            if is_cancelled():
+                return None
+            raise ClamdError("clamd closed the session unexpectedly")
+        match = _SESSION_REPLY_PATTERN.match(reply)
+        if match is None:
+            raise ClamdError(f"Unexpected clamd session reply: {reply.strip()}")
+        return int(match.group(1)), match.group(2)
+
+    def scan_files(
+        self,
+        paths: Iterable[str],
+        on_result: Callable[[ClamdFileResult], None],
+        is_cancelled: Callable[[], bool] | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        use_fildes: bool = True,
+    ) -> bool:
+        """
+        Scan files by passing their descriptors (or paths) to clamd.
+
+        Keeps up to max_pending requests in flight and reports each verdict
+        via on_result as soon as clamd answers. With FILDES, files that cannot
+        be opened are reported as ERROR results without contacting clamd.
+        Without it (over TCP), each file is named in a SCAN request and clamd
+        must be able to open it itself.
+
+        Args:
+            paths: Files to scan (consumed lazily, so a tree walk can feed it)
+            on_result: Called with each ClamdFileResult, in completion order
+            is_cancelled: Optional callable checked between requests
+            max_pending: Maximum outstanding requests on this connection
+            use_fildes: Pass descriptors (Unix socket only) rather than paths
+
+        Returns:
+            True if the scan was cancelled, False if all files were processed
+
+        Raises:
+            ClamdError: If the connection to clamd fails
+        """
+        check_cancelled = is_cancelled or (lambda: False)
+        pending: dict[int, str] = {}
+        path_iter = iter(paths)
+        exhausted = False
+
+        while not exhausted or pending:
+            if check_cancelled():
+                return True
+
+            # Fill the request window
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    path = next(path_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if not use_fildes:
+                    try:
+                        self._sock.sendall(b"zSCAN " + os.fsencode(path) + b"\0")
+                    except OSError as e:
+                        raise ClamdError(f"Failed to send file to clamd: {e}") from e
+                    pending[self._next_id] = path
+                    self._next_id += 1
+                    continue
+                try:
+                    fd = os.open(path, _FILDES_OPEN_FLAGS)
+                except OSError as e:
+                    on_result(
+                        ClamdFileResult(
+                            path=path,
+                            status=ClamdReplyStatus.ERROR,
+                            error=f"Failed to open file: {e.strerror}",
+                        )
+                    )
+                    continue
+                try:
+                    # The kernel holds a reference to the in-flight descriptor,
+                    # so our copy can be closed as soon as it is sent
+                    _send_fildes(self._sock, fd)
+                except OSError as e:
+                    raise ClamdError(f"Failed to send file to clamd: {e}") from e
+                finally:
+                    os.close(fd)
+                pending[self._next_id] = path
+                self._next_id += 1
+
+            if not pending:
+                continue
+
+            reply = self._read_reply(check_cancelled)
+            if reply is None:
+                return True
+            request_id, text = reply
+            path = pending.pop(request_id, None)
+            if path is None:
+                logger.debug("Ignoring clamd reply for unknown request %d", request_id)
+                continue
+            on_result(parse_clamd_reply(text, path))
+
+        return False
+
+
+class ClamdSessionPool:
+    """
+    Scans files over several concurrent IDSESSION connections.
+
+    The caller's iterable (typically a tree walk) is consumed on a feeder
+    thread and distributed through a bounded queue to one worker thread per
+    session, so directory traversal overlaps with scanning and every clamd
+    worker thread stays busy. Results are delivered on the calling thread,
+    so on_result needs no locking.
+
+    While the scan is paused, no new requests are sent: each session waits
+    for its in-flight replies and is ended, since clamd drops connections
+    that stay idle longer than its IdleTimeout. Fresh sessions are opened on
+    resume. Sessions beyond a session limit are idled the same way, so the
+    pool can scan with fewer of clamd's threads while the system is busy.
+    """
+
+    def __init__(self, client: ClamdClient, size: int, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Initialize the pool.
+
+        Args:
+            client: Client used to open the sessions; files are passed as
+                descriptors over a Unix socket and by path over TCP
+            size: Number of concurrent sessions
+            max_pending: Maximum outstanding requests per session
+        """
+        self._client = client
+        self._size = max(1, size)
+        self._max_pending = max(1, max_pending)
+
+    @classmethod
+    def from_clamd_config(
+        cls,
+        client: ClamdClient,
+        shares: int = 1,
+        thread_limits: tuple[int, int] | None = None,
+    ) -> "ClamdSessionPool":
+        """
+        Create a pool sized to clamd's MaxThreads.
+
+        The per-session request window is chosen so the total number of
+        in-flight requests stays below MaxQueue, which clamd enforces by
+        stalling or dropping connections.
+
+        Args:
+            client: Client used to open the sessions
+            shares: Number of pools scanning side by side (one per target of
+                a parallel multi-target scan); they split clamd's threads
+                and queue between them
+            thread_limits: (MaxThreads, MaxQueue) of a daemon not configured
+                through the system clamd.conf
+        """
+        max_threads, max_queue = thread_limits or get_clamd_thread_limits()
+        shares = max(1, shares)
+        size = max(1, min(max_threads, MAX_POOL_SESSIONS) // shares)
+        max_pending = max(1, min(DEFAULT_MAX_PENDING, (max_queue - 1) // (size * shares)))
+        return cls(client, size, max_pending)
+
+    @property
+    def size(self) -> int:
+        """Number of concurrent sessions."""
+        return self._size
+
+    def scan_files(
+        self,
+        paths: Iterable[str],
+        on_result: Callable[[ClamdFileResult], None],
+        is_cancelled: Callable[[], bool] | None = None,
+        is_paused: Callable[[], bool] | None = None,
+        session_limit: Callable[[int], int] | None = None,
+    ) -> bool:
+        """
+        Scan files concurrently, reporting verdicts as they arrive.
+
+        Args:
+            paths: Files to scan (consumed lazily on a feeder thread)
+            on_result: Called on the calling thread with each ClamdFileResult
+            is_cancelled: Optional callable checked while waiting
+            is_paused: Optional callable; while it returns True no new files
+                are sent to clamd and the sessions are closed
+            session_limit: Optional callable given the pool size and returning
+                how many sessions may scan; the others are closed until the
+                limit rises again
+
+        Returns:
+            True if the scan was cancelled, False if all files were processed
+
+        Raises:
+            ClamdError: If any session fails; remaining sessions are stopped
+        """
+        check_cancelled = is_cancelled or (lambda: False)
+        check_paused = is_paused or (lambda: False)
+        get_limit = session_limit or (lambda size: size)
+        stop = threading.Event()
+        path_queue: queue.Queue = queue.Queue(maxsize=self._size * self._max_pending * 2)
+        result_queue: queue.Queue = queue.Queue()
+        feeder_done = threading.Event()
+        errors: list[BaseException] = []
+
+        def should_stop() -> bool:
+            return stop.is_set() or check_cancelled()
+
+        def feed() -> None:
+            try:
+                for path in paths:
+                    while not should_stop():
+                        try:
+                            path_queue.put(path, timeout=REPLY_POLL_TIMEOUT)
+                            break
+                        except queue.Full:
+                            continue
+                    if should_stop():
+                        return
+            except BaseException as e:  # Walk errors must not hang the workers
+                errors.append(e)
+                stop.set()
+            finally:
+                feeder_done.set()
+
+        def all_queued() -> bool:
+            return feeder_done.is_set() and path_queue.empty()
+
+        def is_idle(index: int) -> bool:
+            return check_paused() or index >= get_limit(self._size)
+
+        def queued_paths(index: int) -> Iterator[str]:
+            # Ends early on pause, so the session drains and is closed
+            while not should_stop() and not is_idle(index):
+                try:
+                    yield path_queue.get(timeout=REPLY_POLL_TIMEOUT)
+                except queue.Empty:
+                    if all_queued():
+                        return
+
+        def work(index: int) -> None:
+            try:
+                while not should_stop() and not all_queued():
+                    if is_idle(index):
+                        stop.wait(REPLY_POLL_TIMEOUT)
+                        continue
+                    with self._client.session() as session:
+                        session.scan_files(
+                            queued_paths(index),
+                            result_queue.put,
+                            should_stop,
+                            self._max_pending,
+                            self._client.supports_fd_passing,
+                        )
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+
+        feeder = threading.Thread(target=feed, name="clamd-feeder", daemon=True)
+        workers = [
+            threading.Thread(target=work, args=(i,), name=f"clamd-session-{i}", daemon=True)
+            for i in range(self._size)
+        ]
+        feeder.start()
+        for worker in workers:
+            worker.start()
+
+        def drain() -> None:
+            while True:
+                try:
+                    on_result(result_queue.get_nowait())
+                except queue.Empty:
+                    return
+
+        try:
+            while any(worker.is_alive() for worker in workers):
+                if check_cancelled():
+                    stop.set()
+                try:
+                    on_result(result_queue.get(timeout=REPLY_POLL_TIMEOUT))
+                except queue.Empty:
+                    continue
+            drain()
+        finally:
+            stop.set()
+            feeder.join()
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            error = errors[0]
+            if isinstance(error, ClamdError):
+                raise error
+            raise ClamdError(f"Concurrent clamd scan failed: {error}") from error
+        return check_cancelled()
@@ -1,29 +1,61 @@
 # ClamUI Daemon Scanner Module
 """
-Daemon scanner module for ClamUI using clamdscan for clamd communication.
+Daemon scanner module for ClamUI communicating with clamd.
 Provides faster scanning by leveraging the ClamAV daemon's in-memory database.
+
+The daemon socket is used directly through the native protocol client when it
+is reachable; clamdscan is kept as a fallback (e.g. inside Flatpak, where the
+host's socket is not visible and commands run via flatpak-spawn).
 """
 
-import fnmatch
 import logging
 import os
 import subprocess
 import threading
 import time
 from collections.abc import Callable
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from gi.repository import GLib
 
-from .flatpak import wrap_host_command
+from .backend_probe import (
+    check_clamd_connection,
+    check_clamdscan_installed,
+    invalidate_backend_probes,
+)
+from .clamd_client import (
+    ClamdClient,
+    ClamdError,
+    ClamdFileResult,
+    ClamdSessionPool,
+    resolve_clamd_address,
+)
+from .exclusions import ExclusionSet
+from .flatpak import runs_on_host, wrap_host_command
+from .load_governor import LoadGovernor, LoadLevel, open_load_governor
 from .log_manager import LogManager
+from .mounts import MountFilter, MountPolicy
+from .package_allowlist import PackageAllowlist, open_package_allowlist
+from .risk_order import RiskOrder, open_risk_order
+from .scan_cache import ScanCache, open_scan_cache
+from .scan_checkpoint import CheckpointTracker, open_checkpoint
+from .scan_dedup import open_file_dedup
+from .scan_limits import ScanLimits, open_scan_limits
+from .scan_output import ScanOutput
+from .scan_walker import FileListPipe, ReadAhead, ScanWalker
 from .scanner_base import (
+    ScanPause,
+    apply_load_level,
     cleanup_process,
     communicate_with_cancel_check,
+    continue_process,
     create_cancelled_result,
     create_error_result,
+    create_progress_reporter,
+    create_scan_output,
     save_scan_log,
     stream_process_output,
+    suspend_process,
     terminate_process_gracefully,
 )
 from .scanner_types import ScanProgress, ScanResult, ScanStatus, ThreatDetail
@@ -33,27 +65,34 @@ from .threat_classifier import (
     classify_threat_severity_str,
 )
 from .utils import (
-    check_clamd_connection,
-    check_clamdscan_installed,
     get_clean_env,
     validate_path,
 )
 
+if TYPE_CHECKING:
+    from .user_clamd import UserClamd
+
 logger = logging.getLogger(__name__)
 
 
 class DaemonScanner:
     """
-    ClamAV daemon scanner using clamdscan.
+    ClamAV daemon scanner.
 
     Provides faster scanning by communicating with the clamd daemon,
-    which keeps the virus database loaded in memory.
+    which keeps the virus database loaded in memory. Uses the native
+    socket protocol when possible and clamdscan otherwise.
+
+    Given a UserClamd, it scans with ClamUI's private daemon instead; the
+    caller keeps that daemon running (acquire/release) around each scan.
     """
 
     def __init__(
         self,
         log_manager: LogManager | None = None,
         settings_manager: SettingsManager | None = None,
+        pool_shares: int = 1,
+        user_clamd: "UserClamd | None" = None,
     ):
         """
         Initialize the daemon scanner.
@@ -62,18 +101,65 @@ class DaemonScanner:
             log_manager: Optional LogManager instance for saving scan logs.
             settings_manager: Optional SettingsManager instance for reading
                               exclusion patterns and daemon settings.
+            pool_shares: Number of daemon scanners scanning side by side,
+                         which split clamd's worker threads between them.
+            user_clamd: Optional private daemon to scan with instead of the
+                        system clamd; there is no clamdscan fallback for it.
         """
         self._current_process: subprocess.Popen | None = None
         self._process_lock = threading.Lock()
         self._cancel_event = threading.Event()
+        self._pause = ScanPause()
+        self._governor: LoadGovernor | None = None
+        self._mounts: MountFilter | None = None
         self._log_manager = log_manager if log_manager else LogManager()
         self._settings_manager = settings_manager
+        self._pool_shares = pool_shares
+        self._user_clamd = user_clamd
+
+    @property
+    def backend(self) -> str:
+        """Backend name recorded in scan logs ("daemon" or "user_daemon")."""
+        return "daemon" if self._user_clamd is None else "user_daemon"
+
+    def _get_clamd_client(self) -> ClamdClient | None:
+        """
+        Get a native clamd client if the daemon socket answers PING.
+
+        Returns:
+            ClamdClient connected to a responsive daemon, or None if the
+            socket cannot be found or reached (use clamdscan instead)
+        """
+        if self._user_clamd is not None:
+            return self._user_clamd.get_client()
+        address = resolve_clamd_address(self._settings_manager)
+        if address is None:
+            return None
+        client = ClamdClient(address)
+        if not client.ping():
+            logger.debug("clamd socket %s not responding, using clamdscan", address)
+            return None
+        return client
 
     def check_available(self) -> tuple[bool, str | None]:
         """
         Check if daemon scanning is available.
 
-        Verifies both clamdscan is installed and clamd is responding.
+        Pings clamd over its socket first; if that is not possible, verifies
+        both clamdscan is installed and clamd is responding to it.
+
+        Returns:
+            Tuple of (is_available, version_or_error)
+        """
+        if self._get_clamd_client() is not None:
+            return (True, "clamd is available")
+        if self._user_clamd is not None:
+            return self._user_clamd.check_available()
+        return self._check_clamdscan_available()
+
+    def _check_clamdscan_available(self) -> tuple[bool, str | None]:
+        """
+        Check if daemon scanning through clamdscan is available.
 
         Returns:
             Tuple of (is_available, version_or_error)
@@ -97,9 +183,21 @@ class DaemonScanner:
         profile_exclusions: dict | None = None,
         count_targets: bool = True,
         progress_callback: Callable[[ScanProgress], None] | None = None,
+        force_full_scan: bool = False,
+        resume: bool = False,
+        load_governor_options: dict | None = None,
+        one_file_system: bool | None = None,
+        trusted_package_files: bool = False,
+        risk_order_options: dict | None = None,
+        limits_options: dict | None = None,
     ) -> ScanResult:
         """
-        Execute a synchronous scan using clamdscan.
+        Execute a synchronous scan using clamd.
+
+        The native socket client is used when clamd is reachable; otherwise
+        the scan is delegated to clamdscan. A native scan that fails falls back
+        to clamdscan only if it reported no progress yet, since the rescan
+        would count those files again.
 
         WARNING: This will block the calling thread. For UI applications,
         use scan_async() instead.
@@ -108,13 +206,33 @@ class DaemonScanner:
             path: Path to file or directory to scan
             recursive: Ignored - clamdscan always scans directories recursively
             profile_exclusions: Optional exclusions from a scan profile.
-            count_targets: Whether to pre-count files/directories before scanning.
-                If False, scanned_files and scanned_dirs will be 0 in the result,
-                but scanning will be faster for large directories by avoiding
-                a separate tree walk. Default is True for backwards compatibility.
+            count_targets: Whether to count files/directories while scanning.
+                Where clamd or clamdscan walks the tree itself, the count comes
+                from a walk running alongside the scan. If False, that walk is
+                skipped and scanned_files and scanned_dirs will be 0 in the
+                result. Default is True for backwards compatibility.
             progress_callback: Optional callback for real-time progress updates.
                               If provided, verbose mode is used and callback receives
                               ScanProgress updates as files are scanned.
+            force_full_scan: Scan every file, ignoring cached clean verdicts from
+                             previous scans.
+            resume: Continue from the checkpoint of an interrupted scan of the
+                    same path and profile, if the signature database is
+                    unchanged. Only native clamd scans write checkpoints.
+            load_governor_options: The "load_governor" option of the scan
+                    profile, overriding the load governor settings.
+            one_file_system: Do not enter other filesystems mounted below
+                    path, overriding the "scan_one_file_system" setting.
+            trusted_package_files: Skip files that are unmodified since a
+                    package manager installed them. Only native clamd scans
+                    check files one by one; clamdscan scans every file.
+            risk_order_options: The "risk_order" option of the scan profile,
+                    scanning likely threats first. Only native clamd scans
+                    order their files; clamdscan scans in walk order.
+            limits_options: The "limits" option of the scan profile. clamd
+                    takes its engine limits from clamd.conf, so native clamd
+                    scans only apply the file size, directory depth and file
+                    type limits while walking; clamdscan applies none.
 
         Returns:
             ScanResult with scan details
@@ -124,40 +242,147 @@ class DaemonScanner:
         # Reset cancel event at the start of every scan
         # This ensures a previous cancelled scan doesn't affect new scans
         self._cancel_event.clear()
+        self._pause.start_scan()
+        self._governor = open_load_governor(self._settings_manager, load_governor_options)
 
         # Validate the path first
         is_valid, error = validate_path(path)
         if not is_valid:
             result = create_error_result(path, error or "Invalid path")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
-        # Check daemon is available
-        is_available, error_msg = self.check_available()
+        # Compile the exclusions once; they are applied while walking the tree
+        exclusions = ExclusionSet.from_settings(self._settings_manager, profile_exclusions)
+        limits = open_scan_limits(limits_options)
+        self._mounts = MountPolicy.from_settings(
+            self._settings_manager, one_file_system
+        ).filter_for(path)
+
+        # Prefer talking to clamd directly over its socket
+        client = self._get_clamd_client()
+        if client is not None:
+            # Progress reported by the native scan, which a clamdscan rescan
+            # would report again and so count twice
+            reported = False
+
+            def report(progress: ScanProgress) -> None:
+                nonlocal reported
+                reported = True
+                progress_callback(progress)
+
+            db_version = self._get_database_version(client, path)
+            cache = open_scan_cache(self._settings_manager, db_version, force_full_scan)
+            checkpoint = open_checkpoint(
+                self._settings_manager,
+                path,
+                profile_exclusions,
+                db_version,
+                resume,
+                lambda: self._pause.active_duration(start_time),
+            )
+            try:
+                result = self._scan_with_client(
+                    client,
+                    path,
+                    exclusions,
+                    report if progress_callback is not None else None,
+                    cache,
+                    checkpoint,
+                    open_package_allowlist(trusted_package_files and os.path.isdir(path)),
+                    open_risk_order(
+                        risk_order_options, lambda: self._pause.active_duration(start_time)
+                    ),
+                    limits,
+                )
+            except ClamdError as e:
+                if self._user_clamd is not None:
+                    result = create_error_result(path, f"Private clamd scan failed: {e}")
+                    self._save_scan_log(result, self._pause.active_duration(start_time))
+                    return result
+                if reported:
+                    result = create_error_result(path, f"clamd scan failed: {e}")
+                    self._save_scan_log(result, self._pause.active_duration(start_time))
+                    return result
+                logger.warning("Native clamd scan failed, falling back to clamdscan: %s", e)
+                invalidate_backend_probes()
+            else:
+                duration = self._pause.active_duration(start_time)
+                if checkpoint is not None:
+                    duration += checkpoint.previous_duration
+                self._save_scan_log(result, duration)
+                return result
+            finally:
+                if cache is not None:
+                    cache.close()
+        elif self._user_clamd is not None:
+            result = create_error_result(path, "Private clamd is not responding")
+            self._save_scan_log(result, self._pause.active_duration(start_time))
+            return result
+
+        # Check daemon is available through clamdscan
+        is_available, error_msg = self._check_clamdscan_available()
         if not is_available:
             result = create_error_result(path, error_msg or "Daemon not available")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
-        # Count files/directories before scanning (clamdscan doesn't report these)
-        # Always count if progress_callback is provided, or if count_targets is True
-        should_count = count_targets or progress_callback is not None
-        file_count, dir_count = (
-            self._count_scan_targets(path, profile_exclusions) if should_count else (0, 0)
-        )
+        if limits is not None:
+            logger.info("clamdscan ignores the profile's scan limits")
+
+        # clamdscan has no --exclude, so with exclusions or skipped mounts the
+        # tree is walked here and clamdscan reads the directories and files
+        # that remain from a file list; otherwise it walks the path itself
+        # while we count
+        counter: ScanWalker | None = None
+        roots: ReadAhead | None = None
+        file_list: FileListPipe | None = None
+        mounts = self._mounts
+        if (exclusions or (mounts is not None and mounts.skipped)) and os.path.isdir(path):
+            try:
+                file_list = FileListPipe()
+            except OSError as e:
+                logger.warning(
+                    "Cannot create clamdscan file list, filtering exclusions after the scan: %s",
+                    e,
+                )
+            else:
+                counter = ScanWalker(
+                    path,
+                    exclusions.is_excluded if exclusions else None,
+                    self._cancel_event.is_set,
+                    mounts=mounts,
+                )
+                roots = counter.iter_ahead(roots=True)
+        if counter is None and (count_targets or progress_callback is not None):
+            counter = self._start_target_count(path, exclusions)
 
-        # Check if cancelled during counting phase
-        if self._cancel_event.is_set():
-            result = create_cancelled_result(path)
-            self._save_scan_log(result, time.monotonic() - start_time)
-            return result
+        output: ScanOutput | None = None
+        try:
+            if roots is not None and roots.peek() is None:
+                # Everything below the path is excluded
+                return self._finish_empty_walk(path, counter, start_time)
+
+            # Build clamdscan command (use verbose mode if progress callback provided)
+            cmd = self._build_command(
+                path,
+                recursive,
+                profile_exclusions,
+                verbose=progress_callback is not None,
+                file_list=file_list.path if file_list is not None else None,
+            )
 
-        # Build clamdscan command (use verbose mode if progress callback provided)
-        cmd = self._build_command(
-            path, recursive, profile_exclusions, verbose=progress_callback is not None
-        )
+            if file_list is not None:
 
-        try:
+                def feeding_should_stop() -> bool:
+                    process = self._current_process
+                    return self._cancel_event.is_set() or (
+                        process is not None and process.poll() is not None
+                    )
+
+                file_list.start(roots, feeding_should_stop)
+
+            output = create_scan_output(self._log_manager, self._settings_manager)
             with self._process_lock:
                 self._current_process = subprocess.Popen(
                     cmd,
@@ -166,6 +391,10 @@ class DaemonScanner:
                     text=True,
                     env=get_clean_env(),
                 )
+                if self._pause.is_paused():
+                    suspend_process(self._current_process)
+            if self._governor is not None:
+                self._governor.start(self._apply_load_level)
 
             progress_files_scanned = 0
             progress_infected_count = 0
@@ -182,26 +411,32 @@ class DaemonScanner:
                         progress_infected_count,
                         progress_infected_files,
                     ) = self._scan_with_progress(
-                        self._current_process, progress_callback, file_count
+                        self._current_process, progress_callback, counter, output
                     )
                 else:
                     # Use standard blocking communication
                     stdout, stderr, was_cancelled = communicate_with_cancel_check(
-                        self._current_process, self._cancel_event.is_set
+                        self._current_process, self._cancel_event.is_set, output
                     )
                 exit_code = self._current_process.returncode
             finally:
                 # Ensure process is cleaned up even if communicate() raises
+                if self._governor is not None:
+                    self._governor.stop()
                 # Acquire lock to safely clear process reference and get it for cleanup
                 with self._process_lock:
                     process = self._current_process
                     self._current_process = None
                 # Perform cleanup outside lock to avoid holding it during I/O
                 cleanup_process(process)
+                if file_list is not None:
+                    file_list.close()
+
+            file_count, dir_count = self._finish_target_count(counter)
 
             # Check if cancelled during execution
             if was_cancelled:
-                # Use progress counters if available, fall back to pre-counted values
+                # Use progress counters if available, fall back to walked counts
                 scanned = progress_files_scanned if progress_files_scanned > 0 else file_count
                 result = create_cancelled_result(
                     path,
@@ -213,30 +448,54 @@ class DaemonScanner:
                     infected_files=progress_infected_files,
                     infected_count=progress_infected_count,
                 )
-                self._save_scan_log(result, time.monotonic() - start_time)
+                result.output_file = output.spill_path
+                self._save_scan_log(result, self._pause.active_duration(start_time))
                 return result
 
             # Parse the results
-            result = self._parse_results(path, stdout, stderr, exit_code, file_count, dir_count)
+            result = self._result_from_output(
+                path, output, stderr, exit_code, file_count, dir_count
+            )
+            if counter is not None:
+                result.scanned_bytes = counter.bytes_found
+                result.skipped_mounts = counter.skipped_mounts
+                result.device_boundaries = counter.device_boundaries
 
-            # Apply exclusion filtering (clamdscan doesn't support --exclude)
-            result = self._filter_excluded_threats(result, profile_exclusions)
+            if file_list is not None:
+                self._add_unlisted_files(result, file_list.unlisted)
+            else:
+                # clamdscan walked the path itself and may have reported
+                # excluded files
+                result = self._filter_excluded_threats(result, exclusions=exclusions)
 
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
         except FileNotFoundError:
+            if output is not None:
+                output.discard_spill()
             result = create_error_result(path, "clamdscan executable not found")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
         except PermissionError as e:
+            if output is not None:
+                output.discard_spill()
             result = create_error_result(path, f"Permission denied: {e}", str(e))
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
         except Exception as e:
+            if output is not None:
+                output.discard_spill()
             result = create_error_result(path, f"Scan failed: {e}", str(e))
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
+        finally:
+            if roots is not None:
+                roots.close()
+            if file_list is not None:
+                file_list.close()
+            if counter is not None:
+                counter.stop()
 
     def scan_async(
         self,
@@ -246,6 +505,7 @@ class DaemonScanner:
         profile_exclusions: dict | None = None,
         count_targets: bool = True,
         progress_callback: Callable[[ScanProgress], None] | None = None,
+        force_full_scan: bool = False,
     ) -> None:
         """
         Execute an asynchronous scan using clamdscan.
@@ -258,18 +518,25 @@ class DaemonScanner:
             callback: Function to call with ScanResult when scan completes
             recursive: Whether to scan directories recursively
             profile_exclusions: Optional exclusions from a scan profile.
-            count_targets: Whether to pre-count files/directories before scanning.
-                If False, scanned_files and scanned_dirs will be 0 in the result,
-                but scanning will be faster for large directories by avoiding
-                a separate tree walk. Default is True for backwards compatibility.
+            count_targets: Whether to count files/directories while scanning.
+                Where clamd or clamdscan walks the tree itself, the count comes
+                from a walk running alongside the scan. If False, that walk is
+                skipped and scanned_files and scanned_dirs will be 0 in the
+                result. Default is True for backwards compatibility.
             progress_callback: Optional callback for real-time progress updates.
                               If provided, callback receives ScanProgress updates
                               as files are scanned.
+            force_full_scan: Scan every file, ignoring cached clean verdicts.
         """
 
         def scan_thread():
             result = self.scan_sync(
-                path, recursive, profile_exclusions, count_targets, progress_callback
+                path,
+                recursive,
+                profile_exclusions,
+                count_targets,
+                progress_callback,
+                force_full_scan,
             )
             GLib.idle_add(callback, result)
 
@@ -286,18 +553,62 @@ class DaemonScanner:
         the grace period.
         """
         self._cancel_event.set()
+        self._pause.resume()
         # Acquire lock to safely get process reference
         with self._process_lock:
             process = self._current_process
         # Terminate outside lock to avoid holding it during I/O
         terminate_process_gracefully(process)
 
+    @property
+    def is_paused(self) -> bool:
+        """Whether scanning is paused."""
+        return self._pause.is_paused()
+
+    @property
+    def can_pause(self) -> bool:
+        """
+        Whether pause() can stop the running scan.
+
+        A clamdscan run on the host through flatpak-spawn under Flatpak
+        cannot be stopped from the sandbox, so such scans cannot be paused.
+        """
+        with self._process_lock:
+            return not runs_on_host(self._current_process)
+
+    def pause(self) -> None:
+        """
+        Pause the current scan until resume() is called.
+
+        Native scans stop sending files to clamd and end their sessions once
+        the files in flight are answered, so clamd's IdleTimeout cannot drop
+        them during a long pause; a clamdscan process is stopped with SIGSTOP,
+        unless it runs on the host under Flatpak (see can_pause).
+        """
+        self._pause.pause()
+        with self._process_lock:
+            suspend_process(self._current_process)
+
+    def resume(self) -> None:
+        """Resume a scan paused by pause(), unless the load governor holds it."""
+        self._pause.resume()
+        governor = self._governor
+        with self._process_lock:
+            if governor is None or not governor.is_paused():
+                continue_process(self._current_process)
+
+    def _apply_load_level(self, level: LoadLevel) -> None:
+        """Apply a load governor level to a running clamdscan process."""
+        with self._process_lock:
+            apply_load_level(self._current_process, level, self._pause.is_paused())
+
     def _build_command(
         self,
         path: str,
         recursive: bool,
         profile_exclusions: dict | None = None,
         verbose: bool = False,
+        file_list: str | None = None,
     ) -> list[str]:
         """
         Build the clamdscan command arguments.
@@ -311,6 +622,8 @@ class DaemonScanner:
             profile_exclusions: Optional exclusions from a scan profile.
             verbose: Whether to enable verbose mode for progress tracking.
                     When True, clamdscan outputs each file as it's scanned.
+            file_list: Optional file list (see ScanWalker.iter_roots) to scan
+                instead of path
 
         Returns:
             List of command arguments (wrapped with flatpak-spawn if in Flatpak)
@@ -333,23 +646,27 @@ class DaemonScanner:
             cmd.append("-i")
 
         # NOTE: clamdscan does NOT support --exclude or --exclude-dir options
-        # (it silently ignores them with a warning). Exclusion filtering is
-        # performed post-scan in _filter_excluded_threats() instead.
-
-        cmd.append(path)
+        # (it silently ignores them with a warning). Exclusions are applied by
+        # walking the tree into a file list instead.
+        if file_list is not None:
+            cmd.append(f"--file-list={file_list}")
+        else:
+            cmd.append(path)
         return wrap_host_command(cmd, force_host=True)
 
     def _scan_with_progress(
         self,
         process: subprocess.Popen,
         progress_callback: Callable[[ScanProgress], None],
-        files_total: int | None,
+        counter: ScanWalker | None,
+        output: ScanOutput | None = None,
     ) -> tuple[str, str, bool, int, int, list[str]]:
         """
         Scan with real-time progress updates.
 
-        Streams clamdscan verbose output and parses it to track progress,
-        calling the progress_callback for each file scanned.
+        Streams clamdscan verbose output and parses it to track progress. Updates
+        are coalesced by a ProgressReporter, so the callback receives at most
+        one ScanProgress per interval, carrying only newly found infections.
 
         Return Tuple Structure:
         [0] stdout (str): Complete accumulated output for final parsing
@@ -362,187 +679,377 @@ class DaemonScanner:
         Args:
             process: The subprocess running clamdscan with -v flag
             progress_callback: Callback to receive ScanProgress updates
-            files_total: Total number of files to scan (for percentage)
+            counter: Walker counting the files to scan (for percentage); the
+                total is an estimate until the walk finishes
+            output: Optional ScanOutput collecting the results and a bounded
+                tail of the output
 
         Returns:
             Tuple of (stdout, stderr, was_cancelled, files_scanned,
             infected_count, infected_files)
         """
-        files_scanned = 0
-        infected_count = 0
-        infected_files: list[str] = []
-        current_file = ""
+        reporter = create_progress_reporter(progress_callback, self._settings_manager, counter)
 
         def on_line(line: str) -> None:
-            nonlocal files_scanned, infected_count, infected_files, current_file
-
             # Parse verbose clamdscan output
             # Format for scanning: "/path/to/file: OK" or "/path/to/file: ThreatName FOUND"
             line = line.strip()
 
             if ": OK" in line:
                 # Clean file - extract path
-                current_file = line.rsplit(": OK", 1)[0].strip()
-                files_scanned += 1
-
-                # Create and send progress update
-                progress = ScanProgress(
-                    current_file=current_file,
-                    files_scanned=files_scanned,
-                    files_total=files_total,
-                    infected_count=infected_count,
-                    infected_files=infected_files.copy(),
-                )
-                progress_callback(progress)
+                reporter.file_scanned(line.rsplit(": OK", 1)[0].strip())
 
             elif line.endswith("FOUND"):
                 # Infected file detected
                 # Format: "/path/to/file: ThreatName FOUND"
                 parts = line.rsplit(":", 1)
                 if len(parts) == 2:
-                    file_path = parts[0].strip()
-                    files_scanned += 1
-                    infected_count += 1
-                    infected_files.append(file_path)
-
-                    # Send updated progress with new infection
-                    progress = ScanProgress(
-                        current_file=file_path,
-                        files_scanned=files_scanned,
-                        files_total=files_total,
-                        infected_count=infected_count,
-                        infected_files=infected_files.copy(),
-                    )
-                    progress_callback(progress)
+                    reporter.file_scanned(parts[0].strip(), infected=True)
 
         stdout, stderr, was_cancelled = stream_process_output(
-            process, self._cancel_event.is_set, on_line
+            process, self._cancel_event.is_set, on_line, output=output
+        )
+        reporter.flush()
+        return (
+            stdout,
+            stderr,
+            was_cancelled,
+            reporter.files_scanned,
+            len(reporter.infected_files),
+            reporter.infected_files,
         )
-        return stdout, stderr, was_cancelled, files_scanned, infected_count, infected_files
 
-    def _count_scan_targets(
-        self, path: str, profile_exclusions: dict | None = None
-    ) -> tuple[int, int]:
+    def _get_database_version(self, client: ClamdClient, path: str) -> str | None:
         """
-        Count files and directories that will be scanned.
+        Get the signature version of a directory scan.
 
-        Since clamdscan doesn't report file/directory counts in its output,
-        we count them ourselves before scanning.
-
-        Performance Note for Large Directories:
-        - Uses os.scandir() (via os.walk) which is 2-3x faster than os.listdir()
-        - Depth-first traversal with cancellation checks at each directory level
-        - Modifies dirs[:] in-place to skip excluded directories (avoids unnecessary descent)
-        - For ~100K files: typically takes 1-2 seconds
-        - This is a trade-off: accurate progress bars vs slightly longer total scan time
+        Cached verdicts and checkpoints are bound to the signature version
+        clamd reports as loaded.
 
         Args:
+            client: Client for a responsive clamd
             path: Path to scan
-            profile_exclusions: Optional exclusions from a scan profile.
 
         Returns:
-            Tuple of (file_count, dir_count)
+            The version string, or None for other scans or if clamd does not
+            report one
+        """
+        if self._settings_manager is None or not os.path.isdir(path):
+            return None
+        try:
+            return f"clamd:{client.version()}"
+        except ClamdError as e:
+            logger.debug("Could not query clamd version for the scan cache: %s", e)
+            return None
+
+    def _scan_with_client(
+        self,
+        client: ClamdClient,
+        path: str,
+        exclusions: ExclusionSet,
+        progress_callback: Callable[[ScanProgress], None] | None,
+        cache: ScanCache | None = None,
+        checkpoint: CheckpointTracker | None = None,
+        allowlist: PackageAllowlist | None = None,
+        risk_order: RiskOrder | None = None,
+        limits: ScanLimits | None = None,
+    ) -> ScanResult:
         """
-        scan_path = Path(path)
+        Scan using the native clamd protocol client.
 
-        # Single file scan
-        if scan_path.is_file():
-            return (1, 0)
+        The tree is walked here, skipping excluded directories and files, and
+        the remaining files are sent to clamd through a pool of pipelined
+        IDSESSION connections sized from clamd's MaxThreads, so all of its
+        worker threads stay busy and every verdict arrives as a structured
+        result. Over a Unix socket each file descriptor is passed, so clamd
+        needs no access to the files; over TCP each file is named in a SCAN
+        request. Excluded paths are never opened or sent to clamd.
 
-        # Not a valid path
-        if not scan_path.is_dir():
-            return (0, 0)
+        Args:
+            client: Client for a responsive clamd
+            path: Path to file or directory to scan
+            exclusions: Compiled exclusions applied during the walk
+            progress_callback: Optional callback for real-time progress updates
+            cache: Open scan cache; files with a cached clean verdict are not
+                sent to clamd and clean results are recorded after the scan
+            checkpoint: Checkpoint of a resumable scan; it is kept up to date
+                with every verdict and the result includes earlier runs
+            allowlist: Unmodified package files to skip, or None
+            risk_order: Order in which to send the walked files, or None for
+                walk order
+            limits: Profile limits applied while walking, or None
 
-        # Collect exclusion patterns
-        exclude_patterns: list[str] = []
-        exclude_dirs: list[str] = []
-
-        # Global exclusions from settings
-        if self._settings_manager is not None:
-            exclusions = self._settings_manager.get("exclusion_patterns", [])
-            for exclusion in exclusions:
-                if not exclusion.get("enabled", True):
-                    continue
-                pattern = exclusion.get("pattern", "")
-                if not pattern:
-                    continue
-                exclusion_type = exclusion.get("type", "pattern")
-                if exclusion_type == "directory":
-                    exclude_dirs.append(pattern)
-                else:
-                    exclude_patterns.append(pattern)
-
-        # Profile exclusions
-        if profile_exclusions:
-            for excl_path in profile_exclusions.get("paths", []):
-                if excl_path:
-                    # Expand ~ in paths
-                    if excl_path.startswith("~"):
-                        excl_path = str(Path(excl_path).expanduser())
-                    exclude_dirs.append(excl_path)
-
-            for pattern in profile_exclusions.get("patterns", []):
-                if pattern:
-                    exclude_patterns.append(pattern)
-
-        file_count = 0
+        Returns:
+            ScanResult with scan details
+
+        Raises:
+            ClamdError: If the connection to clamd fails
+        """
+        files_scanned = 0
         dir_count = 0
+        cached_count = 0
+        infected_files: list[str] = []
+        threat_details: list[ThreatDetail] = []
+        skipped_files: list[str] = []
+        errors: list[str] = []
+        failed_paths: list[str] = []
+        # Only errors and detections are reported, so the tail needs no spill
+        output = ScanOutput()
+        governor = self._governor
+
+        # The walk feeds clamd and counts as it goes
+        walker = ScanWalker(
+            path,
+            exclusions.is_excluded if exclusions else None,
+            self._cancel_event.is_set,
+            cache,
+            track_sizes=progress_callback is not None,
+            checkpoint=checkpoint,
+            mounts=self._mounts,
+            dedup=open_file_dedup(self._settings_manager),
+            trusted=allowlist,
+            limits=limits,
+        )
+        if limits is not None and (limits.narrows_scan or limits.temp_dir is not None):
+            logger.info("clamd applies its own engine limits from clamd.conf")
+        reporter = (
+            create_progress_reporter(
+                progress_callback, self._settings_manager, walker, include_cached=True
+            )
+            if progress_callback is not None
+            else None
+        )
+
+        def on_result(file_result: ClamdFileResult) -> None:
+            nonlocal files_scanned
+
+            if file_result.is_error or file_result.is_infected:
+                failed_paths.append(file_result.path)
+
+            if file_result.is_error:
+                output.add_line(file_result.to_output_line())
+                if (file_result.error or "").startswith("Failed to open file"):
+                    skipped_files.append(file_result.path)
+                else:
+                    errors.append(file_result.to_output_line())
+                return
+
+            if file_result.is_infected:
+                signature = file_result.signature or "Unknown"
+                infected_files.append(file_result.path)
+                threat_details.append(
+                    ThreatDetail(
+                        file_path=file_result.path,
+                        threat_name=signature,
+                        category=categorize_threat(signature),
+                        severity=classify_threat_severity_str(signature),
+                    )
+                )
+                output.add_line(file_result.to_output_line())
 
+            files_scanned += 1
+
+            if checkpoint is not None:
+                checkpoint.file_done(
+                    file_result.path,
+                    (file_result.signature or "Unknown") if file_result.is_infected else None,
+                )
+            if reporter is not None:
+                reporter.file_scanned(file_result.path, infected=file_result.is_infected)
+
+        pool = ClamdSessionPool.from_clamd_config(
+            client,
+            self._pool_shares,
+            self._user_clamd.thread_limits if self._user_clamd is not None else None,
+        )
+        logger.debug("Scanning %s over %d clamd sessions", path, pool.size)
+        is_paused = self._pause.is_paused
+        session_limit = None
+        if governor is not None:
+            # The governor pauses the scan or idles part of the sessions
+            governor.start()
+            session_limit = governor.session_limit
+
+            def is_paused() -> bool:
+                return self._pause.is_paused() or governor.is_paused()
+
+        paths = walker.iter_ahead(order=risk_order)
         try:
-            for root, dirs, files in os.walk(path):
-                # Check for cancellation during counting
-                if self._cancel_event.is_set():
-                    logger.info("File counting cancelled by user")
-                    return (0, 0)
+            was_cancelled = pool.scan_files(
+                paths, on_result, self._cancel_event.is_set, is_paused, session_limit
+            )
+        finally:
+            paths.close()
+            if governor is not None:
+                governor.stop()
+        if reporter is not None:
+            reporter.flush()
+        dir_count = walker.dirs_found
+        cached_count = walker.cached_count
+
+        output.finish()
+        stdout = output.text
+        if cache is not None and not was_cancelled:
+            cache.commit(failed_paths + walker.unscanned)
+
+        if was_cancelled:
+            result = create_cancelled_result(
+                path,
+                stdout,
+                "",
+                -1,
+                scanned_files=files_scanned,
+                scanned_dirs=dir_count,
+                infected_files=infected_files,
+                infected_count=len(infected_files),
+                threat_details=threat_details,
+            )
+            if checkpoint is not None:
+                checkpoint.finish(result, completed=False)
+            return result
 
-                # Filter out excluded directories (modifies dirs in-place)
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self._is_excluded(os.path.join(root, d), d, exclude_dirs, is_dir=True)
-                ]
+        # Mirror clamdscan's exit codes: 0=clean, 1=infected, 2=error
+        warning_message = None
+        error_message = None
+        if infected_files:
+            status = ScanStatus.INFECTED
+            exit_code = 1
+        elif errors:
+            status = ScanStatus.ERROR
+            exit_code = 2
+            error_message = "\n".join(errors)
+        else:
+            status = ScanStatus.CLEAN
+            exit_code = 2 if skipped_files else 0
+            if skipped_files:
+                warning_message = f"{len(skipped_files)} file(s) could not be accessed"
+        if walker.unscanned and warning_message is None:
+            warning_message = (
+                f"{len(walker.unscanned)} lower-risk file(s) were not scanned (scan cap reached)"
+            )
 
-                # Count directories (excluding the root)
-                dir_count += len(dirs)
+        result = ScanResult(
+            status=status,
+            path=path,
+            stdout=stdout,
+            stderr=error_message or "",
+            exit_code=exit_code,
+            infected_files=infected_files,
+            scanned_files=files_scanned,
+            scanned_dirs=dir_count,
+            infected_count=len(infected_files),
+            error_message=error_message,
+            threat_details=threat_details,
+            skipped_files=skipped_files,
+            skipped_count=len(skipped_files),
+            warning_message=warning_message,
+            cached_count=cached_count,
+            trusted_count=walker.trusted_count,
+            trusted_bytes=walker.trusted_bytes,
+            unscanned_count=len(walker.unscanned),
+            limited_count=walker.limited_count,
+            scanned_bytes=walker.bytes_found,
+            skipped_mounts=walker.skipped_mounts,
+            device_boundaries=walker.device_boundaries,
+            timings={"walk": walker.walk_duration} if walker.finished else {},
+        )
+        if walker.dedup is not None:
+            walker.dedup.add_aliases(result)
+        if checkpoint is not None:
+            checkpoint.finish(result, completed=True)
+        return result
+
+    def _finish_empty_walk(self, path: str, walker: ScanWalker, start_time: float) -> ScanResult:
+        """
+        Finish a clamdscan scan whose walk left nothing to scan.
+
+        Args:
+            path: The scanned path
+            walker: The finished (or cancelled) walk
+            start_time: Monotonic time the scan started
+
+        Returns:
+            A CLEAN result, or a cancelled one if the walk was cancelled
+        """
+        if self._cancel_event.is_set():
+            result = create_cancelled_result(
+                path, "", "", -1, scanned_files=0, scanned_dirs=walker.dirs_found
+            )
+        else:
+            result = ScanResult(
+                status=ScanStatus.CLEAN,
+                path=path,
+                stdout="",
+                stderr="",
+                exit_code=0,
+                infected_files=[],
+                scanned_files=0,
+                scanned_dirs=walker.dirs_found,
+                infected_count=0,
+                error_message=None,
+                threat_details=[],
+                skipped_mounts=walker.skipped_mounts,
+                device_boundaries=walker.device_boundaries,
+            )
+        self._save_scan_log(result, self._pause.active_duration(start_time))
+        return result
+
+    @staticmethod
+    def _add_unlisted_files(result: ScanResult, unlisted: list[str]) -> None:
+        """
+        Record files that could not be written to the clamdscan file list.
 
-                # Count files that aren't excluded
-                for f in files:
-                    file_path = os.path.join(root, f)
-                    if not self._is_excluded(file_path, f, exclude_patterns, is_dir=False):
-                        file_count += 1
-        except (PermissionError, OSError):
-            # If we can't access the directory, return 0 counts
-            pass
+        Args:
+            result: Parsed scan result, updated in place
+            unlisted: Paths left out of the file list
+        """
+        if not unlisted:
+            return
+        result.skipped_files = list(result.skipped_files or []) + unlisted
+        result.skipped_count = len(result.skipped_files)
+        message = f"{len(unlisted)} file(s) could not be passed to clamdscan"
+        result.warning_message = (
+            f"{result.warning_message}; {message}" if result.warning_message else message
+        )
+
+    def _start_target_count(self, path: str, exclusions: ExclusionSet) -> ScanWalker:
+        """
+        Start counting the files and directories that will be scanned.
 
-        # Count the root directory itself
-        if dir_count > 0 or file_count > 0:
-            dir_count += 1
+        Since clamdscan doesn't report file/directory counts, we walk the tree ourselves in a background thread while the
+        daemon scans it. The walker's counts serve as a growing progress total
+        until the walk finishes; collect the final counts with
+        _finish_target_count().
 
-        return (file_count, dir_count)
+        Args:
+            path: Path to scan
+            exclusions: Compiled exclusions for the scan
 
-    def _is_excluded(self, full_path: str, name: str, patterns: list[str], is_dir: bool) -> bool:
+        Returns:
+            The running ScanWalker
         """
-        Check if a path matches any exclusion pattern.
+        walker = ScanWalker(
+            path,
+            exclusions.is_excluded if exclusions else None,
+            self._cancel_event.is_set,
+            mounts=self._mounts,
+        )
+        walker.count_in_background()
+        return walker
+
+    def _finish_target_count(self, walker: ScanWalker | None) -> tuple[int, int]:
+        """
+        Wait for a counting walk started by _start_target_count().
 
         Args:
-            full_path: Full path to check
-            name: Base name of the file/directory
-            patterns: List of exclusion patterns (glob or path)
-            is_dir: Whether this is a directory
+            walker: The counting walker, or None if nothing was counted
 
         Returns:
-            True if the path should be excluded
-        """
-        for pattern in patterns:
-            # Check if pattern is an absolute path
-            if pattern.startswith("/") or pattern.startswith("~"):
-                expanded = str(Path(pattern).expanduser()) if pattern.startswith("~") else pattern
-                if full_path.startswith(expanded):
-                    return True
-            # Check glob pattern against filename
-            elif fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(full_path, pattern):
-                return True
-        return False
+            Tuple of (file_count, dir_count); (0, 0) without a walker
+        """
+        if walker is None:
+            return (0, 0)
+        return walker.wait()
 
     def _parse_results(
         self,
@@ -573,50 +1080,49 @@ class DaemonScanner:
         Returns:
             Parsed ScanResult
         """
-        infected_files = []
-        threat_details = []
-        skipped_files = []
-        scanned_files = file_count
-        scanned_dirs = dir_count
-        infected_count = 0
-
-        # Regex pattern: "/path/to/file: ThreatName FOUND"
-        # Uses rsplit(":") to handle colons in Windows paths (C:\)
-        # Also extracts threat name by removing " FOUND" suffix
-        for line in stdout.splitlines():
-            line = line.strip()
+        result = self._result_from_output(
+            path, ScanOutput.from_text(stdout), stderr, exit_code, file_count, dir_count
+        )
+        result.stdout = stdout
+        return result
 
-            if line.endswith("FOUND"):
-                parts = line.rsplit(":", 1)
-                if len(parts) == 2:
-                    file_path = parts[0].strip()
-                    threat_part = parts[1].strip()
-                    threat_name = (
-                        threat_part.rsplit(" ", 1)[0].strip()
-                        if " FOUND" in threat_part
-                        else threat_part
-                    )
+    def _result_from_output(
+        self,
+        path: str,
+        output: ScanOutput,
+        stderr: str,
+        exit_code: int,
+        file_count: int = 0,
+        dir_count: int = 0,
+    ) -> ScanResult:
+        """
+        Build a ScanResult from clamdscan output parsed while it streamed.
 
-                    infected_files.append(file_path)
+        Args:
+            path: The scanned path
+            output: Parsed clamdscan output
+            stderr: Standard error from clamdscan
+            exit_code: Process exit code
+            file_count: Pre-counted number of files scanned
+            dir_count: Pre-counted number of directories scanned
 
-                    threat_detail = ThreatDetail(
-                        file_path=file_path,
-                        threat_name=threat_name,
-                        category=categorize_threat(threat_name),
-                        severity=classify_threat_severity_str(threat_name),
-                    )
-                    threat_details.append(threat_detail)
-                    infected_count += 1
-
-            # Pattern: "/path: Failed to open file ERROR"
-            # Extracts path before the error message for tracking skipped files
-            # Look for "Failed to open file" warnings (permission denied)
-            # Format: "/path/to/file: Failed to open file ERROR"
-            elif ": Failed to open file" in line:
-                # Extract the file path (everything before ": Failed to open file")
-                file_path = line.split(": Failed to open file")[0].strip()
-                if file_path:
-                    skipped_files.append(file_path)
+        Returns:
+            ScanResult whose stdout is the retained tail of the output
+        """
+        infected_files = []
+        threat_details = []
+        for file_path, threat_name in output.threats:
+            infected_files.append(file_path)
+            threat_details.append(
+                ThreatDetail(
+                    file_path=file_path,
+                    threat_name=threat_name,
+                    category=categorize_threat(threat_name),
+                    severity=classify_threat_severity_str(threat_name),
+                )
+            )
+        infected_count = len(threat_details)
+        skipped_files = list(output.skipped_files)
 
         # Determine overall status based on exit code
         warning_message = None
@@ -638,119 +1144,26 @@ class DaemonScanner:
         return ScanResult(
             status=status,
             path=path,
-            stdout=stdout,
+            stdout=output.text,
             stderr=stderr,
             exit_code=exit_code,
             infected_files=infected_files,
-            scanned_files=scanned_files,
-            scanned_dirs=scanned_dirs,
+            scanned_files=file_count,
+            scanned_dirs=dir_count,
             infected_count=infected_count,
             error_message=stderr if status == ScanStatus.ERROR else None,
             threat_details=threat_details,
             skipped_files=skipped_files,
             skipped_count=len(skipped_files),
             warning_message=warning_message,
+            output_file=output.spill_path,
         )
 
-    def _collect_exclusion_patterns(self, profile_exclusions: dict | None = None) -> list[str]:
-        """
-        Collect all exclusion patterns from settings and profile.
-
-        Args:
-            profile_exclusions: Optional exclusions from a scan profile
-
-        Returns:
-            List of exclusion patterns (glob patterns or exact paths)
-        """
-        patterns: list[str] = []
-
-        # Global exclusions from settings
-        if self._settings_manager is not None:
-            exclusions = self._settings_manager.get("exclusion_patterns", [])
-            for exclusion in exclusions:
-                if not exclusion.get("enabled", True):
-                    continue
-                pattern = exclusion.get("pattern", "")
-                if pattern:
-                    patterns.append(pattern)
-
-        # Profile exclusions - patterns
-        if profile_exclusions:
-            for pattern in profile_exclusions.get("patterns", []):
-                if pattern:
-                    patterns.append(pattern)
-
-        return patterns
-
-    def _collect_exclusion_paths(self, profile_exclusions: dict | None = None) -> list[Path]:
-        """
-        Collect all exclusion directory paths from profile.
-
-        Args:
-            profile_exclusions: Optional exclusions from a scan profile
-
-        Returns:
-            List of resolved Path objects for excluded directories
-        """
-        paths: list[Path] = []
-
-        if profile_exclusions:
-            for path_str in profile_exclusions.get("paths", []):
-                if path_str:
-                    path = Path(path_str).expanduser().resolve()
-                    paths.append(path)
-
-        return paths
-
-    def _matches_exclusion_pattern(self, file_path: str, patterns: list[str]) -> bool:
-        """
-        Check if a file path matches any exclusion pattern.
-
-        Args:
-            file_path: The file path to check
-            patterns: List of exclusion patterns (glob or exact path)
-
-        Returns:
-            True if the file matches any pattern
-        """
-        for pattern in patterns:
-            # Expand ~ in patterns
-            if pattern.startswith("~"):
-                pattern = str(Path(pattern).expanduser())
-
-            # Check for exact path match or fnmatch pattern match
-            if file_path == pattern or fnmatch.fnmatch(file_path, pattern):
-                return True
-
-        return False
-
-    def _matches_exclusion_path(self, file_path: str, exclude_paths: list[Path]) -> bool:
-        """
-        Check if a file path is under any excluded directory.
-
-        Args:
-            file_path: The file path to check
-            exclude_paths: List of resolved excluded directory paths
-
-        Returns:
-            True if the file is under any excluded directory
-        """
-        if not exclude_paths:
-            return False
-
-        resolved_file = Path(file_path).resolve()
-        resolved_file_str = str(resolved_file)
-
-        for excl_path in exclude_paths:
-            excl_path_str = str(excl_path)
-            # Match if file is the excluded path or under it
-            if resolved_file == excl_path or resolved_file_str.startswith(excl_path_str + "/"):
-                return True
-
-        return False
-
     def _filter_excluded_threats(
-        self, result: ScanResult, profile_exclusions: dict | None = None
+        self,
+        result: ScanResult,
+        profile_exclusions: dict | None = None,
+        exclusions: ExclusionSet | None = None,
     ) -> ScanResult:
         """
         Filter out threats that match exclusion patterns.
@@ -761,6 +1174,8 @@ class DaemonScanner:
         Args:
             result: The parsed ScanResult
             profile_exclusions: Optional exclusions from a scan profile
+            exclusions: Exclusions already compiled for the scan; built from
+                the settings and profile_exclusions if omitted
 
         Returns:
             A new ScanResult with excluded threats filtered out
@@ -768,28 +1183,20 @@ class DaemonScanner:
         if result.status != ScanStatus.INFECTED or not result.threat_details:
             return result
 
-        # Collect exclusion patterns and paths using helper methods
-        exclude_patterns = self._collect_exclusion_patterns(profile_exclusions)
-        exclude_paths = self._collect_exclusion_paths(profile_exclusions)
-
-        if not exclude_patterns and not exclude_paths:
+        if exclusions is None:
+            exclusions = ExclusionSet.from_settings(self._settings_manager, profile_exclusions)
+        if not exclusions:
             return result
 
-        # Filter threats using helper methods
         filtered_threats = []
         filtered_files = []
 
         for threat in result.threat_details:
-            file_path = threat.file_path
-
-            # Check pattern exclusions, then path exclusions
-            if self._matches_exclusion_pattern(file_path, exclude_patterns):
-                continue
-            if self._matches_exclusion_path(file_path, exclude_paths):
+            if exclusions.is_path_excluded(threat.file_path):
                 continue
 
             filtered_threats.append(threat)
-            filtered_files.append(file_path)
+            filtered_files.append(threat.file_path)
 
         # Build result based on remaining threats
         if not filtered_threats:
@@ -805,6 +1212,11 @@ class DaemonScanner:
                 infected_count=0,
                 error_message=None,
                 threat_details=[],
+                cached_count=result.cached_count,
+                output_file=result.output_file,
+                scanned_bytes=result.scanned_bytes,
+                skipped_mounts=result.skipped_mounts,
+                device_boundaries=result.device_boundaries,
             )
 
         return ScanResult(
@@ -819,8 +1231,15 @@ class DaemonScanner:
             infected_count=len(filtered_threats),
             error_message=None,
             threat_details=filtered_threats,
+            cached_count=result.cached_count,
+            output_file=result.output_file,
+            scanned_bytes=result.scanned_bytes,
+            skipped_mounts=result.skipped_mounts,
+            device_boundaries=result.device_boundaries,
         )
 
     def _save_scan_log(self, result: ScanResult, duration: float) -> None:
-        """Save scan result to log."""
-        save_scan_log(self._log_manager, result, duration, suffix="(daemon)")
+        """Save scan result to log, with the load governor's decisions."""
+        if self._governor is not None:
+            result.load_decisions = self._governor.describe_decisions()
+        save_scan_log(self._log_manager, result, duration, suffix="(daemon)", backend=self.backend)
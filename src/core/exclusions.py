@@ -0,0 +1,280 @@
+# ClamUI Exclusions Module
+"""
+Compiled scan exclusions for ClamUI.
+
+An ExclusionSet is built once per scan from the exclusion_patterns setting and
+the scan profile's exclusions, and is shared by walking, counting and
+post-scan filtering in both scanner backends.
+
+Absolute paths (after ~ expansion) go into a prefix trie keyed by path
+component, so a lookup costs one step per component regardless of how many
+paths are excluded, and "/data/build" never matches "/data/build-tools". Glob
+patterns are translated once and combined into a single compiled regex per
+kind (file or directory patterns). Patterns without a "/" are matched against
+the entry name, the others against the full path; plain names ("node_modules")
+and suffix patterns ("*.log") are answered by a set lookup and str.endswith()
+before the regex is consulted.
+
+Usage:
+    exclusions = ExclusionSet.from_settings(settings_manager, profile_exclusions)
+    walker = ScanWalker(path, exclude=exclusions.is_excluded)
+    ...
+    if exclusions.is_path_excluded(threat.file_path):
+        ...  # drop the threat
+"""
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings_manager import SettingsManager
+
+# Characters that make a pattern a glob rather than a literal path
+_GLOB_CHARS = frozenset("*?[")
+
+# Trie node key marking an excluded path
+_TERMINAL = ""
+
+
+class _GlobMatcher:
+    """Glob patterns of one kind (file or directory), compiled together."""
+
+    def __init__(self, patterns: list[str]):
+        """
+        Compile glob patterns.
+
+        Args:
+            patterns: fnmatch-style glob patterns or plain names
+        """
+        names: set[str] = set()
+        suffixes: list[str] = []
+        name_globs: list[str] = []
+        path_globs: list[str] = []
+
+        for pattern in patterns:
+            if "/" in pattern:
+                path_globs.append(pattern)
+            elif not _GLOB_CHARS.intersection(pattern):
+                names.add(pattern)
+            elif pattern.startswith("*") and not _GLOB_CHARS.intersection(pattern[1:]):
+                suffixes.append(pattern[1:])
+            else:
+                name_globs.append(pattern)
+
+        self._names = frozenset(names)
+        self._suffixes = tuple(suffixes)
+        self._name_regex = self._compile(name_globs)
+        self._path_regex = self._compile(path_globs)
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern | None:
+        """Combine glob patterns into one compiled regex, or None if there are none."""
+        if not patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+    def __bool__(self) -> bool:
+        return bool(self._names or self._suffixes or self._name_regex or self._path_regex)
+
+    def matches(self, path: str, name: str) -> bool:
+        """
+        Check an entry against the patterns.
+
+        Args:
+            path: Full path of the entry
+            name: Base name of the entry
+
+        Returns:
+            True if any pattern matches
+        """
+        if name in self._names:
+            return True
+        if self._suffixes and name.endswith(self._suffixes):
+            return True
+        if self._name_regex is not None and self._name_regex.match(name) is not None:
+            return True
+        return self._path_regex is not None and self._path_regex.match(path) is not None
+
+
+class ExclusionSet:
+    """
+    Exclusion patterns compiled for fast per-file matching.
+
+    File patterns apply to files; directory patterns apply to directories and
+    so prune whole subtrees during a walk. Excluded absolute paths apply to
+    both, along with everything below them.
+    """
+
+    def __init__(self, file_patterns: Iterable[str] = (), dir_patterns: Iterable[str] = ()):
+        """
+        Compile exclusion patterns.
+
+        Args:
+            file_patterns: Glob patterns or paths excluding files
+            dir_patterns: Glob patterns or paths excluding directories
+        """
+        self._trie: dict = {}
+        file_globs: list[str] = []
+        dir_globs: list[str] = []
+
+        for patterns, globs in ((file_patterns, file_globs), (dir_patterns, dir_globs)):
+            for pattern in patterns:
+                if not pattern:
+                    continue
+                if pattern.startswith("~"):
+                    pattern = os.path.expanduser(pattern)
+                if _GLOB_CHARS.intersection(pattern):
+                    globs.append(pattern)
+                elif pattern.startswith("/"):
+                    self._add_path(pattern)
+                else:
+                    # A bare name such as "node_modules" matches the entry name
+                    globs.append(pattern)
+
+        self._file_globs = _GlobMatcher(file_globs)
+        self._dir_globs = _GlobMatcher(dir_globs)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings_manager: "SettingsManager | None",
+        profile_exclusions: dict | None = None,
+    ) -> "ExclusionSet":
+        """
+        Build the exclusions for a scan.
+
+        Args:
+            settings_manager: Settings providing the global exclusion_patterns
+            profile_exclusions: Optional exclusions from a scan profile.
+                               Format: {"paths": ["/path1", ...], "patterns": ["*.ext", ...]}
+
+        Returns:
+            ExclusionSet combining enabled global and profile exclusions
+        """
+        file_patterns: list[str] = []
+        dir_patterns: list[str] = []
+
+        # Global exclusions from settings
+        if settings_manager is not None:
+            for exclusion in settings_manager.get("exclusion_patterns", []) or []:
+                if not exclusion.get("enabled", True):
+                    continue
+                pattern = exclusion.get("pattern", "")
+                if not pattern:
+                    continue
+                if exclusion.get("type", "pattern") == "directory":
+                    dir_patterns.append(pattern)
+                else:
+                    file_patterns.append(pattern)
+
+        # Profile exclusions
+        if profile_exclusions:
+            dir_patterns.extend(p for p in profile_exclusions.get("paths", []) if p)
+            file_patterns.extend(p for p in profile_exclusions.get("patterns", []) if p)
+
+        return cls(file_patterns, dir_patterns)
+
+    def _add_path(self, path: str) -> None:
+        """Add an absolute path, and its resolved form, to the prefix trie."""
+        self._insert(os.path.normpath(path))
+        try:
+            resolved = str(Path(path).resolve())
+        except (OSError, RuntimeError):
+            return
+        self._insert(resolved)
+
+    def _insert(self, path: str) -> None:
+        """Insert a normalized absolute path into the prefix trie."""
+        node = self._trie
+        for component in path.split("/"):
+            if not component:
+                continue
+            if _TERMINAL in node:
+                # An ancestor is already excluded
+                return
+            node = node.setdefault(component, {})
+        node.clear()
+        node[_TERMINAL] = True
+
+    def _is_under_excluded_path(self, path: str) -> bool:
+        """Check whether path is an excluded path or lies below one."""
+        node = self._trie
+        if _TERMINAL in node:
+            return True
+        for component in path.split("/"):
+            if not component:
+                continue
+            node = node.get(component)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+    @property
+    def paths(self) -> list[str]:
+        """Get the excluded absolute paths held in the prefix trie."""
+        found: list[str] = []
+        stack: list[tuple[str, dict]] = [("", self._trie)]
+        while stack:
+            prefix, node = stack.pop()
+            if _TERMINAL in node:
+                found.append(prefix or "/")
+                continue
+            stack.extend((f"{prefix}/{name}", child) for name, child in node.items())
+        return sorted(found)
+
+    def __bool__(self) -> bool:
+        """Whether any exclusion is configured."""
+        return bool(self._trie) or bool(self._file_globs) or bool(self._dir_globs)
+
+    def is_excluded(self, path: str, name: str | None = None, is_dir: bool = False) -> bool:
+        """
+        Check a walked entry.
+
+        Matches the signature expected by ScanWalker's exclude callable.
+
+        Args:
+            path: Full path of the entry
+            name: Base name of the entry (derived from path if omitted)
+            is_dir: Whether the entry is a directory
+
+        Returns:
+            True if the entry should be excluded
+        """
+        if self._trie and self._is_under_excluded_path(path):
+            return True
+        globs = self._dir_globs if is_dir else self._file_globs
+        if not globs:
+            return False
+        if name is None:
+            name = os.path.basename(path)
+        return globs.matches(path, name)
+
+    def is_path_excluded(self, path: str) -> bool:
+        """
+        Check a file reported by a scan, including its parent directories.
+
+        Used to filter results where the walk could not apply the exclusions
+        (clamd walking the tree itself).
+
+        Args:
+            path: Full path of a scanned file
+
+        Returns:
+            True if the file or any of its parent directories is excluded
+        """
+        if self.is_excluded(path):
+            return True
+        if not self._dir_globs:
+            return False
+        parent = os.path.dirname(path)
+        while parent and parent != "/":
+            if self.is_excluded(parent, os.path.basename(parent), is_dir=True):
+                return True
+            parent = os.path.dirname(parent)
+        return False
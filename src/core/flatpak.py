@@ -288,6 +288,28 @@ def wrap_host_command(command: list[str], force_host: bool = False) -> list[str]
     return list(command)
 
 
+def runs_on_host(process: subprocess.Popen | None) -> bool:
+    """
+    Check whether a process is a flatpak-spawn --host wrapper.
+
+    The wrapper runs in the sandbox while the command it started runs on the
+    host, out of reach of the sandbox: signals such as SIGSTOP are not
+    forwarded, and renicing the wrapper does not change the host process.
+
+    Args:
+        process: A process started from a wrap_host_command() command, or None
+
+    Returns:
+        True if the process runs its command on the host through flatpak-spawn
+    """
+    if process is None:
+        return False
+    args = process.args
+    if not isinstance(args, (list, tuple)) or not args:
+        return False
+    return os.path.basename(os.fsdecode(args[0])) == "flatpak-spawn"
+
+
 def get_xdg_user_dir(dir_type: str) -> str | None:
     """
     Get the XDG user directory path for a given type.
@@ -0,0 +1,492 @@
+# ClamUI Load Governor Module
+"""
+System-load-aware scan throttling for ClamUI.
+
+A long scan competes with interactive users for CPU time, disk bandwidth and
+page cache. The LoadGovernor samples the kernel's pressure stall information
+(/proc/pressure/{cpu,io,memory}, the "some avg10" share of time tasks were
+stalled) and the 1-minute load average per CPU, and moves a running scan
+between three levels:
+
+- NORMAL: scan at full speed
+- THROTTLED: clamd scans use half of their sessions; clamscan and clamdscan
+  processes get a lower CPU and I/O priority (nice 10, idle I/O class)
+- PAUSED: no files are sent to clamd and clamscan/clamdscan processes are
+  stopped, until the load recovers or the pause has lasted max_pause seconds
+
+A level is left only once the readings fall below RECOVERY_FACTOR times its
+threshold, so the scan does not flap around a threshold. Kernels without PSI
+are governed by the load average alone.
+
+Every level change is recorded with the readings that caused it and is
+written to the scan log, so thresholds can be tuned from real scans. The
+governor is off by default; it is enabled and tuned through the
+"load_governor_*" settings, which the "load_governor" option of a scan
+profile can override.
+
+Usage:
+    governor = open_load_governor(settings_manager, profile.options.get("load_governor"))
+    if governor is not None:
+        governor.start(on_change)
+        ...  # consult governor.is_paused() and governor.session_limit(size)
+        governor.stop()
+        result.load_decisions = governor.describe_decisions()
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, fields, replace
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from .flatpak import runs_on_host
+
+if TYPE_CHECKING:
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Directory of the kernel's pressure stall information files
+PRESSURE_DIR = "/proc/pressure"
+
+# Resources whose pressure is sampled
+PRESSURE_RESOURCES = ("cpu", "io", "memory")
+
+# Seconds between load samples while a scan runs
+SAMPLE_INTERVAL = 5.0
+
+# Share of a threshold the readings must fall below to leave its level
+RECOVERY_FACTOR = 0.75
+
+# Niceness given to throttled scanner processes
+THROTTLED_NICE = 10
+
+# Decisions recorded per scan; later ones are only counted
+MAX_DECISIONS = 50
+
+# Settings holding the global thresholds, by LoadThresholds field
+_SETTING_KEYS = {
+    "throttle_pressure": "load_governor_throttle_pressure",
+    "pause_pressure": "load_governor_pause_pressure",
+    "throttle_load": "load_governor_throttle_load",
+    "pause_load": "load_governor_pause_load",
+    "max_pause": "load_governor_max_pause",
+}
+
+
+class LoadLevel(Enum):
+    """How hard a governed scan may run."""
+
+    NORMAL = "normal"
+    THROTTLED = "throttled"
+    PAUSED = "paused"
+
+
+@dataclass(frozen=True)
+class LoadReading:
+    """One sample of the system load."""
+
+    cpu: float | None  # PSI "some avg10" in percent, None without PSI
+    io: float | None
+    memory: float | None
+    load: float  # 1-minute load average per CPU
+
+    @property
+    def pressure(self) -> float | None:
+        """Highest pressure of the three resources, None without PSI."""
+        values = [value for value in (self.cpu, self.io, self.memory) if value is not None]
+        return max(values) if values else None
+
+    def describe(self) -> str:
+        """Format the reading for the scan log."""
+        parts = [
+            f"{name} {value:.1f}%"
+            for name, value in (("cpu", self.cpu), ("io", self.io), ("memory", self.memory))
+            if value is not None
+        ]
+        parts.append(f"load {self.load:.2f} per CPU")
+        return ", ".join(parts)
+
+
+@dataclass(frozen=True)
+class LoadThresholds:
+    """Readings at which a governed scan is throttled or paused."""
+
+    throttle_pressure: float = 20.0  # PSI percent
+    pause_pressure: float = 60.0
+    throttle_load: float = 1.0  # load average per CPU
+    pause_load: float = 2.0
+    max_pause: float = 600.0  # seconds a scan may stay paused at a time
+
+    def with_overrides(self, overrides: dict | None) -> "LoadThresholds":
+        """
+        Apply overrides from settings or a profile, ignoring invalid values.
+
+        Args:
+            overrides: Mapping of field names to numbers
+
+        Returns:
+            Thresholds with the valid overrides applied
+        """
+        if not isinstance(overrides, dict):
+            return self
+        changes = {}
+        for item in fields(self):
+            value = overrides.get(item.name)
+            if isinstance(value, int | float) and not isinstance(value, bool) and value >= 0:
+                changes[item.name] = float(value)
+            elif value is not None:
+                logger.warning("Ignoring invalid load governor %s: %r", item.name, value)
+        return replace(self, **changes)
+
+    def _exceeds(self, reading: LoadReading, pressure: float, load: float, factor: float) -> bool:
+        current = reading.pressure
+        return (current is not None and current >= pressure * factor) or (
+            reading.load >= load * factor
+        )
+
+    def level_for(self, reading: LoadReading, current: LoadLevel) -> LoadLevel:
+        """
+        Choose the level for a reading.
+
+        Args:
+            reading: Current system load
+            current: Level the scan runs at now
+
+        Returns:
+            The level the scan should run at
+        """
+        if self._exceeds(reading, self.pause_pressure, self.pause_load, 1.0):
+            return LoadLevel.PAUSED
+        if current is LoadLevel.PAUSED and self._exceeds(
+            reading, self.pause_pressure, self.pause_load, RECOVERY_FACTOR
+        ):
+            return LoadLevel.PAUSED
+        if self._exceeds(reading, self.throttle_pressure, self.throttle_load, 1.0):
+            return LoadLevel.THROTTLED
+        if current is not LoadLevel.NORMAL and self._exceeds(
+            reading, self.throttle_pressure, self.throttle_load, RECOVERY_FACTOR
+        ):
+            return LoadLevel.THROTTLED
+        return LoadLevel.NORMAL
+
+
+@dataclass(frozen=True)
+class GovernorDecision:
+    """A level change and the reading that caused it."""
+
+    elapsed: float  # seconds since the governor started
+    level: LoadLevel
+    reading: LoadReading
+    reason: str = ""
+
+    def describe(self) -> str:
+        """Format the decision for the scan log."""
+        reason = f"; {self.reason}" if self.reason else ""
+        return f"+{self.elapsed:.0f}s {self.level.value} ({self.reading.describe()}){reason}"
+
+
+def read_pressure(resource: str, pressure_dir: str = PRESSURE_DIR) -> float | None:
+    """
+    Read the "some avg10" pressure of a resource.
+
+    Args:
+        resource: "cpu", "io" or "memory"
+        pressure_dir: Directory of the PSI files
+
+    Returns:
+        Percentage of the last 10 seconds some task was stalled on the
+        resource, or None if PSI is not available
+    """
+    try:
+        with open(os.path.join(pressure_dir, resource), encoding="ascii") as f:
+            for line in f:
+                kind, _, values = line.partition(" ")
+                if kind != "some":
+                    continue
+                for value in values.split():
+                    key, _, number = value.partition("=")
+                    if key == "avg10":
+                        return float(number)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def read_system_load(pressure_dir: str = PRESSURE_DIR) -> LoadReading:
+    """
+    Sample the pressure of every resource and the load average.
+
+    Args:
+        pressure_dir: Directory of the PSI files
+
+    Returns:
+        The current LoadReading
+    """
+    try:
+        load = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        load = 0.0
+    cpu, io, memory = (read_pressure(resource, pressure_dir) for resource in PRESSURE_RESOURCES)
+    return LoadReading(cpu=cpu, io=io, memory=memory, load=load)
+
+
+def lower_process_priority(process: subprocess.Popen | None) -> None:
+    """
+    Give a scanner process a low CPU and I/O priority.
+
+    An unprivileged process cannot raise its priority again, so the lowered
+    priority lasts until the process exits. A scanner run on the host through
+    flatpak-spawn keeps its priority: only the sandboxed wrapper could be
+    reniced.
+
+    Args:
+        process: The process, or None
+    """
+    if process is None or process.poll() is not None:
+        return
+    if runs_on_host(process):
+        logger.info(
+            "Cannot lower the priority of a scanner running on the host outside the Flatpak sandbox"
+        )
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, process.pid, THROTTLED_NICE)
+    except OSError as e:
+        logger.debug("Cannot renice scanner process %d: %s", process.pid, e)
+    ionice = shutil.which("ionice")
+    if ionice is None:
+        return
+    try:
+        subprocess.run(
+            [ionice, "-c", "3", "-p", str(process.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("Cannot lower I/O priority of scanner process %d: %s", process.pid, e)
+
+
+class LoadGovernor:
+    """
+    Moves a running scan between load levels.
+
+    sample() takes one reading and changes the level if needed; start() runs
+    it every interval on a background thread until stop(). The level and
+    session limit can be read from any thread.
+    """
+
+    def __init__(
+        self,
+        thresholds: LoadThresholds,
+        read_load: Callable[[], LoadReading] | None = None,
+        interval: float = SAMPLE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a governor at the NORMAL level.
+
+        Args:
+            thresholds: Readings at which the scan is throttled or paused
+            read_load: Returns the current LoadReading; defaults to
+                read_system_load()
+            interval: Seconds between samples while started
+            clock: Monotonic clock, replaceable for tests
+        """
+        self._thresholds = thresholds
+        self._read_load = read_load or read_system_load
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._level = LoadLevel.NORMAL
+        self._started_at = clock()
+        self._paused_since: float | None = None
+        self._pause_exhausted = False
+        self._decisions: list[GovernorDecision] = []
+        self._dropped_decisions = 0
+        self._on_change: Callable[[LoadLevel], None] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def thresholds(self) -> LoadThresholds:
+        """Thresholds the governor applies."""
+        return self._thresholds
+
+    @property
+    def level(self) -> LoadLevel:
+        """Level the scan runs at."""
+        with self._lock:
+            return self._level
+
+    def is_paused(self) -> bool:
+        """Whether the scan should stop sending work."""
+        return self.level is LoadLevel.PAUSED
+
+    def session_limit(self, size: int) -> int:
+        """
+        Get how many of a pool's sessions may scan.
+
+        Args:
+            size: Number of sessions in the pool
+
+        Returns:
+            size when NORMAL, half of it (at least one) when THROTTLED and 0
+            when PAUSED
+        """
+        level = self.level
+        if level is LoadLevel.PAUSED:
+            return 0
+        if level is LoadLevel.THROTTLED:
+            return max(1, size // 2)
+        return size
+
+    def sample(self) -> LoadLevel:
+        """
+        Take a reading and change the level if the load calls for it.
+
+        The first sample is always recorded, so the scan log shows the load
+        a scan started under.
+
+        Returns:
+            The level after the sample
+        """
+        reading = self._read_load()
+        now = self._clock()
+        with self._lock:
+            previous = self._level
+            level = self._thresholds.level_for(reading, previous)
+            reason = ""
+            if level is not LoadLevel.PAUSED:
+                self._pause_exhausted = False
+            elif self._pause_exhausted or (
+                self._paused_since is not None
+                and now - self._paused_since >= self._thresholds.max_pause
+            ):
+                # Do not starve the scan under lasting load
+                if not self._pause_exhausted:
+                    reason = f"paused for {self._thresholds.max_pause:.0f}s, continuing"
+                self._pause_exhausted = True
+                level = LoadLevel.THROTTLED
+
+            if level is LoadLevel.PAUSED:
+                if self._paused_since is None:
+                    self._paused_since = now
+            else:
+                self._paused_since = None
+
+            changed = level is not previous
+            if changed or (not self._decisions and not self._dropped_decisions):
+                decision = GovernorDecision(now - self._started_at, level, reading, reason)
+                if len(self._decisions) < MAX_DECISIONS:
+                    self._decisions.append(decision)
+                else:
+                    self._dropped_decisions += 1
+            self._level = level
+            on_change = self._on_change
+
+        if changed:
+            logger.info("Load governor: scan %s (%s)", level.value, reading.describe())
+            if on_change is not None:
+                on_change(level)
+        return level
+
+    def start(self, on_change: Callable[[LoadLevel], None] | None = None) -> None:
+        """
+        Take a first sample and keep sampling on a background thread.
+
+        Args:
+            on_change: Called with the new level on every level change, from
+                the sampling thread
+        """
+        with self._lock:
+            self._on_change = on_change
+            self._started_at = self._clock()
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="load-governor", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Sample until stop() is called."""
+        while not self._stop.wait(self._interval):
+            try:
+                self.sample()
+            except Exception as e:  # A failed sample must not end governing
+                logger.warning("Load governor sample failed: %s", e)
+
+    def stop(self) -> None:
+        """Stop sampling; the level stays as it is."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+        with self._lock:
+            self._on_change = None
+
+    @property
+    def decisions(self) -> list[GovernorDecision]:
+        """Recorded level changes, oldest first."""
+        with self._lock:
+            return list(self._decisions)
+
+    def describe_decisions(self) -> list[str]:
+        """
+        Format the recorded decisions for the scan log.
+
+        Returns:
+            One line per decision; empty if the load never left NORMAL
+        """
+        with self._lock:
+            decisions = list(self._decisions)
+            dropped = self._dropped_decisions
+        if all(decision.level is LoadLevel.NORMAL for decision in decisions) and not dropped:
+            return []
+        lines = [decision.describe() for decision in decisions]
+        if dropped:
+            lines.append(f"{dropped} later level change(s) not recorded")
+        return lines
+
+
+def open_load_governor(
+    settings_manager: "SettingsManager | None",
+    profile_options: dict | None = None,
+) -> LoadGovernor | None:
+    """
+    Create the governor of a scan if governing is enabled.
+
+    The "load_governor_enabled" setting turns governing on for every scan,
+    and the "load_governor_*" settings hold the thresholds. A scan profile's
+    "load_governor" option may override both, e.g.
+    {"enabled": true, "throttle_pressure": 10, "pause_load": 1.5}.
+
+    Args:
+        settings_manager: Settings of the calling scanner, or None
+        profile_options: The "load_governor" option of the scan profile
+
+    Returns:
+        A LoadGovernor that has not been started, or None
+    """
+    if not isinstance(profile_options, dict):
+        profile_options = {}
+
+    enabled = False
+    defaults = {}
+    if settings_manager is not None:
+        enabled = settings_manager.get("load_governor_enabled", False) is True
+        defaults = {name: settings_manager.get(key) for name, key in _SETTING_KEYS.items()}
+    if "enabled" in profile_options:
+        enabled = profile_options["enabled"] is True
+    if not enabled:
+        return None
+
+    thresholds = LoadThresholds().with_overrides(defaults).with_overrides(profile_options)
+    return LoadGovernor(thresholds)
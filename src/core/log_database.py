@@ -0,0 +1,417 @@
+# ClamUI Log Database Module
+"""
+SQLite storage for ClamUI's scan, update and VirusTotal logs.
+
+Each log is one row of the "logs" table, whose timestamp, type, status, path
+and scheduled columns are indexed so that listing and filtering the history
+read only the rows they return. The full details text of a log (raw ClamAV
+output, possibly megabytes) lives in the separate "log_details" table and is
+only read when the details of a log are wanted.
+
+The counts of a scan (files, directories, infections, skipped files) and
+its phase timings are columns too, so statistics read numbers instead of
+parsing the details. Scan logs stored before these columns existed are
+backfilled once by backfill_scan_counts().
+
+Rows are plain dicts with the fields of LogEntry; LogManager converts them
+and sanitizes them on the way out.
+
+Usage:
+    db = open_log_database(path)
+    if db is not None:
+        db.add_entries([entry.to_dict()])
+        rows = db.get_entries(limit=100, log_type="scan")
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+
+from .quarantine import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Columns of the logs table, in LogEntry field order (details is stored apart)
+_COLUMNS = (
+    "id",
+    "timestamp",
+    "type",
+    "status",
+    "summary",
+    "path",
+    "duration",
+    "scheduled",
+    "scanned_bytes",
+    "backend",
+    "scanned_files",
+    "scanned_dirs",
+    "infected_count",
+    "skipped_count",
+    "timings",
+)
+
+# Columns added after the first release of the schema, with their types
+_ADDED_COLUMNS = (
+    ("scanned_files", "INTEGER"),
+    ("scanned_dirs", "INTEGER"),
+    ("infected_count", "INTEGER"),
+    ("skipped_count", "INTEGER"),
+    ("timings", "TEXT"),
+)
+
+# Scan logs backfilled per transaction
+BACKFILL_BATCH_SIZE = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS logs (
+        id TEXT PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        path TEXT,
+        duration REAL NOT NULL DEFAULT 0,
+        scheduled INTEGER NOT NULL DEFAULT 0,
+        scanned_bytes INTEGER NOT NULL DEFAULT 0,
+        backend TEXT,
+        scanned_files INTEGER,
+        scanned_dirs INTEGER,
+        infected_count INTEGER,
+        skipped_count INTEGER,
+        timings TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS log_details (
+        id TEXT PRIMARY KEY REFERENCES logs(id) ON DELETE CASCADE,
+        details TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_type ON logs(type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_status ON logs(status)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_path ON logs(path)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_scheduled ON logs(scheduled)",
+)
+
+# Created after the added columns: finds the scan logs still to backfill
+_BACKFILL_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_logs_uncounted ON logs(id) "
+    "WHERE type = 'scan' AND scanned_files IS NULL"
+)
+
+
+class LogDatabase:
+    """
+    Log persistence using SQLite.
+
+    Operations are thread-safe and report failures through their return
+    values, like QuarantineDatabase.
+    """
+
+    def __init__(self, db_path: str, pool_size: int = 3):
+        """
+        Initialize the database and create its schema.
+
+        Args:
+            db_path: Path of the database file
+            pool_size: Size of the connection pool
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialized
+        """
+        self._db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._pool = ConnectionPool(str(self._db_path), pool_size=pool_size)
+        try:
+            with self._pool.get_connection() as conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                # Migration: add the columns of databases created before them
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+                for column, column_type in _ADDED_COLUMNS:
+                    if column not in columns:
+                        conn.execute(f"ALTER TABLE logs ADD COLUMN {column} {column_type}")
+                conn.execute(_BACKFILL_INDEX)
+        except (sqlite3.Error, OSError):
+            self._pool.close_all()
+            raise
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the database file."""
+        return self._db_path
+
+    @contextmanager
+    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get a pooled connection; commits on success, rolls back on error."""
+        with self._pool.get_connection() as conn:
+            yield conn
+
+    @staticmethod
+    def _row_to_dict(row: tuple) -> dict:
+        """Convert a row of _COLUMNS followed by details to a log dict."""
+        data = dict(zip(_COLUMNS, row, strict=False))
+        data["scheduled"] = bool(data["scheduled"])
+        try:
+            data["timings"] = json.loads(data["timings"]) if data["timings"] else {}
+        except ValueError:
+            data["timings"] = {}
+        data["details"] = row[len(_COLUMNS)] or ""
+        return data
+
+    def add_entries(self, entries: Iterable[dict]) -> bool:
+        """
+        Store logs, replacing any stored log with the same id.
+
+        Args:
+            entries: Log dicts with the fields of LogEntry
+
+        Returns:
+            True if all logs were stored in one transaction, False otherwise
+        """
+        rows = []
+        details = []
+        for entry in entries:
+            values = {column: entry.get(column) for column in _COLUMNS}
+            values["scheduled"] = int(bool(values["scheduled"]))
+            values["timings"] = json.dumps(values["timings"]) if values["timings"] else None
+            rows.append(tuple(values.values()))
+            details.append((entry["id"], entry.get("details") or ""))
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO logs ({', '.join(_COLUMNS)}) "
+                        f"VALUES ({placeholders})",
+                        rows,
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO log_details (id, details) VALUES (?, ?)",
+                        details,
+                    )
+                return True
+            except sqlite3.Error as e:
+                logger.error("Failed to store %d log(s) in %s: %s", len(rows), self._db_path, e)
+                return False
+
+    def get_entries(
+        self,
+        limit: int = 100,
+        log_type: str | None = None,
+        status: str | None = None,
+        path: str | None = None,
+        scheduled: bool | None = None,
+        since: str | None = None,
+        with_details: bool = True,
+    ) -> list[dict]:
+        """
+        Get stored logs, newest first.
+
+        Args:
+            limit: Maximum number of logs to return
+            log_type: Only logs of this type
+            status: Only logs with this status
+            path: Only logs of this scanned path
+            scheduled: Only scheduled (True) or manual (False) operations
+            since: Only logs with a later timestamp
+            with_details: Set to False to not read the details (left empty)
+
+        Returns:
+            Log dicts; empty if the query failed
+        """
+        conditions = []
+        params: list = []
+        for column, value in (("type", log_type), ("status", status), ("path", path)):
+            if value is not None:
+                conditions.append(f"logs.{column} = ?")
+                params.append(value)
+        if scheduled is not None:
+            conditions.append("logs.scheduled = ?")
+            params.append(int(scheduled))
+        if since is not None:
+            conditions.append("logs.timestamp > ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        columns = ", ".join(f"logs.{column}" for column in _COLUMNS)
+        details = "log_details.details" if with_details else "NULL"
+        join = "LEFT JOIN log_details ON log_details.id = logs.id" if with_details else ""
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.execute(
+                        f"SELECT {columns}, {details} FROM logs {join} "
+                        f"{where} ORDER BY logs.timestamp DESC LIMIT ?",
+                        (*params, max(limit, 0)),
+                    )
+                    return [self._row_to_dict(row) for row in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error("Failed to read logs from %s: %s", self._db_path, e)
+                return []
+
+    def get_entry(self, log_id: str) -> dict | None:
+        """
+        Get one stored log.
+
+        Args:
+            log_id: The UUID of the log
+
+        Returns:
+            The log dict, or None if not found or the query failed
+        """
+        columns = ", ".join(f"logs.{column}" for column in _COLUMNS)
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    row = conn.execute(
+                        f"SELECT {columns}, log_details.details FROM logs "
+                        "LEFT JOIN log_details ON log_details.id = logs.id "
+                        "WHERE logs.id = ?",
+                        (log_id,),
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.error("Failed to read log %s: %s", log_id, e)
+                return None
+        return self._row_to_dict(row) if row else None
+
+    def has_entry(self, log_id: str) -> bool:
+        """
+        Check whether a log is stored, without reading it.
+
+        Args:
+            log_id: The UUID of the log
+
+        Returns:
+            True if the log exists, False if not or the query failed
+        """
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    row = conn.execute("SELECT 1 FROM logs WHERE id = ?", (log_id,)).fetchone()
+            except sqlite3.Error as e:
+                logger.error("Failed to look up log %s: %s", log_id, e)
+                return False
+        return row is not None
+
+    def delete_entry(self, log_id: str) -> bool:
+        """
+        Delete one stored log and its details.
+
+        Args:
+            log_id: The UUID of the log
+
+        Returns:
+            True if the log existed and was deleted, False otherwise
+        """
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.execute("DELETE FROM logs WHERE id = ?", (log_id,))
+                    return cursor.rowcount > 0
+            except sqlite3.Error as e:
+                logger.error("Failed to delete log %s: %s", log_id, e)
+                return False
+
+    def clear(self) -> bool:
+        """
+        Delete all stored logs.
+
+        Returns:
+            True if cleared successfully, False otherwise
+        """
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    conn.execute("DELETE FROM log_details")
+                    conn.execute("DELETE FROM logs")
+                return True
+            except sqlite3.Error as e:
+                logger.error("Failed to clear logs in %s: %s", self._db_path, e)
+                return False
+
+    def count(self) -> int:
+        """
+        Get the number of stored logs.
+
+        Returns:
+            Number of logs; 0 if the query failed
+        """
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.error("Failed to count logs in %s: %s", self._db_path, e)
+                return 0
+
+    def backfill_scan_counts(self, parse: Callable[[str, str, str], dict[str, int]]) -> int:
+        """
+        Store the counts of scan logs that were saved without them.
+
+        Args:
+            parse: Reads scanned_files, scanned_dirs and infected_count from
+                   the status, summary and details of a log
+
+        Returns:
+            Number of logs backfilled
+        """
+        backfilled = 0
+        while True:
+            with self._lock:
+                try:
+                    with self._get_connection() as conn:
+                        rows = conn.execute(
+                            "SELECT logs.id, logs.status, logs.summary, log_details.details "
+                            "FROM logs LEFT JOIN log_details ON log_details.id = logs.id "
+                            "WHERE logs.type = 'scan' AND logs.scanned_files IS NULL LIMIT ?",
+                            (BACKFILL_BATCH_SIZE,),
+                        ).fetchall()
+                        updates = []
+                        for log_id, status, summary, details in rows:
+                            counts = parse(status, summary, details or "")
+                            updates.append(
+                                (
+                                    counts["scanned_files"],
+                                    counts["scanned_dirs"],
+                                    counts["infected_count"],
+                                    log_id,
+                                )
+                            )
+                        conn.executemany(
+                            "UPDATE logs SET scanned_files = ?, scanned_dirs = ?, "
+                            "infected_count = ? WHERE id = ?",
+                            updates,
+                        )
+                except sqlite3.Error as e:
+                    logger.error("Failed to backfill scan counts in %s: %s", self._db_path, e)
+                    return backfilled
+            backfilled += len(rows)
+            if len(rows) < BACKFILL_BATCH_SIZE:
+                return backfilled
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close_all()
+
+
+def open_log_database(db_path: str) -> LogDatabase | None:
+    """
+    Open the log database.
+
+    Args:
+        db_path: Path of the database file
+
+    Returns:
+        The database, or None if it cannot be opened
+    """
+    try:
+        return LogDatabase(db_path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Cannot open log database %s, keeping logs as files: %s", db_path, e)
+        return None
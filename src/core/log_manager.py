@@ -133,24 +133,30 @@ For implementation details, see: src/core/sanitize.py
 
 import contextlib
 import csv
+import fcntl
 import io
 import json
 import logging
+import mmap
 import os
 import random
 import re
 import subprocess
 import tempfile
 import threading
+import time
 import uuid
-from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
-from gi.repository import GLib
+from gi.repository import Gio, GLib
 
+from .clipboard import format_size
+from .log_database import LogDatabase, open_log_database
 from .sanitize import sanitize_log_line, sanitize_log_text
 from .utils import is_flatpak, which_host_command, wrap_host_command
 
@@ -214,6 +220,86 @@ def _extract_index_fields(file_path: Path) -> dict[str, str] | None:
         return None
 
 
+# Pre-compiled regex patterns for reading counts from the text of scan logs
+# written before LogEntry had typed count fields
+FILES_SCANNED_PATTERNS = [
+    re.compile(r"(\d+)\s*files?\s*scanned", re.IGNORECASE),
+    re.compile(r"scanned\s*(\d+)\s*files?", re.IGNORECASE),
+    re.compile(r"files[:\s]+(\d+)", re.IGNORECASE),
+    re.compile(r"(\d+)\s*files?", re.IGNORECASE),
+]
+
+THREATS_FOUND_PATTERNS = [
+    re.compile(r"(\d+)\s*(?:threats?|infections?|infected)", re.IGNORECASE),
+    re.compile(r"found\s*(\d+)", re.IGNORECASE),
+    re.compile(r"detected\s*(\d+)", re.IGNORECASE),
+]
+
+DIRS_SCANNED_PATTERNS = [
+    re.compile(r"director(?:y|ies)\s+scanned[:\s]+(\d+)", re.IGNORECASE),
+    re.compile(r"(\d+)\s*director(?:y|ies)\s*scanned", re.IGNORECASE),
+    re.compile(r"scanned\s*(\d+)\s*director(?:y|ies)", re.IGNORECASE),
+    re.compile(r"director(?:y|ies)[:\s]+(\d+)", re.IGNORECASE),
+    re.compile(r"(\d+)\s*director(?:y|ies)", re.IGNORECASE),
+]
+
+
+def count_in_text(patterns: list[re.Pattern], text: str) -> int | None:
+    """
+    Read a count from log text with the first of several patterns that matches.
+
+    Args:
+        patterns: Patterns whose first group is the count, most specific first
+        text: Summary and details of a log
+
+    Returns:
+        The count, or None if no pattern matches
+    """
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            try:
+                return int(match.group(1))
+            except (ValueError, IndexError):
+                continue
+    return None
+
+
+def parse_scan_counts(status: str, summary: str, details: str) -> dict[str, int]:
+    """
+    Read the counts of a scan log from its text.
+
+    Used once per log to backfill the typed count fields of logs written by
+    earlier versions.
+
+    Args:
+        status: Status of the scan
+        summary: Summary of the log
+        details: Details of the log
+
+    Returns:
+        Dict with scanned_files, scanned_dirs and infected_count; an infected
+        scan without a readable threat count counts as one threat
+    """
+    text = f"{summary} {details}"
+    infected_count = 0
+    if status == "infected":
+        found = count_in_text(THREATS_FOUND_PATTERNS, text)
+        infected_count = 1 if found is None else found
+    return {
+        "scanned_files": count_in_text(FILES_SCANNED_PATTERNS, text) or 0,
+        "scanned_dirs": count_in_text(DIRS_SCANNED_PATTERNS, text) or 0,
+        "infected_count": infected_count,
+    }
+
+
+def _typed_count(value: object) -> int | None:
+    """Get a stored count, or None if it is missing or not a count."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        return None
+    return value
+
+
 class LogType(Enum):
     """Type of log entry."""
 
@@ -244,6 +330,14 @@ class LogEntry:
     path: str | None = None  # Scanned path (for scans)
     duration: float = 0.0  # Operation duration in seconds
     scheduled: bool = False  # Whether this was a scheduled automatic scan
+    scanned_bytes: int = 0  # Size of the scanned files (for scans, 0 if unknown)
+    backend: str | None = None  # Scan backend that ran the scan ("clamscan", "daemon", ...)
+    # Counts of a scan; None for other logs and for scan logs not yet backfilled
+    scanned_files: int | None = None
+    scanned_dirs: int | None = None
+    infected_count: int | None = None
+    skipped_count: int | None = None  # Files that could not be scanned
+    timings: dict[str, float] = field(default_factory=dict)  # Seconds per scan phase
 
     @classmethod
     def create(
@@ -255,6 +349,13 @@ class LogEntry:
         path: str | None = None,
         duration: float = 0.0,
         scheduled: bool = False,
+        scanned_bytes: int = 0,
+        backend: str | None = None,
+        scanned_files: int | None = None,
+        scanned_dirs: int | None = None,
+        infected_count: int | None = None,
+        skipped_count: int | None = None,
+        timings: dict[str, float] | None = None,
     ) -> "LogEntry":
         """
         Create a new LogEntry with auto-generated id and timestamp.
@@ -267,6 +368,13 @@ class LogEntry:
             path: Scanned path (for scan operations)
             duration: Operation duration in seconds
             scheduled: Whether this was a scheduled automatic scan
+            scanned_bytes: Size of the scanned files (for scan operations)
+            backend: Scan backend that ran the scan (for scan operations)
+            scanned_files: Number of files scanned (for scan operations)
+            scanned_dirs: Number of directories scanned (for scan operations)
+            infected_count: Number of infections found (for scan operations)
+            skipped_count: Number of files that could not be scanned
+            timings: Seconds spent in each phase of the scan, e.g. "walk"
 
         Returns:
             New LogEntry instance
@@ -281,6 +389,13 @@ class LogEntry:
             path=sanitize_log_line(path) if path else None,
             duration=duration,
             scheduled=scheduled,
+            scanned_bytes=scanned_bytes,
+            backend=backend,
+            scanned_files=scanned_files,
+            scanned_dirs=scanned_dirs,
+            infected_count=infected_count,
+            skipped_count=skipped_count,
+            timings=dict(timings or {}),
         )
 
     def to_dict(self) -> dict:
@@ -288,21 +403,40 @@ class LogEntry:
         return asdict(self)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "LogEntry":
+    def from_dict(cls, data: dict, with_details: bool = True) -> "LogEntry":
         """
         Create LogEntry from dictionary.
 
         Sanitizes fields when deserializing from JSON to protect against
         tampering with stored log files or reading maliciously crafted log entries.
+
+        Args:
+            data: The stored log
+            with_details: False leaves the details empty, except of scan logs
+                saved without their counts, which are counted from the details
         """
         # Extract and sanitize fields
         # IDs and timestamps are system-controlled, don't need sanitization
         # Type and status should be controlled enums but sanitize for defense in depth
         raw_summary = data.get("summary", "")
-        raw_details = data.get("details", "")
+        raw_details = data.get("details") or ""
         raw_status = data.get("status", "unknown")
         raw_type = data.get("type", "unknown")
         raw_path = data.get("path")
+        raw_backend = data.get("backend")
+        scanned_bytes = data.get("scanned_bytes", 0)
+        raw_timings = data.get("timings")
+        timings = {
+            sanitize_log_line(phase): float(seconds)
+            for phase, seconds in (raw_timings.items() if isinstance(raw_timings, dict) else ())
+            if isinstance(phase, str)
+            and isinstance(seconds, int | float)
+            and not isinstance(seconds, bool)
+        }
+
+        scanned_files = _typed_count(data.get("scanned_files"))
+        if not with_details and (raw_type != "scan" or scanned_files is not None):
+            raw_details = ""
 
         return cls(
             id=data.get("id", str(uuid.uuid4())),
@@ -314,6 +448,13 @@ class LogEntry:
             path=sanitize_log_line(raw_path) if raw_path else None,
             duration=data.get("duration", 0.0),
             scheduled=data.get("scheduled", False),
+            scanned_bytes=scanned_bytes if isinstance(scanned_bytes, int) else 0,
+            backend=sanitize_log_line(raw_backend) if raw_backend else None,
+            scanned_files=scanned_files,
+            scanned_dirs=_typed_count(data.get("scanned_dirs")),
+            infected_count=_typed_count(data.get("infected_count")),
+            skipped_count=_typed_count(data.get("skipped_count")),
+            timings=timings,
         )
 
     @classmethod
@@ -330,6 +471,19 @@ class LogEntry:
         stdout: str = "",
         suffix: str = "",
         scheduled: bool = False,
+        cached_files: int = 0,
+        duplicate_files: int = 0,
+        trusted_files: int = 0,
+        trusted_bytes: int = 0,
+        unscanned_files: int = 0,
+        limited_files: int = 0,
+        scanned_bytes: int = 0,
+        backend: str | None = None,
+        load_decisions: list[str] | None = None,
+        skipped_mounts: list[str] | None = None,
+        device_boundaries: list[str] | None = None,
+        skipped_count: int = 0,
+        timings: dict[str, float] | None = None,
     ) -> "LogEntry":
         """
         Create a LogEntry from scan result data.
@@ -349,6 +503,25 @@ class LogEntry:
             stdout: Raw stdout from scan command
             suffix: Optional suffix for summary (e.g., "(daemon)")
             scheduled: Whether this was a scheduled scan
+            cached_files: Number of unchanged files skipped thanks to a cached
+                          clean verdict
+            duplicate_files: Number of hardlinked or identical files covered
+                             by the verdict of another file
+            trusted_files: Number of unmodified package files skipped
+            trusted_bytes: Size of the skipped package files
+            unscanned_files: Number of lower-risk files a risk order cap
+                             left unscanned
+            limited_files: Number of files outside the profile's size, type
+                           or depth limits
+            scanned_bytes: Size of the scanned files, 0 if unknown
+            backend: Scan backend that ran the scan ("clamscan", "daemon" or
+                     "user_daemon")
+            load_decisions: Level changes of the load governor, if it
+                            throttled or paused the scan
+            skipped_mounts: Mounted filesystems the walk did not enter
+            device_boundaries: Mounts on other devices the walk entered
+            skipped_count: Number of files that could not be scanned
+            timings: Seconds spent in each phase of the scan, e.g. "walk"
 
         Returns:
             New LogEntry instance
@@ -359,7 +532,6 @@ class LogEntry:
         sanitized_path = sanitize_log_line(path)
         sanitized_suffix = sanitize_log_line(suffix)
         sanitized_error_message = sanitize_log_line(error_message) if error_message else None
-        sanitized_stdout = sanitize_log_text(stdout)
 
         # Build summary based on status
         suffix_str = f" {sanitized_suffix}" if sanitized_suffix else ""
@@ -380,6 +552,19 @@ class LogEntry:
         details_parts = []
         if scanned_files > 0:
             details_parts.append(f"Scanned: {scanned_files} files, {scanned_dirs} directories")
+        if cached_files > 0:
+            details_parts.append(f"Unchanged since last clean scan: {cached_files} files")
+        if trusted_files > 0:
+            details_parts.append(
+                f"Unmodified package files skipped: {trusted_files} files"
+                f" ({format_size(trusted_bytes)})"
+            )
+        if duplicate_files > 0:
+            details_parts.append(f"Duplicates of scanned files: {duplicate_files} files")
+        if unscanned_files > 0:
+            details_parts.append(f"Not scanned (scan cap reached): {unscanned_files} files")
+        if limited_files > 0:
+            details_parts.append(f"Outside the profile's limits: {limited_files} files")
         if infected_count > 0:
             details_parts.append(f"Threats found: {infected_count}")
             for threat in threat_details:
@@ -389,9 +574,22 @@ class LogEntry:
                 sanitized_file_path = sanitize_log_line(raw_file_path)
                 sanitized_threat_name = sanitize_log_line(raw_threat_name)
                 details_parts.append(f"  - {sanitized_file_path}: {sanitized_threat_name}")
+                details_parts.extend(
+                    f"    also at {sanitize_log_line(alias)}" for alias in threat.get("aliases", [])
+                )
         if sanitized_error_message:
             details_parts.append(f"Error: {sanitized_error_message}")
-        details = "\n".join(details_parts) if details_parts else sanitized_stdout or ""
+        # Raw output only serves as details when nothing structured was found,
+        # so it is only sanitized then
+        details = "\n".join(details_parts) if details_parts else sanitize_log_text(stdout) or ""
+        for heading, lines in (
+            ("Skipped mounts:", skipped_mounts),
+            ("Filesystems crossed:", device_boundaries),
+            ("Load governor:", load_decisions),
+        ):
+            if lines:
+                section = [heading, *(f"  - {sanitize_log_line(line)}" for line in lines)]
+                details = "\n".join([details, *section]) if details else "\n".join(section)
 
         return cls.create(
             log_type="scan",
@@ -401,6 +599,13 @@ class LogEntry:
             path=sanitized_path,
             duration=duration,
             scheduled=scheduled,
+            scanned_bytes=scanned_bytes,
+            backend=backend,
+            scanned_files=scanned_files,
+            scanned_dirs=scanned_dirs,
+            infected_count=infected_count,
+            skipped_count=skipped_count,
+            timings=timings,
         )
 
     @classmethod
@@ -501,15 +706,98 @@ class LogEntry:
         )
 
 
+@dataclass
+class LogSummary:
+    """The fields of a log entry shown in log lists, without its details."""
+
+    id: str
+    timestamp: str
+    type: str
+    status: str
+    summary: str
+    path: str | None = None
+    duration: float = 0.0
+    scheduled: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogSummary":
+        """
+        Create LogSummary from a stored log dictionary.
+
+        Sanitizes fields like LogEntry.from_dict(); the details are neither
+        read nor sanitized.
+        """
+        raw_path = data.get("path")
+        return cls(
+            id=data.get("id", str(uuid.uuid4())),
+            timestamp=data.get("timestamp", datetime.now().isoformat()),
+            type=sanitize_log_line(data.get("type", "unknown")),
+            status=sanitize_log_line(data.get("status", "unknown")),
+            summary=sanitize_log_line(data.get("summary", "")),
+            path=sanitize_log_line(raw_path) if raw_path else None,
+            duration=data.get("duration", 0.0),
+            scheduled=data.get("scheduled", False),
+        )
+
+
 # Common locations for clamd log files
 CLAMD_LOG_PATHS = [
     "/var/log/clamav/clamd.log",
     "/var/log/clamd.log",
 ]
 
-# Index file for optimized log retrieval
+# Database holding the logs
+DATABASE_FILENAME = "logs.db"
+
+# Index file for optimized log retrieval from JSON log files
 INDEX_FILENAME = "log_index.json"
 
+# Append-only journal of index changes since the index file was last written
+INDEX_JOURNAL_FILENAME = "log_index.journal"
+
+# Journal size above which it is folded into the index file
+INDEX_JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# Bounds of the entry lines in the index file
+_INDEX_ENTRIES_OPEN = b'"entries": ['
+_INDEX_ENTRIES_CLOSE = b"]}"
+
+# Lock file serializing access to the logs across processes (the GUI and
+# clamui-scheduled-scan)
+LOCK_FILENAME = ".log.lock"
+
+# Delay collecting a burst of log directory changes into one notification
+CHANGE_NOTIFY_DELAY_MS = 500
+
+# A directory modified this recently may still change within the same mtime
+# tick, so its validation is not remembered
+_RACY_MTIME_NS = 2_000_000_000
+
+# JSON log files moved into the database per transaction
+MIGRATION_BATCH_SIZE = 500
+
+# Suffix of the compressed full scan output kept next to a log entry
+OUTPUT_SUFFIX = ".output.gz"
+
+# Prefix of output files still being written by a running scan
+OUTPUT_TEMP_PREFIX = ".scan-output-"
+
+
+def _is_log_store_file(name: str) -> bool:
+    """
+    Check whether a file in the log directory holds stored logs.
+
+    Args:
+        name: File name
+
+    Returns:
+        True for the database and its write-ahead log, and for JSON log files
+        (not the index or its temporary files)
+    """
+    if name in (DATABASE_FILENAME, f"{DATABASE_FILENAME}-wal"):
+        return True
+    return name.endswith(".json") and not name.startswith(INDEX_FILENAME.removesuffix(".json"))
+
 
 class LogManager:
     """
@@ -518,6 +806,11 @@ class LogManager:
     Provides methods for saving scan/update logs, retrieving historical logs,
     and accessing clamd daemon logs.
 
+    Logs are stored in an SQLite database (logs.db, see LogDatabase). Logs
+    written as one JSON file each by earlier versions are moved into it on
+    first access. If the database cannot be opened, logs are kept as JSON
+    files with an index instead.
+
     Index Schema:
         The log index file (log_index.json) contains metadata for fast log retrieval:
         {
@@ -527,14 +820,21 @@ class LogManager:
                 ...
             ]
         }
+
+        Saving or deleting a log appends one line to log_index.journal instead
+        of rewriting the index: an entry as above, or {"id": ..., "deleted": true}.
+        The journal is replayed over the index file when loading, and folded
+        into it once it grows past INDEX_JOURNAL_COMPACT_BYTES.
     """
 
-    def __init__(self, log_dir: str | None = None):
+    def __init__(self, log_dir: str | None = None, use_database: bool = True):
         """
         Initialize the LogManager.
 
         Args:
             log_dir: Optional custom log directory. Defaults to XDG_DATA_HOME/clamui/logs
+            use_database: Store logs in the SQLite database; False keeps them as
+                JSON files
         """
         if log_dir:
             self._log_dir = Path(log_dir)
@@ -548,9 +848,59 @@ class LogManager:
         # Flag to track if migration check has been performed
         self._migration_checked = False
 
+        # (directory mtime, entry count) of the last index found valid
+        self._validated_state: tuple[int, int] | None = None
+
         # Ensure log directory exists
         self._ensure_log_dir()
 
+        # Log database, or None when logs are kept as JSON files
+        self._db: LogDatabase | None = (
+            open_log_database(str(self._log_dir / DATABASE_FILENAME)) if use_database else None
+        )
+
+    @contextlib.contextmanager
+    def _store_lock(self) -> Iterator[None]:
+        """
+        Hold the thread lock and an exclusive advisory lock on the log directory.
+
+        The fcntl lock keeps the GUI and clamui-scheduled-scan from interleaving
+        index updates. If it cannot be taken (e.g. on a file system without
+        locking), only threads of this process are excluded.
+        """
+        with self._lock:
+            fd = None
+            try:
+                fd = os.open(self._log_dir / LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.debug("Cannot lock log directory %s: %s", self._log_dir, e)
+            try:
+                yield
+            finally:
+                if fd is not None:
+                    # Closing the descriptor releases the lock
+                    os.close(fd)
+
+    @contextlib.contextmanager
+    def _read_lock(self) -> Iterator[None]:
+        """
+        Lock the log store for reading.
+
+        SQLite isolates its readers from writers in any process, so once the
+        JSON logs have been migrated, reads from the database take no lock and
+        never wait for a scan saving its log. Reads of JSON logs may rebuild
+        the index and hold the store lock.
+        """
+        if self._db is None:
+            with self._store_lock():
+                yield
+            return
+        if not self._migration_checked:
+            with self._store_lock():
+                self._check_and_run_migration_unlocked()
+        yield
+
     def _ensure_log_dir(self) -> None:
         """Ensure the log directory exists."""
         try:
@@ -568,9 +918,19 @@ class LogManager:
         """
         return self._log_dir / INDEX_FILENAME
 
+    @property
+    def _journal_path(self) -> Path:
+        """
+        Get the path to the log index journal.
+
+        Returns:
+            Path object pointing to log_index.journal in the log directory
+        """
+        return self._log_dir / INDEX_JOURNAL_FILENAME
+
     def _load_index(self) -> dict:
         """
-        Load the log index from file.
+        Load the log index from file and replay its journal.
 
         Returns a dictionary with 'version' and 'entries' keys. If the file doesn't
         exist or is corrupted, returns an empty structure with version 1 and empty entries list.
@@ -578,22 +938,127 @@ class LogManager:
         Returns:
             Dictionary with structure: {"version": 1, "entries": [...]}
         """
+        data = {"version": 1, "entries": []}
         try:
-            if self._index_path.exists():
-                with open(self._index_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Validate structure has required keys
-                    if isinstance(data, dict) and "version" in data and "entries" in data:
-                        return data
-            # File doesn't exist or invalid structure - return empty index
-            return {"version": 1, "entries": []}
-        except (OSError, json.JSONDecodeError, PermissionError) as e:
+            loaded = self._read_index_file()
+        except (OSError, ValueError) as e:
+            # A damaged index is rebuilt rather than patched up by the journal
             logger.debug("Failed to load log index: %s", e)
-            return {"version": 1, "entries": []}
+            return data
+        if loaded is not None:
+            # Validate structure has required keys
+            if not (isinstance(loaded, dict) and "version" in loaded and "entries" in loaded):
+                return data
+            data = loaded
+
+        records = self._read_journal()
+        if not records:
+            return data
+
+        # Replaying is idempotent, so records already folded into the index
+        # file (by a compaction interrupted before the journal was removed)
+        # do no harm
+        entries = {entry.get("id"): entry for entry in data["entries"]}
+        for record in records:
+            if record.get("deleted"):
+                entries.pop(record["id"], None)
+            else:
+                entries[record["id"]] = record
+        data["entries"] = list(entries.values())
+        return data
+
+    def _read_index_file(self) -> object | None:
+        """
+        Read the index file through a memory map.
+
+        _save_index writes the index as JSON with one entry per line, so the
+        entries are parsed line by line from the map. Index files written
+        with indent=2 by older versions are parsed whole.
+
+        Returns:
+            The parsed index, or None if there is no index file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        try:
+            with (
+                open(self._index_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                header = mapped.readline()
+                if not header.rstrip().endswith(_INDEX_ENTRIES_OPEN):
+                    return json.loads(mapped[:])
+                data = json.loads(header.rstrip() + b"]}")
+                for line in iter(mapped.readline, b""):
+                    line = line.rstrip()
+                    if line == _INDEX_ENTRIES_CLOSE:
+                        return data
+                    data["entries"].append(json.loads(line.removesuffix(b",")))
+        except FileNotFoundError:
+            return None
+        raise ValueError("truncated index file")
+
+    def _read_journal(self) -> list[dict]:
+        """
+        Read the records of the index journal through a memory map.
+
+        Returns:
+            Journal records in the order they were written; lines that are
+            not valid records (a write cut short by a crash) are skipped
+        """
+        records = []
+        try:
+            with open(self._journal_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return records
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for line in iter(mapped.readline, b""):
+                        try:
+                            record = json.loads(line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                        if isinstance(record, dict) and isinstance(record.get("id"), str):
+                            records.append(record)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug("Failed to read log index journal: %s", e)
+        return records
+
+    def _append_index_record(self, record: dict) -> bool:
+        """
+        Append a change to the index journal, compacting it when due.
+
+        Without an index file, or once the journal has grown past
+        INDEX_JOURNAL_COMPACT_BYTES, the journal is folded into the index file.
+
+        Args:
+            record: An index entry, or {"id": ..., "deleted": True}
+
+        Returns:
+            True if the change was recorded, False otherwise
+        """
+        try:
+            fd = os.open(self._journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                # One write() per record, so concurrent appends never interleave
+                os.write(fd, (json.dumps(record) + "\n").encode("utf-8"))
+                journal_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug("Failed to append to log index journal: %s", e)
+            return False
+
+        if journal_size > INDEX_JOURNAL_COMPACT_BYTES or not self._index_path.exists():
+            self._save_index(self._load_index())
+        return True
 
     def _save_index(self, index_data: dict) -> bool:
         """
-        Atomically save the log index to file.
+        Atomically save the log index to file and drop the journal.
 
         Uses a temporary file and rename pattern to prevent corruption
         during write operations (crash safety).
@@ -615,12 +1080,23 @@ class LogManager:
                 dir=self._log_dir,
             )
             try:
+                header = {key: value for key, value in index_data.items() if key != "entries"}
+                entries = index_data.get("entries", [])
                 with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(index_data, f, indent=2)
+                    # One entry per line, for _read_index_file
+                    f.write(json.dumps(header)[:-1].rstrip())
+                    f.write((", " if header else "") + _INDEX_ENTRIES_OPEN.decode() + "\n")
+                    for position, entry in enumerate(entries, 1):
+                        f.write(json.dumps(entry) + (",\n" if position < len(entries) else "\n"))
+                    f.write(_INDEX_ENTRIES_CLOSE.decode() + "\n")
 
                 # Atomic rename
                 temp_path_obj = Path(temp_path)
                 temp_path_obj.replace(self._index_path)
+
+                # The index file now holds everything the journal recorded
+                with contextlib.suppress(OSError):
+                    self._journal_path.unlink(missing_ok=True)
                 return True
             except Exception as e:
                 # Clean up temp file on failure
@@ -641,6 +1117,9 @@ class LogManager:
         - Entry count mismatch (index entries vs actual log files)
         - Missing referenced files (>20% of indexed files don't exist)
 
+        Listing the directory is skipped while it has not been modified since
+        an index with the same number of entries was found valid.
+
         Args:
             index_data: The loaded index data
 
@@ -652,6 +1131,11 @@ class LogManager:
                 # No log directory means index should be empty
                 return len(index_data.get("entries", [])) == 0
 
+            dir_mtime = self._log_dir.stat().st_mtime_ns
+            state = (dir_mtime, len(index_data.get("entries", [])))
+            if state == self._validated_state:
+                return True
+
             # Single glob() call, convert to set of stems for O(1) membership testing
             # This avoids multiple filesystem syscalls for individual exists() checks
             actual_file_stems = {
@@ -687,6 +1171,8 @@ class LogManager:
                 if missing_percentage > 20:
                     return False
 
+            if time.time_ns() - dir_mtime > _RACY_MTIME_NS:
+                self._validated_state = state
             return True
 
         except Exception as e:
@@ -760,7 +1246,7 @@ class LogManager:
         Returns:
             True if rebuilt successfully, False otherwise
         """
-        with self._lock:
+        with self._store_lock():
             try:
                 index_data = self._rebuild_index_unlocked()
                 return self._save_index(index_data)
@@ -778,7 +1264,10 @@ class LogManager:
         Returns:
             True if saved successfully, False otherwise
         """
-        with self._lock:
+        with self._store_lock():
+            if self._db is not None:
+                self._check_and_run_migration_unlocked()
+                return self._db.add_entries([entry.to_dict()])
             try:
                 self._ensure_log_dir()
                 log_file = self._log_dir / f"{entry.id}.json"
@@ -791,15 +1280,13 @@ class LogManager:
 
                 # Update index with new entry metadata (best-effort)
                 try:
-                    index_data = self._load_index()
-                    index_data["entries"].append(
+                    self._append_index_record(
                         {
                             "id": entry.id,
                             "timestamp": entry.timestamp,
                             "type": entry.type,
                         }
                     )
-                    self._save_index(index_data)
                 except Exception as e:
                     # Index update failed, but log file was saved successfully
                     # Index can be rebuilt later if needed
@@ -815,16 +1302,30 @@ class LogManager:
         Check and perform index migration on first access (without lock).
 
         Internal method for use by callers that already hold the lock.
-        If no index exists but log files do, rebuilds the index to migrate
-        existing installations to the indexed retrieval system.
+        With the database, moves JSON log files into it and stores the counts
+        of scan logs written before they were typed fields. Otherwise, if no index
+        exists but log files do, rebuilds the index to migrate existing
+        installations to the indexed retrieval system.
         """
         if self._migration_checked:
             return
 
+        if self._db is not None:
+            # Marked checked only once every readable JSON log is moved, as
+            # database reads never look at JSON files; until then, every
+            # access retries under the store lock
+            if not self._migrate_json_logs_unlocked():
+                return
+            backfilled = self._db.backfill_scan_counts(parse_scan_counts)
+            if backfilled:
+                logger.info("Stored the counts of %d earlier scan log(s)", backfilled)
+            self._migration_checked = True
+            return
+
         self._migration_checked = True
 
         # Check if index exists
-        if self._index_path.exists():
+        if self._index_path.exists() or self._journal_path.exists():
             return
 
         # Check if any log files exist - if so, rebuild index
@@ -839,6 +1340,49 @@ class LogManager:
             # If migration fails, continue normally - will fall back to full scan
             logger.debug("Index migration failed: %s", e)
 
+    def _migrate_json_logs_unlocked(self) -> bool:
+        """
+        Move JSON log files into the database (without lock).
+
+        Files are deleted once their batch is committed, together with the
+        index when none are left. Unreadable files stay where they are.
+
+        Returns:
+            True if every readable log was moved, False to retry later
+        """
+        try:
+            log_files = [f for f in self._log_dir.glob("*.json") if f.name != INDEX_FILENAME]
+        except OSError as e:
+            logger.warning("Cannot look for JSON logs to migrate, will retry: %s", e)
+            return False
+
+        migrated = 0
+        failed = 0
+        for start in range(0, len(log_files), MIGRATION_BATCH_SIZE):
+            batch = []
+            for log_file in log_files[start : start + MIGRATION_BATCH_SIZE]:
+                try:
+                    with open(log_file, encoding="utf-8") as f:
+                        batch.append((log_file, LogEntry.from_dict(json.load(f))))
+                except (OSError, json.JSONDecodeError, AttributeError) as e:
+                    logger.debug("Not migrating unreadable log %s: %s", log_file.name, e)
+                    failed += 1
+            if not self._db.add_entries(entry.to_dict() for _log_file, entry in batch):
+                logger.warning("Migrating JSON logs into the database failed, will retry")
+                return False
+            for log_file, _entry in batch:
+                with contextlib.suppress(OSError):
+                    log_file.unlink()
+            migrated += len(batch)
+
+        if not failed:
+            with contextlib.suppress(OSError):
+                self._index_path.unlink(missing_ok=True)
+                self._journal_path.unlink(missing_ok=True)
+        if migrated:
+            logger.info("Moved %d log(s) from JSON files into %s", migrated, DATABASE_FILENAME)
+        return True
+
     def _get_valid_index_unlocked(self) -> dict:
         """
         Load and validate the index, rebuilding if necessary (without lock).
@@ -879,7 +1423,7 @@ class LogManager:
         return index_data
 
     def _filter_and_sort_index_entries(
-        self, entries: list[dict], log_type: str | None, limit: int
+        self, entries: list[dict], log_type: str | None, limit: int, since: str | None = None
     ) -> list[dict]:
         """
         Filter, sort, and limit index entries.
@@ -888,6 +1432,7 @@ class LogManager:
             entries: List of index entry dicts with 'id', 'timestamp', 'type' keys
             log_type: Optional filter by type ("scan" or "update")
             limit: Maximum number of entries to return
+            since: Optional timestamp; only newer entries are kept
 
         Returns:
             Filtered, sorted, and limited list of index entries
@@ -896,21 +1441,27 @@ class LogManager:
         if log_type is not None:
             entries = [entry for entry in entries if entry.get("type") == log_type]
 
+        if since is not None:
+            entries = [entry for entry in entries if entry.get("timestamp", "") > since]
+
         # Sort by timestamp descending (newest first)
         entries.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
 
         # Apply limit
         return entries[:limit]
 
-    def _load_log_entries_by_ids(self, index_entries: list[dict]) -> list[LogEntry]:
+    def _load_log_entries_by_ids(
+        self, index_entries: list[dict], parse: Callable[[dict], Any] = LogEntry.from_dict
+    ) -> list:
         """
         Load LogEntry objects for the given index entries.
 
         Args:
             index_entries: List of index entry dicts with 'id' keys
+            parse: Creates the returned object from a stored log dict
 
         Returns:
-            List of LogEntry objects (skips corrupted/missing files)
+            List of parsed objects (skips corrupted/missing files)
         """
         entries = []
         for index_entry in index_entries:
@@ -922,15 +1473,20 @@ class LogManager:
                 if log_file.exists():
                     with open(log_file, encoding="utf-8") as f:
                         data = json.load(f)
-                        entries.append(LogEntry.from_dict(data))
+                        entries.append(parse(data))
             except (OSError, json.JSONDecodeError):
                 # Skip corrupted or missing files
                 continue
         return entries
 
     def _retrieve_logs_from_index(
-        self, index_data: dict, log_type: str | None, limit: int
-    ) -> list[LogEntry] | None:
+        self,
+        index_data: dict,
+        log_type: str | None,
+        limit: int,
+        since: str | None = None,
+        parse: Callable[[dict], Any] = LogEntry.from_dict,
+    ) -> list | None:
         """
         Retrieve logs using index-based approach.
 
@@ -938,23 +1494,31 @@ class LogManager:
             index_data: Valid index data structure
             log_type: Optional filter by type ("scan" or "update")
             limit: Maximum number of entries to return
+            since: Optional timestamp; only newer logs are returned
+            parse: Creates the returned objects from stored log dicts
 
         Returns:
-            List of LogEntry objects, or None if retrieval fails
+            List of parsed objects, or None if retrieval fails
         """
         if not index_data.get("entries"):
             return None
 
         try:
             filtered_entries = self._filter_and_sort_index_entries(
-                index_data["entries"], log_type, limit
+                index_data["entries"], log_type, limit, since
             )
-            return self._load_log_entries_by_ids(filtered_entries)
+            return self._load_log_entries_by_ids(filtered_entries, parse)
         except Exception as e:
             logger.debug("Index-based retrieval failed, falling back: %s", e)
             return None
 
-    def _retrieve_logs_full_scan(self, log_type: str | None, limit: int) -> list[LogEntry]:
+    def _retrieve_logs_full_scan(
+        self,
+        log_type: str | None,
+        limit: int,
+        since: str | None = None,
+        parse: Callable[[dict], Any] = LogEntry.from_dict,
+    ) -> list:
         """
         Retrieve logs using full directory scan (fallback method).
 
@@ -963,9 +1527,11 @@ class LogManager:
         Args:
             log_type: Optional filter by type ("scan" or "update")
             limit: Maximum number of entries to return
+            since: Optional timestamp; only newer logs are returned
+            parse: Creates the returned objects from stored log dicts
 
         Returns:
-            List of LogEntry objects
+            List of parsed objects
         """
         entries = []
         try:
@@ -980,10 +1546,12 @@ class LogManager:
                 try:
                     with open(log_file, encoding="utf-8") as f:
                         data = json.load(f)
-                        entry = LogEntry.from_dict(data)
+                        entry = parse(data)
 
-                        # Apply type filter if specified
-                        if log_type is None or entry.type == log_type:
+                        # Apply type and time filters if specified
+                        if (log_type is None or entry.type == log_type) and (
+                            since is None or entry.timestamp > since
+                        ):
                             entries.append(entry)
                 except (OSError, json.JSONDecodeError):
                     # Skip corrupted files
@@ -996,25 +1564,81 @@ class LogManager:
         entries.sort(key=lambda e: e.timestamp, reverse=True)
         return entries[:limit]
 
-    def get_logs(self, limit: int = 100, log_type: str | None = None) -> list[LogEntry]:
+    def get_logs(
+        self,
+        limit: int = 100,
+        log_type: str | None = None,
+        since: str | None = None,
+        with_details: bool = True,
+    ) -> list[LogEntry]:
         """
         Retrieve stored log entries, sorted by timestamp (newest first).
 
-        Uses an index file for optimized retrieval. Validates the index and
-        triggers automatic rebuild if stale/invalid. Falls back to full directory
-        scan if the index is missing or corrupted.
+        Queries the database when it is available. Otherwise uses an index file
+        for optimized retrieval. Validates the index and triggers automatic
+        rebuild if stale/invalid. Falls back to full directory scan if the index
+        is missing or corrupted.
 
-        On first access, automatically rebuilds the index if logs exist but no
-        index is present (migration for existing installations).
+        On first access, automatically migrates logs written by earlier versions
+        (into the database, or into the index if no index is present).
 
         Args:
             limit: Maximum number of entries to return
             log_type: Optional filter by type ("scan" or "update")
+            since: Optional timestamp of the newest log already known; only
+                newer logs are returned
+            with_details: False leaves out the details, for callers that only
+                need the counts of scan logs; scan logs saved without their
+                counts keep them
 
         Returns:
             List of LogEntry objects
         """
-        with self._lock:
+        if with_details:
+            return self._query_logs(LogEntry.from_dict, limit, log_type, since, True)
+        return self._query_logs(
+            lambda data: LogEntry.from_dict(data, with_details=False),
+            limit,
+            log_type,
+            since,
+            False,
+        )
+
+    def get_log_summaries(
+        self, limit: int = 100, log_type: str | None = None, since: str | None = None
+    ) -> list[LogSummary]:
+        """
+        Retrieve stored logs without their details, sorted by timestamp (newest first).
+
+        Like get_logs(), for listing logs; get_log_by_id() loads the details
+        of one log when it is shown.
+
+        Args:
+            limit: Maximum number of logs to return
+            log_type: Optional filter by type ("scan" or "update")
+            since: Optional timestamp; only newer logs are returned
+
+        Returns:
+            List of LogSummary objects
+        """
+        return self._query_logs(LogSummary.from_dict, limit, log_type, since, False)
+
+    def _query_logs(
+        self,
+        parse: Callable[[dict], Any],
+        limit: int,
+        log_type: str | None,
+        since: str | None,
+        with_details: bool,
+    ) -> list:
+        """Retrieve stored logs as the objects parse creates from them."""
+        with self._read_lock():
+            if self._db is not None:
+                rows = self._db.get_entries(
+                    limit=limit, log_type=log_type, since=since, with_details=with_details
+                )
+                return [parse(row) for row in rows]
+
             # Perform auto-migration check on first access
             self._check_and_run_migration_unlocked()
 
@@ -1022,18 +1646,19 @@ class LogManager:
             index_data = self._get_valid_index_unlocked()
 
             # Try index-based retrieval first
-            entries = self._retrieve_logs_from_index(index_data, log_type, limit)
+            entries = self._retrieve_logs_from_index(index_data, log_type, limit, since, parse)
             if entries is not None:
                 return entries
 
             # Fallback: full directory scan
-            return self._retrieve_logs_full_scan(log_type, limit)
+            return self._retrieve_logs_full_scan(log_type, limit, since, parse)
 
     def get_logs_async(
         self,
         callback: Callable[[list["LogEntry"]], None],
         limit: int = 100,
         log_type: str | None = None,
+        since: str | None = None,
     ) -> None:
         """
         Retrieve stored log entries asynchronously.
@@ -1045,11 +1670,72 @@ class LogManager:
             callback: Function to call with list of LogEntry objects when loading completes
             limit: Maximum number of entries to return
             log_type: Optional filter by type ("scan" or "update")
+            since: Optional timestamp; only newer logs are returned
+        """
+        self._run_async(
+            lambda: self.get_logs(limit=limit, log_type=log_type, since=since), callback
+        )
+
+    def get_log_summaries_async(
+        self,
+        callback: Callable[[list["LogSummary"]], None],
+        limit: int = 100,
+        log_type: str | None = None,
+        since: str | None = None,
+    ) -> None:
         """
+        Retrieve stored logs without their details asynchronously.
+
+        Runs get_log_summaries() in a background thread and invokes the
+        callback on the main GTK thread via GLib.idle_add when complete.
+
+        Args:
+            callback: Function to call with list of LogSummary objects when loading completes
+            limit: Maximum number of logs to return
+            log_type: Optional filter by type ("scan" or "update")
+            since: Optional timestamp; only newer logs are returned
+        """
+        self._run_async(
+            lambda: self.get_log_summaries(limit=limit, log_type=log_type, since=since),
+            callback,
+        )
+
+    def get_newer_log_summaries_async(
+        self,
+        callback: Callable[[list["LogSummary"] | None], None],
+        newest: "LogSummary",
+        known_count: int,
+        limit: int = 100,
+    ) -> None:
+        """
+        Retrieve the logs saved after a known one asynchronously.
+
+        Logs known to the caller may have been deleted since, e.g. by another
+        process. The callback then receives None instead of a list: when
+        newest no longer exists, or fewer than known_count logs are stored.
+
+        Args:
+            callback: Function to call with the newer LogSummary objects, or None
+            newest: The newest log known to the caller
+            known_count: Number of logs known to the caller
+            limit: Maximum number of logs to return
+        """
+
+        def load() -> list | None:
+            if self.get_log_count() < known_count or not self.has_log(newest.id):
+                return None
+            return self.get_log_summaries(limit=limit, since=newest.timestamp)
+
+        self._run_async(load, callback)
+
+    def _run_async(
+        self, load: Callable[[], list | None], callback: Callable[[list | None], None]
+    ) -> None:
+        """Run a log query in a background thread, passing its result to callback."""
 
         def _load_logs_thread():
             try:
-                entries = self.get_logs(limit=limit, log_type=log_type)
+                entries = load()
             except Exception as e:
                 # On any error, return empty list to ensure callback is always called
                 # This prevents loading state from getting stuck forever
@@ -1062,6 +1748,46 @@ class LogManager:
         thread.daemon = True
         thread.start()
 
+    def monitor_changes(self, callback: Callable[[], None]) -> Gio.FileMonitor | None:
+        """
+        Watch the log directory for logs written by any process.
+
+        Uses a GIO directory monitor (inotify on Linux). A burst of changes,
+        like the files of one saved log, results in a single callback
+        CHANGE_NOTIFY_DELAY_MS later on the main thread. Keep the returned
+        monitor referenced, and cancel() it to stop watching.
+
+        Args:
+            callback: Called without arguments when logs may have changed
+
+        Returns:
+            The monitor, or None if the directory cannot be watched
+        """
+        pending_id: int | None = None
+
+        def _notify() -> bool:
+            nonlocal pending_id
+            pending_id = None
+            callback()
+            return False
+
+        def _on_changed(_monitor, changed_file, _other_file, _event_type) -> None:
+            nonlocal pending_id
+            name = changed_file.get_basename() if changed_file is not None else None
+            if not name or not _is_log_store_file(name) or pending_id is not None:
+                return
+            pending_id = GLib.timeout_add(CHANGE_NOTIFY_DELAY_MS, _notify)
+
+        try:
+            monitor = Gio.File.new_for_path(str(self._log_dir)).monitor_directory(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except GLib.Error as e:
+            logger.debug("Cannot watch log directory %s: %s", self._log_dir, e)
+            return None
+        monitor.connect("changed", _on_changed)
+        return monitor
+
     def get_log_by_id(self, log_id: str) -> LogEntry | None:
         """
         Retrieve a specific log entry by ID.
@@ -1072,7 +1798,10 @@ class LogManager:
         Returns:
             LogEntry if found, None otherwise
         """
-        with self._lock:
+        with self._read_lock():
+            if self._db is not None:
+                row = self._db.get_entry(log_id)
+                return LogEntry.from_dict(row) if row else None
             try:
                 log_file = self._log_dir / f"{log_id}.json"
                 if log_file.exists():
@@ -1083,6 +1812,21 @@ class LogManager:
                 logger.debug("Failed to load log by id %s: %s", log_id, e)
         return None
 
+    def has_log(self, log_id: str) -> bool:
+        """
+        Check whether a log entry exists, without loading its details.
+
+        Args:
+            log_id: The UUID of the log entry
+
+        Returns:
+            True if the log entry is stored, False otherwise
+        """
+        with self._read_lock():
+            if self._db is not None:
+                return self._db.has_entry(log_id)
+            return (self._log_dir / f"{log_id}.json").exists()
+
     def delete_log(self, log_id: str) -> bool:
         """
         Delete a specific log entry and remove it from the index.
@@ -1093,7 +1837,14 @@ class LogManager:
         Returns:
             True if deleted successfully, False otherwise
         """
-        with self._lock:
+        with self._store_lock():
+            if self._db is not None:
+                self._check_and_run_migration_unlocked()
+                if not self._db.delete_entry(log_id):
+                    return False
+                with contextlib.suppress(OSError):
+                    (self._log_dir / f"{log_id}{OUTPUT_SUFFIX}").unlink(missing_ok=True)
+                return True
             try:
                 log_file = self._log_dir / f"{log_id}.json"
                 if log_file.exists():
@@ -1101,16 +1852,15 @@ class LogManager:
 
                     # Update index by removing the deleted entry (best-effort)
                     try:
-                        index_data = self._load_index()
-                        index_data["entries"] = [
-                            entry for entry in index_data["entries"] if entry.get("id") != log_id
-                        ]
-                        self._save_index(index_data)
+                        self._append_index_record({"id": log_id, "deleted": True})
                     except Exception as e:
                         # Index update failed, but log file was deleted successfully
                         # Index can be rebuilt later if needed
                         logger.debug("Index update failed after deleting log: %s", e)
 
+                    with contextlib.suppress(OSError):
+                        (self._log_dir / f"{log_id}{OUTPUT_SUFFIX}").unlink(missing_ok=True)
+
                     return True
             except OSError as e:
                 logger.debug("Failed to delete log %s: %s", log_id, e)
@@ -1118,12 +1868,14 @@ class LogManager:
 
     def clear_logs(self) -> bool:
         """
-        Clear all stored log entries and reset the index.
+        Clear all stored log entries, their output files and the index.
 
         Returns:
             True if cleared successfully, False otherwise
         """
-        with self._lock:
+        with self._store_lock():
+            if self._db is not None and not self._db.clear():
+                return False
             try:
                 if self._log_dir.exists():
                     for log_file in self._log_dir.glob("*.json"):
@@ -1132,6 +1884,15 @@ class LogManager:
                             continue
                         with contextlib.suppress(OSError):
                             log_file.unlink()
+                    for output_file in self._log_dir.glob(f"*{OUTPUT_SUFFIX}"):
+                        with contextlib.suppress(OSError):
+                            output_file.unlink()
+
+                if self._db is not None:
+                    with contextlib.suppress(OSError):
+                        self._index_path.unlink(missing_ok=True)
+                        self._journal_path.unlink(missing_ok=True)
+                    return True
 
                 # Reset index to empty state (best-effort)
                 try:
@@ -1146,17 +1907,74 @@ class LogManager:
                 logger.warning("Failed to clear logs: %s", e)
                 return False
 
+    def create_output_file(self) -> str | None:
+        """
+        Create a file for a running scan to write its full output to.
+
+        The file is attached to the scan's log entry with attach_output()
+        once the entry has been saved.
+
+        Returns:
+            Path of the new file, or None if it could not be created
+        """
+        try:
+            self._ensure_log_dir()
+            fd, path = tempfile.mkstemp(
+                prefix=OUTPUT_TEMP_PREFIX, suffix=OUTPUT_SUFFIX, dir=self._log_dir
+            )
+            os.close(fd)
+        except OSError as e:
+            logger.warning("Failed to create scan output file: %s", e)
+            return None
+        return path
+
+    def attach_output(self, log_id: str, output_path: str) -> bool:
+        """
+        Store a scan's full output file next to its log entry.
+
+        Args:
+            log_id: The UUID of the saved log entry
+            output_path: File created by create_output_file()
+
+        Returns:
+            True if the file was moved into place, False otherwise
+        """
+        try:
+            os.replace(output_path, self._log_dir / f"{log_id}{OUTPUT_SUFFIX}")
+            return True
+        except OSError as e:
+            logger.warning("Failed to store scan output for log %s: %s", log_id, e)
+            with contextlib.suppress(OSError):
+                os.unlink(output_path)
+            return False
+
+    def get_log_output_path(self, log_id: str) -> str | None:
+        """
+        Get the full output file stored with a log entry.
+
+        Args:
+            log_id: The UUID of the log entry
+
+        Returns:
+            Path to the gzip-compressed output, or None if none was kept
+        """
+        output_file = self._log_dir / f"{log_id}{OUTPUT_SUFFIX}"
+        return str(output_file) if output_file.exists() else None
+
     def get_log_count(self) -> int:
         """
         Get the total number of stored logs.
 
-        Uses the index for O(1) performance when available. Falls back to
-        directory globbing if the index is missing or corrupted.
+        Counts the rows of the database when it is available. Otherwise uses
+        the index for O(1) performance, falling back to directory globbing if
+        the index is missing or corrupted.
 
         Returns:
             Number of log entries
         """
-        with self._lock:
+        with self._read_lock():
+            if self._db is not None:
+                return self._db.count()
             try:
                 if not self._log_dir.exists():
                     return 0
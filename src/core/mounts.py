@@ -0,0 +1,348 @@
+# ClamUI Mounts Module
+"""
+Filesystem-aware traversal policy for ClamUI.
+
+A scan of / used to descend into every mounted filesystem: /proc and /sys,
+whose files are generated by the kernel and can block or be endless, network
+shares that turn a local scan into a slow remote one, and FUSE mounts such as
+the document portal. This module reads the mount table from
+/proc/self/mountinfo and decides, for every mount point a walk reaches,
+whether it is entered:
+
+- Pseudo filesystems (proc, sysfs, cgroup, ...) are skipped unless the
+  "scan_skip_pseudo_filesystems" setting is off
+- Remote and FUSE filesystems (nfs, cifs, sshfs, ...) are skipped unless the
+  "scan_skip_remote_filesystems" setting is off; fuseblk, which FUSE drivers
+  of local disks use, counts as local
+- In one-file-system mode ("scan_one_file_system" or a profile's
+  "one_file_system" option), no mount point below the scan target is entered
+
+The scan target itself is always scanned, even if it lies on a skipped
+filesystem: it was chosen explicitly. Mounts that are entered on a different
+device than the target are reported as device boundaries, and ScanWalker
+walks each device on its own thread.
+
+Usage:
+    mounts = MountPolicy.from_settings(settings_manager).filter_for(path)
+    walker = ScanWalker(path, mounts=mounts)
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Mount table of the calling process
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# Filesystems whose files are provided by the kernel, not stored anywhere
+PSEUDO_FILESYSTEMS = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "proc",
+        "pstore",
+        "rpc_pipefs",
+        "securityfs",
+        "selinuxfs",
+        "sysfs",
+        "tracefs",
+    }
+)
+
+# Filesystems whose files live on another machine
+REMOTE_FILESYSTEMS = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "davfs",
+        "glusterfs",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    }
+)
+
+# Reasons a mount is not entered
+REASON_PSEUDO = "pseudo filesystem"
+REASON_REMOTE = "remote filesystem"
+REASON_FUSE = "FUSE filesystem"
+REASON_OTHER_FILESYSTEM = "other filesystem"
+
+
+@dataclass(frozen=True)
+class MountInfo:
+    """A mounted filesystem from /proc/self/mountinfo."""
+
+    mount_point: str
+    device: str  # "major:minor" of the mounted filesystem
+    fstype: str
+    source: str
+
+    def describe(self, path: str | None = None) -> str:
+        """
+        Format the mount for scan results.
+
+        Args:
+            path: Path the walk knows the mount point by, if it differs
+
+        Returns:
+            E.g. "/home (ext4 on /dev/sdb1)"
+        """
+        return f"{path or self.mount_point} ({self.fstype} on {self.source})"
+
+
+def _unescape(field: str) -> str:
+    """Decode the octal escapes (\\040 for a space) of a mountinfo field."""
+    if "\\" not in field:
+        return field
+    parts = field.split("\\")
+    decoded = [parts[0]]
+    for part in parts[1:]:
+        code = part[:3]
+        if len(code) == 3 and all(c in "01234567" for c in code):
+            decoded.append(chr(int(code, 8)) + part[3:])
+        else:
+            decoded.append("\\" + part)
+    return "".join(decoded)
+
+
+def parse_mountinfo(text: str) -> list[MountInfo]:
+    """
+    Parse the contents of a mountinfo file.
+
+    Args:
+        text: Lines in the format of /proc/<pid>/mountinfo
+
+    Returns:
+        Mounts in mount order; malformed lines are skipped
+    """
+    mounts = []
+    for line in text.splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index("-", 6)
+            mounts.append(
+                MountInfo(
+                    mount_point=_unescape(fields[4]),
+                    device=fields[2],
+                    fstype=fields[separator + 1],
+                    source=_unescape(fields[separator + 2]),
+                )
+            )
+        except (ValueError, IndexError):
+            continue
+    return mounts
+
+
+def read_mounts(mountinfo_path: str = MOUNTINFO_PATH) -> list[MountInfo]:
+    """
+    Read the mount table of the calling process.
+
+    Args:
+        mountinfo_path: mountinfo file to read
+
+    Returns:
+        Mounts in mount order, or an empty list if the table is unavailable
+    """
+    try:
+        with open(mountinfo_path, encoding="utf-8", errors="surrogateescape") as f:
+            return parse_mountinfo(f.read())
+    except OSError as e:
+        logger.debug("Cannot read mount table %s: %s", mountinfo_path, e)
+        return []
+
+
+def filesystem_kind(fstype: str) -> str | None:
+    """
+    Classify a filesystem type.
+
+    Args:
+        fstype: Filesystem type from the mount table
+
+    Returns:
+        REASON_PSEUDO, REASON_REMOTE or REASON_FUSE, or None for local storage
+    """
+    if fstype in PSEUDO_FILESYSTEMS:
+        return REASON_PSEUDO
+    if fstype in REMOTE_FILESYSTEMS or fstype.startswith("nfs"):
+        return REASON_REMOTE
+    if fstype == "fuse" or fstype.startswith("fuse."):
+        return REASON_FUSE
+    return None
+
+
+@dataclass(frozen=True)
+class MountPolicy:
+    """Which mounted filesystems a walk enters."""
+
+    skip_pseudo: bool = True
+    skip_remote: bool = True
+    one_file_system: bool = False
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings_manager: "SettingsManager | None",
+        one_file_system: bool | None = None,
+    ) -> "MountPolicy":
+        """
+        Build the policy from the scan settings.
+
+        Args:
+            settings_manager: Settings of the calling scanner, or None
+            one_file_system: Override of the "scan_one_file_system" setting,
+                e.g. from a scan profile
+
+        Returns:
+            The policy; the defaults apply without settings
+        """
+        policy = cls()
+        if settings_manager is not None:
+            policy = cls(
+                skip_pseudo=settings_manager.get("scan_skip_pseudo_filesystems", True) is not False,
+                skip_remote=settings_manager.get("scan_skip_remote_filesystems", True) is not False,
+                one_file_system=settings_manager.get("scan_one_file_system", False) is True,
+            )
+        if one_file_system is not None:
+            policy = cls(policy.skip_pseudo, policy.skip_remote, bool(one_file_system))
+        return policy
+
+    def skip_reason(self, mount: MountInfo) -> str | None:
+        """
+        Decide whether a mount below the scan target is skipped.
+
+        Args:
+            mount: Mount whose mount point the walk reached
+
+        Returns:
+            Why the mount is skipped, or None if it is entered
+        """
+        kind = filesystem_kind(mount.fstype)
+        if kind == REASON_PSEUDO and self.skip_pseudo:
+            return kind
+        if kind in (REASON_REMOTE, REASON_FUSE) and self.skip_remote:
+            return kind
+        if self.one_file_system:
+            return REASON_OTHER_FILESYSTEM
+        return None
+
+    def filter_for(self, path: str, mounts: list[MountInfo] | None = None) -> "MountFilter | None":
+        """
+        Prepare the mount checks of a walk.
+
+        Args:
+            path: Scan target
+            mounts: Mount table (default: read from /proc/self/mountinfo)
+
+        Returns:
+            A MountFilter, or None if path is not a directory or the mount
+            table is unavailable
+        """
+        if not os.path.isdir(path):
+            return None
+        if mounts is None:
+            mounts = read_mounts()
+        if not mounts:
+            return None
+        return MountFilter(self, path, mounts)
+
+
+class MountFilter:
+    """
+    The mount points below one scan target and what to do with them.
+
+    Mount points are translated to the paths the walk reaches them by, so a
+    target given through a symlink is handled like its real path. Later
+    mounts on the same mount point hide earlier ones, as in the kernel.
+    """
+
+    def __init__(self, policy: MountPolicy, path: str, mounts: list[MountInfo]):
+        """
+        Index the mounts below path.
+
+        Args:
+            policy: Which filesystems are entered
+            path: Scan target, as passed to the walker
+            mounts: Mount table in mount order
+        """
+        self._policy = policy
+        real_root = os.path.realpath(path)
+        root = os.path.normpath(path)
+        self._root_mount: MountInfo | None = None
+        # Walker path -> mount, for mount points strictly below the target
+        self._below: dict[str, MountInfo] = {}
+        best = -1
+        for mount in mounts:
+            point = mount.mount_point
+            if real_root == point or real_root.startswith(point.rstrip("/") + "/"):
+                if len(point) >= best:
+                    best = len(point)
+                    self._root_mount = mount
+            elif point.startswith(real_root.rstrip("/") + "/"):
+                relative = os.path.relpath(point, real_root)
+                self._below[os.path.join(root, relative)] = mount
+
+    @property
+    def policy(self) -> MountPolicy:
+        """The policy applied."""
+        return self._policy
+
+    @property
+    def root_device(self) -> str | None:
+        """Device of the filesystem the target lies on, if known."""
+        return self._root_mount.device if self._root_mount is not None else None
+
+    def check(self, path: str) -> tuple[MountInfo | None, str | None]:
+        """
+        Check a directory the walk is about to enter.
+
+        Args:
+            path: Directory path as produced by the walk
+
+        Returns:
+            (mount, skip_reason): mount is None unless path is a mount point;
+            skip_reason is None unless the mount is skipped
+        """
+        mount = self._below.get(path)
+        if mount is None:
+            return None, None
+        return mount, self._policy.skip_reason(mount)
+
+    @property
+    def skipped(self) -> list[str]:
+        """Walker paths of the skipped mount points below the target."""
+        return [path for path, mount in self._below.items() if self._policy.skip_reason(mount)]
+
+    @property
+    def devices(self) -> set[str]:
+        """Devices of the target and the entered mounts below it."""
+        devices = {
+            mount.device
+            for mount in self._below.values()
+            if self._policy.skip_reason(mount) is None
+        }
+        if self._root_mount is not None:
+            devices.add(self._root_mount.device)
+        return devices
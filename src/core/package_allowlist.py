@@ -0,0 +1,278 @@
+# ClamUI Package Allowlist Module
+"""
+Trusted package files for ClamUI scans.
+
+Most files of a full-system scan live in /usr and are byte-identical to what
+the package manager installed. With a profile's "trusted_package_files"
+option, such files are skipped. The checksums recorded by the package manager
+are loaded into one index:
+
+- dpkg: /var/lib/dpkg/info/<package>.md5sums. dpkg records no sizes or times,
+  so a file whose change time (ctime, which cannot be set from user space)
+  is not later than the package's file list was not touched since the
+  package was unpacked
+- RPM: the FILEDIGESTS, FILESIZES and FILEMTIMES of every installed package,
+  queried through `rpm`. A file matching the recorded size and mtime is
+  taken as unmodified
+
+Only a file that looks modified by those checks is hashed and compared with
+the recorded digest, so the allowlist costs a stat() per file in the common
+case. The index is built once per process and rebuilt when the package
+databases change.
+
+Usage:
+    allowlist = open_package_allowlist(profile_options.get("trusted_package_files"))
+    walker = ScanWalker(path, trusted=allowlist)
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Where dpkg keeps its per-package metadata
+DPKG_INFO_DIR = "/var/lib/dpkg/info"
+
+# Locations of the RPM database (older and newer layouts)
+RPM_DB_DIRS = ("/var/lib/rpm", "/usr/lib/sysimage/rpm")
+
+# One line per file of every installed package: size, mtime, digest, path
+_RPM_QUERY_FORMAT = "[%{FILESIZES}\\t%{FILEMTIMES}\\t%{FILEDIGESTS}\\t%{FILENAMES}\\n]"
+
+# Seconds the RPM database query may take
+RPM_QUERY_TIMEOUT = 120
+
+# Top-level directories that merged-/usr systems turn into symlinks into /usr
+_USR_MERGED_DIRS = ("/bin", "/sbin", "/lib", "/lib32", "/lib64", "/libx32")
+
+# Hash functions by digest length in bytes
+_DIGESTS_BY_LENGTH = {
+    16: "md5",
+    20: "sha1",
+    28: "sha224",
+    32: "sha256",
+    48: "sha384",
+    64: "sha512",
+}
+
+# Read size while hashing
+_HASH_CHUNK = 1024 * 1024
+
+
+class PackageFile(NamedTuple):
+    """A file as installed by the package manager."""
+
+    digest: bytes
+    size: int | None  # None for dpkg, which records no sizes
+    # RPM: the file's recorded mtime; dpkg: when the package was unpacked
+    stamp: int
+
+
+def _usr_merged_prefixes() -> list[str]:
+    """Top-level directories that are symlinks to their /usr counterpart."""
+    return [
+        directory
+        for directory in _USR_MERGED_DIRS
+        if os.path.islink(directory) and os.path.realpath(directory) == "/usr" + directory
+    ]
+
+
+def load_dpkg_files(info_dir: str = DPKG_INFO_DIR) -> dict[str, PackageFile]:
+    """
+    Read the checksums of all installed dpkg packages.
+
+    Args:
+        info_dir: dpkg metadata directory
+
+    Returns:
+        Installed files by absolute path; empty if dpkg is not used
+    """
+    files: dict[str, PackageFile] = {}
+    merged = _usr_merged_prefixes()
+    for md5sums in glob.glob(os.path.join(info_dir, "*.md5sums")):
+        # The file list is written once the package's files are unpacked
+        file_list = md5sums[: -len(".md5sums")] + ".list"
+        try:
+            unpacked = int(max(os.stat(md5sums).st_mtime, os.stat(file_list).st_mtime)) + 1
+            with open(md5sums, encoding="utf-8", errors="surrogateescape") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            logger.debug("Cannot read %s: %s", md5sums, e)
+            continue
+        for line in lines:
+            digest_hex, _, relative = line.partition("  ")
+            try:
+                entry = PackageFile(bytes.fromhex(digest_hex), None, unpacked)
+            except ValueError:
+                continue
+            path = "/" + relative
+            files[path] = entry
+            for prefix in merged:
+                if path.startswith(prefix + "/"):
+                    files["/usr" + path] = entry
+    return files
+
+
+def load_rpm_files() -> dict[str, PackageFile]:
+    """
+    Read the digests of all files of installed RPM packages.
+
+    Returns:
+        Installed files by absolute path; empty if RPM is not used
+    """
+    rpm = shutil.which("rpm")
+    if rpm is None or not any(os.path.isdir(path) for path in RPM_DB_DIRS):
+        return {}
+    try:
+        completed = subprocess.run(
+            [rpm, "-qa", "--queryformat", _RPM_QUERY_FORMAT],
+            capture_output=True,
+            text=True,
+            errors="surrogateescape",
+            timeout=RPM_QUERY_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("Cannot query the RPM database: %s", e)
+        return {}
+    if completed.returncode != 0:
+        logger.warning("Cannot query the RPM database: %s", completed.stderr.strip())
+        return {}
+    files: dict[str, PackageFile] = {}
+    for line in completed.stdout.splitlines():
+        parts = line.split("\t", 3)
+        if len(parts) != 4 or not parts[2]:
+            # Directories and symlinks have no digest
+            continue
+        try:
+            files[parts[3]] = PackageFile(bytes.fromhex(parts[2]), int(parts[0]), int(parts[1]))
+        except ValueError:
+            continue
+    return files
+
+
+def file_digest(path: str, length: int) -> bytes | None:
+    """
+    Hash a file with the function a package manager used.
+
+    Args:
+        path: File to hash
+        length: Length of the recorded digest in bytes
+
+    Returns:
+        The digest, or None if the file cannot be read or the digest type
+        is unknown
+    """
+    name = _DIGESTS_BY_LENGTH.get(length)
+    if name is None:
+        return None
+    digest = hashlib.new(name)
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                digest.update(chunk)
+    except OSError as e:
+        logger.debug("Cannot hash %s: %s", path, e)
+        return None
+    return digest.digest()
+
+
+class PackageAllowlist:
+    """Recognizes files that are unmodified since their package installed them."""
+
+    def __init__(self, files: dict[str, PackageFile]):
+        """
+        Initialize the allowlist.
+
+        Args:
+            files: Installed files by absolute path
+        """
+        self._files = files
+
+    def __len__(self) -> int:
+        """Number of package files known."""
+        return len(self._files)
+
+    def is_trusted(self, path: str, st: os.stat_result) -> bool:
+        """
+        Check whether a file is unmodified since its package installed it.
+
+        Args:
+            path: Absolute path of the file
+            st: lstat() result of the file
+
+        Returns:
+            True if the file can be skipped
+        """
+        entry = self._files.get(path)
+        if entry is None:
+            return False
+        if entry.size is not None:
+            if st.st_size != entry.size:
+                return False
+            if int(st.st_mtime) == entry.stamp:
+                return True
+        elif st.st_ctime <= entry.stamp:
+            return True
+        return file_digest(path, len(entry.digest)) == entry.digest
+
+
+# Index shared by all scans of the process, with the database state it
+# was built from
+_cache_lock = threading.Lock()
+_cached: tuple[tuple, PackageAllowlist] | None = None
+
+
+def _database_state() -> tuple:
+    """Modification times that change whenever packages are installed."""
+    state = []
+    for path in (DPKG_INFO_DIR, *RPM_DB_DIRS):
+        try:
+            state.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+
+def load_package_allowlist() -> PackageAllowlist:
+    """
+    Get the allowlist of the installed packages.
+
+    Returns:
+        The allowlist, rebuilt if packages changed since it was last built
+    """
+    global _cached
+    with _cache_lock:
+        state = _database_state()
+        if _cached is not None and _cached[0] == state:
+            return _cached[1]
+        files = load_dpkg_files()
+        files.update(load_rpm_files())
+        allowlist = PackageAllowlist(files)
+        logger.info("Loaded %d package files into the allowlist", len(allowlist))
+        _cached = (state, allowlist)
+        return allowlist
+
+
+def open_package_allowlist(enabled: object) -> PackageAllowlist | None:
+    """
+    Get the allowlist for a scan, if the scan trusts package files.
+
+    Args:
+        enabled: The profile's "trusted_package_files" option
+
+    Returns:
+        The allowlist, or None if disabled or no package database was found
+    """
+    if enabled is not True:
+        return None
+    allowlist = load_package_allowlist()
+    if not len(allowlist):
+        logger.info("No package database found, scanning package files")
+        return None
+    return allowlist
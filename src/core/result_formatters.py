@@ -106,6 +106,8 @@ def format_results_as_text(result: "ScanResult", timestamp: str | None = None) -
                 )
             )
             lines.append(_("    File: {path}").format(path=threat.file_path))
+            for alias in threat.aliases:
+                lines.append(_("    Also at: {path}").format(path=alias))
             lines.append(_("    Threat: {name}").format(name=threat.threat_name))
             lines.append("")
     elif result.status.value == "clean":
@@ -178,8 +180,9 @@ def format_results_as_csv(result: "ScanResult", timestamp: str | None = None) ->
     # Write threat details
     if result.threat_details:
         for threat in result.threat_details:
-            writer.writerow(
-                [threat.file_path, threat.threat_name, threat.category, threat.severity, timestamp]
-            )
+            for file_path in [threat.file_path, *threat.aliases]:
+                writer.writerow(
+                    [file_path, threat.threat_name, threat.category, threat.severity, timestamp]
+                )
 
     return output.getvalue()
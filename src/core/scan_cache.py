@@ -0,0 +1,417 @@
+# ClamUI Scan Cache Module
+"""
+Incremental scan cache for ClamUI.
+
+Remembers files that were scanned clean so that unchanged files can be skipped
+on the next scan. A file is identified by (st_dev, st_ino, size, mtime_ns,
+ctime_ns); any change to its content or metadata changes at least one of those
+values and forces a rescan. Every cached verdict is bound to the signature
+database version it was produced with, so a database update invalidates the
+whole cache.
+
+Only clean verdicts are cached. Infected files and files that could not be
+scanned are always rescanned.
+
+Usage:
+    cache = ScanCache()
+    if cache.open(get_database_version(engine_version)):
+        for path, st in candidates:
+            if cache.is_clean(st):
+                continue  # unchanged since last clean scan
+            cache.add_pending(path, st)
+            ...  # scan the file
+        cache.commit(failed_paths)
+        cache.close()
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .flatpak import get_clamav_database_dir, is_flatpak
+
+if TYPE_CHECKING:
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Signature database file extensions that make up the loaded database
+_DATABASE_EXTENSIONS = (".cvd", ".cld", ".cud")
+
+# Default signature database directory for native installations
+_DEFAULT_DATABASE_DIR = Path("/var/lib/clamav")
+
+FileIdentity = tuple[int, int, int, int, int]
+
+
+def file_identity(st: os.stat_result) -> FileIdentity:
+    """
+    Build the cache key for a file from its stat result.
+
+    Args:
+        st: Result of os.stat()/os.lstat() for the file
+
+    Returns:
+        Tuple of (st_dev, st_ino, st_size, st_mtime_ns, st_ctime_ns)
+    """
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def get_database_version(engine_version: str | None = None) -> str | None:
+    """
+    Build a version string for the signature database used by clamscan.
+
+    clamscan loads its signatures from disk on every run, so the version is
+    derived from the database files themselves (name, size and mtime of each
+    .cvd/.cld/.cud file) combined with the engine version reported by
+    'clamscan --version'. Any freshclam update changes at least one file.
+
+    Args:
+        engine_version: Output of 'clamscan --version' (e.g.
+                        "ClamAV 1.0.1/26823/Fri Mar  3 08:29:22 2023")
+
+    Returns:
+        Version string, or None if neither the engine version nor the
+        database files could be determined
+    """
+    db_dir = get_clamav_database_dir() if is_flatpak() else _DEFAULT_DATABASE_DIR
+    parts = [engine_version.strip()] if engine_version else []
+
+    if db_dir is not None:
+        try:
+            with os.scandir(db_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if not entry.name.lower().endswith(_DATABASE_EXTENSIONS):
+                        continue
+                    st = entry.stat()
+                    parts.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError as e:
+            logger.debug("Could not read signature database directory %s: %s", db_dir, e)
+
+    return "|".join(parts) if parts else None
+
+
+def open_scan_cache(
+    settings_manager: "SettingsManager | None",
+    db_version: str | None,
+    force_full_scan: bool = False,
+) -> "ScanCache | None":
+    """
+    Open the scan cache for a scan if incremental scanning applies.
+
+    The cache is only used when a settings manager is available, the
+    "scan_cache_enabled" setting is on, a full scan was not requested and the
+    signature database version is known.
+
+    Args:
+        settings_manager: Settings of the calling scanner
+        db_version: Version string of the signature database in use
+        force_full_scan: Whether every file must be scanned regardless of the cache
+
+    Returns:
+        An open ScanCache, or None if the scan should not use the cache
+    """
+    if force_full_scan or settings_manager is None or not db_version:
+        return None
+    if not settings_manager.get("scan_cache_enabled", True):
+        return None
+
+    cache = ScanCache()
+    if not cache.open(db_version):
+        return None
+    return cache
+
+
+class ScanCache:
+    """
+    SQLite-backed cache of clean scan verdicts.
+
+    Candidates for scanning are first recorded as pending; once the scan
+    finished, commit() promotes every pending file that was not reported as
+    infected or failed to a cached clean verdict. A cancelled or failed scan
+    simply discards the pending set.
+
+    All methods are thread-safe, so the file walk may run on a different
+    thread than the one collecting results.
+    """
+
+    # Cache file permissions: 0o600 (owner read/write only)
+    # The cache holds file identities of everything the user scanned.
+    DB_FILE_PERMISSIONS = 0o600
+
+    # Number of pending rows buffered in memory before they are written
+    PENDING_BATCH_SIZE = 1000
+
+    def __init__(self, db_path: str | None = None):
+        """
+        Initialize the ScanCache.
+
+        Args:
+            db_path: Optional custom database path.
+                     Defaults to XDG_DATA_HOME/clamui/scan_cache.db
+        """
+        if db_path:
+            self._db_path = Path(db_path)
+        else:
+            xdg_data_home = os.environ.get("XDG_DATA_HOME", "~/.local/share")
+            self._db_path = Path(xdg_data_home).expanduser() / "clamui" / "scan_cache.db"
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pending: list[tuple] = []
+        self._pending_count = 0
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the cache database file."""
+        return self._db_path
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the cache has been opened for a scan."""
+        return self._conn is not None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of files recorded as pending since the cache was opened."""
+        return self._pending_count
+
+    def open(self, db_version: str) -> bool:
+        """
+        Open the cache for a scan with the given signature database version.
+
+        If the stored version differs from db_version, all cached verdicts are
+        dropped before the cache is used.
+
+        Args:
+            db_version: Version string of the signature database in use
+
+        Returns:
+            True if the cache is usable, False if it could not be opened
+        """
+        with self._lock:
+            if self._conn is not None:
+                return True
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self._db_path), timeout=30.0, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Could not open scan cache %s: %s", self._db_path, e)
+                return False
+
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS meta (
+                            key TEXT PRIMARY KEY,
+                            value TEXT NOT NULL
+                        )
+                        """
+                    )
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS clean_files (
+                            dev INTEGER NOT NULL,
+                            ino INTEGER NOT NULL,
+                            size INTEGER NOT NULL,
+                            mtime_ns INTEGER NOT NULL,
+                            ctime_ns INTEGER NOT NULL,
+                            PRIMARY KEY (dev, ino)
+                        ) WITHOUT ROWID
+                        """
+                    )
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'db_version'").fetchone()
+                    if row is None or row[0] != db_version:
+                        if row is not None:
+                            logger.info("Signature database changed, invalidating scan cache")
+                        conn.execute("DELETE FROM clean_files")
+                        conn.execute(
+                            "INSERT OR REPLACE INTO meta (key, value) VALUES ('db_version', ?)",
+                            (db_version,),
+                        )
+                conn.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS pending (
+                        path TEXT PRIMARY KEY,
+                        dev INTEGER NOT NULL,
+                        ino INTEGER NOT NULL,
+                        size INTEGER NOT NULL,
+                        mtime_ns INTEGER NOT NULL,
+                        ctime_ns INTEGER NOT NULL
+                    )
+                    """
+                )
+            except sqlite3.Error as e:
+                logger.warning("Could not initialize scan cache %s: %s", self._db_path, e)
+                conn.close()
+                return False
+
+            self._secure_db_file_permissions()
+            self._conn = conn
+            self._pending = []
+            self._pending_count = 0
+            return True
+
+    def _secure_db_file_permissions(self) -> None:
+        """Restrict the cache database and its WAL/SHM files to the owner."""
+        for suffix in ("", "-wal", "-shm"):
+            db_file = Path(str(self._db_path) + suffix)
+            if db_file.exists():
+                try:
+                    os.chmod(db_file, self.DB_FILE_PERMISSIONS)
+                except OSError:
+                    pass
+
+    def is_clean(self, st: os.stat_result) -> bool:
+        """
+        Check whether a file is unchanged since it was last scanned clean.
+
+        Args:
+            st: Current stat result of the file
+
+        Returns:
+            True if a clean verdict is cached for this exact file identity
+        """
+        with self._lock:
+            if self._conn is None:
+                return False
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT 1 FROM clean_files
+                    WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ? AND ctime_ns = ?
+                    """,
+                    file_identity(st),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug("Scan cache lookup failed: %s", e)
+                return False
+            return row is not None
+
+    def add_pending(self, path: str, st: os.stat_result) -> None:
+        """
+        Record a file that is about to be scanned.
+
+        The identity is taken before the scan; if the file changes while it is
+        being scanned, its new identity will not match on the next run.
+
+        Args:
+            path: Path of the file as it will be reported by the scanner
+            st: Stat result of the file taken before scanning
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending.append((path, *file_identity(st)))
+            self._pending_count += 1
+            if len(self._pending) >= self.PENDING_BATCH_SIZE:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write buffered pending rows. Caller must hold the lock."""
+        if not self._pending or self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO pending VALUES (?, ?, ?, ?, ?, ?)", self._pending
+                )
+        except sqlite3.Error as e:
+            logger.debug("Could not record pending scan cache entries: %s", e)
+        self._pending = []
+
+    def commit(self, failed_paths: Iterable[str] = ()) -> int:
+        """
+        Cache a clean verdict for every pending file that did not fail.
+
+        Args:
+            failed_paths: Paths reported as infected, skipped or errored
+
+        Returns:
+            Number of files recorded as clean
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            self._flush_pending()
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "DELETE FROM pending WHERE path = ?", ((p,) for p in failed_paths)
+                    )
+                    cursor = self._conn.execute(
+                        """
+                        INSERT OR REPLACE INTO clean_files (dev, ino, size, mtime_ns, ctime_ns)
+                        SELECT dev, ino, size, mtime_ns, ctime_ns FROM pending
+                        """
+                    )
+                    recorded = max(cursor.rowcount, 0)
+                    self._conn.execute("DELETE FROM pending")
+            except sqlite3.Error as e:
+                logger.warning("Could not update scan cache: %s", e)
+                return 0
+            self._pending_count = 0
+            return recorded
+
+    def discard(self) -> None:
+        """Drop all pending files without caching a verdict for them."""
+        with self._lock:
+            self._pending = []
+            self._pending_count = 0
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM pending")
+            except sqlite3.Error as e:
+                logger.debug("Could not discard pending scan cache entries: %s", e)
+
+    def clear(self) -> bool:
+        """
+        Remove all cached verdicts.
+
+        Returns:
+            True if the cache was cleared (or did not exist), False on error
+        """
+        with self._lock:
+            conn = self._conn
+            try:
+                if conn is None:
+                    if not self._db_path.exists():
+                        return True
+                    conn = sqlite3.connect(str(self._db_path), timeout=30.0)
+                try:
+                    with conn:
+                        conn.execute("DELETE FROM clean_files")
+                finally:
+                    if conn is not self._conn:
+                        conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Could not clear scan cache: %s", e)
+                return False
+            return True
+
+    def close(self) -> None:
+        """Close the cache. Pending files that were not committed are dropped."""
+        with self._lock:
+            self._pending = []
+            self._pending_count = 0
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
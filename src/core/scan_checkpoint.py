@@ -0,0 +1,591 @@
+# ClamUI Scan Checkpoint Module
+"""
+Resumable scans through on-disk checkpoints for ClamUI.
+
+A long directory scan periodically writes a checkpoint to the ClamUI data
+directory ($XDG_DATA_HOME/clamui/checkpoints), so that a scan killed by a
+reboot or cancelled near its end can continue where it stopped instead of
+starting over. A checkpoint records:
+
+- The frontier of the walk: directories whose whole subtree was scanned, and
+  the scanned files of directories that are only partly done
+- The results so far: threats found, file, directory and byte counts, and the
+  active scan duration
+
+The scan order of os.scandir() is not stable between runs, so the walk is
+resumed by skipping what the frontier covers rather than by seeking to a
+position. A checkpoint is only used when the target, the profile exclusions
+and the signature database version all match; files scanned with different
+signatures must be scanned again. The results it holds are merged into the
+resumed scan's result, so the finished scan is logged as a single entry.
+
+Checkpoints are written by the directory walks that report a verdict per file:
+the native clamd client and clamscan reading a file list. A finished scan
+removes its checkpoint; a cancelled one writes a final one.
+
+Usage:
+    previous = load_checkpoint(path, profile_exclusions, db_version) if resume else None
+    checkpoint = CheckpointTracker(path, profile_exclusions, db_version, previous)
+    walker = ScanWalker(path, checkpoint=checkpoint)
+    ...  # report every scanned file with checkpoint.file_done()
+    checkpoint.finish(result, completed=True)
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .scanner_types import ScanResult, ScanStatus, ThreatDetail
+from .threat_classifier import categorize_threat, classify_threat_severity_str
+
+if TYPE_CHECKING:
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checkpoints written during a scan
+CHECKPOINT_INTERVAL = 30.0
+
+# Format version of the checkpoint files
+CHECKPOINT_VERSION = 1
+
+# Checkpoint file permissions: 0o600 (owner read/write only)
+# A checkpoint lists the paths of scanned files and threats.
+CHECKPOINT_FILE_PERMISSIONS = 0o600
+
+
+def get_checkpoint_dir() -> Path:
+    """
+    Get the directory holding the scan checkpoints.
+
+    Returns:
+        XDG_DATA_HOME/clamui/checkpoints
+    """
+    xdg_data_home = os.environ.get("XDG_DATA_HOME", "~/.local/share")
+    return Path(xdg_data_home).expanduser() / "clamui" / "checkpoints"
+
+
+def checkpoint_key(path: str, profile_exclusions: dict | None = None) -> str:
+    """
+    Identify the scans a checkpoint can resume.
+
+    Args:
+        path: Scan target
+        profile_exclusions: Exclusions of the scan profile, if any
+
+    Returns:
+        Hex digest of the target and the profile exclusions
+    """
+    material = json.dumps(
+        {"path": os.path.abspath(path), "exclusions": profile_exclusions or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def _checkpoint_file(path: str, profile_exclusions: dict | None) -> Path:
+    """Get the checkpoint file of a target and profile."""
+    return get_checkpoint_dir() / f"{checkpoint_key(path, profile_exclusions)}.json"
+
+
+def _root_key(path: str) -> str:
+    """Normalize a scan target the way os.path.dirname() reports its entries."""
+    return path.rstrip(os.sep) or os.sep
+
+
+@dataclass
+class ScanCheckpoint:
+    """The saved state of an interrupted scan."""
+
+    path: str
+    db_version: str
+    completed_dirs: list[str] = field(default_factory=list)
+    completed_files: list[str] = field(default_factory=list)
+    scanned_files: int = 0
+    scanned_dirs: int = 0
+    scanned_bytes: int = 0
+    # (file_path, threat_name) of every threat found so far
+    threats: list[tuple[str, str]] = field(default_factory=list)
+    # Active scan duration so far, in seconds
+    duration: float = 0.0
+    updated: str = ""
+
+    def to_dict(self) -> dict:
+        """Convert the checkpoint to a JSON-serializable dictionary."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "path": self.path,
+            "db_version": self.db_version,
+            "completed_dirs": self.completed_dirs,
+            "completed_files": self.completed_files,
+            "scanned_files": self.scanned_files,
+            "scanned_dirs": self.scanned_dirs,
+            "scanned_bytes": self.scanned_bytes,
+            "threats": [list(threat) for threat in self.threats],
+            "duration": self.duration,
+            "updated": self.updated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScanCheckpoint | None":
+        """
+        Create a checkpoint from a dictionary written by to_dict().
+
+        Args:
+            data: Parsed checkpoint file
+
+        Returns:
+            The checkpoint, or None if the data is not a valid checkpoint
+        """
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            return None
+        try:
+            return cls(
+                path=str(data["path"]),
+                db_version=str(data["db_version"]),
+                completed_dirs=[str(p) for p in data.get("completed_dirs", [])],
+                completed_files=[str(p) for p in data.get("completed_files", [])],
+                scanned_files=int(data.get("scanned_files", 0)),
+                scanned_dirs=int(data.get("scanned_dirs", 0)),
+                scanned_bytes=int(data.get("scanned_bytes", 0)),
+                threats=[(str(p), str(name)) for p, name in data.get("threats", [])],
+                duration=float(data.get("duration", 0.0)),
+                updated=str(data.get("updated", "")),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def merge_into(self, result: ScanResult) -> None:
+        """
+        Add the results of the earlier runs to the result of a resumed scan.
+
+        Args:
+            result: Result of the resumed run, updated in place
+        """
+        result.scanned_files += self.scanned_files
+        result.scanned_dirs += self.scanned_dirs
+        result.scanned_bytes += self.scanned_bytes
+        if not self.threats:
+            return
+
+        result.infected_files = [p for p, _name in self.threats] + list(result.infected_files)
+        result.threat_details = [
+            ThreatDetail(
+                file_path=file_path,
+                threat_name=threat_name,
+                category=categorize_threat(threat_name),
+                severity=classify_threat_severity_str(threat_name),
+            )
+            for file_path, threat_name in self.threats
+        ] + list(result.threat_details)
+        result.infected_count += len(self.threats)
+        if result.status == ScanStatus.CLEAN:
+            result.status = ScanStatus.INFECTED
+            result.exit_code = 1
+
+
+def find_checkpoint(path: str, profile_exclusions: dict | None = None) -> ScanCheckpoint | None:
+    """
+    Find the checkpoint of an interrupted scan, e.g. to offer resuming it.
+
+    The signature database version is not checked here; load_checkpoint()
+    does that when the scan is resumed.
+
+    Args:
+        path: Scan target
+        profile_exclusions: Exclusions of the scan profile, if any
+
+    Returns:
+        The checkpoint, or None if there is none or it cannot be read
+    """
+    checkpoint_file = _checkpoint_file(path, profile_exclusions)
+    try:
+        with open(checkpoint_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Cannot read scan checkpoint %s: %s", checkpoint_file, e)
+        return None
+
+    checkpoint = ScanCheckpoint.from_dict(data)
+    if checkpoint is None or checkpoint.path != os.path.abspath(path):
+        logger.warning("Ignoring invalid scan checkpoint %s", checkpoint_file)
+        return None
+    return checkpoint
+
+
+def load_checkpoint(
+    path: str, profile_exclusions: dict | None, db_version: str | None
+) -> ScanCheckpoint | None:
+    """
+    Load the checkpoint to resume a scan from.
+
+    Args:
+        path: Scan target
+        profile_exclusions: Exclusions of the scan profile, if any
+        db_version: Version string of the signature database in use
+
+    Returns:
+        The checkpoint, or None if there is none or it was written with
+        another signature database
+    """
+    checkpoint = find_checkpoint(path, profile_exclusions)
+    if checkpoint is None:
+        return None
+    if checkpoint.db_version != db_version:
+        logger.info("Not resuming scan of %s: the signature database has changed", path)
+        return None
+    return checkpoint
+
+
+def discard_checkpoint(path: str, profile_exclusions: dict | None = None) -> None:
+    """
+    Remove the checkpoint of a target and profile, if there is one.
+
+    Args:
+        path: Scan target
+        profile_exclusions: Exclusions of the scan profile, if any
+    """
+    with contextlib.suppress(FileNotFoundError):
+        _checkpoint_file(path, profile_exclusions).unlink()
+
+
+def open_checkpoint(
+    settings_manager: "SettingsManager | None",
+    path: str,
+    profile_exclusions: dict | None,
+    db_version: str | None,
+    resume: bool = False,
+    duration: Callable[[], float] | None = None,
+) -> "CheckpointTracker | None":
+    """
+    Start checkpointing a scan if checkpoints apply.
+
+    Checkpoints are written for directory scans when a settings manager is
+    available, the "scan_checkpoints_enabled" setting is on and the signature
+    database version is known.
+
+    Args:
+        settings_manager: Settings of the calling scanner
+        path: Scan target
+        profile_exclusions: Exclusions of the scan profile, if any
+        db_version: Version string of the signature database in use
+        resume: Whether to continue from a matching checkpoint
+        duration: Returns the active duration of the running scan
+
+    Returns:
+        A CheckpointTracker, or None if the scan is not checkpointed
+    """
+    if settings_manager is None or not db_version or not os.path.isdir(path):
+        return None
+    if not settings_manager.get("scan_checkpoints_enabled", True):
+        return None
+
+    previous = load_checkpoint(path, profile_exclusions, db_version) if resume else None
+    if previous is not None:
+        logger.info(
+            "Resuming scan of %s from checkpoint of %s (%d files scanned)",
+            path,
+            previous.updated,
+            previous.scanned_files,
+        )
+    return CheckpointTracker(path, profile_exclusions, db_version, previous, duration)
+
+
+class _DirState:
+    """A directory whose subtree is not completely scanned yet."""
+
+    __slots__ = ("parent", "pending", "listed")
+
+    def __init__(self, parent: str | None):
+        self.parent = parent
+        # Queued files and subdirectories not completely scanned yet
+        self.pending = 0
+        # Whether the walk has finished listing the directory
+        self.listed = False
+
+
+class CheckpointTracker:
+    """
+    Track which parts of a walked tree are scanned and write checkpoints.
+
+    The walk reports each directory once it is listed and each file it hands
+    to the scanner; the scanner reports every file with a verdict. A
+    directory is complete once it is listed and all of its queued files and
+    subdirectories are, and only the outermost complete directories are
+    kept. Files that failed to scan are never reported, so they are scanned
+    again on resume.
+
+    All methods are thread-safe: the walk, the scan workers and the thread
+    writing checkpoints may all differ.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        profile_exclusions: dict | None,
+        db_version: str,
+        previous: ScanCheckpoint | None = None,
+        duration: Callable[[], float] | None = None,
+        interval: float = CHECKPOINT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            path: Directory being scanned
+            profile_exclusions: Exclusions of the scan profile, if any
+            db_version: Version string of the signature database in use
+            previous: Checkpoint the scan resumes from, if any
+            duration: Returns the active duration of the running scan
+            interval: Minimum seconds between checkpoints
+            clock: Monotonic clock, replaceable for tests
+        """
+        self._path = path
+        self._root = _root_key(path)
+        self._file = _checkpoint_file(path, profile_exclusions)
+        self._db_version = db_version
+        self._previous = previous
+        self._duration = duration or (lambda: 0.0)
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._last_save = clock()
+
+        # Frontier of the checkpoint resumed from; read by the walk without locking
+        self._resume_dirs = frozenset(previous.completed_dirs if previous else ())
+        self._resume_files = frozenset(previous.completed_files if previous else ())
+
+        self._dirs: dict[str, _DirState] = {self._root: _DirState(None)}
+        self._queued: dict[str, int] = {}
+        self._done_dirs: set[str] = set()
+        self._done_files: set[str] = set()
+        self._finished = False
+
+        self._files = 0
+        self._dir_count = 0
+        self._bytes = 0
+        self._threats: list[tuple[str, str]] = []
+
+    @property
+    def previous(self) -> ScanCheckpoint | None:
+        """Get the checkpoint the scan resumed from, if any."""
+        return self._previous
+
+    @property
+    def previous_duration(self) -> float:
+        """Get the active duration of the earlier runs, in seconds."""
+        return self._previous.duration if self._previous is not None else 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether every queued file of the whole tree is scanned."""
+        return self._finished
+
+    def is_done(self, path: str) -> bool:
+        """
+        Check whether a walked entry was scanned by an earlier run.
+
+        Args:
+            path: Path of a file or directory below the target
+
+        Returns:
+            True if the walk should skip the entry
+        """
+        return path in self._resume_dirs or path in self._resume_files
+
+    def dir_listed(self, directory: str, subdirs: Iterable[str]) -> None:
+        """
+        Record that the walk has listed a directory.
+
+        Args:
+            directory: The listed directory
+            subdirs: Its subdirectories the walk will enter
+        """
+        directory = _root_key(directory)
+        with self._lock:
+            state = self._dirs.get(directory)
+            if state is None or state.listed:
+                return
+            state.listed = True
+            self._dir_count += 1
+            for subdir in subdirs:
+                self._dirs[subdir] = _DirState(directory)
+                state.pending += 1
+            self._complete(directory)
+
+    def file_queued(self, path: str, size: int = 0) -> None:
+        """
+        Record a file handed to the scanner.
+
+        Args:
+            path: Path of the file
+            size: Size of the file in bytes
+        """
+        with self._lock:
+            state = self._dirs.get(os.path.dirname(path))
+            if state is None:
+                return
+            self._queued[path] = size
+            state.pending += 1
+
+    def file_done(self, path: str, threat_name: str | None = None) -> None:
+        """
+        Record a verdict for a queued file, writing a checkpoint when one is due.
+
+        Args:
+            path: Path of the scanned file
+            threat_name: Name of the threat found in the file, if any
+        """
+        with self._lock:
+            size = self._queued.pop(path, None)
+            if size is None:
+                return
+            self._files += 1
+            self._bytes += size
+            if threat_name is not None:
+                self._threats.append((path, threat_name))
+            directory = os.path.dirname(path)
+            state = self._dirs.get(directory)
+            if state is not None:
+                state.pending -= 1
+                self._done_files.add(path)
+                self._complete(directory)
+
+            due = self._clock() - self._last_save >= self._interval
+            if due:
+                self._last_save = self._clock()
+        if due:
+            self.save()
+
+    def _complete(self, directory: str) -> None:
+        """Mark a directory and its ancestors complete where nothing is pending (locked)."""
+        while True:
+            state = self._dirs.get(directory)
+            if state is None or not state.listed or state.pending:
+                return
+            del self._dirs[directory]
+            if state.parent is None:
+                self._finished = True
+                return
+            self._done_dirs.add(directory)
+            directory = state.parent
+            self._dirs[directory].pending -= 1
+
+    def _has_done_ancestor(self, path: str, done_dirs: set[str]) -> bool:
+        """Check whether a directory containing path is complete."""
+        parent = os.path.dirname(path)
+        while parent != self._root and len(parent) > len(self._root):
+            if parent in done_dirs:
+                return True
+            parent = os.path.dirname(parent)
+        return False
+
+    def snapshot(self) -> ScanCheckpoint:
+        """
+        Build the checkpoint of the scan so far.
+
+        Entries inside complete directories are dropped, here and from the
+        tracked state, so the checkpoint stays as small as the frontier.
+
+        Returns:
+            The checkpoint, including the results of the earlier runs
+        """
+        previous = self._previous
+        with self._lock:
+            done_dirs = self._done_dirs | self._resume_dirs
+            self._done_dirs = {
+                p for p in self._done_dirs if not self._has_done_ancestor(p, done_dirs)
+            }
+            self._done_files = {
+                p for p in self._done_files if not self._has_done_ancestor(p, done_dirs)
+            }
+            self._resume_dirs = frozenset(
+                p for p in self._resume_dirs if not self._has_done_ancestor(p, done_dirs)
+            )
+            self._resume_files = frozenset(
+                p for p in self._resume_files if not self._has_done_ancestor(p, done_dirs)
+            )
+            checkpoint = ScanCheckpoint(
+                path=os.path.abspath(self._path),
+                db_version=self._db_version,
+                completed_dirs=sorted(self._done_dirs | self._resume_dirs),
+                completed_files=sorted(self._done_files | self._resume_files),
+                scanned_files=self._files,
+                scanned_dirs=self._dir_count,
+                scanned_bytes=self._bytes,
+                threats=list(self._threats),
+            )
+        if previous is not None:
+            checkpoint.scanned_files += previous.scanned_files
+            checkpoint.scanned_dirs += previous.scanned_dirs
+            checkpoint.scanned_bytes += previous.scanned_bytes
+            checkpoint.threats = previous.threats + checkpoint.threats
+        checkpoint.duration = self.previous_duration + self._duration()
+        checkpoint.updated = datetime.now().isoformat()
+        return checkpoint
+
+    def save(self) -> bool:
+        """
+        Write the checkpoint, replacing the previous one atomically.
+
+        Returns:
+            True if the checkpoint was written
+        """
+        checkpoint = self.snapshot()
+        with self._save_lock:
+            tmp_path = None
+            try:
+                self._file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self._file.parent, prefix=".checkpoint_", suffix=".tmp"
+                )
+                os.fchmod(fd, CHECKPOINT_FILE_PERMISSIONS)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(checkpoint.to_dict(), f)
+                os.replace(tmp_path, self._file)
+            except OSError as e:
+                logger.warning("Cannot write scan checkpoint %s: %s", self._file, e)
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+                return False
+        logger.debug(
+            "Wrote scan checkpoint for %s (%d files scanned)", self._path, checkpoint.scanned_files
+        )
+        return True
+
+    def discard(self) -> None:
+        """Remove the checkpoint file."""
+        with self._save_lock, contextlib.suppress(OSError):
+            self._file.unlink()
+
+    def finish(self, result: ScanResult, completed: bool) -> None:
+        """
+        Merge the earlier runs into the final result and settle the checkpoint.
+
+        Args:
+            result: Result of this run, updated in place
+            completed: Whether the scan covered the whole target; the
+                checkpoint is then removed, otherwise a final one is written
+        """
+        if completed:
+            self.discard()
+        else:
+            self.save()
+        if self._previous is not None:
+            self._previous.merge_into(result)
@@ -0,0 +1,194 @@
+# ClamUI Scan Dedup Module
+"""
+Duplicate-file detection for ClamUI scans.
+
+Backup trees, container layers and package caches often hold the same file
+under many paths. Hardlinked paths share one inode, so a file whose
+(st_dev, st_ino) was already walked is not scanned again; only files with
+more than one link are tracked, so ordinary trees cost nothing. Optionally,
+identical content on different inodes is detected too: a file is hashed
+only once a second file of the same size turns up.
+
+Each duplicate is recorded as an alias of the first path walked. The
+verdict of that path applies to all of its aliases, and threats list them.
+
+Usage:
+    dedup = open_file_dedup(settings_manager)
+    walker = ScanWalker(path, dedup=dedup)
+    ...  # scan the walked files
+    dedup.add_aliases(result)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .scanner_types import ScanResult
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Largest file compared by content; hashing bigger files costs about as
+# much as scanning them
+CONTENT_MAX_SIZE = 16 * 1024 * 1024
+
+# Read size while hashing
+_HASH_CHUNK = 1024 * 1024
+
+
+def content_digest(path: str) -> bytes | None:
+    """
+    Hash the content of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        BLAKE2b digest, or None if the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                digest.update(chunk)
+    except OSError as e:
+        logger.debug("Cannot hash %s: %s", path, e)
+        return None
+    return digest.digest()
+
+
+class FileDedup:
+    """
+    Tracks the files of one scan and recognizes duplicates.
+
+    Thread-safe, so walks of several devices can share one instance.
+    """
+
+    def __init__(self, hardlinks: bool = True, content: bool = False):
+        """
+        Initialize the tracker.
+
+        Args:
+            hardlinks: Recognize paths of an already walked inode
+            content: Recognize files with the same content as a walked file
+        """
+        self._hardlinks = hardlinks
+        self._content = content
+        self._lock = threading.Lock()
+        # (st_dev, st_ino) -> first path walked
+        self._inodes: dict[tuple[int, int], str] = {}
+        # Size -> first path of that size, until a second one is hashed
+        self._unhashed: dict[int, str] = {}
+        # Sizes whose files have been hashed
+        self._hashed_sizes: set[int] = set()
+        # (size, digest) -> first path walked
+        self._digests: dict[tuple[int, bytes], str] = {}
+        # First path -> duplicates not scanned
+        self._aliases: dict[str, list[str]] = {}
+        self._alias_count = 0
+
+    @property
+    def alias_count(self) -> int:
+        """Number of duplicates that were not scanned."""
+        return self._alias_count
+
+    def primary_for(self, path: str, st: os.stat_result) -> str | None:
+        """
+        Check whether a walked file duplicates one walked before.
+
+        A duplicate is recorded as an alias of the earlier path; any other
+        file is remembered for later comparisons.
+
+        Args:
+            path: Walked file
+            st: lstat() result of the file
+
+        Returns:
+            The earlier path whose verdict applies, or None if path must be
+            scanned
+        """
+        with self._lock:
+            if self._hardlinks and st.st_nlink > 1:
+                inode = (st.st_dev, st.st_ino)
+                primary = self._inodes.get(inode)
+                if primary is not None:
+                    return self._add_alias(primary, path)
+                self._inodes[inode] = path
+            if not self._content or not 0 < st.st_size <= CONTENT_MAX_SIZE:
+                return None
+            size = st.st_size
+            first = None
+            if size not in self._hashed_sizes:
+                first = self._unhashed.pop(size, None)
+                if first is None:
+                    self._unhashed[size] = path
+                    return None
+                self._hashed_sizes.add(size)
+
+        # Hashed without the lock, so walks of other devices go on meanwhile.
+        # A file of this size hashed meanwhile may become the primary of the
+        # content instead of first; both are scanned then.
+        first_digest = content_digest(first) if first is not None else None
+        digest = content_digest(path)
+
+        with self._lock:
+            if first_digest is not None:
+                self._digests.setdefault((size, first_digest), first)
+            if digest is None:
+                return None
+            primary = self._digests.setdefault((size, digest), path)
+            return self._add_alias(primary, path) if primary != path else None
+
+    def _add_alias(self, primary: str, path: str) -> str:
+        """Record path as a duplicate of primary; called with the lock held."""
+        self._aliases.setdefault(primary, []).append(path)
+        self._alias_count += 1
+        return primary
+
+    def aliases_of(self, path: str) -> list[str]:
+        """
+        Get the duplicates of a scanned file.
+
+        Args:
+            path: Scanned file
+
+        Returns:
+            Paths that were not scanned because they duplicate path
+        """
+        with self._lock:
+            return list(self._aliases.get(path, ()))
+
+    def add_aliases(self, result: "ScanResult") -> None:
+        """
+        Apply the verdicts of scanned files to their duplicates.
+
+        Args:
+            result: Result of the scan of the walked files; its threats get
+                their aliases and the duplicates are counted
+        """
+        for threat in result.threat_details:
+            threat.aliases = self.aliases_of(threat.file_path)
+        result.duplicate_count = self._alias_count
+
+
+def open_file_dedup(settings_manager: "SettingsManager | None") -> FileDedup | None:
+    """
+    Create the duplicate tracker of a scan, if enabled in the settings.
+
+    Args:
+        settings_manager: Settings providing "scan_dedup_hardlinks" and
+            "scan_dedup_content", or None for the defaults
+
+    Returns:
+        A FileDedup, or None if both kinds of deduplication are disabled
+    """
+    hardlinks, content = True, False
+    if settings_manager is not None:
+        hardlinks = settings_manager.get("scan_dedup_hardlinks", True) is not False
+        content = settings_manager.get("scan_dedup_content", False) is True
+    if not hardlinks and not content:
+        return None
+    return FileDedup(hardlinks, content)
@@ -0,0 +1,185 @@
+# ClamUI Scan ETA Module
+"""
+Time-remaining estimates for running scans.
+
+A ScanEtaEstimator turns the byte counts of a scan's progress into an
+estimate of the time left. It blends the throughput measured during the
+scan with the typical throughput of past scans on the same backend, taken
+from the scan logs: early on, when the live rate is noisy, the historical
+rate dominates; the live rate takes over as the scan progresses.
+
+Usage:
+    estimator = ScanEtaEstimator(historical_throughput(log_manager, "daemon"))
+    ...
+    seconds = estimator.estimate(state.bytes_scanned, state.bytes_total)
+    if seconds is not None:
+        label.set_text(format_eta(seconds))
+"""
+
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .i18n import _, ngettext
+
+if TYPE_CHECKING:
+    from .log_manager import LogManager
+
+logger = logging.getLogger(__name__)
+
+# Number of recent scan logs considered for the historical throughput
+HISTORY_LIMIT = 50
+
+# Past scans smaller or shorter than this are too noisy to learn from
+MIN_HISTORY_BYTES = 16 * 1024 * 1024
+MIN_HISTORY_DURATION = 1.0
+
+
+def historical_throughput(
+    log_manager: "LogManager", backend: str, limit: int = HISTORY_LIMIT
+) -> float | None:
+    """
+    Get the typical throughput of past scans on a backend.
+
+    Only completed scans that recorded their scanned size are considered.
+
+    Args:
+        log_manager: LogManager holding the scan logs
+        backend: Scan backend ("clamscan", "daemon" or "user_daemon")
+        limit: Number of recent scan logs to consider
+
+    Returns:
+        Median throughput in bytes per second, or None without usable history
+    """
+    rates = []
+    try:
+        entries = log_manager.get_logs(limit=limit, log_type="scan", with_details=False)
+    except Exception as e:
+        logger.debug("Cannot read scan history for ETA: %s", e)
+        return None
+
+    for entry in entries:
+        if entry.backend != backend or entry.status not in ("clean", "infected"):
+            continue
+        if entry.scanned_bytes < MIN_HISTORY_BYTES or entry.duration < MIN_HISTORY_DURATION:
+            continue
+        rates.append(entry.scanned_bytes / entry.duration)
+
+    return statistics.median(rates) if rates else None
+
+
+class ScanEtaEstimator:
+    """
+    Estimates the time left in a scan from its byte counts.
+
+    The live throughput is measured from the first estimate() call, so bytes
+    counted before it (files skipped through the scan cache) do not inflate
+    it. Its weight grows with the fraction of the scan done and reaches 1 at
+    LIVE_WEIGHT_FRACTION; without history only the live rate is used. Time
+    between pause() and resume() does not count towards the live rate.
+    """
+
+    # Seconds of measurement before the live throughput is trusted at all
+    MIN_LIVE_SECONDS = 2.0
+
+    # Fraction of the scan after which only the live throughput is used
+    LIVE_WEIGHT_FRACTION = 0.25
+
+    def __init__(
+        self,
+        historical_rate: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            historical_rate: Typical throughput of past scans in bytes per
+                second, or None if there is no history
+            clock: Monotonic clock, replaceable for tests
+        """
+        self._historical_rate = historical_rate
+        self._clock = clock
+        self._start_time: float | None = None
+        self._start_bytes = 0
+        self._paused_at: float | None = None
+
+    @property
+    def historical_rate(self) -> float | None:
+        """Get the historical throughput in bytes per second."""
+        return self._historical_rate
+
+    def pause(self) -> None:
+        """Stop the clock of the live throughput while the scan is paused."""
+        if self._paused_at is None:
+            self._paused_at = self._clock()
+
+    def resume(self) -> None:
+        """Restart the clock of the live throughput."""
+        if self._paused_at is None:
+            return
+        if self._start_time is not None:
+            self._start_time += self._clock() - self._paused_at
+        self._paused_at = None
+
+    def estimate(self, bytes_scanned: int, bytes_total: int | None) -> float | None:
+        """
+        Estimate the seconds left.
+
+        Args:
+            bytes_scanned: Bytes scanned so far
+            bytes_total: Bytes to scan in total, None if not known yet
+
+        Returns:
+            Estimated seconds remaining, or None if there is no basis yet
+        """
+        now = self._paused_at if self._paused_at is not None else self._clock()
+        if self._start_time is None:
+            self._start_time = now
+            self._start_bytes = bytes_scanned
+        if not bytes_total:
+            return None
+
+        remaining = max(bytes_total - bytes_scanned, 0)
+        if remaining == 0:
+            return 0.0
+
+        live_rate = None
+        elapsed = now - self._start_time
+        if elapsed >= self.MIN_LIVE_SECONDS and bytes_scanned > self._start_bytes:
+            live_rate = (bytes_scanned - self._start_bytes) / elapsed
+
+        if live_rate is None:
+            rate = self._historical_rate
+        elif self._historical_rate is None:
+            rate = live_rate
+        else:
+            weight = min(1.0, bytes_scanned / (bytes_total * self.LIVE_WEIGHT_FRACTION))
+            rate = weight * live_rate + (1 - weight) * self._historical_rate
+
+        if not rate:
+            return None
+        return remaining / rate
+
+
+def format_eta(seconds: float) -> str:
+    """
+    Format an estimated time remaining for display.
+
+    Args:
+        seconds: Estimated seconds remaining
+
+    Returns:
+        Localized text such as "about 5 minutes left"
+    """
+    minutes = round(seconds / 60)
+    if minutes < 1:
+        return _("less than a minute left")
+    if minutes < 60:
+        return ngettext("about {n} minute left", "about {n} minutes left", minutes).format(
+            n=minutes
+        )
+    hours, minutes = divmod(minutes, 60)
+    return _("about {hours} h {minutes} min left").format(hours=hours, minutes=minutes)
@@ -0,0 +1,434 @@
+# ClamUI Scan Executor Module
+"""
+Parallel scanning of multiple targets for ClamUI.
+
+A MultiTargetScan scans a list of targets with bounded concurrency. Targets on
+the same storage device form a lane and are scanned one after another, since
+parallel walks of one disk compete for the same device; lanes on different
+devices run side by side, each on its own worker Scanner.
+
+How many lanes run at once comes from the max_parallel_scans setting (0 picks
+one per device, up to MAX_AUTO_PARALLEL) and from the backend:
+- daemon: the workers share clamd, splitting its worker threads and queue
+  between their session pools, so clamd is never oversubscribed
+- clamscan: every process loads the full signature database, so the number
+  of workers is capped by the available memory
+
+With a single worker the targets are scanned in order on the caller's scanner
+and each target reports its own progress; with several, the progress events of
+all targets are merged into one stream by CombinedProgress.
+
+Usage:
+    scan = MultiTargetScan(scanner, targets, settings_manager, is_cancelled)
+    for target, result in scan.run(progress_factory=create_callback):
+        ...
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .scanner_types import ScanProgress, ScanResult, ScanStatus
+
+if TYPE_CHECKING:
+    from .scanner import Scanner
+    from .settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# Workers used when max_parallel_scans is 0 (automatic)
+MAX_AUTO_PARALLEL = 4
+
+# Approximate resident size of a clamscan process with the full signature
+# database loaded; used to cap parallel clamscan processes by available memory
+CLAMSCAN_MEMORY_BYTES = 1536 * 1024 * 1024
+
+# Seconds between cancellation checks while workers are scanning
+CANCEL_POLL_INTERVAL = 0.1
+
+
+def get_available_memory() -> int | None:
+    """
+    Get the memory available for new processes.
+
+    Returns:
+        MemAvailable from /proc/meminfo in bytes, or None if unknown
+    """
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def get_clamscan_worker_limit() -> int:
+    """
+    Get how many clamscan processes fit in the available memory.
+
+    Returns:
+        Number of concurrent clamscan processes, at least 1
+    """
+    available = get_available_memory()
+    if available is None:
+        return 1
+    return max(1, available // CLAMSCAN_MEMORY_BYTES)
+
+
+def group_by_device(targets: list[str]) -> list[list[int]]:
+    """
+    Group targets by the storage device they live on.
+
+    Targets that cannot be examined are grouped together; their scans fail
+    quickly on validation anyway.
+
+    Args:
+        targets: Paths to scan
+
+    Returns:
+        Lanes of target indexes, in order of first appearance
+    """
+    lanes: dict[int | None, list[int]] = {}
+    for index, target in enumerate(targets):
+        try:
+            device = os.stat(target).st_dev
+        except OSError:
+            device = None
+        lanes.setdefault(device, []).append(index)
+    return list(lanes.values())
+
+
+class CombinedProgress:
+    """
+    Merges the progress events of targets scanned in parallel into one stream.
+
+    Every event sent on is the sum of the latest counts of all targets and
+    carries the infections of the event that triggered it. The totals remain
+    an estimate until every target has reported final totals or finished.
+    """
+
+    def __init__(self, callback: Callable[[ScanProgress], None], target_count: int):
+        """
+        Initialize the combined progress.
+
+        Args:
+            callback: Receives the merged ScanProgress events
+            target_count: Number of targets in the scan
+        """
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._targets: list[ScanProgress | None] = [None] * target_count
+        # Infected files already sent on, per target
+        self._reported: list[set[str]] = [set() for _ in range(target_count)]
+
+    def for_target(self, index: int) -> Callable[[ScanProgress], None]:
+        """
+        Get the progress callback for one target.
+
+        Args:
+            index: Index of the target
+
+        Returns:
+            Callback to pass to the target's scan
+        """
+
+        def on_progress(progress: ScanProgress) -> None:
+            with self._lock:
+                self._targets[index] = progress
+                self._reported[index].update(progress.new_infected_files)
+                self._send(progress.current_file, progress.new_infected_files)
+
+        return on_progress
+
+    def target_finished(self, index: int, result: ScanResult) -> None:
+        """
+        Mark a target as done so it no longer holds the totals open.
+
+        Infections of the result that no event reported, because the target
+        finished before its first event or after its last one, are sent on.
+
+        Args:
+            index: Index of the target
+            result: Result of the target's scan
+        """
+        with self._lock:
+            last = self._targets[index]
+            if last is None:
+                # Failed or empty before its first event
+                done = ScanProgress(
+                    result.path,
+                    result.scanned_files,
+                    result.scanned_files,
+                    result.infected_count,
+                )
+            else:
+                files_total = last.files_total if last.files_total is not None else 0
+                done = ScanProgress(
+                    last.current_file,
+                    max(last.files_scanned, files_total),
+                    max(last.files_scanned, files_total),
+                    max(last.infected_count, result.infected_count),
+                    bytes_scanned=last.bytes_total or last.bytes_scanned,
+                    bytes_total=last.bytes_total,
+                )
+            unreported = [
+                path for path in result.infected_files if path not in self._reported[index]
+            ]
+            self._reported[index].update(unreported)
+            self._targets[index] = done
+            self._send(done.current_file, unreported)
+
+    def _send(self, current_file: str, new_infected_files: list[str]) -> None:
+        """Send the sum of the latest counts of all targets."""
+        reported = [progress for progress in self._targets if progress is not None]
+        self._callback(
+            ScanProgress(
+                current_file=current_file,
+                files_scanned=sum(p.files_scanned for p in reported),
+                files_total=sum(p.files_total or 0 for p in reported),
+                infected_count=sum(p.infected_count for p in reported),
+                new_infected_files=list(new_infected_files),
+                bytes_scanned=sum(p.bytes_scanned for p in reported),
+                bytes_total=sum(p.bytes_total or 0 for p in reported),
+                total_is_estimate=(
+                    len(reported) < len(self._targets)
+                    or any(p.total_is_estimate or p.files_total is None for p in reported)
+                ),
+            )
+        )
+
+
+class MultiTargetScan:
+    """
+    Scans several targets, in parallel where they sit on different devices.
+
+    A scanner runs one scan at a time, so parallel lanes each get a worker
+    from Scanner.create_worker(). Cancellation is polled through is_cancelled;
+    once it returns True no further target is started and every running
+    worker is cancelled. Pausing and resuming the caller's scanner is passed
+    on to the workers.
+    """
+
+    def __init__(
+        self,
+        scanner: "Scanner",
+        targets: list[str],
+        settings_manager: "SettingsManager | None" = None,
+        is_cancelled: Callable[[], bool] | None = None,
+        **scan_options,
+    ):
+        """
+        Plan the scan.
+
+        Args:
+            scanner: Scanner used directly for sequential scans and to create
+                the workers of parallel ones
+            targets: Paths to scan
+            settings_manager: Optional settings providing max_parallel_scans
+            is_cancelled: Optional callable returning True once the whole
+                scan should stop
+            **scan_options: Further keyword arguments for Scanner.scan_sync()
+                (profile_exclusions, force_full_scan, resume,
+                load_governor_options, one_file_system,
+                trusted_package_files, risk_order_options, limits_options)
+        """
+        self._scanner = scanner
+        self._targets = list(targets)
+        self._is_cancelled = is_cancelled or (lambda: False)
+        self._scan_options = scan_options
+        self._lanes = group_by_device(self._targets) if len(self._targets) > 1 else []
+        self._workers = self._plan_workers(settings_manager)
+
+    def _plan_workers(self, settings_manager: "SettingsManager | None") -> int:
+        """Decide how many lanes are scanned at once."""
+        if len(self._lanes) < 2:
+            return 1
+
+        limit = 0
+        if settings_manager is not None:
+            value = settings_manager.get("max_parallel_scans", 0)
+            if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                limit = value
+        if limit == 0:
+            limit = MAX_AUTO_PARALLEL
+
+        workers = min(limit, len(self._lanes))
+        if workers > 1 and self._scanner.get_active_backend() == "clamscan":
+            memory_limit = get_clamscan_worker_limit()
+            if memory_limit < workers:
+                logger.info(
+                    "Limiting parallel clamscan processes to %d by available memory",
+                    memory_limit,
+                )
+                workers = memory_limit
+
+        if workers > 1:
+            logger.info(
+                "Scanning %d targets on %d devices, %d at a time",
+                len(self._targets),
+                len(self._lanes),
+                workers,
+            )
+        return workers
+
+    @property
+    def workers(self) -> int:
+        """Number of targets scanned at once."""
+        return self._workers
+
+    @property
+    def parallel(self) -> bool:
+        """Whether targets are scanned in parallel."""
+        return self._workers > 1
+
+    def run(
+        self,
+        progress_factory: Callable[[], Callable[[ScanProgress], None] | None] | None = None,
+        on_target_started: Callable[[int, str], None] | None = None,
+        on_target_finished: Callable[[int, str, ScanResult], None] | None = None,
+    ) -> list[tuple[str, ScanResult]]:
+        """
+        Scan the targets.
+
+        Args:
+            progress_factory: Optional factory for progress callbacks; called
+                once per target for sequential scans and once for parallel
+                ones, whose callback receives the merged progress
+            on_target_started: Called with the target index and path before
+                each target is scanned
+            on_target_finished: Called with the target index, path and result
+                after each target; on the worker's thread for parallel scans
+
+        Returns:
+            (target, result) pairs of the scanned targets in target order;
+            targets skipped after cancellation are missing
+
+        Raises:
+            Exception: Whatever a scanner raised; other workers are cancelled
+        """
+        if self.parallel:
+            results = self._run_parallel(progress_factory, on_target_started, on_target_finished)
+        else:
+            results = self._run_sequential(progress_factory, on_target_started, on_target_finished)
+        return [(self._targets[index], results[index]) for index in sorted(results)]
+
+    def _scan_target(
+        self,
+        scanner: "Scanner",
+        index: int,
+        progress_callback: Callable[[ScanProgress], None] | None,
+        on_target_started: Callable[[int, str], None] | None,
+        on_target_finished: Callable[[int, str, ScanResult], None] | None,
+    ) -> ScanResult:
+        """Scan one target, notifying the callbacks."""
+        target = self._targets[index]
+        if on_target_started is not None:
+            on_target_started(index, target)
+        result = scanner.scan_sync(
+            target,
+            recursive=True,
+            progress_callback=progress_callback,
+            **self._scan_options,
+        )
+        if on_target_finished is not None:
+            on_target_finished(index, target, result)
+        return result
+
+    def _run_sequential(self, progress_factory, on_target_started, on_target_finished):
+        """Scan the targets in order on the caller's scanner."""
+        results: dict[int, ScanResult] = {}
+        for index in range(len(self._targets)):
+            if self._is_cancelled():
+                logger.info(
+                    "Cancel all requested, skipping target %d/%d", index + 1, len(self._targets)
+                )
+                break
+            progress_callback = progress_factory() if progress_factory is not None else None
+            result = self._scan_target(
+                self._scanner, index, progress_callback, on_target_started, on_target_finished
+            )
+            results[index] = result
+            if result.status == ScanStatus.CANCELLED or self._is_cancelled():
+                break
+        return results
+
+    def _run_parallel(self, progress_factory, on_target_started, on_target_finished):
+        """Scan the lanes on worker scanners, polling for cancellation."""
+        combined = None
+        if progress_factory is not None:
+            callback = progress_factory()
+            if callback is not None:
+                combined = CombinedProgress(callback, len(self._targets))
+
+        lanes: queue.SimpleQueue = queue.SimpleQueue()
+        for lane in self._lanes:
+            lanes.put(lane)
+
+        results: dict[int, ScanResult] = {}
+        errors: list[BaseException] = []
+        stop = threading.Event()
+        scanners = [
+            self._scanner.create_worker(pool_shares=self._workers) for _ in range(self._workers)
+        ]
+
+        def should_stop() -> bool:
+            return stop.is_set() or self._is_cancelled()
+
+        def work(scanner: "Scanner") -> None:
+            try:
+                while not should_stop():
+                    try:
+                        lane = lanes.get_nowait()
+                    except queue.Empty:
+                        return
+                    for index in lane:
+                        if should_stop():
+                            return
+                        progress_callback = (
+                            combined.for_target(index) if combined is not None else None
+                        )
+                        result = self._scan_target(
+                            scanner, index, progress_callback, on_target_started, on_target_finished
+                        )
+                        results[index] = result
+                        if combined is not None:
+                            combined.target_finished(index, result)
+                        if result.status == ScanStatus.CANCELLED:
+                            stop.set()
+                            return
+            except BaseException as e:  # Surfaced by run() once all workers stopped
+                errors.append(e)
+                stop.set()
+
+        threads = [
+            threading.Thread(target=work, args=(scanner,), name=f"scan-target-{i}", daemon=True)
+            for i, scanner in enumerate(scanners)
+        ]
+        for thread in threads:
+            thread.start()
+
+        while True:
+            alive = [thread for thread in threads if thread.is_alive()]
+            if not alive:
+                break
+            if should_stop():
+                # Repeated while workers run, so a target starting right now
+                # (which resets its scanner's cancel flag) is cancelled as well
+                for scanner in scanners:
+                    scanner.cancel()
+            paused = self._scanner.is_paused
+            for scanner in scanners:
+                if paused and not scanner.is_paused:
+                    scanner.pause()
+                elif not paused and scanner.is_paused:
+                    scanner.resume()
+            alive[0].join(CANCEL_POLL_INTERVAL)
+
+        if errors:
+            raise errors[0]
+        return results
@@ -0,0 +1,217 @@
+# ClamUI Scan Limits Module
+"""
+Per-profile resource limits for ClamUI scans.
+
+A profile's "limits" option bounds what a scan costs:
+
+- max_filesize: Skip files larger than this many MiB
+- max_scansize: Read at most this many MiB of each file, archive members
+  included
+- max_recursion: Unpack archives nested at most this deep
+- max_files: Scan at most this many members of each archive
+- max_dir_depth: Enter directories at most this deep below the target
+- include_types: Scan only files whose name matches one of these globs
+- scan_archive, scan_pdf, scan_ole2: Set to false to not look inside
+  archives, PDFs or Office (OLE2) documents
+- temp_dir: Directory for files extracted while scanning
+
+clamscan receives them all as command-line flags. clamd reads its engine
+limits from clamd.conf only, so daemon scans apply max_filesize,
+max_dir_depth and include_types while walking the tree and ignore the rest.
+
+Usage:
+    limits = open_scan_limits(profile.options.get("limits"))
+    cmd.extend(limits.clamscan_args())
+    walker = ScanWalker(path, limits=limits)
+"""
+
+import fnmatch
+import logging
+from dataclasses import dataclass, field, fields
+
+logger = logging.getLogger(__name__)
+
+# Bytes per MiB, the unit of the size limits
+MIB = 1024 * 1024
+
+# Limits given in whole numbers
+_COUNT_FIELDS = ("max_filesize", "max_scansize", "max_recursion", "max_files", "max_dir_depth")
+
+# Toggles of the content scanned inside files
+_TOGGLE_FIELDS = ("scan_archive", "scan_pdf", "scan_ole2")
+
+
+@dataclass(frozen=True)
+class ScanLimits:
+    """Resource limits of a scan; None and True leave ClamAV's defaults."""
+
+    max_filesize: int | None = None
+    max_scansize: int | None = None
+    max_recursion: int | None = None
+    max_files: int | None = None
+    max_dir_depth: int | None = None
+    include_types: tuple[str, ...] = field(default=())
+    scan_archive: bool = True
+    scan_pdf: bool = True
+    scan_ole2: bool = True
+    temp_dir: str | None = None
+
+    @classmethod
+    def from_options(cls, options: dict | None) -> "ScanLimits":
+        """
+        Read the limits from a profile's "limits" option.
+
+        Args:
+            options: The option's object, or None
+
+        Returns:
+            The limits; missing keys keep their defaults
+
+        Raises:
+            ValueError: If the option or one of its values is invalid
+        """
+        if options is None:
+            return cls()
+        if not isinstance(options, dict):
+            raise ValueError("'limits' must be an object")
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(options) - known)
+        if unknown:
+            raise ValueError(f"Unknown limit: {unknown[0]}")
+
+        values: dict = {}
+        for name in _COUNT_FIELDS:
+            value = options.get(name)
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError(f"Limit '{name}' must be a whole number of at least 0")
+            values[name] = value
+        for name in _TOGGLE_FIELDS:
+            value = options.get(name, True)
+            if not isinstance(value, bool):
+                raise ValueError(f"Limit '{name}' must be true or false")
+            values[name] = value
+        include_types = options.get("include_types", [])
+        if not isinstance(include_types, list) or not all(
+            isinstance(pattern, str) and pattern.strip() for pattern in include_types
+        ):
+            raise ValueError("Limit 'include_types' must be a list of file name patterns")
+        values["include_types"] = tuple(pattern.strip() for pattern in include_types)
+        temp_dir = options.get("temp_dir")
+        if temp_dir is not None and (not isinstance(temp_dir, str) or not temp_dir.strip()):
+            raise ValueError("Limit 'temp_dir' must be a directory path")
+        values["temp_dir"] = temp_dir.strip() if temp_dir else None
+        return cls(**values)
+
+    def to_options(self) -> dict:
+        """
+        Get the limits as a profile's "limits" option.
+
+        Returns:
+            Only the limits that differ from the defaults
+        """
+        options: dict = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value != f.default:
+                options[f.name] = list(value) if isinstance(value, tuple) else value
+        return options
+
+    def __bool__(self) -> bool:
+        """Whether any limit is set."""
+        return self != ScanLimits()
+
+    @property
+    def narrows_scan(self) -> bool:
+        """
+        Whether files are scanned less thoroughly than ClamAV would by default.
+
+        Clean verdicts of such a scan must not be cached, since a later scan
+        without the limits would skip files it never fully inspected.
+        """
+        return (
+            self.max_scansize is not None
+            or self.max_recursion is not None
+            or self.max_files is not None
+            or not (self.scan_archive and self.scan_pdf and self.scan_ole2)
+        )
+
+    def clamscan_args(self) -> list[str]:
+        """
+        Get the clamscan flags for the limits.
+
+        Returns:
+            Command-line arguments, empty if no limit is set
+        """
+        # Deferred import: scanner imports this module
+        from .scanner import glob_to_regex
+
+        args = []
+        if self.max_filesize is not None:
+            args.append(f"--max-filesize={self.max_filesize}M")
+        if self.max_scansize is not None:
+            args.append(f"--max-scansize={self.max_scansize}M")
+        if self.max_recursion is not None:
+            args.append(f"--max-recursion={self.max_recursion}")
+        if self.max_files is not None:
+            args.append(f"--max-files={self.max_files}")
+        if self.max_dir_depth is not None:
+            args.append(f"--max-dir-recursion={self.max_dir_depth}")
+        args.extend(f"--include={glob_to_regex(pattern)}" for pattern in self.include_types)
+        if not self.scan_archive:
+            args.append("--scan-archive=no")
+        if not self.scan_pdf:
+            args.append("--scan-pdf=no")
+        if not self.scan_ole2:
+            args.append("--scan-ole2=no")
+        if self.temp_dir is not None:
+            args.append(f"--tempdir={self.temp_dir}")
+        return args
+
+    def accepts_file(self, name: str, size: int) -> bool:
+        """
+        Check a walked file against the limits applied while walking.
+
+        Args:
+            name: File name
+            size: File size in bytes
+
+        Returns:
+            False if the file is too large or not of an included type
+        """
+        if self.max_filesize and size > self.max_filesize * MIB:
+            return False
+        return not self.include_types or any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self.include_types
+        )
+
+    def accepts_depth(self, depth: int) -> bool:
+        """
+        Check whether a directory is shallow enough to enter.
+
+        Args:
+            depth: Depth below the scan target; its subdirectories are 1
+
+        Returns:
+            True if the directory is entered
+        """
+        return self.max_dir_depth is None or depth <= self.max_dir_depth
+
+
+def open_scan_limits(options: dict | None) -> ScanLimits | None:
+    """
+    Get the limits of a scan from a profile's "limits" option.
+
+    Args:
+        options: The option's object, or None
+
+    Returns:
+        The limits, or None if none are set or the option is invalid
+    """
+    try:
+        limits = ScanLimits.from_options(options)
+    except ValueError as e:
+        logger.warning("Ignoring the profile's scan limits: %s", e)
+        return None
+    return limits or None
@@ -0,0 +1,211 @@
+# ClamUI Scan Output Module
+"""
+Bounded-memory handling of scanner output for ClamUI.
+
+Verbose clamscan and clamdscan runs print one line per scanned file, so the
+raw output of a large scan can reach hundreds of megabytes. A ScanOutput
+parses each line as it arrives, keeping only the structured results (threats,
+skipped files, summary counts) and a fixed-size tail of the raw text for
+display. The complete output can optionally be written to a gzip-compressed
+spill file, which the log manager stores next to the scan's log entry.
+
+Usage:
+    output = ScanOutput(spill_path=log_manager.create_output_file())
+    stream_process_output(process, is_cancelled, on_line, output=output)
+    output.finish()
+    for file_path, threat_name in output.threats:
+        ...
+"""
+
+import gzip
+import logging
+import os
+import re
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Summary lines printed by clamscan: "Scanned files: 123"
+_SUMMARY_PATTERN = re.compile(r"^Scanned (files|directories):\s*(\d+)")
+
+
+class ScanOutput:
+    """
+    Incrementally parsed scanner output with a bounded in-memory tail.
+
+    Understands the line formats shared by clamscan and clamdscan:
+    "<path>: <threat> FOUND", "<path>: Failed to open file ERROR",
+    other "<path>: <message> ERROR" lines and clamscan's summary counts.
+    """
+
+    # Characters of raw output kept in memory for display
+    TAIL_CHARS = 256 * 1024
+
+    def __init__(self, tail_chars: int = TAIL_CHARS, spill_path: str | None = None):
+        """
+        Initialize the output.
+
+        Args:
+            tail_chars: Maximum characters of raw output to keep in memory
+            spill_path: Optional path of a gzip file receiving the full output
+        """
+        self._tail: deque[str] = deque()
+        self._tail_chars = 0
+        self._max_tail_chars = tail_chars
+        self._partial = ""
+        self._spill_path = spill_path
+        self._spill = None
+        if spill_path is not None:
+            try:
+                # Kept open for the whole scan and closed by finish()
+                self._spill = gzip.open(  # noqa: SIM115
+                    spill_path, "wt", encoding="utf-8", errors="replace"
+                )
+            except OSError as e:
+                logger.warning("Cannot write scan output to %s: %s", spill_path, e)
+                self._spill_path = None
+
+        self.lines_total = 0
+        self.lines_dropped = 0
+        self.threats: list[tuple[str, str]] = []
+        self.skipped_files: list[str] = []
+        self.failed_paths: list[str] = []
+        self.scanned_files = 0
+        self.scanned_dirs = 0
+
+    @classmethod
+    def from_text(cls, text: str) -> "ScanOutput":
+        """
+        Parse complete output held in a string.
+
+        Args:
+            text: Scanner output
+
+        Returns:
+            ScanOutput holding the parsed results
+        """
+        output = cls(tail_chars=len(text) + 1)
+        output.feed(text)
+        output.finish()
+        return output
+
+    @property
+    def spill_path(self) -> str | None:
+        """Get the path of the compressed full output, if one is written."""
+        return self._spill_path
+
+    @property
+    def truncated(self) -> bool:
+        """Whether earlier lines were dropped from the in-memory tail."""
+        return self.lines_dropped > 0
+
+    @property
+    def text(self) -> str:
+        """
+        Get the retained output.
+
+        Returns:
+            The tail of the output, preceded by a note when lines were dropped
+        """
+        tail = "\n".join(self._tail)
+        if not self.truncated:
+            return tail
+        note = f"[{self.lines_dropped} earlier line(s) omitted"
+        if self._spill_path is not None:
+            note += "; the full output is kept with the scan log"
+        return f"{note}]\n{tail}"
+
+    def feed(self, data: str) -> None:
+        """
+        Add a chunk of output; incomplete trailing lines are buffered.
+
+        Args:
+            data: Raw output text
+        """
+        if not data:
+            return
+        lines = (self._partial + data).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self.add_line(line)
+
+    def add_line(self, line: str) -> None:
+        """
+        Add one complete line of output (without its line break).
+
+        Args:
+            line: Output line
+        """
+        self.lines_total += 1
+        if self._spill is not None:
+            try:
+                self._spill.write(line + "\n")
+            except OSError as e:
+                logger.warning("Failed to write scan output spill: %s", e)
+                self.discard_spill()
+
+        self._tail.append(line)
+        self._tail_chars += len(line) + 1
+        while self._tail_chars > self._max_tail_chars and len(self._tail) > 1:
+            self._tail_chars -= len(self._tail.popleft()) + 1
+            self.lines_dropped += 1
+
+        self._parse(line.strip())
+
+    def _parse(self, line: str) -> None:
+        """Collect the structured result carried by a line, if any."""
+        if line.endswith("FOUND"):
+            # "/path/to/file: ThreatName FOUND"; rsplit keeps colons in paths
+            parts = line.rsplit(":", 1)
+            if len(parts) == 2:
+                file_path = parts[0].strip()
+                threat_part = parts[1].strip()
+                threat_name = (
+                    threat_part.rsplit(" ", 1)[0].strip()
+                    if " FOUND" in threat_part
+                    else threat_part
+                )
+                self.threats.append((file_path, threat_name))
+                self.failed_paths.append(file_path)
+        elif ": Failed to open file" in line:
+            # "/path/to/file: Failed to open file ERROR" (permission denied)
+            file_path = line.split(": Failed to open file")[0].strip()
+            if file_path:
+                self.skipped_files.append(file_path)
+                self.failed_paths.append(file_path)
+        elif line.endswith("ERROR") and ": " in line:
+            self.failed_paths.append(line.rsplit(": ", 1)[0])
+        elif line.startswith("Scanned "):
+            match = _SUMMARY_PATTERN.match(line)
+            if match is not None:
+                if match.group(1) == "files":
+                    self.scanned_files = int(match.group(2))
+                else:
+                    self.scanned_dirs = int(match.group(2))
+
+    def finish(self) -> None:
+        """Process a final line without a line break and close the spill file."""
+        if self._partial:
+            partial, self._partial = self._partial, ""
+            self.add_line(partial)
+        self._close_spill()
+
+    def _close_spill(self) -> None:
+        """Close the spill file."""
+        if self._spill is None:
+            return
+        spill, self._spill = self._spill, None
+        try:
+            spill.close()
+        except OSError as e:
+            logger.warning("Failed to finish scan output spill: %s", e)
+
+    def discard_spill(self) -> None:
+        """Close and remove the spill file, e.g. when the scan failed."""
+        self._close_spill()
+        if self._spill_path is not None:
+            try:
+                os.unlink(self._spill_path)
+            except OSError:
+                pass
+            self._spill_path = None
@@ -0,0 +1,931 @@
+# ClamUI Scan Walker Module
+"""
+Single-pass traversal of scan targets for ClamUI.
+
+A ScanWalker walks a scan target once, applies exclusions and the scan cache
+as it goes and keeps running file and directory counts, so the scanners no
+longer need a separate counting pass before the scan itself. The walked paths
+are handed straight to the scanning backend: clamscan reads them from a named
+pipe through --file-list (FileListPipe), and the clamd session pool consumes
+them directly. iter_roots() instead yields whole directories wherever no
+exclusion applies, for clamdscan, which walks directories itself but has no
+way to skip excluded paths.
+
+The walk also sums the sizes of the files it finds, so progress can be
+weighted by bytes rather than file count.
+
+Given a MountFilter, the walk does not enter pseudo, remote or (in
+one-file-system mode) any other mounted filesystems, and records the mounts
+it skipped and the device boundaries it crossed. When the target spans
+several devices, each device is walked on its own thread, so trees on an SSD
+and an HDD are read concurrently.
+
+Given a PackageAllowlist, files unmodified since a package manager installed
+them are skipped and counted like cached ones.
+
+Given a FileDedup, files that are hardlinks of (or, optionally, identical to)
+a file walked before are not yielded but recorded as its aliases.
+
+Given ScanLimits, directories deeper than the profile allows are not
+entered, and files too large or not of an included type are counted in
+limited_count instead of being yielded.
+
+Because the walk runs alongside the scan, the file total is only an estimate
+until the walk has finished. iter_ahead() lets the walk run a bounded distance
+ahead of the scan so that the estimate firms up early.
+
+Usage:
+    walker = ScanWalker(path, exclude=is_excluded, is_cancelled=event.is_set)
+    with FileListPipe() as pipe:
+        cmd = [clamscan, f"--file-list={pipe.path}"]
+        pipe.start(walker.iter_ahead(), should_stop)
+        ...  # run clamscan, reading walker.files_found for progress
+"""
+
+import errno
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .flatpak import is_flatpak
+
+if TYPE_CHECKING:
+    from .mounts import MountFilter
+    from .package_allowlist import PackageAllowlist
+    from .risk_order import RiskOrder
+    from .scan_cache import ScanCache
+    from .scan_checkpoint import CheckpointTracker
+    from .scan_dedup import FileDedup
+    from .scan_limits import ScanLimits
+
+logger = logging.getLogger(__name__)
+
+# Callable deciding whether a walked entry is excluded: (path, name, is_dir) -> bool
+ExcludeCallable = Callable[[str, str, bool], bool]
+
+# Marks the end of a walk spread over several devices
+_WALK_DONE = object()
+
+# Seconds between stop checks while a device walk waits for the consumer
+_DEVICE_PUT_TIMEOUT = 0.1
+
+
+class ScanWalker:
+    """
+    Walk a scan target once, counting what will be scanned.
+
+    The walk is depth-first over os.scandir(). Symlinks, devices, FIFOs and
+    sockets are skipped, matching clamscan -r and clamdscan, and unreadable
+    directories are silently skipped. Excluded directories are never entered.
+
+    Files with a cached clean verdict are counted in cached_count instead of
+    being yielded; every yielded file is recorded as pending in the cache.
+    File sizes are summed in bytes_found and cached_bytes, and the size of
+    each yielded file can be kept until take_size() collects it.
+
+    With a checkpoint, entries an earlier run already scanned are skipped,
+    and every listed directory and yielded file is reported to it.
+
+    With a mount filter, skipped mount points are not entered and are listed
+    in skipped_mounts; entered mounts on other devices are listed in
+    device_boundaries. Iterating over the files of a target that spans
+    several devices walks each device on its own thread.
+    """
+
+    # Default number of paths iter_ahead() may walk ahead of the consumer
+    READ_AHEAD = 65536
+
+    # Paths the device walks may queue for the consumer
+    DEVICE_QUEUE_SIZE = 1024
+
+    def __init__(
+        self,
+        path: str,
+        exclude: ExcludeCallable | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+        cache: "ScanCache | None" = None,
+        track_sizes: bool = False,
+        checkpoint: "CheckpointTracker | None" = None,
+        mounts: "MountFilter | None" = None,
+        dedup: "FileDedup | None" = None,
+        trusted: "PackageAllowlist | None" = None,
+        limits: "ScanLimits | None" = None,
+    ):
+        """
+        Initialize the walker.
+
+        Args:
+            path: File or directory to walk
+            exclude: Optional callable returning True for excluded entries
+            is_cancelled: Optional callable that stops the walk when it returns True
+            cache: Optional open scan cache for an incremental scan
+            track_sizes: Keep the size of each yielded file for take_size();
+                only useful when the consumer collects them
+            checkpoint: Optional checkpoint of a resumable scan; used when
+                iterating over single files, not by iter_roots()
+            mounts: Optional mount points below path and the policy deciding
+                which of them are entered
+            dedup: Optional duplicate tracker; files duplicating a walked
+                file are recorded as its aliases instead of being yielded
+                (not used by iter_roots())
+            trusted: Optional allowlist of unmodified package files, which
+                are skipped (not used by iter_roots())
+            limits: Optional profile limits on directory depth, file size
+                and file types (not used by iter_roots())
+        """
+        self._path = path
+        self._exclude = exclude
+        self._is_cancelled = is_cancelled or (lambda: False)
+        self._stopped = False
+        self._cache = cache
+        self._checkpoint = checkpoint
+        self._mounts = mounts
+        self.dedup = dedup
+        self._trusted = trusted
+        self._limits = limits
+        self._count_thread: threading.Thread | None = None
+        # Guards the counts while several devices are walked at once
+        self._lock = threading.Lock()
+        self.skipped_mounts: list[str] = []
+        self.device_boundaries: list[str] = []
+        self.files_found = 0
+        self.dirs_found = 0
+        self.cached_count = 0
+        self.bytes_found = 0
+        self.cached_bytes = 0
+        self.trusted_count = 0
+        self.trusted_bytes = 0
+        # Files outside the profile's limits
+        self.limited_count = 0
+        # Walked files a risk order cap left out of the scan
+        self.unscanned: list[str] = []
+        # Sizes of yielded files not yet reported as scanned
+        self._track_sizes = track_sizes
+        self._sizes: dict[str, int] = {}
+        self._finished = False
+        # Seconds from the start of the walk until the whole tree was walked
+        self.walk_duration = 0.0
+        self._walk_started = 0.0
+
+    @property
+    def path(self) -> str:
+        """Get the walked path."""
+        return self._path
+
+    @property
+    def finished(self) -> bool:
+        """Whether the whole tree has been walked."""
+        return self._finished
+
+    @property
+    def files_total(self) -> int:
+        """
+        Get the number of files found so far, including cached ones.
+
+        This is final once finished is True and an estimate before that.
+        """
+        return self.files_found + self.cached_count
+
+    @property
+    def bytes_total(self) -> int:
+        """
+        Get the size of the files found so far, including cached ones.
+
+        This is final once finished is True and an estimate before that.
+        """
+        return self.bytes_found + self.cached_bytes
+
+    def take_size(self, path: str) -> int:
+        """
+        Get the size of a file reported as scanned.
+
+        Sizes of files yielded by the walk are kept until collected here;
+        other files (below directories yielded by iter_roots()) are looked up.
+
+        Args:
+            path: Path of a scanned file
+
+        Returns:
+            File size in bytes, or 0 if it cannot be determined
+        """
+        size = self._sizes.pop(path, None)
+        if size is not None:
+            return size
+        try:
+            return os.lstat(path).st_size
+        except OSError:
+            return 0
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Walk the target, yielding the paths of files to scan.
+
+        Yields:
+            Paths of regular files that are neither excluded nor cached clean
+        """
+        self._reset()
+        if not os.path.isdir(self._path):
+            if os.path.isfile(self._path) and self._accept(self._path, None):
+                yield self._path
+            self._finish(True)
+            return
+
+        if self._mounts is not None and len(self._mounts.devices) > 1:
+            completed = yield from self._walk_devices()
+        else:
+            completed = yield from self._walk([self._path])
+        self._finish(completed)
+
+    def _walk(
+        self,
+        roots: list[str],
+        device: str | None = None,
+        handoff: Callable[[str, str], None] | None = None,
+        halt: threading.Event | None = None,
+    ) -> Generator[str, None, bool]:
+        """
+        Walk directories depth-first, yielding the files to scan.
+
+        Args:
+            roots: Directories to walk
+            device: Device this walk covers, when devices are walked apart
+            handoff: Called with the device and path of each entered mount on
+                another device, which is then left to that device's walk
+            halt: Optional event that stops the walk
+
+        Returns:
+            True if the walk completed, False if it was stopped or cancelled
+        """
+        checkpoint = self._checkpoint
+        stack = list(roots)
+        while stack:
+            if self._stopped or (halt is not None and halt.is_set()):
+                return False
+            if self._is_cancelled():
+                logger.info("File walk cancelled by user")
+                return False
+            directory = stack.pop()
+            with self._lock:
+                self.dirs_found += 1
+            subdirs: list[str] = []
+            elsewhere: list[tuple[str, str]] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if checkpoint is not None and checkpoint.is_done(entry.path):
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                if self._is_excluded(entry.path, entry.name, True):
+                                    continue
+                                if not self._within_depth(entry.path):
+                                    continue
+                                enter, mount_device = self._check_mount(entry.path)
+                                if not enter:
+                                    continue
+                                subdirs.append(entry.path)
+                                if handoff is not None and mount_device not in (None, device):
+                                    elsewhere.append((mount_device, entry.path))
+                                else:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                if not self._is_excluded(
+                                    entry.path, entry.name, False
+                                ) and self._accept(entry.path, entry):
+                                    yield entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            if checkpoint is not None:
+                checkpoint.dir_listed(directory, subdirs)
+            # Only once the parent is listed, so a checkpoint sees it first
+            for mount_device, path in elsewhere:
+                handoff(mount_device, path)
+        return True
+
+    def _walk_devices(self) -> Generator[str, None, bool]:
+        """
+        Walk each device below the target on its own thread.
+
+        A walk reaching a mount on another device hands the mount point to
+        that device's thread, started on first use. The paths of all walks
+        are merged through a bounded queue.
+
+        Returns:
+            True if every walk completed
+        """
+        out: queue.Queue = queue.Queue(maxsize=self.DEVICE_QUEUE_SIZE)
+        halt = threading.Event()
+        lock = threading.Lock()
+        pending_roots: dict[str, queue.SimpleQueue] = {}
+        outstanding = 0
+        completed = True
+
+        def put(item: object) -> bool:
+            while not halt.is_set():
+                try:
+                    out.put(item, timeout=_DEVICE_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def handoff(device: str, path: str) -> None:
+            nonlocal outstanding
+            with lock:
+                outstanding += 1
+                roots = pending_roots.get(device)
+                if roots is None:
+                    roots = pending_roots[device] = queue.SimpleQueue()
+                    threading.Thread(
+                        target=work,
+                        args=(device, roots),
+                        name=f"clamui-walk-{device}",
+                        daemon=True,
+                    ).start()
+            roots.put(path)
+
+        def work(device: str, roots: queue.SimpleQueue) -> None:
+            nonlocal outstanding, completed
+            while True:
+                root = roots.get()
+                if root is None:
+                    return
+                walk = self._walk([root], device, handoff, halt)
+                try:
+                    while True:
+                        if not put(next(walk)):
+                            walk.close()
+                            break
+                except StopIteration as finished:
+                    if not finished.value:
+                        completed = False
+                except BaseException as e:  # Re-raised by the consumer
+                    put(e)
+                finally:
+                    with lock:
+                        outstanding -= 1
+                        last = outstanding == 0
+                    if last:
+                        put(_WALK_DONE)
+
+        logger.debug("Walking %s on %d devices", self._path, len(self._mounts.devices))
+        handoff(self._mounts.root_device or "", self._path)
+        try:
+            while True:
+                item = out.get()
+                if item is _WALK_DONE:
+                    return completed
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            halt.set()
+            with lock:
+                for roots in pending_roots.values():
+                    roots.put(None)
+
+    def iter_roots(self) -> Iterator[str]:
+        """
+        Walk the target, yielding the fewest paths that cover every file to scan.
+
+        A directory whose subtree contains no excluded entry is yielded as a
+        whole, so a scanner that walks directories itself (clamd, clamdscan)
+        keeps its own parallelism there; inside directories that do contain
+        an exclusion, the remaining files and clean subdirectories are
+        yielded individually. Excluded entries are therefore never handed to
+        the scanner. Counts cover every file below the yielded directories.
+
+        A subtree is known to be clean only once it has been walked, so its
+        path is held back until then; as soon as an exclusion turns up, the
+        held paths of the enclosing directories are released.
+
+        Yields:
+            Paths of directories and files to scan
+        """
+        if not os.path.isdir(self._path):
+            yield from self
+            return
+
+        self._reset()
+        stack = [self._enter(self._path)]
+        while stack:
+            if self._stopped:
+                return
+            if self._is_cancelled():
+                logger.info("File walk cancelled by user")
+                return
+            frame = stack[-1]
+
+            if frame.dirty:
+                # Every enclosing directory now contains an exclusion too
+                for ancestor in reversed(stack):
+                    if ancestor.held is None:
+                        break
+                    held, ancestor.held = ancestor.held, None
+                    yield from held
+                frame.dirty = False
+
+            if frame.subdirs:
+                stack.append(self._enter(frame.subdirs.pop()))
+                continue
+
+            stack.pop()
+            if frame.held is None:
+                yield from self._files_in(frame.path)
+            elif not stack or stack[-1].held is None:
+                yield frame.path
+            else:
+                stack[-1].held.append(frame.path)
+        self._finish(True)
+
+    def _reset(self) -> None:
+        """Reset the counts before a walk."""
+        self.files_found = self.dirs_found = self.cached_count = 0
+        self.bytes_found = self.cached_bytes = 0
+        self.trusted_count = self.trusted_bytes = self.limited_count = 0
+        self.unscanned = []
+        self.skipped_mounts = []
+        self.device_boundaries = []
+        self._sizes.clear()
+        self._finished = False
+        self.walk_duration = 0.0
+        self._walk_started = time.monotonic()
+
+    def _finish(self, completed: bool) -> None:
+        """Record the end of a walk; only a completed walk has a duration."""
+        self._finished = completed
+        if completed:
+            self.walk_duration = time.monotonic() - self._walk_started
+
+    def _check_mount(self, path: str) -> tuple[bool, str | None]:
+        """
+        Check a directory against the mount filter before entering it.
+
+        Args:
+            path: Directory about to be entered
+
+        Returns:
+            (enter, device): whether to enter the directory, and the device of
+            the mount if the directory is an entered mount point
+        """
+        if self._mounts is None:
+            return True, None
+        mount, reason = self._mounts.check(path)
+        if mount is None:
+            return True, None
+        if reason is not None:
+            logger.info("Not scanning %s: %s", mount.describe(path), reason)
+            with self._lock:
+                self.skipped_mounts.append(f"{mount.describe(path)}: {reason}")
+            return False, None
+        if mount.device != self._mounts.root_device:
+            with self._lock:
+                self.device_boundaries.append(mount.describe(path))
+        return True, mount.device
+
+    def _enter(self, directory: str) -> "_RootFrame":
+        """List a directory for iter_roots(), counting its files."""
+        self.dirs_found += 1
+        frame = _RootFrame(directory)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._is_excluded(entry.path, entry.name, True):
+                                frame.dirty = True
+                            elif self._check_mount(entry.path)[0]:
+                                frame.subdirs.append(entry.path)
+                            else:
+                                # A skipped mount must not be covered by a
+                                # yielded ancestor, like an exclusion
+                                frame.dirty = True
+                        elif entry.is_file(follow_symlinks=False):
+                            if self._is_excluded(entry.path, entry.name, False):
+                                frame.dirty = True
+                            else:
+                                self.files_found += 1
+                                self.bytes_found += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return frame
+
+    def _files_in(self, directory: str) -> Iterator[str]:
+        """Yield the files of a directory that are not excluded."""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and not self._is_excluded(
+                            entry.path, entry.name, False
+                        ):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    def _is_excluded(self, path: str, name: str, is_dir: bool) -> bool:
+        """Check an entry against the exclusion callable."""
+        return self._exclude is not None and self._exclude(path, name, is_dir)
+
+    def _within_depth(self, directory: str) -> bool:
+        """Check a directory below the target against the depth limit."""
+        if self._limits is None or self._limits.max_dir_depth is None:
+            return True
+        relative = os.path.relpath(directory, self._path)
+        return self._limits.accepts_depth(relative.count(os.sep) + 1)
+
+    def _accept(self, path: str, entry: os.DirEntry | None) -> bool:
+        """
+        Count a file, record its size and consult the profile limits, the
+        scan cache, the package allowlist and the duplicate tracker.
+
+        Args:
+            path: File path
+            entry: Directory entry for the file, or None for a single-file target
+
+        Returns:
+            True if the file needs scanning
+        """
+        try:
+            st = entry.stat(follow_symlinks=False) if entry else os.lstat(path)
+        except OSError:
+            st = None
+        if (
+            st is not None
+            and self._limits is not None
+            and not self._limits.accepts_file(os.path.basename(path), st.st_size)
+        ):
+            with self._lock:
+                self.limited_count += 1
+            return False
+        if st is not None and self._cache is not None and self._cache.is_clean(st):
+            with self._lock:
+                self.cached_count += 1
+                self.cached_bytes += st.st_size
+            return False
+        if st is not None and self._trusted is not None and self._trusted.is_trusted(path, st):
+            with self._lock:
+                self.trusted_count += 1
+                self.trusted_bytes += st.st_size
+            return False
+        if st is not None and self.dedup is not None and self.dedup.primary_for(path, st):
+            return False
+        with self._lock:
+            if st is not None:
+                if self._cache is not None:
+                    self._cache.add_pending(path, st)
+                self.bytes_found += st.st_size
+                if self._track_sizes:
+                    self._sizes[path] = st.st_size
+            self.files_found += 1
+            if self._checkpoint is not None:
+                self._checkpoint.file_queued(path, st.st_size if st is not None else 0)
+        return True
+
+    def _forget(self, path: str, size: int) -> None:
+        """Take a walked file back out of the scan totals; it will not be scanned."""
+        with self._lock:
+            self.files_found -= 1
+            self.bytes_found -= size
+            self._sizes.pop(path, None)
+            self.unscanned.append(path)
+
+    def stop(self) -> None:
+        """Stop the walk at the next directory."""
+        self._stopped = True
+
+    def count(self) -> tuple[int, int]:
+        """
+        Walk the whole target without consuming the paths.
+
+        Returns:
+            Tuple of (files_found, dirs_found)
+        """
+        for _path in self:
+            pass
+        return self.files_found, self.dirs_found
+
+    def count_in_background(self) -> None:
+        """
+        Run count() in a background thread.
+
+        Used where the scanner walks the tree itself and only the counts are
+        needed; files_found grows while the scan runs. Call wait() for the
+        final counts.
+        """
+        self._count_thread = threading.Thread(
+            target=self.count, name="clamui-scan-count", daemon=True
+        )
+        self._count_thread.start()
+
+    def wait(self) -> tuple[int, int]:
+        """
+        Wait for a count started by count_in_background().
+
+        Returns:
+            Tuple of (files_found, dirs_found)
+        """
+        if self._count_thread is not None:
+            self._count_thread.join()
+            self._count_thread = None
+        return self.files_found, self.dirs_found
+
+    def iter_ahead(
+        self,
+        max_ahead: int | None = None,
+        roots: bool = False,
+        order: "RiskOrder | None" = None,
+    ) -> "ReadAhead":
+        """
+        Walk in a background thread, up to max_ahead paths ahead of the consumer.
+
+        Running ahead lets the counts (and so the progress total) firm up long
+        before the scan reaches the end of the tree, while memory stays bounded.
+
+        Args:
+            max_ahead: Maximum number of queued paths (default READ_AHEAD)
+            roots: Yield the paths from iter_roots() instead of single files
+            order: Optional risk order for single files; the whole tree is
+                walked before the first file is yielded, and files left out
+                by its caps are listed in unscanned
+
+        Returns:
+            Iterator over the paths to scan; close() stops the walk
+        """
+        if roots:
+            source: Iterable[str] = self.iter_roots()
+        elif order is not None:
+            source = order.order(self, self._forget)
+        else:
+            source = self
+        return ReadAhead(source, max_ahead or self.READ_AHEAD)
+
+
+class _RootFrame:
+    """A directory being walked by ScanWalker.iter_roots()."""
+
+    __slots__ = ("path", "subdirs", "held", "dirty")
+
+    def __init__(self, path: str):
+        self.path = path
+        # Subdirectories still to be walked
+        self.subdirs: list[str] = []
+        # Clean subdirectories waiting for this directory's verdict;
+        # None once the directory is known to contain an exclusion
+        self.held: list[str] | None = []
+        # Whether an exclusion was found that has not been propagated yet
+        self.dirty = False
+
+
+class ReadAhead:
+    """
+    Iterator that runs a ScanWalker walk in a background thread.
+
+    The walk starts as soon as the iterator is created and runs up to a fixed
+    number of paths ahead of the consumer.
+    """
+
+    # Poll interval for the walker thread while the queue is full
+    _QUEUE_POLL_INTERVAL = 0.1
+
+    _DONE = object()
+
+    def __init__(self, walker: Iterable[str], max_ahead: int):
+        """
+        Start walking.
+
+        Args:
+            walker: Walker (or walk generator) to run
+            max_ahead: Maximum number of queued paths
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_ahead)
+        self._stopped = threading.Event()
+        self._failure: BaseException | None = None
+        self._peeked: str | None = None
+        self._exhausted = False
+        self._thread = threading.Thread(
+            target=self._walk, args=(walker,), name="clamui-scan-walker", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: object) -> bool:
+        """Queue an item, giving up once the iterator is closed."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=self._QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _walk(self, walker: Iterable[str]) -> None:
+        """Walk the tree into the queue (runs in the walker thread)."""
+        try:
+            for path in walker:
+                if not self._put(path):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            self._failure = e
+        self._put(self._DONE)
+
+    def peek(self) -> str | None:
+        """
+        Get the next path without consuming it.
+
+        Returns:
+            The next path, or None if the walk produced no more files
+        """
+        if self._peeked is None:
+            try:
+                self._peeked = next(self)
+            except StopIteration:
+                return None
+        return self._peeked
+
+    def __iter__(self) -> "ReadAhead":
+        return self
+
+    def __next__(self) -> str:
+        if self._peeked is not None:
+            path, self._peeked = self._peeked, None
+            return path
+        if self._exhausted:
+            raise StopIteration
+        item = self._queue.get()
+        if item is self._DONE:
+            self._exhausted = True
+            if self._failure is not None:
+                raise self._failure
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop the walk and wait for the walker thread to exit."""
+        self._stopped.set()
+        self._thread.join()
+
+
+class FileListPipe:
+    """
+    Named pipe that streams file paths to clamscan --file-list.
+
+    clamscan reads its file list line by line, so paths written to the pipe
+    are scanned while the walk is still running. The pipe lives in a private
+    temporary directory; under Flatpak it is created in the application data
+    directory, which the host clamscan can reach at the same path.
+
+    Paths that cannot be represented in a file list (containing a line break,
+    or longer than clamscan's line buffer) are not written and are collected
+    in unlisted instead.
+    """
+
+    # clamscan reads each file list line with fgets() into a 1024-byte buffer,
+    # which leaves room for 1022 bytes of path plus the newline
+    MAX_PATH_BYTES = 1022
+
+    # Poll interval while waiting for clamscan to open the pipe
+    _OPEN_POLL_INTERVAL = 0.05
+
+    def __init__(self, directory: str | None = None):
+        """
+        Create the named pipe.
+
+        Args:
+            directory: Parent directory for the pipe (default: see class docstring)
+
+        Raises:
+            OSError: If the pipe cannot be created
+        """
+        if directory is None:
+            directory = self._default_directory()
+        if directory is not None:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._dir = tempfile.mkdtemp(prefix="clamui-filelist-", dir=directory)
+        self._path = os.path.join(self._dir, "files")
+        try:
+            os.mkfifo(self._path, 0o600)
+        except OSError:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            raise
+        self._thread: threading.Thread | None = None
+        self._closed = threading.Event()
+        self._completed = False
+        self.unlisted: list[str] = []
+
+    @staticmethod
+    def _default_directory() -> str | None:
+        """Get the pipe's parent directory, or None for the system temp directory."""
+        if not is_flatpak():
+            return None
+        data_home = os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+        return os.path.join(data_home, "clamui")
+
+    @property
+    def path(self) -> str:
+        """Get the path to pass as clamscan --file-list."""
+        return self._path
+
+    @property
+    def completed(self) -> bool:
+        """Whether every path was written and the list was closed."""
+        return self._completed
+
+    def start(self, paths: Iterable[str], should_stop: Callable[[], bool]) -> None:
+        """
+        Start writing paths to the pipe in a background thread.
+
+        The writer waits for clamscan to open the pipe and stops early when
+        should_stop returns True, when clamscan closes its end or when the
+        pipe is closed.
+
+        Args:
+            paths: File paths to list
+            should_stop: Callable returning True once clamscan has exited
+                or the scan was cancelled
+        """
+        self._thread = threading.Thread(
+            target=self._write, args=(paths, should_stop), name="clamui-file-list", daemon=True
+        )
+        self._thread.start()
+
+    def _stopping(self, should_stop: Callable[[], bool]) -> bool:
+        """Check whether writing should stop."""
+        return self._closed.is_set() or should_stop()
+
+    def _open_writer(self, should_stop: Callable[[], bool]) -> int | None:
+        """
+        Open the write end once clamscan has opened the read end.
+
+        Opening without O_NONBLOCK would block until a reader appears, with
+        no way to give up if clamscan fails to start.
+
+        Returns:
+            File descriptor, or None if writing should stop
+        """
+        while not self._stopping(should_stop):
+            try:
+                fd = os.open(self._path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if e.errno != errno.ENXIO:
+                    raise
+                time.sleep(self._OPEN_POLL_INTERVAL)
+                continue
+            os.set_blocking(fd, True)
+            return fd
+        return None
+
+    def _write(self, paths: Iterable[str], should_stop: Callable[[], bool]) -> None:
+        """Write paths to the pipe (runs in the writer thread)."""
+        iterator = iter(paths)
+        fd = None
+        try:
+            fd = self._open_writer(should_stop)
+            if fd is None:
+                return
+            for path in iterator:
+                if self._stopping(should_stop):
+                    return
+                line = os.fsencode(path)
+                if b"\n" in line or line.endswith(b"\r") or len(line) > self.MAX_PATH_BYTES:
+                    logger.warning("Cannot pass file to clamscan through a file list: %r", path)
+                    self.unlisted.append(path)
+                    continue
+                os.write(fd, line + b"\n")
+            self._completed = True
+        except BrokenPipeError:
+            logger.debug("clamscan closed its file list early")
+        except OSError as e:
+            logger.warning("Failed to write clamscan file list: %s", e)
+        finally:
+            if fd is not None:
+                os.close(fd)
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def close(self) -> None:
+        """Stop the writer and remove the pipe."""
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self) -> "FileListPipe":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
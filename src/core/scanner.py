@@ -5,7 +5,6 @@ Scanner module for ClamUI providing ClamAV subprocess execution and async scanni
 
 import fnmatch
 import logging
-import os
 import re
 import subprocess
 import threading
@@ -16,26 +15,43 @@ from typing import TYPE_CHECKING
 
 from gi.repository import GLib
 
-from .flatpak import get_clamav_database_dir
+from .backend_probe import check_clamav_installed, check_clamd_connection
+from .exclusions import ExclusionSet
+from .flatpak import get_clamav_database_dir, runs_on_host
+from .load_governor import LoadGovernor, LoadLevel, open_load_governor
 from .log_manager import LogManager
+from .mounts import MountFilter, MountPolicy
+from .package_allowlist import PackageAllowlist, open_package_allowlist
+from .risk_order import RiskOrder, open_risk_order
+from .scan_cache import ScanCache, get_database_version, open_scan_cache
+from .scan_checkpoint import CheckpointTracker, open_checkpoint
+from .scan_dedup import open_file_dedup
+from .scan_eta import historical_throughput
+from .scan_limits import ScanLimits, open_scan_limits
+from .scan_output import ScanOutput
+from .scan_walker import FileListPipe, ReadAhead, ScanWalker
 from .scanner_base import (
+    ScanPause,
+    apply_load_level,
     cleanup_process,
     communicate_with_cancel_check,
+    continue_process,
     create_cancelled_result,
     create_error_result,
+    create_progress_reporter,
+    create_scan_output,
     save_scan_log,
     stream_process_output,
+    suspend_process,
     terminate_process_gracefully,
 )
-from .scanner_types import ScanProgress, ScanResult, ScanStatus, ThreatDetail
+from .scanner_types import ScanProgress, ScanProgressState, ScanResult, ScanStatus, ThreatDetail
 from .settings_manager import SettingsManager
 from .threat_classifier import (
     categorize_threat,
     classify_threat_severity_str,
 )
 from .utils import (
-    check_clamav_installed,
-    check_clamd_connection,
     get_clamav_path,
     get_clean_env,
     validate_path,
@@ -44,10 +60,29 @@ from .utils import (
 
 if TYPE_CHECKING:
     from .daemon_scanner import DaemonScanner
+    from .user_clamd import UserClamd
 
 logger = logging.getLogger(__name__)
 
 
+def _report_verdict(checkpoint: CheckpointTracker, line: str) -> None:
+    """
+    Report a clamscan verdict line to the checkpoint of a resumable scan.
+
+    Args:
+        checkpoint: Checkpoint of the running scan
+        line: Output line, e.g. "/path: OK" or "/path: ThreatName FOUND"
+    """
+    line = line.strip()
+    if line.endswith((": OK", ": Empty file")):
+        checkpoint.file_done(line.rsplit(": ", 1)[0])
+    elif line.endswith(" FOUND"):
+        # rpartition keeps colons in paths
+        file_path, _sep, threat_name = line[: -len(" FOUND")].rpartition(": ")
+        if file_path:
+            checkpoint.file_done(file_path, threat_name)
+
+
 def glob_to_regex(pattern: str) -> str:
     """
     Convert a user-friendly glob pattern to POSIX ERE for ClamAV.
@@ -108,6 +143,7 @@ def validate_pattern(pattern: str) -> bool:
 __all__ = [
     "ScanStatus",
     "ScanProgress",
+    "ScanProgressState",
     "ThreatDetail",
     "ScanResult",
     "Scanner",
@@ -121,7 +157,8 @@ class Scanner:
     ClamAV scanner with async execution support.
 
     Supports multiple scan backends:
-    - "auto": Prefer daemon if available, fallback to clamscan
+    - "auto": Prefer daemon if available, then ClamUI's private daemon
+      (user_daemon_enabled), fallback to clamscan
     - "daemon": Use clamd daemon only (error if unavailable)
     - "clamscan": Use standalone clamscan only
 
@@ -133,6 +170,7 @@ class Scanner:
         self,
         log_manager: LogManager | None = None,
         settings_manager: SettingsManager | None = None,
+        pool_shares: int = 1,
     ):
         """
         Initialize the scanner.
@@ -142,13 +180,23 @@ class Scanner:
                          If not provided, a default instance is created.
             settings_manager: Optional SettingsManager instance for reading
                               exclusion patterns and scan backend settings.
+            pool_shares: Number of scanners scanning side by side; with the
+                         daemon backend they split clamd's worker threads.
         """
         self._current_process: subprocess.Popen | None = None
         self._process_lock = threading.Lock()
         self._cancel_event = threading.Event()
+        self._pause = ScanPause()
+        self._governor: LoadGovernor | None = None
+        self._mounts: MountFilter | None = None
+        self._allowlist: PackageAllowlist | None = None
+        self._risk_order: RiskOrder | None = None
+        self._limits: ScanLimits | None = None
         self._log_manager = log_manager if log_manager else LogManager()
         self._settings_manager = settings_manager
+        self._pool_shares = pool_shares
         self._daemon_scanner: DaemonScanner | None = None
+        self._user_daemon_scanner: DaemonScanner | None = None
 
     def _get_backend(self) -> str:
         """Get the configured scan backend.
@@ -167,16 +215,80 @@ class Scanner:
             from .daemon_scanner import DaemonScanner
 
             self._daemon_scanner = DaemonScanner(
-                log_manager=self._log_manager, settings_manager=self._settings_manager
+                log_manager=self._log_manager,
+                settings_manager=self._settings_manager,
+                pool_shares=self._pool_shares,
             )
+            if self.is_paused:
+                self._daemon_scanner.pause()
         return self._daemon_scanner
 
+    def _get_user_clamd(self) -> "UserClamd | None":
+        """
+        Get ClamUI's private daemon for auto mode without a system daemon.
+
+        Returns:
+            The shared UserClamd if enabled in the settings and it can be
+            started, None otherwise
+        """
+        if self._settings_manager is None:
+            return None
+        if self._settings_manager.get("user_daemon_enabled", True) is not True:
+            return None
+
+        from .user_clamd import DEFAULT_IDLE_TIMEOUT, get_user_clamd
+
+        idle_timeout = self._settings_manager.get("user_daemon_idle_timeout", DEFAULT_IDLE_TIMEOUT)
+        if not isinstance(idle_timeout, int | float) or idle_timeout <= 0:
+            idle_timeout = DEFAULT_IDLE_TIMEOUT
+        user_clamd = get_user_clamd(idle_timeout)
+        is_available, error = user_clamd.check_available()
+        if not is_available:
+            logger.debug("Private clamd not available: %s", error)
+            return None
+        return user_clamd
+
+    def _get_user_daemon_scanner(self, user_clamd: "UserClamd") -> "DaemonScanner":
+        """Get or create the daemon scanner using ClamUI's private daemon."""
+        if self._user_daemon_scanner is None:
+            from .daemon_scanner import DaemonScanner
+
+            self._user_daemon_scanner = DaemonScanner(
+                log_manager=self._log_manager,
+                settings_manager=self._settings_manager,
+                pool_shares=self._pool_shares,
+                user_clamd=user_clamd,
+            )
+            if self.is_paused:
+                self._user_daemon_scanner.pause()
+        return self._user_daemon_scanner
+
+    def create_worker(self, pool_shares: int = 1) -> "Scanner":
+        """
+        Create a scanner that can run alongside this one.
+
+        A scanner runs one scan at a time, so each target of a parallel
+        multi-target scan gets its own worker sharing the logs and settings.
+
+        Args:
+            pool_shares: Number of workers scanning side by side
+
+        Returns:
+            A new Scanner with the same log and settings managers, paused
+            if this one is
+        """
+        worker = Scanner(self._log_manager, self._settings_manager, pool_shares=pool_shares)
+        if self.is_paused:
+            worker.pause()
+        return worker
+
     def get_active_backend(self) -> str:
         """
         Get the backend that will actually be used for scanning.
 
         Returns:
-            "daemon" if daemon will be used, "clamscan" otherwise
+            "daemon" if the system daemon will be used, "user_daemon" for
+            ClamUI's private daemon, "clamscan" otherwise
         """
         backend = self._get_backend()
         if backend == "clamscan":
@@ -185,8 +297,25 @@ class Scanner:
             is_available, _ = self._get_daemon_scanner().check_available()
             return "daemon" if is_available else "unavailable"
         else:  # auto
-            is_available, _ = check_clamd_connection()
-            return "daemon" if is_available else "clamscan"
+            is_available, _ = check_clamd_connection(settings_manager=self._settings_manager)
+            if is_available:
+                return "daemon"
+            return "user_daemon" if self._get_user_clamd() is not None else "clamscan"
+
+    def get_historical_throughput(self) -> float | None:
+        """
+        Get the typical throughput of past scans on the active backend.
+
+        Used to estimate the time left in a scan before enough of it has run
+        to measure its own throughput.
+
+        Returns:
+            Median throughput in bytes per second, or None without usable history
+        """
+        backend = self.get_active_backend()
+        if backend == "unavailable":
+            return None
+        return historical_throughput(self._log_manager, backend)
 
     def check_available(self) -> tuple[bool, str | None]:
         """
@@ -195,9 +324,10 @@ class Scanner:
         Auto Backend Fallback Logic:
         1. Check if clamd daemon is accessible via socket connection
         2. If daemon available: return success with "Using clamd daemon"
-        3. If daemon unavailable: fall back to checking clamscan binary
-        4. If clamscan available: return success (scans will use clamscan)
-        5. If neither available: return error from clamscan check
+        3. If ClamUI's private daemon can be started: return success
+        4. Otherwise fall back to checking clamscan binary
+        5. If clamscan available: return success (scans will use clamscan)
+        6. If neither available: return error from clamscan check
 
         This ensures seamless fallback without user intervention, preferring
         the faster daemon when available but gracefully using clamscan otherwise.
@@ -213,9 +343,11 @@ class Scanner:
             return self._get_daemon_scanner().check_available()
         else:  # auto
             # For auto, check if daemon is available, otherwise fallback to clamscan
-            is_daemon_available, _ = check_clamd_connection()
+            is_daemon_available, _ = check_clamd_connection(settings_manager=self._settings_manager)
             if is_daemon_available:
                 return (True, "Using clamd daemon")
+            if self._get_user_clamd() is not None:
+                return (True, "Using private clamd daemon")
             return check_clamav_installed()
 
     def scan_sync(
@@ -224,6 +356,13 @@ class Scanner:
         recursive: bool = True,
         profile_exclusions: dict | None = None,
         progress_callback: Callable[[ScanProgress], None] | None = None,
+        force_full_scan: bool = False,
+        resume: bool = False,
+        load_governor_options: dict | None = None,
+        one_file_system: bool | None = None,
+        trusted_package_files: bool = False,
+        risk_order_options: dict | None = None,
+        limits_options: dict | None = None,
     ) -> ScanResult:
         """
         Execute a synchronous scan on the given path.
@@ -245,6 +384,25 @@ class Scanner:
             progress_callback: Optional callback for real-time progress updates.
                               If provided, verbose mode is used and callback receives
                               ScanProgress updates as files are scanned.
+            force_full_scan: Scan every file, ignoring cached clean verdicts from
+                             previous scans.
+            resume: Continue from the checkpoint of an interrupted scan of the
+                    same path and profile, if the signature database is
+                    unchanged (see scan_checkpoint).
+            load_governor_options: The "load_governor" option of the scan
+                    profile, overriding the load governor settings
+                    (see load_governor).
+            one_file_system: Do not enter other filesystems mounted below
+                    path, overriding the "scan_one_file_system" setting
+                    (see mounts).
+            trusted_package_files: Skip files that are unmodified since a
+                    package manager installed them (see package_allowlist).
+            risk_order_options: The "risk_order" option of the scan profile,
+                    scanning likely threats first, optionally capped to the
+                    riskiest files or a time budget (see risk_order).
+            limits_options: The "limits" option of the scan profile, bounding
+                    file sizes, archive unpacking, directory depth and the
+                    file types scanned (see scan_limits).
 
         Returns:
             ScanResult with scan details
@@ -254,12 +412,15 @@ class Scanner:
         # Reset cancel event at the start of every scan
         # This ensures a previous cancelled scan doesn't affect new scans
         self._cancel_event.clear()
+        self._pause.start_scan()
+        self._governor = open_load_governor(self._settings_manager, load_governor_options)
+        self._limits = open_scan_limits(limits_options)
 
         # Validate the path first
         is_valid, error = validate_path(path)
         if not is_valid:
             result = create_error_result(path, error or "Invalid path")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
         # Determine which backend to use
@@ -268,40 +429,277 @@ class Scanner:
         # For daemon-only mode, delegate entirely to daemon scanner
         if backend == "daemon":
             return self._get_daemon_scanner().scan_sync(
-                path, recursive, profile_exclusions, progress_callback=progress_callback
+                path,
+                recursive,
+                profile_exclusions,
+                progress_callback=progress_callback,
+                force_full_scan=force_full_scan,
+                resume=resume,
+                load_governor_options=load_governor_options,
+                one_file_system=one_file_system,
+                trusted_package_files=trusted_package_files,
+                risk_order_options=risk_order_options,
+                limits_options=limits_options,
             )
 
         # For auto mode, try daemon first if available
         if backend == "auto":
-            is_daemon_available, _ = check_clamd_connection()
+            is_daemon_available, _ = check_clamd_connection(settings_manager=self._settings_manager)
             if is_daemon_available:
                 return self._get_daemon_scanner().scan_sync(
-                    path, recursive, profile_exclusions, progress_callback=progress_callback
+                    path,
+                    recursive,
+                    profile_exclusions,
+                    progress_callback=progress_callback,
+                    force_full_scan=force_full_scan,
+                    resume=resume,
+                    load_governor_options=load_governor_options,
+                    one_file_system=one_file_system,
+                    trusted_package_files=trusted_package_files,
+                    risk_order_options=risk_order_options,
+                    limits_options=limits_options,
                 )
 
+            # Without a system daemon, keep the database loaded in a private one
+            user_clamd = self._get_user_clamd()
+            if user_clamd is not None:
+                is_running, error = user_clamd.acquire(self._cancel_event.is_set)
+                if is_running:
+                    try:
+                        return self._get_user_daemon_scanner(user_clamd).scan_sync(
+                            path,
+                            recursive,
+                            profile_exclusions,
+                            progress_callback=progress_callback,
+                            force_full_scan=force_full_scan,
+                            resume=resume,
+                            load_governor_options=load_governor_options,
+                            one_file_system=one_file_system,
+                            trusted_package_files=trusted_package_files,
+                            risk_order_options=risk_order_options,
+                            limits_options=limits_options,
+                        )
+                    finally:
+                        user_clamd.release()
+                if self._cancel_event.is_set():
+                    result = create_cancelled_result(path)
+                    self._save_scan_log(result, self._pause.active_duration(start_time))
+                    return result
+                logger.warning("Cannot start private clamd, using clamscan: %s", error)
+
         # Fall through to clamscan for "clamscan" mode or auto fallback
         is_installed, version_or_error = check_clamav_installed()
         if not is_installed:
             result = create_error_result(path, version_or_error or "ClamAV not installed")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
-        # Count files for progress tracking (if callback is provided)
-        files_total: int | None = None
-        if progress_callback is not None:
-            files_total = self._count_files(path, profile_exclusions)
-            # Check if cancelled during file counting
-            if self._cancel_event.is_set():
-                result = create_cancelled_result(path)
-                self._save_scan_log(result, time.monotonic() - start_time)
+        # Incremental scan: only files without a cached clean verdict are
+        # passed to clamscan
+        cache: ScanCache | None = None
+        checkpoint: CheckpointTracker | None = None
+        self._mounts = None
+        self._allowlist = None
+        self._risk_order = None
+        if recursive and Path(path).is_dir():
+            self._mounts = MountPolicy.from_settings(
+                self._settings_manager, one_file_system
+            ).filter_for(path)
+            self._allowlist = open_package_allowlist(trusted_package_files)
+            self._risk_order = open_risk_order(
+                risk_order_options, lambda: self._pause.active_duration(start_time)
+            )
+            db_version = get_database_version(version_or_error)
+            cache = open_scan_cache(self._settings_manager, db_version, force_full_scan)
+            checkpoint = open_checkpoint(
+                self._settings_manager,
+                path,
+                profile_exclusions,
+                db_version,
+                resume,
+                lambda: self._pause.active_duration(start_time),
+            )
+
+        try:
+            return self._run_clamscan(
+                path,
+                recursive,
+                profile_exclusions,
+                progress_callback,
+                cache,
+                start_time,
+                checkpoint,
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def _run_clamscan(
+        self,
+        path: str,
+        recursive: bool,
+        profile_exclusions: dict | None,
+        progress_callback: Callable[[ScanProgress], None] | None,
+        cache: ScanCache | None,
+        start_time: float,
+        checkpoint: CheckpointTracker | None = None,
+    ) -> ScanResult:
+        """
+        Run clamscan on a validated path and save the scan log.
+
+        Directories are walked once here and streamed to clamscan through
+        --file-list while the walk is still running, so there is no separate
+        counting pass and clamscan does not walk the tree a second time. The
+        progress total is an estimate until the walk has finished.
+
+        Args:
+            path: Path to file or directory to scan
+            recursive: Whether to scan directories recursively
+            profile_exclusions: Optional exclusions from a scan profile
+            progress_callback: Optional callback for real-time progress updates
+            cache: Open scan cache for an incremental scan, or None for a full scan
+            start_time: Monotonic time the scan started
+            checkpoint: Checkpoint of a resumable directory scan, or None
+
+        Returns:
+            ScanResult with scan details
+        """
+        walker: ScanWalker | None = None
+        paths: ReadAhead | None = None
+        file_list: FileListPipe | None = None
+
+        if recursive and Path(path).is_dir():
+            try:
+                file_list = FileListPipe()
+            except OSError as e:
+                logger.info("Cannot stream a file list, letting clamscan walk %s: %s", path, e)
+                cache = None
+                checkpoint = None
+            else:
+                walker = self._create_walker(
+                    path,
+                    profile_exclusions,
+                    cache,
+                    track_sizes=progress_callback is not None,
+                    checkpoint=checkpoint,
+                )
+                paths = walker.iter_ahead(order=self._risk_order)
+        elif progress_callback is not None and Path(path).is_file():
+            walker = ScanWalker(path)
+            walker.count()
+
+        try:
+            if (
+                (cache is not None or checkpoint is not None)
+                and paths is not None
+                and paths.peek() is None
+            ):
+                # Nothing to hand to clamscan: cancelled, or every file is
+                # unchanged since its last clean scan or was scanned before
+                # the scan was interrupted
+                if self._cancel_event.is_set():
+                    result = create_cancelled_result(path)
+                else:
+                    result = ScanResult(
+                        status=ScanStatus.CLEAN,
+                        path=path,
+                        stdout="",
+                        stderr="",
+                        exit_code=0,
+                        infected_files=[],
+                        scanned_files=0,
+                        scanned_dirs=walker.dirs_found,
+                        infected_count=0,
+                        error_message=None,
+                        threat_details=[],
+                        cached_count=walker.cached_count,
+                        trusted_count=walker.trusted_count,
+                        trusted_bytes=walker.trusted_bytes,
+                        skipped_mounts=walker.skipped_mounts,
+                        device_boundaries=walker.device_boundaries,
+                    )
+                duration = self._pause.active_duration(start_time)
+                if checkpoint is not None:
+                    checkpoint.finish(result, completed=result.status != ScanStatus.CANCELLED)
+                    duration += checkpoint.previous_duration
+                self._save_scan_log(result, duration)
                 return result
 
+            return self._execute_clamscan(
+                path,
+                recursive,
+                profile_exclusions,
+                progress_callback,
+                cache,
+                walker,
+                paths,
+                file_list,
+                start_time,
+                checkpoint,
+            )
+        finally:
+            if paths is not None:
+                paths.close()
+            if file_list is not None:
+                file_list.close()
+
+    def _execute_clamscan(
+        self,
+        path: str,
+        recursive: bool,
+        profile_exclusions: dict | None,
+        progress_callback: Callable[[ScanProgress], None] | None,
+        cache: ScanCache | None,
+        walker: ScanWalker | None,
+        paths: ReadAhead | None,
+        file_list: FileListPipe | None,
+        start_time: float,
+        checkpoint: CheckpointTracker | None = None,
+    ) -> ScanResult:
+        """
+        Start clamscan, feed it the walked files and collect the result.
+
+        A checkpointed scan runs clamscan without --infected, so that every
+        verdict is printed and reported to the checkpoint.
+
+        Args:
+            path: Path to file or directory to scan
+            recursive: Whether to scan directories recursively
+            profile_exclusions: Optional exclusions from a scan profile
+            progress_callback: Optional callback for real-time progress updates
+            cache: Open scan cache for an incremental scan, or None
+            walker: Walker supplying the progress total, or None
+            paths: Walked files to stream through file_list, or None
+            file_list: Pipe clamscan reads the walked files from, or None to
+                let clamscan walk path itself
+            start_time: Monotonic time the scan started
+            checkpoint: Checkpoint of a resumable scan, or None
+
+        Returns:
+            ScanResult with scan details
+        """
         # Build clamscan command (use verbose mode if progress callback provided)
         cmd = self._build_command(
-            path, recursive, profile_exclusions, verbose=progress_callback is not None
+            path,
+            recursive,
+            profile_exclusions,
+            verbose=progress_callback is not None or checkpoint is not None,
+            file_list=file_list.path if file_list is not None else None,
+            mounts=self._mounts if file_list is None else None,
+            limits=self._limits,
         )
 
+        def feeding_should_stop() -> bool:
+            process = self._current_process
+            return self._cancel_event.is_set() or (
+                process is not None and process.poll() is not None
+            )
+
+        output = create_scan_output(self._log_manager, self._settings_manager)
         try:
+            if file_list is not None and paths is not None:
+                file_list.start(paths, feeding_should_stop)
+
             with self._process_lock:
                 self._current_process = subprocess.Popen(
                     cmd,
@@ -310,6 +708,10 @@ class Scanner:
                     text=True,
                     env=get_clean_env(),
                 )
+                if self._pause.is_paused():
+                    suspend_process(self._current_process)
+            if self._governor is not None:
+                self._governor.start(self._apply_load_level)
 
             progress_files_scanned = 0
             progress_infected_count = 0
@@ -326,22 +728,33 @@ class Scanner:
                         progress_infected_count,
                         progress_infected_files,
                     ) = self._scan_with_progress(
-                        self._current_process, progress_callback, files_total
+                        self._current_process, progress_callback, walker, output, checkpoint
+                    )
+                elif checkpoint is not None:
+                    stdout, stderr, was_cancelled = stream_process_output(
+                        self._current_process,
+                        self._cancel_event.is_set,
+                        lambda line: _report_verdict(checkpoint, line),
+                        output=output,
                     )
                 else:
                     # Use standard blocking communication
                     stdout, stderr, was_cancelled = communicate_with_cancel_check(
-                        self._current_process, self._cancel_event.is_set
+                        self._current_process, self._cancel_event.is_set, output
                     )
                 exit_code = self._current_process.returncode
             finally:
                 # Ensure process is cleaned up even if communicate() raises
+                if self._governor is not None:
+                    self._governor.stop()
                 # Acquire lock to safely clear process reference and get it for cleanup
                 with self._process_lock:
                     process = self._current_process
                     self._current_process = None
                 # Perform cleanup outside lock to avoid holding it during I/O
                 cleanup_process(process)
+                if file_list is not None:
+                    file_list.close()
 
             # Check if cancelled during execution
             if was_cancelled:
@@ -354,165 +767,158 @@ class Scanner:
                     infected_files=progress_infected_files,
                     infected_count=progress_infected_count,
                 )
-                self._save_scan_log(result, time.monotonic() - start_time)
+                result.output_file = output.spill_path
+                duration = self._pause.active_duration(start_time)
+                if checkpoint is not None:
+                    checkpoint.finish(result, completed=False)
+                    duration += checkpoint.previous_duration
+                self._save_scan_log(result, duration)
                 return result
 
             # Parse the results
-            result = self._parse_results(path, stdout, stderr, exit_code)
-            self._save_scan_log(result, time.monotonic() - start_time)
+            result = self._result_from_output(path, output, stderr, exit_code)
+            if walker is not None:
+                result.scanned_bytes = walker.bytes_found
+                result.skipped_mounts = walker.skipped_mounts
+                result.device_boundaries = walker.device_boundaries
+                if walker.finished:
+                    result.timings["walk"] = walker.walk_duration
+            if file_list is not None and walker is not None:
+                self._apply_walk_results(result, walker, file_list)
+                if (
+                    cache is not None
+                    and file_list.completed
+                    and result.status in (ScanStatus.CLEAN, ScanStatus.INFECTED)
+                    and (self._limits is None or not self._limits.narrows_scan)
+                ):
+                    cache.commit(output.failed_paths + file_list.unlisted + walker.unscanned)
+            duration = self._pause.active_duration(start_time)
+            if checkpoint is not None:
+                checkpoint.finish(result, completed=file_list is not None and file_list.completed)
+                duration += checkpoint.previous_duration
+            self._save_scan_log(result, duration)
             return result
 
         except FileNotFoundError:
+            output.discard_spill()
             result = create_error_result(path, "ClamAV executable not found")
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
         except PermissionError as e:
+            output.discard_spill()
             result = create_error_result(path, f"Permission denied: {e}", str(e))
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
         except Exception as e:
+            output.discard_spill()
             result = create_error_result(path, f"Scan failed: {e}", str(e))
-            self._save_scan_log(result, time.monotonic() - start_time)
+            self._save_scan_log(result, self._pause.active_duration(start_time))
             return result
 
-    def _count_files(self, path: str, profile_exclusions: dict | None = None) -> int:
+    def _create_walker(
+        self,
+        path: str,
+        profile_exclusions: dict | None,
+        cache: ScanCache | None,
+        track_sizes: bool = False,
+        checkpoint: CheckpointTracker | None = None,
+    ) -> ScanWalker:
         """
-        Pre-count files for progress calculation.
-
-        Uses os.scandir for fast counting, respecting exclusion patterns.
+        Create the walker for a directory scan.
 
         Args:
-            path: Path to scan
+            path: Directory to scan
             profile_exclusions: Optional exclusions from a scan profile
+            cache: Open scan cache for an incremental scan, or None
+            track_sizes: Whether progress reporting collects the file sizes
+            checkpoint: Checkpoint of a resumable scan, or None
 
         Returns:
-            Total number of files that will be scanned
+            ScanWalker applying the settings, profile exclusions and mount
+            policy, and skipping duplicate and trusted package files if
+            enabled
         """
-        scan_path = Path(path)
-
-        # Single file scan
-        if scan_path.is_file():
-            return 1
-
-        # Not a valid path
-        if not scan_path.is_dir():
-            return 0
-
-        # Collect exclusion patterns
-        exclude_patterns: list[str] = []
-        exclude_dirs: list[str] = []
-
-        # Global exclusions from settings
-        if self._settings_manager is not None:
-            exclusions = self._settings_manager.get("exclusion_patterns", [])
-            for exclusion in exclusions:
-                if not exclusion.get("enabled", True):
-                    continue
-                pattern = exclusion.get("pattern", "")
-                if not pattern:
-                    continue
-                exclusion_type = exclusion.get("type", "pattern")
-                if exclusion_type == "directory":
-                    exclude_dirs.append(pattern)
-                else:
-                    exclude_patterns.append(pattern)
-
-        # Profile exclusions
-        if profile_exclusions:
-            for excl_path in profile_exclusions.get("paths", []):
-                if excl_path:
-                    if excl_path.startswith("~"):
-                        excl_path = str(Path(excl_path).expanduser())
-                    exclude_dirs.append(excl_path)
-
-            for pattern in profile_exclusions.get("patterns", []):
-                if pattern:
-                    exclude_patterns.append(pattern)
-
-        file_count = 0
-
-        try:
-            for root, dirs, files in os.walk(path):
-                # Check for cancellation during counting
-                if self._cancel_event.is_set():
-                    logger.info("File counting cancelled by user")
-                    return 0
-
-                # Filter out excluded directories (modifies dirs in-place)
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self._is_path_excluded(
-                        os.path.join(root, d), d, exclude_dirs, is_dir=True
-                    )
-                ]
-
-                # Count files that aren't excluded
-                for f in files:
-                    file_path = os.path.join(root, f)
-                    if not self._is_path_excluded(file_path, f, exclude_patterns, is_dir=False):
-                        file_count += 1
-        except (PermissionError, OSError):
-            # If we can't access the directory, return 0
-            pass
-
-        return file_count
+        exclusions = ExclusionSet.from_settings(self._settings_manager, profile_exclusions)
+        return ScanWalker(
+            path,
+            exclusions.is_excluded if exclusions else None,
+            self._cancel_event.is_set,
+            cache,
+            track_sizes,
+            checkpoint,
+            self._mounts,
+            open_file_dedup(self._settings_manager),
+            self._allowlist,
+            self._limits,
+        )
 
-    def _is_path_excluded(
-        self, full_path: str, name: str, patterns: list[str], is_dir: bool
-    ) -> bool:
+    @staticmethod
+    def _apply_walk_results(
+        result: ScanResult, walker: ScanWalker, file_list: FileListPipe
+    ) -> None:
         """
-        Check if a path matches any exclusion pattern.
+        Add what only the walk knows to a parsed clamscan result.
 
         Args:
-            full_path: Full path to check
-            name: Base name of the file/directory
-            patterns: List of exclusion patterns (glob or path)
-            is_dir: Whether this is a directory
-
-        Returns:
-            True if the path should be excluded
-        """
-        for pattern in patterns:
-            # Check if pattern is an absolute path
-            if pattern.startswith("/") or pattern.startswith("~"):
-                expanded = str(Path(pattern).expanduser()) if pattern.startswith("~") else pattern
-                if full_path.startswith(expanded):
-                    return True
-            # Check glob pattern against filename
-            elif fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(full_path, pattern):
-                return True
-        return False
+            result: Parsed result to update
+            walker: Walker that produced the file list
+            file_list: Pipe the files were streamed through
+        """
+        # clamscan counts no directories when it reads files from --file-list
+        if result.scanned_dirs == 0:
+            result.scanned_dirs = walker.dirs_found
+        result.cached_count = walker.cached_count
+        result.trusted_count = walker.trusted_count
+        result.trusted_bytes = walker.trusted_bytes
+        result.unscanned_count = len(walker.unscanned)
+        result.limited_count = walker.limited_count
+        if walker.dedup is not None:
+            walker.dedup.add_aliases(result)
+        if walker.unscanned and result.warning_message is None:
+            result.warning_message = (
+                f"{len(walker.unscanned)} lower-risk file(s) were not scanned (scan cap reached)"
+            )
+        if file_list.unlisted:
+            result.skipped_files.extend(file_list.unlisted)
+            result.skipped_count = len(result.skipped_files)
+            if result.warning_message is None:
+                result.warning_message = (
+                    f"{len(file_list.unlisted)} file(s) could not be passed to clamscan"
+                )
 
     def _scan_with_progress(
         self,
         process: subprocess.Popen,
         progress_callback: Callable[[ScanProgress], None],
-        files_total: int | None,
+        walker: ScanWalker | None,
+        output: ScanOutput | None = None,
+        checkpoint: CheckpointTracker | None = None,
     ) -> tuple[str, str, bool, int, int, list[str]]:
         """
         Scan with real-time progress updates.
 
-        Streams ClamAV verbose output and parses it to track progress,
-        calling the progress_callback for each file scanned.
+        Streams ClamAV verbose output and parses it to track progress. Updates
+        are coalesced by a ProgressReporter, so the callback receives at most
+        one ScanProgress per interval, carrying only newly found infections.
 
         Args:
             process: The subprocess running clamscan with -v flag
             progress_callback: Callback to receive ScanProgress updates
-            files_total: Total number of files to scan (for percentage)
+            walker: Walker supplying the total number of files to scan (for
+                percentage); the total is an estimate until the walk finishes
+            output: Optional ScanOutput collecting the results and a bounded
+                tail of the output
+            checkpoint: Optional checkpoint receiving the verdicts
 
         Returns:
             Tuple of (stdout, stderr, was_cancelled, files_scanned,
             infected_count, infected_files)
         """
-        files_scanned = 0
-        infected_count = 0
-        infected_files: list[str] = []
-        current_file = ""
+        reporter = create_progress_reporter(
+            progress_callback, self._settings_manager, walker, reports_start=True
+        )
 
         def on_line(line: str) -> None:
-            nonlocal files_scanned, infected_count, infected_files, current_file
-
             # Parse verbose ClamAV output
             # Format for scanning: "Scanning /path/to/file"
             # Format for infected: "/path/to/file: ThreatName FOUND"
@@ -520,42 +926,30 @@ class Scanner:
 
             if line.startswith("Scanning "):
                 # Extract file path from "Scanning /path/to/file"
-                current_file = line[9:]  # Remove "Scanning " prefix
-                files_scanned += 1
-
-                # Create and send progress update
-                progress = ScanProgress(
-                    current_file=current_file,
-                    files_scanned=files_scanned,
-                    files_total=files_total,
-                    infected_count=infected_count,
-                    infected_files=infected_files.copy(),
-                )
-                progress_callback(progress)
+                reporter.file_scanned(line[9:])  # Remove "Scanning " prefix
 
             elif line.endswith("FOUND"):
                 # Infected file detected
                 # Format: "/path/to/file: ThreatName FOUND"
                 parts = line.rsplit(":", 1)
                 if len(parts) == 2:
-                    file_path = parts[0].strip()
-                    infected_count += 1
-                    infected_files.append(file_path)
-
-                    # Send updated progress with new infection
-                    progress = ScanProgress(
-                        current_file=file_path,
-                        files_scanned=files_scanned,
-                        files_total=files_total,
-                        infected_count=infected_count,
-                        infected_files=infected_files.copy(),
-                    )
-                    progress_callback(progress)
+                    reporter.infection_found(parts[0].strip())
+
+            if checkpoint is not None:
+                _report_verdict(checkpoint, line)
 
         stdout, stderr, was_cancelled = stream_process_output(
-            process, self._cancel_event.is_set, on_line
+            process, self._cancel_event.is_set, on_line, output=output
+        )
+        reporter.flush()
+        return (
+            stdout,
+            stderr,
+            was_cancelled,
+            reporter.files_scanned,
+            len(reporter.infected_files),
+            reporter.infected_files,
         )
-        return stdout, stderr, was_cancelled, files_scanned, infected_count, infected_files
 
     def scan_async(
         self,
@@ -564,6 +958,7 @@ class Scanner:
         recursive: bool = True,
         profile_exclusions: dict | None = None,
         progress_callback: Callable[[ScanProgress], None] | None = None,
+        force_full_scan: bool = False,
     ) -> None:
         """
         Execute an asynchronous scan on the given path.
@@ -593,10 +988,13 @@ class Scanner:
             progress_callback: Optional callback for real-time progress updates.
                               If provided, callback receives ScanProgress updates
                               as files are scanned.
+            force_full_scan: Scan every file, ignoring cached clean verdicts.
         """
 
         def scan_thread():
-            result = self.scan_sync(path, recursive, profile_exclusions, progress_callback)
+            result = self.scan_sync(
+                path, recursive, profile_exclusions, progress_callback, force_full_scan
+            )
             # Schedule callback on main thread
             GLib.idle_add(callback, result)
 
@@ -625,15 +1023,78 @@ class Scanner:
         the grace period. Cancels both clamscan and daemon scanner if active.
         """
         self._cancel_event.set()
+        self._pause.resume()
         # Acquire lock to safely get process reference
         with self._process_lock:
             process = self._current_process
         # Terminate outside lock to avoid holding it during I/O
         terminate_process_gracefully(process)
 
-        # Also cancel daemon scanner if it exists
+        # Also cancel daemon scanners if they exist
         if self._daemon_scanner is not None:
             self._daemon_scanner.cancel()
+        if self._user_daemon_scanner is not None:
+            self._user_daemon_scanner.cancel()
+
+    @property
+    def is_paused(self) -> bool:
+        """Whether scanning is paused."""
+        return self._pause.is_paused()
+
+    @property
+    def can_pause(self) -> bool:
+        """
+        Whether pause() can stop the running scan.
+
+        A clamscan or clamdscan run on the host through flatpak-spawn under
+        Flatpak cannot be stopped from the sandbox, so such scans cannot be
+        paused.
+        """
+        with self._process_lock:
+            if runs_on_host(self._current_process):
+                return False
+        return all(
+            scanner.can_pause
+            for scanner in (self._daemon_scanner, self._user_daemon_scanner)
+            if scanner is not None
+        )
+
+    def pause(self) -> None:
+        """
+        Pause the current scan until resume() is called.
+
+        A running clamscan or clamdscan process is stopped with SIGSTOP,
+        unless it runs on the host under Flatpak (see can_pause); daemon
+        scans stop sending files to clamd and end their sessions.
+        Scans started while paused begin paused, and the paused time is not
+        counted in the logged scan duration.
+        """
+        if self._pause.pause():
+            logger.info("Pausing scan")
+        with self._process_lock:
+            suspend_process(self._current_process)
+        if self._daemon_scanner is not None:
+            self._daemon_scanner.pause()
+        if self._user_daemon_scanner is not None:
+            self._user_daemon_scanner.pause()
+
+    def resume(self) -> None:
+        """Resume a scan paused by pause(), unless the load governor holds it."""
+        if self._pause.resume():
+            logger.info("Resuming scan")
+        governor = self._governor
+        with self._process_lock:
+            if governor is None or not governor.is_paused():
+                continue_process(self._current_process)
+        if self._daemon_scanner is not None:
+            self._daemon_scanner.resume()
+        if self._user_daemon_scanner is not None:
+            self._user_daemon_scanner.resume()
+
+    def _apply_load_level(self, level: LoadLevel) -> None:
+        """Apply a load governor level to a running clamscan process."""
+        with self._process_lock:
+            apply_load_level(self._current_process, level, self._pause.is_paused())
 
     def _build_command(
         self,
@@ -641,6 +1102,9 @@ class Scanner:
         recursive: bool,
         profile_exclusions: dict | None = None,
         verbose: bool = False,
+        file_list: str | None = None,
+        mounts: MountFilter | None = None,
+        limits: ScanLimits | None = None,
     ) -> list[str]:
         """
         Build the clamscan command arguments.
@@ -655,6 +1119,10 @@ class Scanner:
                                Format: {"paths": ["/path1", ...], "patterns": ["*.ext", ...]}
             verbose: Whether to enable verbose mode for progress tracking.
                     When True, clamscan outputs each file as it's scanned.
+            file_list: Optional file with one path per line to scan instead of
+                       walking path (the walked files of a directory scan).
+            mounts: Mount filter to apply when clamscan walks path itself.
+            limits: Resource limits of the scan profile.
 
         Returns:
             List of command arguments (wrapped with flatpak-spawn if in Flatpak)
@@ -670,7 +1138,7 @@ class Scanner:
 
         # -r / --recursive: Scan subdirectories recursively
         # Add recursive flag for directories
-        if recursive and Path(path).is_dir():
+        if recursive and file_list is None and Path(path).is_dir():
             cmd.append("-r")
 
         # -v / --verbose: Output each file as it's scanned (enables progress tracking)
@@ -721,8 +1189,22 @@ class Scanner:
                 regex = glob_to_regex(pattern)
                 cmd.extend(["--exclude", regex])
 
-        # Add the path to scan
-        cmd.append(path)
+        # Keep clamscan's own walk out of the mounts the policy skips
+        if mounts is not None:
+            if mounts.policy.one_file_system:
+                cmd.append("--cross-fs=no")
+            for mount_path in mounts.skipped:
+                cmd.extend(["--exclude-dir", f"^{re.escape(mount_path)}$"])
+
+        # Resource limits of the scan profile
+        if limits is not None:
+            cmd.extend(limits.clamscan_args())
+
+        # Add the path to scan, or the list of files already walked
+        if file_list is not None:
+            cmd.append(f"--file-list={file_list}")
+        else:
+            cmd.append(path)
 
         # Wrap with flatpak-spawn if running inside Flatpak sandbox
         return wrap_host_command(cmd)
@@ -745,66 +1227,39 @@ class Scanner:
         Returns:
             Parsed ScanResult
         """
-        infected_files = []
-        threat_details = []
-        skipped_files = []
-        scanned_files = 0
-        scanned_dirs = 0
-        infected_count = 0
-
-        # Parse stdout line by line
-        for line in stdout.splitlines():
-            line = line.strip()
+        result = self._result_from_output(path, ScanOutput.from_text(stdout), stderr, exit_code)
+        result.stdout = stdout
+        return result
 
-            # Regex pattern: "/path/to/file: ThreatName FOUND"
-            # Uses rsplit to handle colons in file paths (e.g., Windows C:\)
-            # Look for infected file lines (format: "/path/to/file: Virus.Name FOUND")
-            if line.endswith("FOUND"):
-                # Extract file path and threat name
-                # Format: "/path/to/file: ThreatName FOUND"
-                parts = line.rsplit(":", 1)
-                if len(parts) == 2:
-                    file_path = parts[0].strip()
-                    # Extract threat name (remove " FOUND" suffix)
-                    threat_part = parts[1].strip()
-                    threat_name = (
-                        threat_part.rsplit(" ", 1)[0].strip()
-                        if " FOUND" in threat_part
-                        else threat_part
-                    )
+    def _result_from_output(
+        self, path: str, output: ScanOutput, stderr: str, exit_code: int
+    ) -> ScanResult:
+        """
+        Build a ScanResult from clamscan output parsed while it streamed.
 
-                    infected_files.append(file_path)
+        Args:
+            path: The scanned path
+            output: Parsed clamscan output
+            stderr: Standard error from clamscan
+            exit_code: Process exit code
 
-                    # Create ThreatDetail with classification
-                    threat_detail = ThreatDetail(
-                        file_path=file_path,
-                        threat_name=threat_name,
-                        category=categorize_threat(threat_name),
-                        severity=classify_threat_severity_str(threat_name),
-                    )
-                    threat_details.append(threat_detail)
-                    infected_count += 1
-
-            # Look for "Failed to open file" warnings (permission denied)
-            # Format: "/path/to/file: Failed to open file ERROR"
-            elif ": Failed to open file" in line:
-                # Extract the file path (everything before ": Failed to open file")
-                file_path = line.split(": Failed to open file")[0].strip()
-                if file_path:
-                    skipped_files.append(file_path)
-
-            # Regex pattern for statistics: "Scanned files: 123"
-            # Captures numeric value after the label
-            # Look for individual summary lines from ClamAV output
-            # Format: "Scanned files: 10" or "Scanned directories: 1" or "Infected files: 0"
-            elif line.startswith("Scanned files:"):
-                match = re.search(r"Scanned files:\s*(\d+)", line)
-                if match:
-                    scanned_files = int(match.group(1))
-            elif line.startswith("Scanned directories:"):
-                match = re.search(r"Scanned directories:\s*(\d+)", line)
-                if match:
-                    scanned_dirs = int(match.group(1))
+        Returns:
+            ScanResult whose stdout is the retained tail of the output
+        """
+        infected_files = []
+        threat_details = []
+        for file_path, threat_name in output.threats:
+            infected_files.append(file_path)
+            threat_details.append(
+                ThreatDetail(
+                    file_path=file_path,
+                    threat_name=threat_name,
+                    category=categorize_threat(threat_name),
+                    severity=classify_threat_severity_str(threat_name),
+                )
+            )
+        infected_count = len(threat_details)
+        skipped_files = list(output.skipped_files)
 
         # Determine overall status based on exit code
         warning_message = None
@@ -826,20 +1281,23 @@ class Scanner:
         return ScanResult(
             status=status,
             path=path,
-            stdout=stdout,
+            stdout=output.text,
             stderr=stderr,
             exit_code=exit_code,
             infected_files=infected_files,
-            scanned_files=scanned_files,
-            scanned_dirs=scanned_dirs,
+            scanned_files=output.scanned_files,
+            scanned_dirs=output.scanned_dirs,
             infected_count=infected_count,
             error_message=stderr if status == ScanStatus.ERROR else None,
             threat_details=threat_details,
             skipped_files=skipped_files,
             skipped_count=len(skipped_files),
             warning_message=warning_message,
+            output_file=output.spill_path,
         )
 
     def _save_scan_log(self, result: ScanResult, duration: float) -> None:
-        """Save scan result to log."""
-        save_scan_log(self._log_manager, result, duration)
+        """Save scan result to log, with the load governor's decisions."""
+        if self._governor is not None:
+            result.load_decisions = self._governor.describe_decisions()
+        save_scan_log(self._log_manager, result, duration, backend="clamscan")
@@ -6,20 +6,34 @@ This module provides common functionality used by both Scanner (clamscan) and
 DaemonScanner (clamdscan) to avoid code duplication:
 - Process communication with cancellation support
 - Streaming output with progress callbacks
+- Coalesced, delta-based progress reporting
 - Process termination with graceful shutdown
+- Pausing scans, with paused time kept out of their duration
+- Applying load governor levels to scanner processes
 - Scan log saving
 - Error result creation
 """
 
+import contextlib
 import logging
 import os
 import select
+import signal
 import subprocess
+import threading
+import time
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
+from .flatpak import runs_on_host
 from .i18n import _
+from .load_governor import LoadLevel, lower_process_priority
 from .log_manager import LogEntry, LogManager
-from .scanner_types import ScanResult, ScanStatus
+from .scan_output import ScanOutput
+from .scanner_types import ScanProgress, ScanResult, ScanStatus
+
+if TYPE_CHECKING:
+    from .scan_walker import ScanWalker
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +41,13 @@ logger = logging.getLogger(__name__)
 TERMINATE_GRACE_TIMEOUT = 5  # Time to wait after SIGTERM before SIGKILL
 KILL_WAIT_TIMEOUT = 2  # Time to wait after SIGKILL
 STREAM_POLL_TIMEOUT = 0.1  # select() timeout for checking cancellation between output reads
+PROGRESS_UPDATE_INTERVAL_MS = 100  # Default minimum time between progress events
 
 
 def communicate_with_cancel_check(
     process: subprocess.Popen,
     is_cancelled: Callable[[], bool],
+    output: ScanOutput | None = None,
 ) -> tuple[str, str, bool]:
     """
     Communicate with process while checking for cancellation.
@@ -54,6 +70,8 @@ def communicate_with_cancel_check(
     Args:
         process: The subprocess to communicate with.
         is_cancelled: Callable that returns True if operation was cancelled.
+        output: Optional ScanOutput that parses stdout; the returned stdout is
+            then only its retained tail.
 
     Returns:
         Tuple of (stdout, stderr, was_cancelled).
@@ -61,33 +79,55 @@ def communicate_with_cancel_check(
     stdout_parts: list[str] = []
     stderr_parts: list[str] = []
 
+    def collect(stdout: str | None, stderr: str | None) -> tuple[str, str]:
+        if output is not None:
+            output.feed(stdout or "")
+            output.finish()
+        else:
+            stdout_parts.append(stdout or "")
+        stderr_parts.append(stderr or "")
+        stdout_text = output.text if output is not None else "".join(stdout_parts)
+        return stdout_text, "".join(stderr_parts)
+
     while True:
         if is_cancelled():
             # Terminate process and collect any remaining output
+            stdout = stderr = None
             try:
                 process.terminate()
                 stdout, stderr = process.communicate(timeout=2.0)
-                stdout_parts.append(stdout or "")
-                stderr_parts.append(stderr or "")
             except subprocess.TimeoutExpired:
                 process.kill()
                 process.wait()
-            return "".join(stdout_parts), "".join(stderr_parts), True
+            return (*collect(stdout, stderr), True)
 
         try:
             stdout, stderr = process.communicate(timeout=0.5)
-            stdout_parts.append(stdout or "")
-            stderr_parts.append(stderr or "")
-            return "".join(stdout_parts), "".join(stderr_parts), False
+            return (*collect(stdout, stderr), False)
         except subprocess.TimeoutExpired:
             continue  # Loop again, check cancel flag
 
 
+def _read_available(fd: int) -> str:
+    """Read everything left in a pipe via os.read() until EOF or error."""
+    chunks = []
+    while True:
+        try:
+            raw = os.read(fd, 4096)
+        except OSError:
+            break
+        if not raw:
+            break
+        chunks.append(raw.decode("utf-8", errors="replace"))
+    return "".join(chunks)
+
+
 def stream_process_output(
     process: subprocess.Popen,
     is_cancelled: Callable[[], bool],
     on_line: Callable[[str], None],
     poll_interval: float = STREAM_POLL_TIMEOUT,
+    output: ScanOutput | None = None,
 ) -> tuple[str, str, bool]:
     """
     Stream stdout line-by-line with cancellation support.
@@ -109,15 +149,21 @@ def stream_process_output(
     Uses select/poll for non-blocking reads to maintain cancellation responsiveness.
     Each line from stdout is passed to the on_line callback in real-time.
 
+    Without an output, all of stdout is accumulated and returned for final
+    parsing. With one, every line is handed to it instead, so memory use stays
+    bounded however long the scan runs.
+
     Args:
         process: The subprocess to communicate with (must have stdout=PIPE, stderr=PIPE).
         is_cancelled: Callable that returns True if operation was cancelled.
         on_line: Callback function called with each line from stdout.
         poll_interval: Time to wait for output before checking cancellation (seconds).
+        output: Optional ScanOutput parsing the lines as they arrive.
 
     Returns:
         Tuple of (stdout, stderr, was_cancelled).
-        Note: stdout contains all accumulated output for final parsing.
+        Note: stdout contains all accumulated output for final parsing, or
+        the output's retained tail when an output is given.
     """
     stdout_parts: list[str] = []
     stderr_parts: list[str] = []
@@ -125,12 +171,29 @@ def stream_process_output(
     if process.stdout is None or process.stderr is None:
         # Fallback to blocking communicate if pipes not available
         logger.warning("stream_process_output called without stdout/stderr pipes")
-        return communicate_with_cancel_check(process, is_cancelled)
+        return communicate_with_cancel_check(process, is_cancelled, output)
 
     # Get file descriptor for stdout
     stdout_fd = process.stdout.fileno()
     incomplete_line = ""
 
+    def process_lines(data: str, final: bool) -> str:
+        """Dispatch the complete lines in data, returning the incomplete rest."""
+        lines = data.split("\n")
+        rest = "" if final else lines.pop()
+        for line in lines:
+            if output is not None:
+                output.add_line(line)
+            if line:  # Skip empty lines
+                on_line(line)
+        return rest
+
+    def stdout_text() -> str:
+        if output is not None:
+            output.finish()
+            return output.text
+        return "".join(stdout_parts)
+
     try:
         while True:
             # Check for cancellation first
@@ -143,58 +206,26 @@ def stream_process_output(
                     process.wait()
                 # Drain remaining output via os.read() to avoid mixing
                 # with the TextIOWrapper used by process.communicate()
-                for fd, parts in [
-                    (stdout_fd, stdout_parts),
-                    (process.stderr.fileno(), stderr_parts),
-                ]:
-                    while True:
-                        try:
-                            raw = os.read(fd, 4096)
-                            if not raw:
-                                break
-                            parts.append(raw.decode("utf-8", errors="replace"))
-                        except OSError:
-                            break
-                return "".join(stdout_parts), "".join(stderr_parts), True
+                remaining = _read_available(stdout_fd)
+                if output is not None:
+                    output.feed(incomplete_line + remaining)
+                else:
+                    stdout_parts.append(remaining)
+                stderr_parts.append(_read_available(process.stderr.fileno()))
+                return stdout_text(), "".join(stderr_parts), True
 
             # Check if process has finished
             if process.poll() is not None:
                 # Process finished - drain remaining output via os.read()
-                remaining_chunks = []
-                while True:
-                    try:
-                        raw = os.read(stdout_fd, 4096)
-                        if not raw:
-                            break
-                        remaining_chunks.append(raw.decode("utf-8", errors="replace"))
-                    except OSError:
-                        break
-                remaining_stdout = "".join(remaining_chunks)
-
-                stderr_fd = process.stderr.fileno()
-                remaining_stderr_chunks = []
-                while True:
-                    try:
-                        raw = os.read(stderr_fd, 4096)
-                        if not raw:
-                            break
-                        remaining_stderr_chunks.append(raw.decode("utf-8", errors="replace"))
-                    except OSError:
-                        break
-                remaining_stderr = "".join(remaining_stderr_chunks)
-
-                if remaining_stdout:
-                    # Process remaining data including incomplete line
-                    data = incomplete_line + remaining_stdout
-                    lines = data.split("\n")
-                    for line in lines:
-                        if line:  # Skip empty lines from split
-                            on_line(line)
-                    stdout_parts.append(data)
-                elif incomplete_line:
-                    # Process the final incomplete line
-                    on_line(incomplete_line)
-                    stdout_parts.append(incomplete_line)
+                remaining_stdout = _read_available(stdout_fd)
+                remaining_stderr = _read_available(process.stderr.fileno())
+
+                # Process remaining data including the incomplete line
+                # (already accumulated in stdout_parts with its chunk)
+                if output is None:
+                    stdout_parts.append(remaining_stdout)
+                if incomplete_line or remaining_stdout:
+                    process_lines(incomplete_line + remaining_stdout, final=True)
                 if remaining_stderr:
                     stderr_parts.append(remaining_stderr)
                 break
@@ -215,24 +246,16 @@ def stream_process_output(
                 chunk = raw_bytes.decode("utf-8", errors="replace")
 
                 # Accumulate for final parsing
-                stdout_parts.append(chunk)
+                if output is None:
+                    stdout_parts.append(chunk)
 
                 # Incomplete line handling: Buffer partial lines until newline arrives
                 # - incomplete_line holds text from previous read that didn't end with \n
                 # - Prepend it to current chunk to reassemble the full line
-                # - lines[-1] becomes the new incomplete_line (empty string if chunk ended with \n)
+                # - The last piece becomes the new incomplete_line (empty string if
+                #   chunk ended with \n)
                 # - This ensures callbacks always receive complete lines
-                # Process lines for callback
-                data = incomplete_line + chunk
-                lines = data.split("\n")
-
-                # The last element might be incomplete (no newline yet)
-                incomplete_line = lines[-1]
-
-                # Process complete lines
-                for line in lines[:-1]:
-                    if line:  # Skip empty lines
-                        on_line(line)
+                incomplete_line = process_lines(incomplete_line + chunk, final=False)
 
     except OSError as e:
         logger.warning(f"Error streaming process output: {e}")
@@ -240,14 +263,17 @@ def stream_process_output(
         try:
             remaining_stdout, remaining_stderr = process.communicate(timeout=2.0)
             if remaining_stdout:
-                stdout_parts.append(remaining_stdout)
+                if output is not None:
+                    output.feed(remaining_stdout)
+                else:
+                    stdout_parts.append(remaining_stdout)
             if remaining_stderr:
                 stderr_parts.append(remaining_stderr)
         except subprocess.TimeoutExpired:
             process.kill()
             process.wait()
 
-    return "".join(stdout_parts), "".join(stderr_parts), False
+    return stdout_text(), "".join(stderr_parts), False
 
 
 def cleanup_process(process: subprocess.Popen | None) -> None:
@@ -281,9 +307,10 @@ def terminate_process_gracefully(process: subprocess.Popen | None) -> None:
     if process is None:
         return
 
-    # Step 1: SIGTERM (graceful)
+    # Step 1: SIGTERM (graceful); a paused process only acts on it once continued
     try:
         process.terminate()
+        process.send_signal(signal.SIGCONT)
     except (OSError, ProcessLookupError):
         # Process already gone
         return
@@ -301,12 +328,164 @@ def terminate_process_gracefully(process: subprocess.Popen | None) -> None:
             pass  # Best effort
 
 
+def suspend_process(process: subprocess.Popen | None) -> None:
+    """
+    Stop a process with SIGSTOP until continue_process() is called.
+
+    A scanner run on the host through flatpak-spawn is not stopped: the
+    signal would only stop the sandboxed wrapper, so the scan would go on.
+
+    Args:
+        process: The subprocess to suspend, or None.
+    """
+    if process is None or process.poll() is not None:
+        return
+    if runs_on_host(process):
+        logger.info("Cannot pause a scanner running on the host outside the Flatpak sandbox")
+        return
+    try:
+        process.send_signal(signal.SIGSTOP)
+    except (OSError, ProcessLookupError):
+        pass  # Process already gone
+
+
+def continue_process(process: subprocess.Popen | None) -> None:
+    """
+    Continue a process suspended by suspend_process() with SIGCONT.
+
+    Host processes run through flatpak-spawn are never suspended, so they
+    are left alone.
+
+    Args:
+        process: The subprocess to continue, or None.
+    """
+    if process is None or process.poll() is not None or runs_on_host(process):
+        return
+    try:
+        process.send_signal(signal.SIGCONT)
+    except (OSError, ProcessLookupError):
+        pass  # Process already gone
+
+
+def apply_load_level(process: subprocess.Popen | None, level: LoadLevel, user_paused: bool) -> None:
+    """
+    Apply a load governor level to a clamscan or clamdscan process.
+
+    A paused level stops the process; leaving it continues the process unless
+    the user paused the scan. A throttled level lowers the process priority.
+    Under Flatpak, a scanner run on the host through flatpak-spawn can be
+    neither stopped nor reniced from the sandbox, so the governor leaves it
+    running at full speed.
+
+    Args:
+        process: The scanner process, or None.
+        level: The governor's new level.
+        user_paused: Whether the user has paused the scan.
+    """
+    if runs_on_host(process):
+        logger.info(
+            "Load governor level %s not applied: the scanner runs on the host "
+            "outside the Flatpak sandbox",
+            level.value,
+        )
+        return
+    if level is LoadLevel.PAUSED:
+        suspend_process(process)
+        return
+    if not user_paused:
+        continue_process(process)
+    if level is LoadLevel.THROTTLED:
+        lower_process_priority(process)
+
+
+class ScanPause:
+    """
+    Pause state of a scanner and the time its current scan spent paused.
+
+    The state survives from one scan to the next, so a scan started while
+    its scanner is paused (e.g. the next target of a multi-target scan)
+    begins paused. Only the paused time is reset by start_scan().
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an unpaused state.
+
+        Args:
+            clock: Monotonic clock, replaceable for tests
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._paused_since: float | None = None
+        self._paused_total = 0.0
+
+    def is_paused(self) -> bool:
+        """Whether the scanner is paused."""
+        with self._lock:
+            return self._paused_since is not None
+
+    def pause(self) -> bool:
+        """
+        Mark the scanner as paused.
+
+        Returns:
+            True if it was running, False if it was already paused
+        """
+        with self._lock:
+            if self._paused_since is not None:
+                return False
+            self._paused_since = self._clock()
+            return True
+
+    def resume(self) -> bool:
+        """
+        Mark the scanner as running again.
+
+        Returns:
+            True if it was paused, False if it was already running
+        """
+        with self._lock:
+            if self._paused_since is None:
+                return False
+            self._paused_total += self._clock() - self._paused_since
+            self._paused_since = None
+            return True
+
+    def start_scan(self) -> None:
+        """Reset the paused time at the start of a scan."""
+        with self._lock:
+            self._paused_total = 0.0
+            if self._paused_since is not None:
+                self._paused_since = self._clock()
+
+    def paused_seconds(self) -> float:
+        """Seconds the current scan has spent paused, including an ongoing pause."""
+        with self._lock:
+            total = self._paused_total
+            if self._paused_since is not None:
+                total += self._clock() - self._paused_since
+            return total
+
+    def active_duration(self, start_time: float) -> float:
+        """
+        Get the time a scan started at start_time has spent running.
+
+        Args:
+            start_time: Clock value at the start of the scan
+
+        Returns:
+            Elapsed seconds minus the seconds spent paused
+        """
+        return max(0.0, self._clock() - start_time - self.paused_seconds())
+
+
 def save_scan_log(
     log_manager: LogManager,
     result: ScanResult,
     duration: float,
     suffix: str = "",
     scheduled: bool = False,
+    backend: str | None = None,
 ) -> None:
     """
     Save scan result to log.
@@ -317,6 +496,8 @@ def save_scan_log(
         duration: Scan duration in seconds.
         suffix: Optional suffix for summary (e.g., "(daemon)").
         scheduled: Whether this was a scheduled scan.
+        backend: The backend that ran the scan ("clamscan", "daemon" or
+            "user_daemon").
     """
     # Map ScanStatus to string
     status_map = {
@@ -329,7 +510,8 @@ def save_scan_log(
 
     # Convert threat details to dicts for the factory method
     threat_dicts = [
-        {"file_path": t.file_path, "threat_name": t.threat_name} for t in result.threat_details
+        {"file_path": t.file_path, "threat_name": t.threat_name, "aliases": t.aliases}
+        for t in result.threat_details
     ]
 
     entry = LogEntry.from_scan_result_data(
@@ -344,8 +526,217 @@ def save_scan_log(
         stdout=result.stdout,
         suffix=suffix,
         scheduled=scheduled,
+        cached_files=result.cached_count,
+        duplicate_files=result.duplicate_count,
+        trusted_files=result.trusted_count,
+        trusted_bytes=result.trusted_bytes,
+        unscanned_files=result.unscanned_count,
+        limited_files=result.limited_count,
+        scanned_bytes=result.scanned_bytes,
+        backend=backend,
+        load_decisions=result.load_decisions,
+        skipped_mounts=result.skipped_mounts,
+        device_boundaries=result.device_boundaries,
+        skipped_count=result.skipped_count,
+        timings=result.timings,
     )
-    log_manager.save_log(entry)
+    saved = log_manager.save_log(entry)
+    if result.output_file is not None:
+        if saved:
+            log_manager.attach_output(entry.id, result.output_file)
+        else:
+            with contextlib.suppress(OSError):
+                os.unlink(result.output_file)
+
+
+def create_scan_output(log_manager: LogManager, settings_manager=None) -> ScanOutput:
+    """
+    Create the output collector for a scan.
+
+    When the "keep_full_scan_output" setting is on, the full raw output is
+    also written to a compressed file that save_scan_log() stores with the
+    scan's log entry.
+
+    Args:
+        log_manager: The LogManager the scan log will be saved to.
+        settings_manager: Optional SettingsManager of the calling scanner.
+
+    Returns:
+        A new ScanOutput.
+    """
+    spill_path = None
+    if settings_manager is not None and settings_manager.get("keep_full_scan_output", False):
+        spill_path = log_manager.create_output_file()
+    return ScanOutput(spill_path=spill_path)
+
+
+class ProgressReporter:
+    """
+    Coalesces per-file scan events into ScanProgress deltas.
+
+    Recording a scanned file or an infection only updates counters; a
+    ScanProgress is built at most once per interval and carries just the
+    infections found since the previous event. The first event is sent
+    immediately and flush() sends whatever is still pending when the scan
+    ends, so consumers always see the final counts.
+
+    With a walker, bytes are counted from the sizes the walk recorded, so
+    progress can be weighted by bytes.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[ScanProgress], None],
+        interval: float = PROGRESS_UPDATE_INTERVAL_MS / 1000,
+        walker: "ScanWalker | None" = None,
+        include_cached: bool = False,
+        reports_start: bool = False,
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            callback: Receives the coalesced ScanProgress events.
+            interval: Minimum seconds between events.
+            walker: Optional walker supplying file sizes and the totals; the
+                totals are estimates until the walk finishes.
+            include_cached: Whether files skipped through the scan cache
+                count as scanned (and towards the totals).
+            reports_start: Whether file_scanned() is called when a file is
+                started rather than finished (clamscan's "Scanning" lines).
+                Its bytes are then credited when the next file starts, so a
+                large file does not complete the bar as soon as it begins.
+        """
+        self._callback = callback
+        self._interval = interval
+        self._walker = walker
+        self._include_cached = include_cached
+        self._reports_start = reports_start
+        self._current_file = ""
+        self._current_size = 0
+        self._last_sent: float | None = None
+        self._sent_infected = 0
+        self._pending = False
+
+        self.files_scanned = 0
+        self.bytes_scanned = 0
+        self.infected_files: list[str] = []
+
+    def file_scanned(self, path: str, infected: bool = False) -> None:
+        """
+        Record a scanned file.
+
+        Args:
+            path: Path of the file
+            infected: Whether the file was reported infected
+        """
+        self.files_scanned += 1
+        self._current_file = path
+        if self._walker is not None:
+            size = self._walker.take_size(path)
+            if self._reports_start:
+                self.bytes_scanned += self._current_size
+                self._current_size = size
+            else:
+                self.bytes_scanned += size
+        if infected:
+            self.infected_files.append(path)
+        self._maybe_send()
+
+    def infection_found(self, path: str) -> None:
+        """
+        Record an infection reported for a file that was already counted.
+
+        Args:
+            path: Path of the infected file
+        """
+        self.infected_files.append(path)
+        self._current_file = path
+        self._maybe_send()
+
+    def flush(self) -> None:
+        """Send the pending event, if any, once the scanner has finished."""
+        if self._current_size:
+            # The last started file is done as well
+            self.bytes_scanned += self._current_size
+            self._current_size = 0
+            self._pending = True
+        if self._pending:
+            self._send(time.monotonic())
+
+    def _maybe_send(self) -> None:
+        """Send an event unless one was sent within the interval."""
+        now = time.monotonic()
+        if self._last_sent is not None and now - self._last_sent < self._interval:
+            self._pending = True
+            return
+        self._send(now)
+
+    def _send(self, now: float) -> None:
+        """Build and send an event with the infections found since the last one."""
+        self._last_sent = now
+        self._pending = False
+
+        files_scanned = self.files_scanned
+        bytes_scanned = self.bytes_scanned
+        files_total = bytes_total = None
+        total_is_estimate = False
+        walker = self._walker
+        if walker is not None:
+            if self._include_cached:
+                files_scanned += walker.cached_count
+                files_total = walker.files_total
+                bytes_scanned += walker.cached_bytes
+                bytes_total = walker.bytes_total
+            else:
+                files_total = walker.files_found
+                bytes_total = walker.bytes_found
+            total_is_estimate = not walker.finished
+
+        new_infected = self.infected_files[self._sent_infected :]
+        self._sent_infected = len(self.infected_files)
+        self._callback(
+            ScanProgress(
+                current_file=self._current_file,
+                files_scanned=files_scanned,
+                files_total=files_total,
+                infected_count=self._sent_infected,
+                new_infected_files=new_infected,
+                bytes_scanned=bytes_scanned,
+                bytes_total=bytes_total,
+                total_is_estimate=total_is_estimate,
+            )
+        )
+
+
+def create_progress_reporter(
+    callback: Callable[[ScanProgress], None],
+    settings_manager=None,
+    walker: "ScanWalker | None" = None,
+    include_cached: bool = False,
+    reports_start: bool = False,
+) -> ProgressReporter:
+    """
+    Create the progress reporter for a scan.
+
+    The event rate comes from the "progress_update_interval_ms" setting.
+
+    Args:
+        callback: Receives the coalesced ScanProgress events.
+        settings_manager: Optional SettingsManager of the calling scanner.
+        walker: Optional walker supplying file sizes and the totals.
+        include_cached: Whether cached files count as scanned.
+        reports_start: Whether files are reported when they are started.
+
+    Returns:
+        A new ProgressReporter.
+    """
+    interval_ms = PROGRESS_UPDATE_INTERVAL_MS
+    if settings_manager is not None:
+        value = settings_manager.get("progress_update_interval_ms", PROGRESS_UPDATE_INTERVAL_MS)
+        if isinstance(value, int | float) and not isinstance(value, bool) and value >= 0:
+            interval_ms = value
+    return ProgressReporter(callback, interval_ms / 1000, walker, include_cached, reports_start)
 
 
 def create_error_result(
@@ -5,10 +5,12 @@ Type definitions for ClamAV scanner operations.
 This module defines the shared data types used by scanner implementations:
 - ScanStatus: Enum for scan result states
 - ThreatDetail: Dataclass for threat information
+- ScanProgress: Dataclass for progress events sent during a scan
+- ScanProgressState: Dataclass rebuilding the scan state from progress events
 - ScanResult: Dataclass for complete scan results
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -29,14 +31,29 @@ class ThreatDetail:
     threat_name: str
     category: str
     severity: str
+    aliases: list[str] = field(default_factory=list)  # Duplicates sharing this verdict
+
+
+def _progress_percentage(progress: "ScanProgress | ScanProgressState") -> float | None:
+    """Calculate scan completion percentage, or None if the total is not known yet."""
+    if progress.total_is_estimate:
+        return None
+    if progress.bytes_total and progress.bytes_total > 0:
+        return min(progress.bytes_scanned / progress.bytes_total, 1.0) * 100
+    if progress.files_total and progress.files_total > 0:
+        return (progress.files_scanned / progress.files_total) * 100
+    return None
 
 
 @dataclass
 class ScanProgress:
-    """Real-time scan progress information.
+    """Real-time scan progress event.
 
-    This dataclass is used to report progress updates during a scan operation,
-    allowing the UI to display live information about the scanning process.
+    Scanners send these at a coalesced rate while a scan runs. Counters are
+    cumulative, but each event carries only the infections found since the
+    previous event, so a scan with many detections does not copy its whole
+    infected list for every update. Use ScanProgressState to rebuild the full
+    state from a sequence of events.
     """
 
     current_file: str
@@ -51,22 +68,85 @@ class ScanProgress:
     infected_count: int
     """Number of infections found so far."""
 
-    infected_files: list[str]
-    """List of infected file paths found so far."""
+    new_infected_files: list[str] = field(default_factory=list)
+    """Infected file paths found since the previous event."""
 
     bytes_scanned: int = 0
-    """Number of bytes processed (if available from scanner output)."""
+    """Size of the files processed so far, in bytes."""
+
+    bytes_total: int | None = None
+    """Size of all files to scan (None if unknown/not counted)."""
+
+    total_is_estimate: bool = False
+    """Whether the totals are still growing because the tree walk is running."""
 
     @property
     def percentage(self) -> float | None:
         """Calculate scan completion percentage.
 
+        Weighted by bytes when the total size is known, so a single large
+        file takes its share of the bar; by file count otherwise.
+
         Returns:
-            Percentage (0-100) if files_total is known and > 0, None otherwise.
+            Percentage (0-100) if the total is known and > 0, None otherwise
+            (including while the total is only an estimate).
         """
-        if self.files_total and self.files_total > 0:
-            return (self.files_scanned / self.files_total) * 100
-        return None
+        return _progress_percentage(self)
+
+
+@dataclass
+class ScanProgressState:
+    """Progress of one scan, rebuilt from its ScanProgress events.
+
+    Consumers keep one state per scan and apply() every event they receive
+    in order; dropping an event would lose the infections it carries.
+    """
+
+    current_file: str = ""
+    """Path of the file most recently reported."""
+
+    files_scanned: int = 0
+    """Number of files processed so far."""
+
+    files_total: int | None = None
+    """Total number of files to scan (None if unknown/not counted)."""
+
+    infected_files: list[str] = field(default_factory=list)
+    """All infected file paths reported so far."""
+
+    bytes_scanned: int = 0
+    """Size of the files processed so far, in bytes."""
+
+    bytes_total: int | None = None
+    """Size of all files to scan (None if unknown/not counted)."""
+
+    total_is_estimate: bool = False
+    """Whether the totals are still growing because the tree walk is running."""
+
+    def apply(self, progress: ScanProgress) -> None:
+        """
+        Apply a progress event.
+
+        Args:
+            progress: The next event of the scan
+        """
+        self.current_file = progress.current_file
+        self.files_scanned = progress.files_scanned
+        self.files_total = progress.files_total
+        self.infected_files.extend(progress.new_infected_files)
+        self.bytes_scanned = progress.bytes_scanned
+        self.bytes_total = progress.bytes_total
+        self.total_is_estimate = progress.total_is_estimate
+
+    @property
+    def infected_count(self) -> int:
+        """Number of infections found so far."""
+        return len(self.infected_files)
+
+    @property
+    def percentage(self) -> float | None:
+        """Calculate scan completion percentage (see ScanProgress.percentage)."""
+        return _progress_percentage(self)
 
 
 @dataclass
@@ -87,6 +167,18 @@ class ScanResult:
     skipped_files: list[str] | None = None  # Files that couldn't be scanned (permissions)
     skipped_count: int = 0  # Count of skipped files
     warning_message: str | None = None  # User-friendly warning about skipped files
+    cached_count: int = 0  # Unchanged files skipped thanks to a cached clean verdict
+    trusted_count: int = 0  # Unmodified package files skipped
+    trusted_bytes: int = 0  # Size of the skipped package files
+    output_file: str | None = None  # Compressed full output when stdout holds only a tail
+    scanned_bytes: int = 0  # Size of the scanned files, when known from the walk
+    load_decisions: list[str] = field(default_factory=list)  # Load governor level changes
+    skipped_mounts: list[str] = field(default_factory=list)  # Mounts the walk did not enter
+    device_boundaries: list[str] = field(default_factory=list)  # Mounts on other devices entered
+    duplicate_count: int = 0  # Hardlinked or identical files covered by another file's verdict
+    unscanned_count: int = 0  # Lower-risk files a risk order cap left unscanned
+    limited_count: int = 0  # Files outside the profile's size, type or depth limits
+    timings: dict[str, float] = field(default_factory=dict)  # Seconds per phase, e.g. "walk"
 
     @property
     def is_clean(self) -> bool:
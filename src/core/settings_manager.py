@@ -36,12 +36,32 @@ class SettingsManager:
         "schedule_targets": [],  # List of directory paths to scan
         "schedule_skip_on_battery": True,
         "schedule_auto_quarantine": False,
+        "schedule_resume_scans": True,  # Resume interrupted scheduled scans from their checkpoint
         "schedule_day_of_week": 0,  # 0=Monday, 6=Sunday (for weekly scans)
         "schedule_day_of_month": 1,  # 1-28 (for monthly scans)
         "exclusion_patterns": [],
         # Scan backend settings
         "scan_backend": "auto",  # "auto", "daemon", "clamscan"
         "daemon_socket_path": "",  # Empty = auto-detect
+        "scan_cache_enabled": True,  # Skip files unchanged since their last clean scan
+        "scan_checkpoints_enabled": True,  # Write checkpoints so interrupted scans can resume
+        "keep_full_scan_output": False,  # Keep the full raw output compressed with the scan log
+        "max_parallel_scans": 0,  # Targets scanned at once; 0 = one per device, up to 4
+        "user_daemon_enabled": True,  # Auto mode starts a private clamd without a system one
+        "user_daemon_idle_timeout": 300,  # Seconds before an unused private clamd is stopped
+        "pause_scans_on_battery": True,  # Pause running scans on battery, resume on AC power
+        "scan_skip_pseudo_filesystems": True,  # Don't enter /proc, /sys and other kernel mounts
+        "scan_skip_remote_filesystems": True,  # Don't enter network and FUSE mounts
+        "scan_one_file_system": False,  # Don't enter any filesystem mounted below a target
+        "scan_dedup_hardlinks": True,  # Scan each inode once, whatever its number of paths
+        "scan_dedup_content": False,  # Also scan identical files on different inodes once
+        # Load governor: throttle or pause scans while the system is busy
+        "load_governor_enabled": False,
+        "load_governor_throttle_pressure": 20.0,  # PSI "some avg10" percent
+        "load_governor_pause_pressure": 60.0,
+        "load_governor_throttle_load": 1.0,  # 1-minute load average per CPU
+        "load_governor_pause_load": 2.0,
+        "load_governor_max_pause": 600,  # Seconds a scan may stay paused at a time
         # VirusTotal settings
         "virustotal_api_key": None,  # Fallback storage if keyring unavailable
         "virustotal_remember_no_key_action": "none",  # "none", "open_website", "prompt"
@@ -51,6 +71,7 @@ class SettingsManager:
         "debug_log_max_files": 3,  # Number of backup files to keep
         # Live progress settings
         "show_live_progress": True,  # Show real-time file scanning progress
+        "progress_update_interval_ms": 100,  # Minimum time between scanner progress events
     }
 
     def __init__(self, config_dir: Path | None = None):
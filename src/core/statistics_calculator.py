@@ -4,41 +4,20 @@ Statistics calculator module for ClamUI providing scan statistics aggregation.
 Calculates metrics across different timeframes from stored scan logs.
 """
 
-import re
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
-from .log_manager import LogEntry, LogManager
-
-# Pre-compiled regex patterns for extracting file counts
-# These patterns are used to parse scan log entries for file count information
-FILES_SCANNED_PATTERNS = [
-    re.compile(r"(\d+)\s*files?\s*scanned", re.IGNORECASE),
-    re.compile(r"scanned\s*(\d+)\s*files?", re.IGNORECASE),
-    re.compile(r"files[:\s]+(\d+)", re.IGNORECASE),
-    re.compile(r"(\d+)\s*files?", re.IGNORECASE),
-]
-
-# Pre-compiled regex patterns for extracting threat counts
-# These patterns are used to parse scan log entries for threat/infection counts
-THREATS_FOUND_PATTERNS = [
-    re.compile(r"(\d+)\s*(?:threats?|infections?|infected)", re.IGNORECASE),
-    re.compile(r"found\s*(\d+)", re.IGNORECASE),
-    re.compile(r"detected\s*(\d+)", re.IGNORECASE),
-]
-
-# Pre-compiled regex patterns for extracting directory counts
-# These patterns are used to parse scan log entries for directory count information
-DIRS_SCANNED_PATTERNS = [
-    re.compile(r"director(?:y|ies)\s+scanned[:\s]+(\d+)", re.IGNORECASE),
-    re.compile(r"(\d+)\s*director(?:y|ies)\s*scanned", re.IGNORECASE),
-    re.compile(r"scanned\s*(\d+)\s*director(?:y|ies)", re.IGNORECASE),
-    re.compile(r"director(?:y|ies)[:\s]+(\d+)", re.IGNORECASE),
-    re.compile(r"(\d+)\s*director(?:y|ies)", re.IGNORECASE),
-]
+from .log_manager import (
+    DIRS_SCANNED_PATTERNS,
+    FILES_SCANNED_PATTERNS,
+    THREATS_FOUND_PATTERNS,
+    LogEntry,
+    LogManager,
+    count_in_text,
+)
 
 
 class Timeframe(Enum):
@@ -182,8 +161,9 @@ class StatisticsCalculator:
                 # Return cached data
                 return self._cache[cache_key]
 
-            # Fetch fresh data from log_manager
-            logs = self._log_manager.get_logs(limit=limit, log_type=log_type)
+            # Fetch fresh data from log_manager; the typed counts stand in
+            # for the details
+            logs = self._log_manager.get_logs(limit=limit, log_type=log_type, with_details=False)
 
             # Update cache
             self._cache[cache_key] = logs
@@ -278,79 +258,56 @@ class StatisticsCalculator:
 
     def _extract_files_scanned(self, entry: LogEntry) -> int:
         """
-        Extract the number of files scanned from a log entry.
+        Get the number of files scanned from a log entry.
 
-        Parses the summary or details to find file count information.
+        Uses the entry's count; only entries without one (not yet backfilled)
+        have their summary and details parsed.
 
         Args:
-            entry: LogEntry to extract file count from
+            entry: LogEntry to get the file count of
 
         Returns:
             Number of files scanned, or 0 if not found
         """
-        text = f"{entry.summary} {entry.details}"
-
-        # Use pre-compiled patterns for faster matching
-        for pattern in FILES_SCANNED_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return int(match.group(1))
-                except (ValueError, IndexError):
-                    continue
-
-        return 0
+        if entry.scanned_files is not None:
+            return entry.scanned_files
+        return count_in_text(FILES_SCANNED_PATTERNS, f"{entry.summary} {entry.details}") or 0
 
     def _extract_directories_scanned(self, entry: LogEntry) -> int:
         """
-        Extract the number of directories scanned from a log entry.
+        Get the number of directories scanned from a log entry.
 
-        Parses the summary or details to find directory count information.
+        Uses the entry's count; only entries without one (not yet backfilled)
+        have their summary and details parsed.
 
         Args:
-            entry: LogEntry to extract directory count from
+            entry: LogEntry to get the directory count of
 
         Returns:
             Number of directories scanned, or 0 if not found
         """
-        text = f"{entry.summary} {entry.details}"
-
-        # Use pre-compiled patterns for faster matching
-        for pattern in DIRS_SCANNED_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return int(match.group(1))
-                except (ValueError, IndexError):
-                    continue
-
-        return 0
+        if entry.scanned_dirs is not None:
+            return entry.scanned_dirs
+        return count_in_text(DIRS_SCANNED_PATTERNS, f"{entry.summary} {entry.details}") or 0
 
     def _extract_threats_found(self, entry: LogEntry) -> int:
         """
-        Extract the number of threats found from a log entry.
+        Get the number of threats found from a log entry.
 
         Args:
-            entry: LogEntry to extract threat count from
+            entry: LogEntry to get the threat count of
 
         Returns:
             Number of threats found, or 0 if not found
         """
+        if entry.infected_count is not None:
+            return entry.infected_count
+
         # If status indicates infection, try to count
         if entry.status == "infected":
-            text = f"{entry.summary} {entry.details}"
-
-            # Use pre-compiled patterns for faster matching
-            for pattern in THREATS_FOUND_PATTERNS:
-                match = pattern.search(text)
-                if match:
-                    try:
-                        return int(match.group(1))
-                    except (ValueError, IndexError):
-                        continue
-
+            found = count_in_text(THREATS_FOUND_PATTERNS, f"{entry.summary} {entry.details}")
             # Default to 1 if infected but count not found
-            return 1
+            return 1 if found is None else found
 
         return 0
 
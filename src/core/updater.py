@@ -24,6 +24,7 @@ from .flatpak import (
 )
 from .i18n import _
 from .log_manager import LogEntry, LogManager
+from .user_clamd import reload_user_clamd
 from .utils import (
     check_freshclam_installed,
     get_clean_env,
@@ -575,6 +576,11 @@ class FreshclamUpdater:
             if force and result.status == UpdateStatus.ERROR and is_flatpak():
                 self._restore_databases_from_backup()
 
+            # A running private clamd keeps the old signatures until reloaded;
+            # service updates happen later and are picked up by its SelfCheck
+            if result.status == UpdateStatus.SUCCESS:
+                reload_user_clamd()
+
             duration = time.monotonic() - start_time
             self._save_update_log(result, duration)
             self._cleanup_backup()
@@ -0,0 +1,626 @@
+# ClamUI User Daemon Module
+"""
+Private clamd instance for ClamUI.
+
+Without a system clamd, every clamscan run loads the full signature database
+(about 1 GiB of memory and 10-30 seconds) and drops it again when the scan
+ends, once per target. A UserClamd instead starts clamd as the current user,
+with a generated configuration and a socket in a private directory below
+XDG_RUNTIME_DIR, the first time a scan needs it. Later scans reuse the loaded
+database; once no scan has used the daemon for the idle timeout it is shut
+down to give the memory back.
+
+The daemon is shared by all scanners of the process through
+get_user_clamd(), and by all ClamUI processes of the user (the GUI and
+clamui-scheduled-scan) through its socket. Scans hold it between acquire()
+and release(), and every process using it holds a shared flock on
+clamd.lock meanwhile, so it is never stopped under a running scan of any
+process: stop() only shuts it down if it gets the lock exclusively. Starting
+is serialized across processes by an exclusive flock on clamd.start.lock, so
+only one of them spawns clamd and the others adopt it. After a successful
+database update, reload_user_clamd() makes a running daemon load the new
+signatures.
+
+Usage:
+    user_clamd = get_user_clamd()
+    is_running, error = user_clamd.acquire()
+    if is_running:
+        try:
+            client = user_clamd.get_client()
+            ...
+        finally:
+            user_clamd.release()
+"""
+
+import atexit
+import fcntl
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from .clamd_client import DEFAULT_CLAMD_MAX_QUEUE, ClamdAddress, ClamdClient, ClamdError
+from .flatpak import get_clamav_database_dir, get_clean_env, is_flatpak
+
+logger = logging.getLogger(__name__)
+
+# Seconds a daemon may stay unused before it is shut down
+DEFAULT_IDLE_TIMEOUT = 300
+
+# Seconds allowed for clamd to load the database and answer PING
+START_TIMEOUT = 120.0
+
+# Seconds between PINGs while clamd is starting
+START_POLL_INTERVAL = 0.25
+
+# Seconds clamd gets to exit after SIGTERM before it is killed
+STOP_TIMEOUT = 5.0
+
+# Seconds between clamd's own checks for changed database files
+SELF_CHECK_INTERVAL = 600
+
+# Upper bound for clamd's worker threads
+MAX_THREADS = 16
+
+# Database directory of native installations
+SYSTEM_DATABASE_DIR = "/var/lib/clamav"
+
+# clamd is commonly installed to an sbin directory outside a user's PATH
+_CLAMD_LOCATIONS = ("/usr/sbin/clamd", "/usr/local/sbin/clamd")
+
+# Extensions of ClamAV database files
+_DATABASE_EXTENSIONS = (".cvd", ".cld", ".cud")
+
+# Lines of clamd's log quoted when it fails to start
+_LOG_TAIL_LINES = 5
+
+
+def get_user_clamd_dir() -> Path | None:
+    """
+    Get the private directory holding the daemon's socket and configuration.
+
+    Returns:
+        $XDG_RUNTIME_DIR/clamui, or None if XDG_RUNTIME_DIR is not set
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        return None
+    return Path(runtime_dir) / "clamui"
+
+
+def find_clamd_binary() -> str | None:
+    """
+    Find the clamd executable.
+
+    Inside Flatpak only the bundled clamd is used, since a host clamd could
+    not reach a socket in the sandbox's runtime directory.
+
+    Returns:
+        Path to clamd, or None if it is not installed
+    """
+    if is_flatpak():
+        bundled = "/app/bin/clamd"
+        return bundled if os.access(bundled, os.X_OK) else None
+
+    found = shutil.which("clamd")
+    if found is not None:
+        return found
+    for location in _CLAMD_LOCATIONS:
+        if os.access(location, os.X_OK):
+            return location
+    return None
+
+
+def get_database_dir() -> Path:
+    """
+    Get the directory of the signature database the daemon loads.
+
+    Returns:
+        The Flatpak database directory, or the system one otherwise
+    """
+    flatpak_dir = get_clamav_database_dir()
+    return flatpak_dir if flatpak_dir is not None else Path(SYSTEM_DATABASE_DIR)
+
+
+def _has_database(database_dir: Path) -> bool:
+    """Check whether a directory holds any ClamAV database file."""
+    try:
+        return any(entry.suffix.lower() in _DATABASE_EXTENSIONS for entry in database_dir.iterdir())
+    except OSError:
+        return False
+
+
+class UserClamd:
+    """
+    A clamd started on demand as the current user.
+
+    All methods are thread-safe. A daemon left behind by a previous ClamUI
+    process that did not exit cleanly is adopted if its socket still answers.
+    """
+
+    def __init__(self, runtime_dir: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the daemon; nothing is started until acquire().
+
+        Args:
+            runtime_dir: Private directory for the socket, configuration and
+                log; defaults to get_user_clamd_dir()
+            idle_timeout: Seconds without scans before the daemon is stopped
+        """
+        self._runtime_dir = runtime_dir if runtime_dir is not None else get_user_clamd_dir()
+        self.idle_timeout = idle_timeout
+        self._lock = threading.RLock()
+        # Notified when a start finishes
+        self._start_done = threading.Condition(self._lock)
+        self._process: subprocess.Popen | None = None
+        self._running = False
+        # A thread is starting the daemon, without holding the lock
+        self._starting = False
+        # Set by stop() to abandon a start in progress
+        self._abort_start = False
+        self._users = 0
+        # Descriptor holding the shared lock that marks this process as a user
+        self._use_fd: int | None = None
+        self._idle_timer: threading.Timer | None = None
+        self._max_threads = max(1, min(os.cpu_count() or 1, MAX_THREADS))
+
+    @property
+    def socket_path(self) -> str | None:
+        """Path of the daemon's Unix socket."""
+        if self._runtime_dir is None:
+            return None
+        return str(self._runtime_dir / "clamd.sock")
+
+    @property
+    def config_path(self) -> str | None:
+        """Path of the generated clamd.conf."""
+        if self._runtime_dir is None:
+            return None
+        return str(self._runtime_dir / "clamd.conf")
+
+    @property
+    def lock_path(self) -> str | None:
+        """Path of the lock file counting the processes using the daemon."""
+        if self._runtime_dir is None:
+            return None
+        return str(self._runtime_dir / "clamd.lock")
+
+    @property
+    def start_lock_path(self) -> str | None:
+        """Path of the lock file serializing starts across processes."""
+        if self._runtime_dir is None:
+            return None
+        return str(self._runtime_dir / "clamd.start.lock")
+
+    @property
+    def log_path(self) -> str | None:
+        """Path of the daemon's log file."""
+        if self._runtime_dir is None:
+            return None
+        return str(self._runtime_dir / "clamd.log")
+
+    @property
+    def thread_limits(self) -> tuple[int, int]:
+        """The daemon's (MaxThreads, MaxQueue), used to size session pools."""
+        return (self._max_threads, DEFAULT_CLAMD_MAX_QUEUE)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the daemon has been started (or adopted) and not stopped."""
+        with self._lock:
+            return self._running
+
+    def check_available(self) -> tuple[bool, str | None]:
+        """
+        Check whether a private daemon can be started.
+
+        Returns:
+            Tuple of (is_available, error_message)
+        """
+        if self._runtime_dir is None:
+            return (False, "XDG_RUNTIME_DIR is not set")
+        if find_clamd_binary() is None:
+            return (False, "clamd is not installed")
+        database_dir = get_database_dir()
+        if not _has_database(database_dir):
+            return (False, f"No virus database in {database_dir}")
+        return (True, None)
+
+    def get_client(self) -> ClamdClient | None:
+        """
+        Get a client for the daemon if it answers PING.
+
+        Returns:
+            ClamdClient for the private socket, or None if it is not responding
+        """
+        socket_path = self.socket_path
+        if socket_path is None or not os.path.exists(socket_path):
+            return None
+        client = ClamdClient(ClamdAddress(socket_path=socket_path))
+        return client if client.ping() else None
+
+    def acquire(self, is_cancelled: Callable[[], bool] | None = None) -> tuple[bool, str | None]:
+        """
+        Start the daemon if needed and hold it for a scan.
+
+        Blocks while clamd loads the database. The lock is not held meanwhile,
+        so stop(), reload() and is_running do not wait for the start; other
+        acquire() calls wait for its outcome. Every successful call must be
+        paired with release().
+
+        Args:
+            is_cancelled: Optional callable returning True to abandon waiting
+                for the daemon to start
+
+        Returns:
+            Tuple of (is_running, error_message)
+        """
+        with self._lock:
+            self._cancel_idle_timer()
+            if self._use_fd is None:
+                self._hold_use_lock()
+            while self._starting:
+                if is_cancelled is not None and is_cancelled():
+                    # The starting thread drops the use lock if it fails
+                    return (False, "Cancelled while clamd was starting")
+                self._start_done.wait(START_POLL_INTERVAL)
+            if self._running and self._is_alive():
+                self._users += 1
+                return (True, None)
+            if self._process is not None:
+                # Exited on its own since the last scan
+                logger.warning("Private clamd exited with code %s", self._process.poll())
+                self._process = None
+            self._running = False
+            self._starting = True
+            self._abort_start = False
+
+        is_started, error, process = False, None, None
+        try:
+            is_started, error, process = self._start(is_cancelled)
+        finally:
+            with self._lock:
+                self._starting = False
+                if is_started:
+                    self._process = process
+                    self._running = True
+                    self._users += 1
+                elif self._users == 0:
+                    self._drop_use_lock()
+                self._start_done.notify_all()
+        return (is_started, error)
+
+    def release(self) -> None:
+        """Release the daemon after a scan; starts the idle timer for the last user."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0 and not self._starting:
+                self._drop_use_lock()
+                self._schedule_idle_stop()
+
+    def reload(self) -> bool:
+        """
+        Make a running daemon reload its signature database.
+
+        Scans keep running with the old database until the reload completes.
+
+        Returns:
+            True if a reload was requested, False if the daemon is not running
+        """
+        with self._lock:
+            if not self._running:
+                return False
+        client = self.get_client()
+        if client is None:
+            return False
+        try:
+            client.reload()
+        except ClamdError as e:
+            logger.warning("Failed to reload the private clamd: %s", e)
+            return False
+        logger.info("Private clamd is reloading its database")
+        return True
+
+    def stop(self) -> None:
+        """
+        Shut the daemon down, even while scans of this process hold it.
+
+        A daemon another ClamUI process still uses is left running; this
+        process only stops using it, and the last user shuts it down.
+        """
+        with self._lock:
+            self._cancel_idle_timer()
+            if self._starting:
+                # The starting thread shuts its daemon down on abort
+                self._abort_start = True
+                while self._starting:
+                    self._start_done.wait()
+            if not self._running:
+                return
+            self._running = False
+            process, self._process = self._process, None
+            self._drop_use_lock()
+            exclusive_fd = self._lock_exclusive()
+
+        if exclusive_fd is None:
+            logger.info("Private clamd is still used by another ClamUI process, leaving it running")
+            if process is not None:
+                # Reap it once the last user has shut it down
+                threading.Thread(target=process.wait, daemon=True).start()
+            return
+        try:
+            self._shut_down(process)
+        finally:
+            if exclusive_fd >= 0:
+                os.close(exclusive_fd)
+
+    def _shut_down(self, process: subprocess.Popen | None) -> None:
+        """Terminate the daemon and remove its socket."""
+        if process is not None:
+            try:
+                process.terminate()
+                process.wait(timeout=STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            except OSError:
+                pass
+        else:
+            # Adopted from another process, so there is no handle to signal
+            client = self.get_client()
+            if client is not None:
+                try:
+                    client.shutdown()
+                except ClamdError as e:
+                    logger.debug("Failed to shut down the private clamd: %s", e)
+
+        if self.socket_path is not None:
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        logger.info("Private clamd stopped")
+
+    def _open_lock_file(self, path: str | None = None) -> int:
+        """Open a lock file (the use lock by default), creating the runtime directory if needed."""
+        self._runtime_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        return os.open(path or self.lock_path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+
+    def _hold_use_lock(self) -> None:
+        """Mark this process as a user of the daemon. Called with the lock held."""
+        if self._runtime_dir is None:
+            return
+        try:
+            fd = self._open_lock_file()
+        except OSError as e:
+            logger.debug("Cannot open %s: %s", self.lock_path, e)
+            return
+        try:
+            # Waits while another process is shutting the daemon down
+            fcntl.flock(fd, fcntl.LOCK_SH)
+        except OSError as e:
+            logger.debug("Cannot lock %s: %s", self.lock_path, e)
+            os.close(fd)
+            return
+        self._use_fd = fd
+
+    def _drop_use_lock(self) -> None:
+        """Stop marking this process as a user. Called with the lock held."""
+        if self._use_fd is not None:
+            os.close(self._use_fd)
+            self._use_fd = None
+
+    def _lock_exclusive(self) -> int | None:
+        """
+        Lock the daemon against other processes before shutting it down.
+
+        Returns:
+            Descriptor holding the exclusive lock, -1 if locking is not
+            possible here, or None if another process uses the daemon
+        """
+        if self._runtime_dir is None:
+            return -1
+        try:
+            fd = self._open_lock_file()
+        except OSError as e:
+            logger.debug("Cannot open %s: %s", self.lock_path, e)
+            return -1
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        except OSError as e:
+            logger.debug("Cannot lock %s: %s", self.lock_path, e)
+            os.close(fd)
+            return -1
+        return fd
+
+    def _is_alive(self) -> bool:
+        """Check that a started daemon is still running."""
+        if self._process is not None:
+            return self._process.poll() is None
+        return self.get_client() is not None
+
+    def _start(
+        self, is_cancelled: Callable[[], bool] | None
+    ) -> tuple[bool, str | None, subprocess.Popen | None]:
+        """
+        Start clamd and wait until it answers PING.
+
+        Called without the lock by the one thread in the starting state. While
+        another ClamUI process starts the daemon, waits for it and adopts it.
+
+        Returns:
+            Tuple of (is_started, error_message, process); process is None
+            for an adopted daemon
+        """
+        is_available, error = self.check_available()
+        if not is_available:
+            return (False, error, None)
+
+        try:
+            self._runtime_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.chmod(self._runtime_dir, 0o700)
+        except OSError as e:
+            return (False, f"Cannot create {self._runtime_dir}: {e}", None)
+
+        try:
+            start_fd = self._open_lock_file(self.start_lock_path)
+        except OSError as e:
+            logger.debug("Cannot open %s: %s", self.start_lock_path, e)
+            return self._spawn(is_cancelled)
+        try:
+            while True:
+                try:
+                    fcntl.flock(start_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    # Another process is starting the daemon
+                    if self._abort_start or (is_cancelled is not None and is_cancelled()):
+                        return (False, "Cancelled while clamd was starting", None)
+                    time.sleep(START_POLL_INTERVAL)
+                except OSError as e:
+                    logger.debug("Cannot lock %s: %s", self.start_lock_path, e)
+                    break
+            return self._spawn(is_cancelled)
+        finally:
+            os.close(start_fd)
+
+    def _spawn(
+        self, is_cancelled: Callable[[], bool] | None
+    ) -> tuple[bool, str | None, subprocess.Popen | None]:
+        """Spawn clamd unless one answers already. Called holding the start lock."""
+        if self.get_client() is not None:
+            logger.info("Reusing private clamd at %s", self.socket_path)
+            return (True, None, None)
+
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+        try:
+            Path(self.config_path).write_text(self._build_config(), encoding="utf-8")
+        except OSError as e:
+            return (False, f"Cannot write {self.config_path}: {e}", None)
+
+        command = [find_clamd_binary(), f"--config-file={self.config_path}", "--foreground"]
+        logger.info("Starting private clamd with %s", self.config_path)
+        start_time = time.monotonic()
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=get_clean_env(),
+            )
+        except OSError as e:
+            return (False, f"Cannot start clamd: {e}", None)
+
+        while time.monotonic() - start_time < START_TIMEOUT:
+            if process.poll() is not None:
+                error = self._read_log_tail() or f"exit code {process.returncode}"
+                return (False, f"clamd failed to start: {error}", None)
+            if self._abort_start or (is_cancelled is not None and is_cancelled()):
+                # Nobody else uses it yet: other processes wait for the start lock
+                self._shut_down(process)
+                return (False, "Cancelled while clamd was starting", None)
+            if self.get_client() is not None:
+                logger.info("Private clamd ready after %.1f seconds", time.monotonic() - start_time)
+                return (True, None, process)
+            time.sleep(START_POLL_INTERVAL)
+
+        self._shut_down(process)
+        return (False, f"clamd did not respond within {START_TIMEOUT:.0f} seconds", None)
+
+    def _build_config(self) -> str:
+        """Generate the daemon's clamd.conf."""
+        lines = [
+            "# Generated by ClamUI for its private clamd; rewritten on every start",
+            f"LocalSocket {self.socket_path}",
+            "LocalSocketMode 600",
+            f"DatabaseDirectory {get_database_dir()}",
+            f"LogFile {self.log_path}",
+            "LogFileMaxSize 1M",
+            "LogTime yes",
+            "Foreground yes",
+            f"MaxThreads {self._max_threads}",
+            f"MaxQueue {DEFAULT_CLAMD_MAX_QUEUE}",
+            # Picks up database updates made by another process
+            f"SelfCheck {SELF_CHECK_INTERVAL}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _read_log_tail(self) -> str | None:
+        """Get the last lines of clamd's log, which explain a failed start."""
+        try:
+            with open(self.log_path, encoding="utf-8", errors="replace") as f:
+                lines = [line.strip() for line in f if line.strip()]
+        except OSError:
+            return None
+        return " ".join(lines[-_LOG_TAIL_LINES:]) or None
+
+    def _schedule_idle_stop(self) -> None:
+        """Start the timer stopping an unused daemon. Called with the lock held."""
+        self._cancel_idle_timer()
+        if not self._running:
+            return
+        self._idle_timer = threading.Timer(self.idle_timeout, self._on_idle_timeout)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel the idle timer. Called with the lock held."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _on_idle_timeout(self) -> None:
+        """Stop the daemon unless a scan acquired it in the meantime."""
+        with self._lock:
+            if self._users > 0 or self._starting or not self._running:
+                return
+            logger.info("Private clamd idle for %s seconds, stopping", self.idle_timeout)
+            self.stop()
+
+
+_shared: UserClamd | None = None
+_shared_lock = threading.Lock()
+
+
+def get_user_clamd(idle_timeout: float | None = None) -> UserClamd:
+    """
+    Get the private daemon shared by all scanners of this process.
+
+    Args:
+        idle_timeout: Optional new idle timeout in seconds
+
+    Returns:
+        The shared UserClamd
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = UserClamd()
+            atexit.register(_shared.stop)
+        if idle_timeout is not None:
+            _shared.idle_timeout = idle_timeout
+        return _shared
+
+
+def reload_user_clamd() -> bool:
+    """
+    Make the shared private daemon, if running, reload its database.
+
+    Returns:
+        True if a reload was requested
+    """
+    with _shared_lock:
+        shared = _shared
+    return shared.reload() if shared is not None else False
@@ -16,6 +16,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ..core.scan_limits import ScanLimits
 from .models import ScanProfile
 from .profile_storage import ProfileStorage
 
@@ -666,6 +667,8 @@ class ProfileManager:
         targets: list[str],
         exclusions: dict[str, Any],
         exclude_id: str | None = None,
+        options: dict[str, Any] | None = None,
+        stored_options: dict[str, Any] | None = None,
     ) -> list[str]:
         """
         Validate all profile fields.
@@ -675,6 +678,10 @@ class ProfileManager:
             targets: List of target paths
             exclusions: Dictionary of exclusion settings
             exclude_id: Optional profile ID to exclude from name uniqueness check
+            options: Optional scan engine options
+            stored_options: Options of the profile being updated; its scan
+                limits are not validated again when left unchanged, as scans
+                ignore invalid limits
 
         Returns:
             List of warning messages (non-fatal issues)
@@ -695,6 +702,11 @@ class ProfileManager:
         exclusion_warnings = self._validate_exclusions(exclusions, targets)
         warnings.extend(exclusion_warnings)
 
+        # Validate scan limits (raises ValueError if invalid)
+        limits = (options or {}).get("limits")
+        if stored_options is None or limits != stored_options.get("limits"):
+            ScanLimits.from_options(limits)
+
         return warnings
 
     def create_profile(
@@ -724,7 +736,7 @@ class ProfileManager:
             ValueError: If validation fails
         """
         # Validate profile fields (raises ValueError if invalid)
-        self._validate_profile(name, targets, exclusions or {})
+        self._validate_profile(name, targets, exclusions or {}, options=options)
 
         timestamp = self._get_timestamp()
 
@@ -799,10 +811,19 @@ class ProfileManager:
             new_name = updates.get("name", profile.name)
             new_targets = updates.get("targets", profile.targets)
             new_exclusions = updates.get("exclusions", profile.exclusions)
+            new_options = updates.get("options", profile.options)
+            stored_options = profile.options or {}
 
         # Validate updated fields (raises ValueError if invalid)
         # Pass profile_id to exclude_id so name uniqueness check excludes this profile
-        self._validate_profile(new_name, new_targets, new_exclusions, exclude_id=profile_id)
+        self._validate_profile(
+            new_name,
+            new_targets,
+            new_exclusions,
+            exclude_id=profile_id,
+            options=new_options,
+            stored_options=stored_options,
+        )
 
         with self._lock:
             profile = self._profiles.get(profile_id)
@@ -819,7 +840,7 @@ class ProfileManager:
                 updated_at=self._get_timestamp(),
                 is_default=profile.is_default,  # Cannot change is_default
                 description=updates.get("description", profile.description),
-                options=updates.get("options", profile.options),
+                options=new_options,
             )
 
             self._profiles[profile_id] = updated_profile
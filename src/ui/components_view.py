@@ -9,14 +9,15 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, GLib, Gtk
 
-from ..core.flatpak import is_flatpak
-from ..core.i18n import N_, _
-from ..core.log_manager import DaemonStatus, LogManager
-from ..core.utils import (
+from ..core.backend_probe import (
     check_clamav_installed,
     check_clamdscan_installed,
     check_freshclam_installed,
+    invalidate_backend_probes,
 )
+from ..core.flatpak import is_flatpak
+from ..core.i18n import N_, _
+from ..core.log_manager import DaemonStatus, LogManager
 from .compat import safe_add_suffix
 from .utils import add_row_icon, resolve_icon_name
 from .view_helpers import StatusLevel, clear_status_classes, set_status_class
@@ -444,6 +445,7 @@ class ComponentsView(Gtk.Box):
             return
 
         self._set_checking_state(True)
+        invalidate_backend_probes()
         GLib.idle_add(self._check_all_components)
 
     def _set_checking_state(self, is_checking: bool):
@@ -10,7 +10,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw, GLib, GObject, Gtk
 
 from ..core.i18n import _
-from ..core.log_manager import DaemonStatus, LogEntry, LogManager
+from ..core.log_manager import DaemonStatus, LogEntry, LogManager, LogSummary
 from ..core.statistics_calculator import StatisticsCalculator
 from .clipboard_helper import ClipboardHelper
 from .compat import create_toolbar_view, safe_add_suffix, safe_add_titled_with_icon
@@ -171,9 +171,11 @@ class LogsView(Gtk.Box):
 
         # Loading state for historical logs
         self._is_loading = False
+        # Whether the stored logs changed while they were being loaded
+        self._changes_pending = False
 
-        # Keep _all_log_entries for external access
-        self._all_log_entries: list[LogEntry] = []
+        # Keep _all_log_entries for external access; details are loaded on selection
+        self._all_log_entries: list[LogSummary] = []
 
         # Set up the UI (this creates self._logs_listbox and self._logs_scrolled)
         self._setup_ui()
@@ -185,6 +187,9 @@ class LogsView(Gtk.Box):
             row_factory=self._create_log_row,
         )
 
+        # Show logs written by any process (e.g. scheduled scans) as they appear
+        self._log_monitor = self._log_manager.monitor_changes(self._on_logs_changed)
+
         # Load logs on startup asynchronously
         GLib.idle_add(self._load_logs_async)
 
@@ -568,10 +573,10 @@ class LogsView(Gtk.Box):
         # Set loading state - let callback handle empty case
         self._set_loading_state(True)
 
-        # Get logs from log manager asynchronously
+        # Get logs from log manager asynchronously, without their details
         # Note: Rows are cleared in the callback, not here, to avoid
         # blocking the main thread with synchronous operations
-        self._log_manager.get_logs_async(callback=self._on_logs_loaded, limit=100)
+        self._log_manager.get_log_summaries_async(callback=self._on_logs_loaded, limit=100)
 
     def _on_logs_loaded(self, logs: list) -> bool:
         """
@@ -581,7 +586,7 @@ class LogsView(Gtk.Box):
         completes. It populates the listbox with the loaded logs using pagination.
 
         Args:
-            logs: List of LogEntry objects from the log manager
+            logs: List of LogSummary objects from the log manager
 
         Returns:
             False to prevent GLib.idle_add from repeating
@@ -611,9 +616,65 @@ class LogsView(Gtk.Box):
         finally:
             # ALWAYS reset loading state to prevent stuck "Loading logs" forever
             self._set_loading_state(False)
+            self._handle_pending_changes()
 
         return False  # Don't repeat
 
+    def _on_logs_changed(self):
+        """
+        Handle a change notification for the stored logs.
+
+        Only logs newer than the newest one shown are loaded, and added above
+        the list. If logs shown were deleted, e.g. by another process, the list
+        is reloaded. Changes arriving during a load are handled once it is done.
+        """
+        if self._is_loading:
+            self._changes_pending = True
+            return
+        if not self._all_log_entries:
+            self._load_logs_async()
+            return
+
+        # Block other loads without replacing the list with a loading row
+        self._is_loading = True
+        self._log_manager.get_newer_log_summaries_async(
+            callback=self._on_new_logs_loaded,
+            newest=self._all_log_entries[0],
+            known_count=len(self._all_log_entries),
+            limit=100,
+        )
+
+    def _on_new_logs_loaded(self, logs: list | None) -> bool:
+        """
+        Handle completion of loading the logs written since the last load.
+
+        Args:
+            logs: New LogSummary objects, newest first, or None if logs shown
+                were deleted
+
+        Returns:
+            False to prevent GLib.idle_add from repeating
+        """
+        if logs is None:
+            # Pending changes are handled once the reload is done
+            self._is_loading = False
+            self._load_logs_async()
+            return False
+        try:
+            if logs:
+                self._pagination.prepend_entries(logs)
+                self._all_log_entries = self._pagination.all_entries
+        finally:
+            self._is_loading = False
+            self._handle_pending_changes()
+        return False
+
+    def _handle_pending_changes(self):
+        """Handle a change notification that arrived while loading."""
+        if self._changes_pending:
+            self._changes_pending = False
+            self._on_logs_changed()
+
     # Backward compatibility properties and methods for tests
     @property
     def _displayed_log_count(self) -> int:
@@ -657,12 +718,12 @@ class LogsView(Gtk.Box):
         if hasattr(self, "_pagination"):
             self._pagination.show_all()
 
-    def _create_log_row(self, entry: LogEntry) -> Adw.ActionRow:
+    def _create_log_row(self, entry: LogSummary) -> Adw.ActionRow:
         """
         Create a list row for a log entry.
 
         Args:
-            entry: The LogEntry to create a row for
+            entry: The LogSummary to create a row for
 
         Returns:
             Adw.ActionRow widget
@@ -1042,7 +1103,11 @@ class LogsView(Gtk.Box):
         import json
 
         data = []
-        for entry in self._all_log_entries:
+        for summary in self._all_log_entries:
+            # The list holds no details; load each log in full
+            entry = self._log_manager.get_log_by_id(summary.id)
+            if entry is None:
+                continue
             data.append(
                 {
                     "id": entry.id,
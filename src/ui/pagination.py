@@ -150,6 +150,22 @@ class PaginatedListController:
                 # Skip entries that fail to render (corrupted data)
                 continue
 
+    def prepend_entries(self, entries: list):
+        """
+        Add new entries above the displayed ones without rebuilding the list.
+
+        Args:
+            entries: Entries to show first, in display order
+        """
+        self._all_entries = entries + self._all_entries
+        for entry in reversed(entries):
+            try:
+                self._listbox.prepend(self._row_factory(entry))
+                self._displayed_count += 1
+            except Exception:
+                # Skip entries that fail to render (corrupted data)
+                continue
+
     def add_load_more_button(self, entries_label: str = "entries"):
         """
         Add a 'Show More' and 'Show All' button row to the listbox.
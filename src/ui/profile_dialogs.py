@@ -12,7 +12,8 @@ from typing import TYPE_CHECKING
 from gi.repository import Adw, GLib, GObject, Gtk
 
 from ..core.i18n import _, ngettext
-from .compat import create_entry_row, create_toolbar_view
+from ..core.scan_limits import ScanLimits
+from .compat import create_entry_row, create_switch_row, create_toolbar_view
 from .utils import add_row_icon, resolve_icon_name
 
 if TYPE_CHECKING:
@@ -28,6 +29,7 @@ class ProfileDialog(Adw.Window):
     - Profile name and description
     - Target directories/files to scan
     - Exclusion paths and patterns
+    - Scan options
 
     Uses Adw.Window instead of Adw.Dialog for compatibility with
     libadwaita < 1.5 (Ubuntu 22.04, Pop!_OS 22.04).
@@ -86,6 +88,9 @@ class ProfileDialog(Adw.Window):
         if self._is_edit_mode:
             self._load_profile_data()
 
+        # Limits as first shown; only the ones edited afterwards are saved
+        self._shown_limits = self._get_limits()
+
     def _setup_dialog(self):
         """Configure the dialog properties."""
         if self._is_edit_mode:
@@ -140,6 +145,12 @@ class ProfileDialog(Adw.Window):
         # Exclusions group
         self._create_exclusions_group(preferences_page)
 
+        # Scan options group
+        self._create_options_group(preferences_page)
+
+        # Scan limits group
+        self._create_limits_group(preferences_page)
+
         scrolled.set_child(preferences_page)
         toolbar_view.set_content(scrolled)
 
@@ -263,6 +274,228 @@ class ProfileDialog(Adw.Window):
         self._exclusions_group.add(self._exclusions_listbox)
         preferences_page.add(self._exclusions_group)
 
+    def _create_options_group(self, preferences_page: Adw.PreferencesPage):
+        """Create the scan options group."""
+        options_group = Adw.PreferencesGroup()
+        options_group.set_title(_("Scan Options"))
+
+        self._force_full_scan_row = create_switch_row("view-refresh-symbolic")
+        self._force_full_scan_row.set_title(_("Force Full Scan"))
+        self._force_full_scan_row.set_subtitle(
+            _("Scan every file, including files unchanged since their last clean scan")
+        )
+        options_group.add(self._force_full_scan_row)
+
+        self._load_governor_row = create_switch_row("utilities-system-monitor-symbolic")
+        self._load_governor_row.set_title(_("Yield to Busy System"))
+        self._load_governor_row.set_subtitle(
+            _("Slow down or pause the scan while the system is under heavy load")
+        )
+        options_group.add(self._load_governor_row)
+
+        self._one_file_system_row = create_switch_row("drive-harddisk-symbolic")
+        self._one_file_system_row.set_title(_("Stay on One Filesystem"))
+        self._one_file_system_row.set_subtitle(
+            _("Skip disks and partitions mounted inside the scanned folders")
+        )
+        options_group.add(self._one_file_system_row)
+
+        self._trusted_package_files_row = create_switch_row("system-software-install-symbolic")
+        self._trusted_package_files_row.set_title(_("Skip Unmodified Package Files"))
+        self._trusted_package_files_row.set_subtitle(
+            _("Trust system files that match the checksums recorded by the package manager")
+        )
+        options_group.add(self._trusted_package_files_row)
+
+        self._risk_order_row = create_switch_row("dialog-warning-symbolic")
+        self._risk_order_row.set_title(_("Scan Likely Threats First"))
+        self._risk_order_row.set_subtitle(
+            _("Start with recent executables, documents and downloads before other files")
+        )
+        options_group.add(self._risk_order_row)
+
+        preferences_page.add(options_group)
+
+    def _create_limits_group(self, preferences_page: Adw.PreferencesPage):
+        """Create the scan limits group."""
+        from .preferences.base import create_spin_row
+
+        limits_group = Adw.PreferencesGroup()
+        limits_group.set_title(_("Scan Limits"))
+        limits_group.set_description(
+            _("Bound the work of each scan; 0 keeps the ClamAV default or no limit")
+        )
+
+        # Spin buttons of the numeric limits by option name
+        self._limit_spins: dict[str, Gtk.SpinButton] = {}
+        for name, title, subtitle, max_val, icon_name in (
+            (
+                "max_filesize",
+                _("Max File Size (MB)"),
+                _("Skip larger files"),
+                4000,
+                "drive-harddisk-symbolic",
+            ),
+            (
+                "max_scansize",
+                _("Max Scan Size (MB)"),
+                _("Read at most this much of each file, archive contents included"),
+                4000,
+                "drive-harddisk-symbolic",
+            ),
+            (
+                "max_recursion",
+                _("Max Archive Recursion"),
+                _("Unpack archives nested at most this deep"),
+                255,
+                "package-x-generic-symbolic",
+            ),
+            (
+                "max_files",
+                _("Max Files in Archive"),
+                _("Scan at most this many files of each archive"),
+                1000000,
+                "package-x-generic-symbolic",
+            ),
+            (
+                "max_dir_depth",
+                _("Max Folder Depth"),
+                _("Enter folders at most this deep below each target"),
+                255,
+                "folder-symbolic",
+            ),
+        ):
+            row, spin = create_spin_row(title, subtitle, 0, max_val)
+            add_row_icon(row, icon_name)
+            self._limit_spins[name] = spin
+            limits_group.add(row)
+
+        self._include_types_row = create_entry_row("text-x-generic-symbolic")
+        self._include_types_row.set_title(_("Only Scan File Types"))
+        self._include_types_row.get_delegate().set_placeholder_text(_("e.g. *.exe, *.pdf"))
+        limits_group.add(self._include_types_row)
+
+        # Switches of the content scanned inside files by option name
+        self._limit_switches: dict[str, Gtk.Widget] = {}
+        for name, title, icon_name in (
+            ("scan_archive", _("Scan Inside Archives"), "package-x-generic-symbolic"),
+            ("scan_pdf", _("Scan Inside PDF Files"), "x-office-document-symbolic"),
+            ("scan_ole2", _("Scan Inside Office Documents"), "x-office-document-symbolic"),
+        ):
+            row = create_switch_row(icon_name)
+            row.set_title(title)
+            row.set_active(True)
+            self._limit_switches[name] = row
+            limits_group.add(row)
+
+        self._temp_dir_row = create_entry_row("folder-symbolic")
+        self._temp_dir_row.set_title(_("Temporary Directory"))
+        self._temp_dir_row.get_delegate().set_placeholder_text(_("ClamAV default"))
+        limits_group.add(self._temp_dir_row)
+
+        # Warning shown when the profile file holds limits the form cannot show
+        self._limits_warning_label = Gtk.Label()
+        self._limits_warning_label.set_halign(Gtk.Align.START)
+        self._limits_warning_label.set_wrap(True)
+        self._limits_warning_label.set_margin_start(12)
+        self._limits_warning_label.set_margin_top(6)
+        self._limits_warning_label.add_css_class("warning")
+        self._limits_warning_label.set_visible(False)
+        limits_group.add(self._limits_warning_label)
+
+        preferences_page.add(limits_group)
+
+    def _get_limits(self) -> dict:
+        """Build the "limits" option from the form."""
+        limits: dict = {}
+        for name, spin in self._limit_spins.items():
+            value = spin.get_value_as_int()
+            if value > 0:
+                limits[name] = value
+        include_types = [
+            pattern.strip()
+            for pattern in self._include_types_row.get_text().split(",")
+            if pattern.strip()
+        ]
+        if include_types:
+            limits["include_types"] = include_types
+        for name, row in self._limit_switches.items():
+            if not row.get_active():
+                limits[name] = False
+        temp_dir = self._temp_dir_row.get_text().strip()
+        if temp_dir:
+            limits["temp_dir"] = temp_dir
+        return limits
+
+    def _get_options(self) -> dict:
+        """Build the profile options from the form, keeping options not shown here."""
+        options = dict(self._profile.options) if self._profile else {}
+        if self._force_full_scan_row.get_active():
+            options["force_full_scan"] = True
+        else:
+            options.pop("force_full_scan", None)
+        if self._one_file_system_row.get_active():
+            options["one_file_system"] = True
+        else:
+            options.pop("one_file_system", None)
+        if self._trusted_package_files_row.get_active():
+            options["trusted_package_files"] = True
+        else:
+            options.pop("trusted_package_files", None)
+
+        # Thresholds set in the profile file are kept; the switch only
+        # enables the governor, otherwise the global setting applies
+        governor = options.get("load_governor")
+        governor = dict(governor) if isinstance(governor, dict) else {}
+        if self._load_governor_row.get_active():
+            governor["enabled"] = True
+        else:
+            governor.pop("enabled", None)
+        if governor:
+            options["load_governor"] = governor
+        else:
+            options.pop("load_governor", None)
+
+        # Likewise, caps set in the profile file are kept
+        risk_order = options.get("risk_order")
+        risk_order = dict(risk_order) if isinstance(risk_order, dict) else {}
+        if self._risk_order_row.get_active():
+            risk_order["enabled"] = True
+        else:
+            risk_order.pop("enabled", None)
+        if risk_order:
+            options["risk_order"] = risk_order
+        else:
+            options.pop("risk_order", None)
+
+        # The form shows 0 for both an unset limit and a limit of 0, clamps
+        # values to its ranges and cannot show invalid limits, so the limits
+        # in the profile file are kept and only the edited ones replaced.
+        # Once a limit is edited, invalid limits give way to the form.
+        form_limits = self._get_limits()
+        edited = [
+            name
+            for name in set(form_limits) | set(self._shown_limits)
+            if form_limits.get(name) != self._shown_limits.get(name)
+        ]
+        if edited:
+            limits = options.get("limits")
+            try:
+                ScanLimits.from_options(limits)
+            except ValueError:
+                limits, edited = {}, list(form_limits)
+            limits = dict(limits) if limits else {}
+            for name in edited:
+                if name in form_limits:
+                    limits[name] = form_limits[name]
+                else:
+                    limits.pop(name, None)
+            if limits:
+                options["limits"] = limits
+            else:
+                options.pop("limits", None)
+        return options
+
     def _load_profile_data(self):
         """Load existing profile data into the form."""
         if self._profile is None:
@@ -283,6 +516,37 @@ class ProfileDialog(Adw.Window):
         for pattern in exclusions.get("patterns", []):
             self._add_exclusion_pattern_to_list(pattern)
 
+        # Load options
+        options = self._profile.options or {}
+        self._force_full_scan_row.set_active(bool(options.get("force_full_scan", False)))
+        self._one_file_system_row.set_active(options.get("one_file_system") is True)
+        self._trusted_package_files_row.set_active(options.get("trusted_package_files") is True)
+        governor = options.get("load_governor")
+        self._load_governor_row.set_active(
+            isinstance(governor, dict) and governor.get("enabled") is True
+        )
+        risk_order = options.get("risk_order")
+        self._risk_order_row.set_active(
+            isinstance(risk_order, dict) and risk_order.get("enabled") is True
+        )
+        try:
+            limits = ScanLimits.from_options(options.get("limits"))
+        except ValueError as e:
+            limits = ScanLimits()
+            self._limits_warning_label.set_text(
+                _(
+                    "The scan limits in the profile file are invalid and not shown here: "
+                    "{error}. They are kept unless you change a limit."
+                ).format(error=e)
+            )
+            self._limits_warning_label.set_visible(True)
+        for name, spin in self._limit_spins.items():
+            spin.set_value(getattr(limits, name) or 0)
+        self._include_types_row.set_text(", ".join(limits.include_types))
+        for name, row in self._limit_switches.items():
+            row.set_active(getattr(limits, name))
+        self._temp_dir_row.set_text(limits.temp_dir or "")
+
     def _on_name_changed(self, entry_row):
         """Handle name entry changes for validation."""
         name = entry_row.get_text().strip()
@@ -608,6 +872,7 @@ class ProfileDialog(Adw.Window):
                         description=description,
                         targets=self._targets.copy(),
                         exclusions=exclusions,
+                        options=self._get_options(),
                     )
                     saved_profile = self._profile_manager.get_profile(self._profile.id)
                 else:
@@ -617,6 +882,7 @@ class ProfileDialog(Adw.Window):
                         targets=self._targets.copy(),
                         exclusions=exclusions,
                         description=description,
+                        options=self._get_options(),
                     )
 
                 # Notify callback
@@ -657,6 +923,7 @@ class ProfileDialog(Adw.Window):
             "description": self._description_row.get_text().strip(),
             "targets": self._targets.copy(),
             "exclusions": exclusions,
+            "options": self._get_options(),
         }
 
 
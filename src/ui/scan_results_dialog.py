@@ -445,6 +445,22 @@ class ScanResultsDialog(Adw.Window):
         path_label.set_size_request(400, -1)
         content_box.append(path_label)
 
+        # Hardlinks and identical copies that share this verdict
+        if threat.aliases:
+            aliases_label = Gtk.Label()
+            aliases_label.set_label(
+                _("Also at:")
+                + "\n"
+                + "\n".join(format_flatpak_portal_path(alias) for alias in threat.aliases)
+            )
+            aliases_label.set_xalign(0)
+            aliases_label.set_wrap(True)
+            aliases_label.set_selectable(True)
+            aliases_label.add_css_class("monospace")
+            aliases_label.add_css_class("dim-label")
+            aliases_label.add_css_class("caption")
+            content_box.append(aliases_label)
+
         # Action buttons
         actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         actions_box.add_css_class("threat-actions")
@@ -6,7 +6,6 @@ Scan interface component for ClamUI with folder picker, scan button, and results
 import logging
 import os
 import tempfile
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,9 +15,12 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
 
+from ..core.battery_manager import BatteryManager
 from ..core.i18n import _, ngettext
 from ..core.quarantine import QuarantineManager
-from ..core.scanner import Scanner, ScanProgress, ScanResult, ScanStatus
+from ..core.scan_eta import ScanEtaEstimator, format_eta
+from ..core.scan_executor import MultiTargetScan
+from ..core.scanner import Scanner, ScanProgress, ScanProgressState, ScanResult, ScanStatus
 from ..core.utils import (
     format_scan_path,
     is_flatpak,
@@ -51,6 +53,9 @@ logger = logging.getLogger(__name__)
 # This is NOT malware - it's a safe test string recognized by all AV software
 EICAR_TEST_STRING = r"X5O!P%@AP[4\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE!$H+H*"
 
+# Seconds between power source checks while a scan runs (pause_scans_on_battery)
+POWER_POLL_INTERVAL = 10
+
 
 class ScanView(Gtk.Box):
     """
@@ -90,6 +95,12 @@ class ScanView(Gtk.Box):
         self._is_scanning = False
         self._cancel_all_requested = False
 
+        # Pause state: scans paused because the system went onto battery
+        # power are resumed when it is plugged in again
+        self._battery_manager = BatteryManager()
+        self._paused_on_battery = False
+        self._power_poll_id: int | None = None
+
         # Temp file path for EICAR test (for cleanup)
         self._eicar_temp_path: str = ""
 
@@ -99,6 +110,12 @@ class ScanView(Gtk.Box):
         # Scan state change callback (for tray integration)
         self._on_scan_state_changed = None
 
+        # Live progress callback (for tray integration)
+        self._on_scan_progress = None
+
+        # Pause state change callback (for tray integration)
+        self._on_scan_paused = None
+
         # Progress section state
         self._progress_section: Gtk.Box | None = None
         self._progress_bar: Gtk.ProgressBar | None = None
@@ -109,7 +126,10 @@ class ScanView(Gtk.Box):
         self._file_label: Gtk.Label | None = None  # Current file being scanned
         self._stats_label: Gtk.Label | None = None  # "Scanned X / Y files"
         self._threat_label: Gtk.Label | None = None  # Real-time threat count
-        self._last_progress_update: float = 0.0  # For throttling UI updates
+        self._live_progress = ScanProgressState()  # Rebuilt from the current target's events
+        self._historical_throughput: float | None = None  # Bytes/s of past scans, for the ETA
+        self._eta_estimator = ScanEtaEstimator()
+        self._eta: float | None = None  # Estimated seconds left in the current target
         self._updates_paused: bool = False  # Pause updates when view is hidden
         self._is_view_visible: bool = True  # Track view visibility
 
@@ -117,6 +137,7 @@ class ScanView(Gtk.Box):
         self._current_target_idx: int = 1  # Current target (1-based)
         self._total_target_count: int = 0  # Total targets being scanned
         self._cumulative_files_scanned: int = 0  # Files from completed targets
+        self._parallel_targets: bool = False  # Targets scanned at once, merged progress
 
         # View results section state
         self._view_results_section: Gtk.Box | None = None
@@ -1065,6 +1086,15 @@ class ScanView(Gtk.Box):
         self._cancel_button.connect("clicked", self._on_cancel_clicked)
         button_box.append(self._cancel_button)
 
+        # Pause button - hidden initially, shown during scanning
+        self._pause_button = Gtk.Button()
+        self._pause_button.set_label(_("Pause"))
+        self._pause_button.set_tooltip_text(_("Pause the current scan"))
+        self._pause_button.set_size_request(120, -1)
+        self._pause_button.set_visible(False)
+        self._pause_button.connect("clicked", self._on_pause_clicked)
+        button_box.append(self._pause_button)
+
         scan_group.add(button_box)
 
         self.append(scan_group)
@@ -1176,20 +1206,44 @@ class ScanView(Gtk.Box):
     def _on_view_shown(self):
         """Resume UI updates when view becomes visible."""
         self._updates_paused = False
-        # Force an immediate update on next progress callback
+        # Catch up with the progress received while hidden
+        if self._is_scanning:
+            self._update_live_progress(self._live_progress, self._eta)
 
-    def _update_live_progress(self, progress: ScanProgress):
+    def _apply_progress(self, progress: ScanProgress):
         """
-        Update the UI with live scan progress.
+        Apply a progress event from the scanner to the live progress state.
 
         This is called from the scan thread via GLib.idle_add for thread safety.
-        Uses throttling to limit UI updates to ~10/second.
+        Every event is applied, since each carries only the infections found
+        since the previous one; the scanner already limits how often they arrive.
 
         Args:
-            progress: The ScanProgress with current scan state
+            progress: The next ScanProgress event of the current target
         """
-        if self._updates_paused:
-            return  # Don't update UI when view is hidden
+        state = self._live_progress
+        state.apply(progress)
+        self._eta = None
+        if state.percentage is not None:
+            self._eta = self._eta_estimator.estimate(state.bytes_scanned, state.bytes_total)
+
+        if self._on_scan_progress:
+            self._on_scan_progress(state, self._eta)
+
+        if not self._updates_paused:  # Don't update UI when view is hidden
+            self._update_live_progress(state, self._eta)
+        return False
+
+    def _update_live_progress(self, progress: ScanProgressState, eta: float | None = None):
+        """
+        Update the UI with live scan progress.
+
+        Args:
+            progress: The ScanProgressState of the current target
+            eta: Estimated seconds left in the current target, if known
+        """
+        # Whether the scan can pause depends on the scanner process now running
+        self._update_pause_button()
 
         # Update progress bar
         if self._progress_bar is not None:
@@ -1201,19 +1255,26 @@ class ScanView(Gtk.Box):
                 self._progress_bar.set_fraction(progress.percentage / 100)
             # If percentage is None, keep pulsing (handled by _start_progress_pulse)
 
-        # Update progress label with percentage and target context
+        # Update progress label with percentage, time left and target context
         if self._progress_label is not None and progress.percentage is not None:
             pct = int(progress.percentage)
-            if self._total_target_count > 1:
-                self._progress_label.set_text(
-                    _("Target {current} of {total} \u2014 {pct}%").format(
-                        current=self._current_target_idx,
-                        total=self._total_target_count,
-                        pct=pct,
-                    )
+            if self._parallel_targets:
+                text = _("Scanning {total} targets \u2014 {pct}%").format(
+                    total=self._total_target_count, pct=pct
+                )
+            elif self._total_target_count > 1:
+                text = _("Target {current} of {total} \u2014 {pct}%").format(
+                    current=self._current_target_idx,
+                    total=self._total_target_count,
+                    pct=pct,
                 )
             else:
-                self._progress_label.set_text(_("Scanning... {pct}%").format(pct=pct))
+                text = _("Scanning... {pct}%").format(pct=pct)
+            if self._scanner.is_paused:
+                text = _("{progress} (paused)").format(progress=text)
+            elif eta is not None:
+                text = f"{text} \u2014 {format_eta(eta)}"
+            self._progress_label.set_text(text)
 
         # Update file label with current file
         if self._file_label is not None and progress.current_file:
@@ -1224,12 +1285,17 @@ class ScanView(Gtk.Box):
         # Update stats label with cumulative counts for multi-target scans
         if self._stats_label is not None:
             total_scanned = self._cumulative_files_scanned + progress.files_scanned
-            if self._total_target_count > 1:
+            # The total grows while the tree is still being walked
+            files_total = f"{progress.files_total:,}" if progress.files_total else ""
+            if progress.total_is_estimate:
+                files_total = f"~{files_total}"
+            # Merged progress of parallel targets already spans all of them
+            if self._total_target_count > 1 and not self._parallel_targets:
                 if progress.files_total:
                     self._stats_label.set_text(
                         _("Scanned {scanned} / {total} files ({cumulative} total)").format(
                             scanned=f"{progress.files_scanned:,}",
-                            total=f"{progress.files_total:,}",
+                            total=files_total,
                             cumulative=f"{total_scanned:,}",
                         )
                     )
@@ -1244,7 +1310,7 @@ class ScanView(Gtk.Box):
                 self._stats_label.set_text(
                     _("Scanned {scanned} / {total} files").format(
                         scanned=f"{progress.files_scanned:,}",
-                        total=f"{progress.files_total:,}",
+                        total=files_total,
                     )
                 )
             else:
@@ -1301,22 +1367,18 @@ class ScanView(Gtk.Box):
 
     def _create_progress_callback(self):
         """
-        Create a throttled progress callback for the scanner.
+        Create the progress callback for the scanner.
+
+        The scanner coalesces its events (see the progress_update_interval_ms
+        setting), so every event is forwarded.
 
         Returns:
-            A callback function that schedules UI updates via GLib.idle_add
-            with throttling to limit updates to ~10/second.
+            A callback function that schedules progress updates via GLib.idle_add
         """
-        MIN_UPDATE_INTERVAL = 0.1  # 100ms between updates
 
         def progress_callback(progress: ScanProgress):
-            now = time.monotonic()
-            if now - self._last_progress_update < MIN_UPDATE_INTERVAL:
-                return  # Throttle - skip this update
-            self._last_progress_update = now
-
-            # Schedule UI update on main thread
-            GLib.idle_add(self._update_live_progress, progress)
+            # Schedule the update on the main thread
+            GLib.idle_add(self._apply_progress, progress)
 
         return progress_callback
 
@@ -1493,13 +1555,17 @@ class ScanView(Gtk.Box):
         self._eicar_button.set_sensitive(False)
         self._selection_group.set_sensitive(False)
         self._cancel_button.set_visible(True)
+        self._pause_button.set_visible(True)
+        self._update_pause_button()
+        self._start_power_polling()
 
         # Reset progress tracking state
-        self._last_progress_update = 0.0
+        self._live_progress = ScanProgressState()
         self._updates_paused = False
         self._current_target_idx = 1
         self._total_target_count = len(self._selected_paths)
         self._cumulative_files_scanned = 0
+        self._parallel_targets = False
 
         # Update cancel button text based on number of targets
         path_count = len(self._selected_paths)
@@ -1566,7 +1632,8 @@ class ScanView(Gtk.Box):
         Perform the actual scan on all selected paths.
 
         This runs in a background thread to avoid blocking the UI.
-        Scans each selected path sequentially and aggregates results.
+        Scans the selected paths, in parallel where they sit on different
+        devices (see MultiTargetScan), and aggregates results.
         """
         try:
             if not self._selected_paths:
@@ -1592,21 +1659,76 @@ class ScanView(Gtk.Box):
             if self._settings_manager is not None:
                 show_live_progress = self._settings_manager.get("show_live_progress", True)
 
-            # Create progress callback if live progress is enabled
-            progress_callback = self._create_progress_callback() if show_live_progress else None
+            # Create progress callbacks if live progress is enabled, with the
+            # throughput of past scans as a first basis for the time left
+            progress_factory = None
+            if show_live_progress:
+                progress_factory = self._create_progress_callback
+                self._historical_throughput = self._scanner.get_historical_throughput()
 
             # Get profile exclusions if a profile is selected
             profile_exclusions = None
+            force_full_scan = False
+            load_governor_options = None
+            one_file_system = None
+            trusted_package_files = False
+            risk_order_options = None
+            limits_options = None
             if self._selected_profile is not None:
                 profile_exclusions = {
                     "paths": self._selected_profile.exclusions.get("paths", []),
                     "patterns": self._selected_profile.exclusions.get("patterns", []),
                 }
+                force_full_scan = bool(self._selected_profile.options.get("force_full_scan"))
+                load_governor_options = self._selected_profile.options.get("load_governor")
+                one_file_system = self._selected_profile.options.get("one_file_system")
+                trusted_package_files = (
+                    self._selected_profile.options.get("trusted_package_files") is True
+                )
+                risk_order_options = self._selected_profile.options.get("risk_order")
+                limits_options = self._selected_profile.options.get("limits")
+
+            target_count = len(self._selected_paths)
+            scan = MultiTargetScan(
+                self._scanner,
+                self._selected_paths,
+                self._settings_manager,
+                lambda: self._cancel_all_requested,
+                profile_exclusions=profile_exclusions,
+                force_full_scan=force_full_scan,
+                load_governor_options=load_governor_options,
+                one_file_system=one_file_system,
+                trusted_package_files=trusted_package_files,
+                risk_order_options=risk_order_options,
+                limits_options=limits_options,
+            )
+            if scan.parallel:
+                GLib.idle_add(self._start_parallel_progress, target_count)
+
+            def on_target_started(index: int, target_path: str) -> None:
+                # Parallel targets share one merged progress display
+                if not scan.parallel:
+                    GLib.idle_add(self._update_scan_progress, index + 1, target_count, target_path)
+
+            def on_target_finished(index: int, target_path: str, result: ScanResult) -> None:
+                # Track cumulative file count for multi-target progress display
+                if not scan.parallel and not (
+                    result.status == ScanStatus.CANCELLED or self._cancel_all_requested
+                ):
+                    self._cumulative_files_scanned += result.scanned_files
+
+            scan_results = scan.run(
+                progress_factory=progress_factory,
+                on_target_started=on_target_started,
+                on_target_finished=on_target_finished,
+            )
 
             # Track aggregated results
             total_scanned_files = 0
             total_scanned_dirs = 0
             total_infected_count = 0
+            total_cached_count = 0
+            total_scanned_bytes = 0
             all_infected_files: list[str] = []
             all_threat_details: list = []
             all_stdout: list[str] = []
@@ -1614,27 +1736,11 @@ class ScanView(Gtk.Box):
             has_errors = False
             error_messages: list[str] = []
             final_status = ScanStatus.CLEAN
+            if len(scan_results) < target_count:
+                # Cancel all was requested before every target was started
+                final_status = ScanStatus.CANCELLED
 
-            target_count = len(self._selected_paths)
-
-            for idx, target_path in enumerate(self._selected_paths, start=1):
-                # Check if cancel all was requested before starting next target
-                if self._cancel_all_requested:
-                    logger.info(f"Cancel all requested, skipping target {idx}/{target_count}")
-                    final_status = ScanStatus.CANCELLED
-                    break
-
-                # Update progress to show current target
-                GLib.idle_add(self._update_scan_progress, idx, target_count, target_path)
-
-                # Scan this target with progress callback if enabled
-                result = self._scanner.scan_sync(
-                    target_path,
-                    recursive=True,
-                    profile_exclusions=profile_exclusions,
-                    progress_callback=progress_callback,
-                )
-
+            for target_path, result in scan_results:
                 # Check if scan was cancelled (either this target or cancel all)
                 if result.status == ScanStatus.CANCELLED or self._cancel_all_requested:
                     # Aggregate partial results from this cancelled target
@@ -1644,15 +1750,14 @@ class ScanView(Gtk.Box):
                     all_infected_files.extend(result.infected_files)
                     all_threat_details.extend(result.threat_details)
                     final_status = ScanStatus.CANCELLED
-                    break
-
-                # Track cumulative file count for multi-target progress display
-                self._cumulative_files_scanned += result.scanned_files
+                    continue
 
                 # Aggregate results
                 total_scanned_files += result.scanned_files
                 total_scanned_dirs += result.scanned_dirs
                 total_infected_count += result.infected_count
+                total_cached_count += result.cached_count
+                total_scanned_bytes += result.scanned_bytes
                 all_infected_files.extend(result.infected_files)
                 all_threat_details.extend(result.threat_details)
 
@@ -1693,6 +1798,8 @@ class ScanView(Gtk.Box):
                 infected_count=total_infected_count,
                 error_message="; ".join(error_messages) if error_messages else None,
                 threat_details=all_threat_details,
+                cached_count=total_cached_count,
+                scanned_bytes=total_scanned_bytes,
             )
 
             # Schedule UI update on main thread
@@ -1718,6 +1825,12 @@ class ScanView(Gtk.Box):
 
         self._current_target_idx = current_idx
         self._total_target_count = total_count
+        # Progress events of the new target start from zero
+        self._live_progress = ScanProgressState()
+        self._eta_estimator = ScanEtaEstimator(self._historical_throughput)
+        if self._scanner.is_paused:
+            self._eta_estimator.pause()
+        self._eta = None
 
         # Format path for display
         display_path = format_scan_path(current_path)
@@ -1739,6 +1852,34 @@ class ScanView(Gtk.Box):
             self._progress_bar.set_fraction(0.0)
         self._start_progress_pulse()
 
+    def _start_parallel_progress(self, total_count: int):
+        """
+        Show one merged progress display for targets scanned in parallel.
+
+        This is called from the scan worker thread via GLib.idle_add
+        to update the UI on the main thread.
+
+        Args:
+            total_count: Total number of targets
+        """
+        if self._progress_label is None:
+            return
+
+        self._parallel_targets = True
+        self._total_target_count = total_count
+        self._live_progress = ScanProgressState()
+        self._eta_estimator = ScanEtaEstimator(self._historical_throughput)
+        if self._scanner.is_paused:
+            self._eta_estimator.pause()
+        self._eta = None
+
+        self._progress_label.set_label(
+            _("Scanning {total} targets in parallel").format(total=total_count)
+        )
+        if self._progress_bar is not None:
+            self._progress_bar.set_fraction(0.0)
+        self._start_progress_pulse()
+
     def _on_scan_complete(self, result: ScanResult):
         """
         Handle scan completion.
@@ -1768,6 +1909,8 @@ class ScanView(Gtk.Box):
         self._eicar_button.set_sensitive(True)
         self._selection_group.set_sensitive(True)
         self._cancel_button.set_visible(False)
+        self._pause_button.set_visible(False)
+        self._stop_power_polling()
 
         # Notify external handlers
         if self._on_scan_state_changed:
@@ -1839,6 +1982,8 @@ class ScanView(Gtk.Box):
         self._eicar_button.set_sensitive(True)
         self._selection_group.set_sensitive(True)
         self._cancel_button.set_visible(False)
+        self._pause_button.set_visible(False)
+        self._stop_power_polling()
 
         # Notify external handlers
         if self._on_scan_state_changed:
@@ -1860,6 +2005,110 @@ class ScanView(Gtk.Box):
         # The scan thread will check _cancel_all_requested and skip remaining targets
         # _on_scan_complete will handle the UI update
 
+    def _on_pause_clicked(self, button: Gtk.Button) -> None:
+        """Handle pause button click."""
+        self.toggle_pause()
+
+    @property
+    def is_scan_paused(self) -> bool:
+        """Whether the running scan is paused."""
+        return self._is_scanning and self._scanner.is_paused
+
+    def pause_scan(self, on_battery: bool = False) -> None:
+        """
+        Pause the running scan.
+
+        Paused time is left out of the scan's duration and time-left
+        estimate.
+
+        Args:
+            on_battery: Whether the pause is due to battery power; such
+                        pauses end automatically on AC power
+        """
+        if not self._is_scanning or self._scanner.is_paused:
+            return
+        if not self._scanner.can_pause:
+            logger.info("Scan not paused: the scanner runs on the host outside the Flatpak sandbox")
+            return
+        logger.info("Scan paused%s", " on battery power" if on_battery else "")
+        self._paused_on_battery = on_battery
+        self._scanner.pause()
+        self._eta_estimator.pause()
+        self._on_pause_changed()
+
+    def resume_scan(self) -> None:
+        """Resume a paused scan."""
+        if not self._is_scanning or not self._scanner.is_paused:
+            return
+        logger.info("Scan resumed")
+        self._paused_on_battery = False
+        self._scanner.resume()
+        self._eta_estimator.resume()
+        self._on_pause_changed()
+
+    def toggle_pause(self) -> None:
+        """Pause the running scan, or resume it if paused."""
+        if self.is_scan_paused:
+            self.resume_scan()
+        else:
+            self.pause_scan()
+
+    def _on_pause_changed(self) -> None:
+        """Update the controls and external handlers after a pause or resume."""
+        self._update_pause_button()
+        if self._live_progress.percentage is not None:
+            self._update_live_progress(self._live_progress, self._eta)
+        elif self._progress_label is not None and self._scanner.is_paused:
+            self._progress_label.set_label(_("Scan paused"))
+        if self._on_scan_paused:
+            self._on_scan_paused(self._scanner.is_paused)
+
+    def _update_pause_button(self) -> None:
+        """Show Pause or Resume on the pause button, disabled if the scan cannot pause."""
+        if self._scanner.is_paused:
+            self._pause_button.set_sensitive(True)
+            self._pause_button.set_label(_("Resume"))
+            self._pause_button.set_tooltip_text(_("Resume the paused scan"))
+        elif not self._scanner.can_pause:
+            self._pause_button.set_sensitive(False)
+            self._pause_button.set_label(_("Pause"))
+            self._pause_button.set_tooltip_text(
+                _("Scans run by ClamAV on the host cannot be paused from the Flatpak sandbox")
+            )
+        else:
+            self._pause_button.set_sensitive(True)
+            self._pause_button.set_label(_("Pause"))
+            self._pause_button.set_tooltip_text(_("Pause the current scan"))
+
+    def _start_power_polling(self) -> None:
+        """Watch the power source while scanning, if pause_scans_on_battery is set."""
+        self._paused_on_battery = False
+        if self._settings_manager is None or self._power_poll_id is not None:
+            return
+        if not self._settings_manager.get("pause_scans_on_battery", True):
+            return
+        # Record the current source; only switches during the scan count
+        self._battery_manager.poll_power_change()
+        self._power_poll_id = GLib.timeout_add_seconds(POWER_POLL_INTERVAL, self._on_power_poll)
+
+    def _stop_power_polling(self) -> None:
+        """Stop watching the power source."""
+        self._paused_on_battery = False
+        if self._power_poll_id is not None:
+            GLib.source_remove(self._power_poll_id)
+            self._power_poll_id = None
+
+    def _on_power_poll(self) -> bool:
+        """Pause the scan on battery power and resume it on AC power."""
+        on_battery = self._battery_manager.poll_power_change()
+        if on_battery is True and not self._scanner.is_paused:
+            self.pause_scan(on_battery=True)
+            self._show_toast(_("Scan paused while on battery power"))
+        elif on_battery is False and self._paused_on_battery:
+            self.resume_scan()
+            self._show_toast(_("Scan resumed on AC power"))
+        return True
+
     def _create_backend_indicator(self):
         """Create a small indicator showing the active scan backend."""
         self._backend_label = Gtk.Label()
@@ -1874,6 +2123,7 @@ class ScanView(Gtk.Box):
         backend = self._scanner.get_active_backend()
         backend_names = {
             "daemon": "clamd (daemon)",
+            "user_daemon": "clamd (private)",
             "clamscan": "clamscan (standalone)",
         }
         backend_display = backend_names.get(backend, backend)
@@ -1902,6 +2152,30 @@ class ScanView(Gtk.Box):
         """Alias for set_on_scan_state_changed for backwards compatibility."""
         self.set_on_scan_state_changed(callback)
 
+    def set_on_scan_paused(self, callback):
+        """
+        Set a callback for pausing and resuming the running scan.
+
+        Used by the application to show the pause state in the tray.
+
+        Args:
+            callback: Function to call with (paused: bool) parameter
+        """
+        self._on_scan_paused = callback
+
+    def set_on_scan_progress(self, callback):
+        """
+        Set a callback for live scan progress.
+
+        Used by the application to show scan progress in the tray.
+
+        Args:
+            callback: Function to call with (progress: ScanProgressState,
+                      eta: float | None) for the current target on each
+                      progress update; eta is the estimated seconds left
+        """
+        self._on_scan_progress = callback
+
     def get_selected_profile(self) -> "ScanProfile | None":
         """Return the currently selected scan profile."""
         return self._selected_profile
@@ -66,6 +66,7 @@ class TrayManager:
         self._on_update: Callable[[], None] | None = None
         self._on_quit: Callable[[], None] | None = None
         self._on_window_toggle: Callable[[], None] | None = None
+        self._on_pause_toggle: Callable[[], None] | None = None
         self._on_profile_select: Callable[[str], None] | None = None
 
         # Profile state
@@ -326,6 +327,8 @@ class TrayManager:
             GLib.idle_add(self._on_quit)
         elif action == "toggle_window" and self._on_window_toggle:
             GLib.idle_add(self._on_window_toggle)
+        elif action == "toggle_pause" and self._on_pause_toggle:
+            GLib.idle_add(self._on_pause_toggle)
         elif action == "select_profile" and self._on_profile_select:
             profile_id = message.get("profile_id")
             if profile_id:
@@ -388,6 +391,16 @@ class TrayManager:
         self._on_window_toggle = on_toggle
         logger.debug("Window toggle callback configured")
 
+    def set_pause_toggle_callback(self, on_toggle: Callable[[], None]) -> None:
+        """
+        Set the callback for the Pause/Resume Scan menu item.
+
+        Args:
+            on_toggle: Callback to invoke to pause or resume the running scan
+        """
+        self._on_pause_toggle = on_toggle
+        logger.debug("Pause toggle callback configured")
+
     def set_profile_select_callback(self, on_select: Callable[[str], None]) -> None:
         """
         Set the callback for profile selection from tray menu.
@@ -410,14 +423,28 @@ class TrayManager:
             self._current_status = status
         self._send_command({"action": "update_status", "status": status})
 
-    def update_scan_progress(self, percentage: int) -> None:
+    def update_scan_progress(self, percentage: int, eta: str = "") -> None:
         """
         Show scan progress percentage in the tray.
 
         Args:
             percentage: Progress percentage (0-100). Use 0 to clear.
+            eta: Optional estimated time left, e.g. "about 5 minutes left"
+        """
+        command = {"action": "update_progress", "percentage": percentage}
+        if eta:
+            command["eta"] = eta
+        self._send_command(command)
+
+    def update_scan_state(self, scanning: bool, paused: bool = False) -> None:
+        """
+        Show or hide the Pause/Resume Scan menu item.
+
+        Args:
+            scanning: Whether a scan is running
+            paused: Whether the running scan is paused
         """
-        self._send_command({"action": "update_progress", "percentage": percentage})
+        self._send_command({"action": "update_scan_state", "scanning": scanning, "paused": paused})
 
     def update_window_menu_label(self, visible: bool = True) -> None:
         """
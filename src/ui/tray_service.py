@@ -211,6 +211,8 @@ class TrayService:
         self._current_status = "protected"
         self._window_visible = True
         self._progress_label = ""
+        self._scan_active = False
+        self._scan_paused = False
 
         # Profile state
         self._profiles: list[dict] = []
@@ -317,6 +319,15 @@ class TrayService:
         full_scan.connect("item-activated", self._on_menu_full_scan)
         self._menu_root.child_append(full_scan)
 
+        # Pause/Resume Scan (only while a scan runs)
+        if self._scan_active:
+            pause_item = Dbusmenu.Menuitem.new_with_id(item_id)
+            item_id += 1
+            pause_label = _("Resume Scan") if self._scan_paused else _("Pause Scan")
+            pause_item.property_set(Dbusmenu.MENUITEM_PROP_LABEL, pause_label)
+            pause_item.connect("item-activated", self._on_menu_toggle_pause)
+            self._menu_root.child_append(pause_item)
+
         # Separator
         sep2 = Dbusmenu.Menuitem.new_with_id(item_id)
         item_id += 1
@@ -356,6 +367,10 @@ class TrayService:
         """Handle full scan menu item activation."""
         self._send_action("full_scan")
 
+    def _on_menu_toggle_pause(self, menuitem, timestamp):
+        """Handle pause/resume scan menu item activation."""
+        self._send_action("toggle_pause")
+
     def _on_menu_update(self, menuitem, timestamp):
         """Handle update definitions menu item activation."""
         self._send_action("update")
@@ -386,6 +401,8 @@ class TrayService:
         tooltip = _("ClamUI - {status}").format(status=status_display)
         if self._progress_label:
             tooltip += f" ({self._progress_label})"
+        if self._scan_paused:
+            tooltip += " " + _("(Paused)")
         return tooltip
 
     def _get_sni_status(self) -> str:
@@ -581,15 +598,22 @@ class TrayService:
 
         logger.debug(f"Status updated to: {status}")
 
-    def update_progress(self, percentage: int) -> None:
-        """Show scan progress percentage."""
+    def update_progress(self, percentage: int, eta: str = "") -> None:
+        """Show scan progress percentage and, if known, the time left."""
         if 0 < percentage <= 100:
-            self._progress_label = f"{percentage}%"
+            self._progress_label = f"{percentage}%, {eta}" if eta else f"{percentage}%"
         else:
             self._progress_label = ""
 
         self._emit_signal("NewToolTip")
 
+    def update_scan_state(self, scanning: bool, paused: bool = False) -> None:
+        """Update whether a scan runs and is paused, for the Pause/Resume item."""
+        self._scan_active = scanning
+        self._scan_paused = scanning and paused
+        self._rebuild_menu()
+        self._emit_signal("NewToolTip")
+
     def update_window_visible(self, visible: bool) -> None:
         """Update window visibility state."""
         self._window_visible = visible
@@ -613,7 +637,13 @@ class TrayService:
 
         elif action == "update_progress":
             percentage = command.get("percentage", 0)
-            GLib.idle_add(self.update_progress, percentage)
+            eta = command.get("eta", "")
+            GLib.idle_add(self.update_progress, percentage, eta)
+
+        elif action == "update_scan_state":
+            scanning = command.get("scanning", False)
+            paused = command.get("paused", False)
+            GLib.idle_add(self.update_scan_state, scanning, paused)
 
         elif action == "update_window_visible":
             visible = command.get("visible", True)
@@ -70,6 +70,31 @@ class TestParseArguments:
 
         assert args.dry_run is True
 
+    def test_parse_arguments_force_full_scan(self):
+        """Test parse_arguments with --force-full-scan flag."""
+        from src.cli.scheduled_scan import parse_arguments
+
+        with patch("sys.argv", ["clamui-scheduled-scan"]):
+            assert parse_arguments().force_full_scan is False
+
+        with patch("sys.argv", ["clamui-scheduled-scan", "--force-full-scan"]):
+            args = parse_arguments()
+
+        assert args.force_full_scan is True
+
+    def test_parse_arguments_resume(self):
+        """Test parse_arguments with --resume and --no-resume flags."""
+        from src.cli.scheduled_scan import parse_arguments
+
+        with patch("sys.argv", ["clamui-scheduled-scan"]):
+            assert parse_arguments().resume is None
+
+        with patch("sys.argv", ["clamui-scheduled-scan", "--resume"]):
+            assert parse_arguments().resume is True
+
+        with patch("sys.argv", ["clamui-scheduled-scan", "--no-resume"]):
+            assert parse_arguments().resume is False
+
     def test_parse_arguments_verbose(self):
         """Test parse_arguments with --verbose flag."""
         from src.cli.scheduled_scan import parse_arguments
@@ -435,6 +460,25 @@ class TestMain:
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["targets"] == [home_dir]
 
+    def test_main_resume_from_settings_and_cli(self):
+        """Test main resumes by default and --no-resume overrides the setting."""
+        from src.cli.scheduled_scan import main
+
+        mock_settings = MagicMock()
+        mock_settings.get.side_effect = lambda key, default: {
+            "schedule_targets": ["/home/test"],
+        }.get(key, default)
+
+        for argv, expected in ((["--dry-run"], True), (["--dry-run", "--no-resume"], False)):
+            with (
+                patch("sys.argv", ["clamui-scheduled-scan", *argv]),
+                patch("src.cli.scheduled_scan.SettingsManager", return_value=mock_settings),
+                patch("src.cli.scheduled_scan.run_scheduled_scan", return_value=0) as mock_run,
+            ):
+                main()
+
+            assert mock_run.call_args[1]["resume"] is expected
+
 
 class TestExecuteScans:
     """Tests for the _execute_scans function."""
@@ -547,6 +591,60 @@ class TestExecuteScans:
         assert len(agg.all_results) == 2
         assert agg.valid_targets == [str(target1), str(target2)]
 
+    def test_execute_scans_parallel_targets(self, tmp_path, capsys):
+        """Test targets on different devices are scanned in parallel and aggregated."""
+        from src.cli.scheduled_scan import ScanContext, _execute_scans
+        from src.core.scanner_types import ScanResult, ScanStatus
+
+        targets = [str(tmp_path / "disk1"), str(tmp_path / "disk2")]
+
+        def scan_sync(path, **kwargs):
+            infected = path == targets[1]
+            return ScanResult(
+                status=ScanStatus.INFECTED if infected else ScanStatus.CLEAN,
+                path=path,
+                stdout="",
+                stderr="",
+                exit_code=1 if infected else 0,
+                infected_files=[f"{path}/evil"] if infected else [],
+                scanned_files=5,
+                scanned_dirs=1,
+                infected_count=1 if infected else 0,
+                error_message=None,
+                threat_details=[],
+            )
+
+        mock_scanner = MagicMock()
+        mock_scanner.get_active_backend.return_value = "daemon"
+        mock_scanner.create_worker.return_value.scan_sync.side_effect = scan_sync
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: default
+
+        ctx = ScanContext(
+            targets=targets,
+            skip_on_battery=False,
+            auto_quarantine=False,
+            dry_run=False,
+            verbose=False,
+            scanner=mock_scanner,
+            settings=settings,
+            battery_manager=MagicMock(),
+            log_manager=MagicMock(),
+        )
+
+        with patch(
+            "src.core.scan_executor.group_by_device",
+            side_effect=lambda paths: [[i] for i in range(len(paths))],
+        ):
+            agg = _execute_scans(ctx, targets)
+
+        mock_scanner.scan_sync.assert_not_called()
+        mock_scanner.create_worker.assert_called_with(pool_shares=2)
+        assert [result.path for result in agg.all_results] == targets
+        assert agg.total_scanned == 10
+        assert agg.all_infected_files == [f"{targets[1]}/evil"]
+        assert f"{targets[1]}: Found 1 threat(s)" in capsys.readouterr().err
+
     def test_execute_scans_with_infections(self, tmp_path, capsys):
         """Test _execute_scans with infected files found."""
         from src.cli.scheduled_scan import ScanContext, _execute_scans
@@ -646,6 +744,148 @@ class TestExecuteScans:
         captured = capsys.readouterr()
         assert "Error" in captured.err
 
+    def test_execute_scans_force_full_scan(self, tmp_path):
+        """Test _execute_scans passes force_full_scan and totals cached files."""
+        from src.cli.scheduled_scan import ScanContext, _execute_scans
+        from src.core.scanner_types import ScanResult, ScanStatus
+
+        target = tmp_path / "dir"
+        target.mkdir()
+
+        mock_scanner = MagicMock()
+        mock_scanner.scan_sync.return_value = ScanResult(
+            status=ScanStatus.CLEAN,
+            path=str(target),
+            stdout="",
+            stderr="",
+            exit_code=0,
+            infected_files=[],
+            scanned_files=1,
+            scanned_dirs=1,
+            infected_count=0,
+            error_message=None,
+            threat_details=[],
+            cached_count=4,
+        )
+
+        ctx = ScanContext(
+            targets=[str(target)],
+            skip_on_battery=False,
+            auto_quarantine=False,
+            dry_run=False,
+            verbose=False,
+            force_full_scan=True,
+            scanner=mock_scanner,
+            settings=MagicMock(),
+            battery_manager=MagicMock(),
+            log_manager=MagicMock(),
+        )
+
+        agg = _execute_scans(ctx, [str(target)])
+
+        mock_scanner.scan_sync.assert_called_once_with(
+            str(target),
+            recursive=True,
+            force_full_scan=True,
+            resume=False,
+            progress_callback=None,
+        )
+        assert agg.total_cached == 4
+
+    def test_execute_scans_reports_checkpoint(self, tmp_path, monkeypatch, capsys):
+        """Test _execute_scans resumes targets with a checkpoint and says so."""
+        from src.cli.scheduled_scan import ScanContext, _execute_scans
+        from src.core.scan_checkpoint import CheckpointTracker
+        from src.core.scanner_types import ScanResult, ScanStatus
+
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+        target = tmp_path / "dir"
+        target.mkdir()
+        CheckpointTracker(str(target), None, "db-1").save()
+
+        mock_scanner = MagicMock()
+        mock_scanner.scan_sync.return_value = ScanResult(
+            status=ScanStatus.CLEAN,
+            path=str(target),
+            stdout="",
+            stderr="",
+            exit_code=0,
+            infected_files=[],
+            scanned_files=1,
+            scanned_dirs=1,
+            infected_count=0,
+            error_message=None,
+            threat_details=[],
+        )
+
+        ctx = ScanContext(
+            targets=[str(target)],
+            skip_on_battery=False,
+            auto_quarantine=False,
+            dry_run=False,
+            verbose=False,
+            resume=True,
+            scanner=mock_scanner,
+            settings=MagicMock(),
+            battery_manager=MagicMock(),
+            log_manager=MagicMock(),
+        )
+
+        _execute_scans(ctx, [str(target)])
+
+        assert mock_scanner.scan_sync.call_args[1]["resume"] is True
+        assert "Resuming interrupted scan" in capsys.readouterr().err
+
+    def test_execute_scans_verbose_reports_threats_as_found(self, tmp_path, capsys):
+        """Test verbose mode reports threats from progress events during the scan."""
+        from src.cli.scheduled_scan import ScanContext, _execute_scans
+        from src.core.scanner_types import ScanProgress, ScanResult, ScanStatus
+
+        target = tmp_path / "dir"
+        target.mkdir()
+
+        def scan_sync(path, **kwargs):
+            on_progress = kwargs["progress_callback"]
+            on_progress(ScanProgress("/dir/a", 1, 4, 1, new_infected_files=["/dir/a"]))
+            on_progress(ScanProgress("/dir/c", 3, 4, 1))
+            on_progress(ScanProgress("/dir/d", 4, 4, 2, new_infected_files=["/dir/d"]))
+            return ScanResult(
+                status=ScanStatus.INFECTED,
+                path=path,
+                stdout="",
+                stderr="",
+                exit_code=1,
+                infected_files=["/dir/a", "/dir/d"],
+                scanned_files=4,
+                scanned_dirs=1,
+                infected_count=2,
+                error_message=None,
+                threat_details=[],
+            )
+
+        mock_scanner = MagicMock()
+        mock_scanner.scan_sync.side_effect = scan_sync
+
+        ctx = ScanContext(
+            targets=[str(target)],
+            skip_on_battery=False,
+            auto_quarantine=False,
+            dry_run=False,
+            verbose=True,
+            scanner=mock_scanner,
+            settings=MagicMock(),
+            battery_manager=MagicMock(),
+            log_manager=MagicMock(),
+        )
+
+        _execute_scans(ctx, [str(target)])
+
+        err = capsys.readouterr().err
+        assert err.count("Threat found: /dir/a") == 1
+        assert err.count("Threat found: /dir/d") == 1
+        assert "70% (3 files scanned)" in err
+        assert "100% (4 files scanned)" in err
+
 
 class TestProcessQuarantine:
     """Tests for the _process_quarantine function."""
@@ -145,6 +145,20 @@ class MockGtkListBoxRow(MockGtkWidget):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_backend_probes():
+    """
+    Clear the cached backend availability checks before each test.
+
+    Tests mock the underlying checks differently, so a result cached by an
+    earlier test must not leak into the next one.
+    """
+    import src.core.backend_probe as backend_probe_module
+
+    backend_probe_module.invalidate_backend_probes()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def reset_flatpak_cache():
     """
@@ -516,3 +530,191 @@ def mock_scanner():
     scanner._current_process = None
 
     yield scanner
+
+
+# =============================================================================
+# Fake clamd Daemon
+# =============================================================================
+
+
+class FakeClamd:
+    """
+    Minimal clamd speaking the null-terminated socket protocol on a Unix socket.
+
+    Files whose content contains the EICAR marker are reported as
+    "Eicar-Test-Signature FOUND"; everything else is OK. Supports PING,
+    VERSION, STATS, RELOAD, SHUTDOWN, INSTREAM, MULTISCAN/CONTSCAN and
+    IDSESSION with FILDES or SCAN.
+    """
+
+    SIGNATURE = "Eicar-Test-Signature"
+
+    def __init__(self, socket_path: str):
+        import socket
+        import threading
+
+        self.socket_path = socket_path
+        self.commands: list[str] = []
+        self.sessions = 0
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(socket_path)
+        self._server.listen(16)
+        self._stopped = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._server.close()
+
+    def _verdict(self, data: bytes) -> str:
+        return f"{self.SIGNATURE} FOUND" if b"EICAR" in data else "OK"
+
+    def _serve(self) -> None:
+        import threading
+
+        while not self._stopped:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn) -> None:
+        import socket
+        import struct
+
+        buffer = b""
+        fds: list[int] = []
+
+        def recv_more() -> bool:
+            nonlocal buffer
+            data, new_fds, _flags, _addr = socket.recv_fds(conn, 65536, 8)
+            fds.extend(new_fds)
+            buffer += data
+            return bool(data)
+
+        def read_command() -> str | None:
+            nonlocal buffer
+            while b"\0" not in buffer:
+                if not recv_more():
+                    return None
+            command, _, buffer = buffer.partition(b"\0")
+            return command.decode()
+
+        def read_exact(size: int) -> bytes:
+            nonlocal buffer
+            while len(buffer) < size:
+                if not recv_more():
+                    break
+            data, buffer = buffer[:size], buffer[size:]
+            return data
+
+        def scan_fd() -> str:
+            # The FILDES payload is a single byte carrying the descriptor
+            read_exact(1)
+            while not fds:
+                if not recv_more():
+                    return "fd[-1]: No file descriptor received. ERROR"
+            fd = fds.pop(0)
+            try:
+                with os.fdopen(fd, "rb") as f:
+                    return f"fd[{fd}]: {self._verdict(f.read())}"
+            except OSError as e:
+                return f"fd[{fd}]: {e} ERROR"
+
+        def scan_path(path: str) -> str:
+            try:
+                with open(path, "rb") as f:
+                    return f"{path}: {self._verdict(f.read())}"
+            except OSError:
+                return f"{path}: Access denied. ERROR"
+
+        def reply(text: str) -> None:
+            conn.sendall(text.encode() + b"\0")
+
+        try:
+            command = read_command()
+            if command is None:
+                return
+            self.commands.append(command)
+            if command == "zPING":
+                reply("PONG")
+            elif command == "zVERSION":
+                reply("ClamAV 1.0.0/27000/Mon Jan  1 00:00:00 2024")
+            elif command == "zSTATS":
+                reply("POOLS: 1\n\nSTATE: VALID PRIMARY\nTHREADS: live 1  idle 0 max 10\nEND")
+            elif command == "zRELOAD":
+                reply("RELOADING")
+            elif command == "zSHUTDOWN":
+                self.stop()
+            elif command == "zFILDES":
+                reply(scan_fd())
+            elif command == "zINSTREAM":
+                data = b""
+                while True:
+                    (size,) = struct.unpack("!L", read_exact(4))
+                    if size == 0:
+                        break
+                    data += read_exact(size)
+                reply(f"stream: {self._verdict(data)}")
+            elif command.startswith(("zMULTISCAN ", "zCONTSCAN ")):
+                root = command.split(" ", 1)[1]
+                found = False
+                for dirpath, _dirs, files in os.walk(root):
+                    for name in sorted(files):
+                        file_path = os.path.join(dirpath, name)
+                        with open(file_path, "rb") as f:
+                            verdict = self._verdict(f.read())
+                        if verdict != "OK":
+                            found = True
+                            reply(f"{file_path}: {verdict}")
+                if not found:
+                    reply(f"{root}: OK")
+            elif command == "zIDSESSION":
+                self.sessions += 1
+                request_id = 0
+                while True:
+                    command = read_command()
+                    if command is None or command == "zEND":
+                        return
+                    request_id += 1
+                    self.commands.append(command)
+                    if command == "zFILDES":
+                        reply(f"{request_id}: {scan_fd()}")
+                    elif command.startswith("zSCAN "):
+                        reply(f"{request_id}: {scan_path(command[6:])}")
+                    elif command == "zPING":
+                        reply(f"{request_id}: PONG")
+                    else:
+                        reply(f"{request_id}: UNKNOWN COMMAND")
+            else:
+                reply("UNKNOWN COMMAND")
+        except OSError:
+            pass
+        finally:
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+
+
+@pytest.fixture
+def fake_clamd():
+    """
+    Run a FakeClamd on a short Unix socket path for the duration of a test.
+
+    AF_UNIX paths are limited to ~108 bytes, so pytest's tmp_path is not used.
+
+    Yields:
+        FakeClamd: The running fake daemon (see its socket_path attribute)
+    """
+    import shutil
+    import tempfile
+
+    socket_dir = tempfile.mkdtemp(prefix="clamd")
+    daemon = FakeClamd(os.path.join(socket_dir, "clamd.sock"))
+    try:
+        yield daemon
+    finally:
+        daemon.stop()
+        shutil.rmtree(socket_dir, ignore_errors=True)
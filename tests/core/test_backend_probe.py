@@ -0,0 +1,180 @@
+# ClamUI Backend Probe Tests
+"""Unit tests for the cached backend availability checks."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import backend_probe
+from src.core.backend_probe import ProbeCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Clear the shared cache of the module imported here (tests may re-import src)."""
+    backend_probe.invalidate_backend_probes()
+    yield
+    backend_probe.invalidate_backend_probes()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ProbeCache(clock=clock)
+
+
+class TestProbeCache:
+    """Tests for ProbeCache."""
+
+    def test_result_reused_within_ttl(self, cache, clock):
+        probe = MagicMock(return_value=((True, "1.0"), ()))
+
+        assert cache.get("clamscan", probe, ttl=10) == (True, "1.0")
+        clock.now += 9
+        assert cache.get("clamscan", probe, ttl=10) == (True, "1.0")
+
+        assert probe.call_count == 1
+
+    def test_expired_result_probed_again(self, cache, clock):
+        probe = MagicMock(side_effect=[((True, "1.0"), ()), ((False, "gone"), ())])
+
+        cache.get("clamscan", probe, ttl=10)
+        clock.now += 11
+
+        assert cache.get("clamscan", probe, ttl=10) == (False, "gone")
+        assert probe.call_count == 2
+
+    def test_replaced_file_invalidates(self, cache, tmp_path):
+        binary = tmp_path / "clamscan"
+        binary.write_text("v1")
+        probe = MagicMock(return_value=((True, "1.0"), (str(binary),)))
+
+        cache.get("clamscan", probe, ttl=300)
+        cache.get("clamscan", probe, ttl=300)
+        assert probe.call_count == 1
+
+        replacement = tmp_path / "clamscan.new"
+        replacement.write_text("v2")
+        os.utime(replacement, ns=(0, 10**9))
+        replacement.replace(binary)
+
+        cache.get("clamscan", probe, ttl=300)
+        assert probe.call_count == 2
+
+    def test_created_file_invalidates(self, cache, tmp_path):
+        socket_path = tmp_path / "clamd.ctl"
+        probe = MagicMock(return_value=((False, "no socket"), (str(socket_path),)))
+
+        cache.get("clamd", probe, ttl=30)
+        socket_path.write_text("")
+        cache.get("clamd", probe, ttl=30)
+
+        assert probe.call_count == 2
+
+    def test_invalidate(self, cache):
+        probe = MagicMock(return_value=((True, "1.0"), ()))
+
+        cache.get("clamscan", probe, ttl=300)
+        cache.invalidate()
+        cache.get("clamscan", probe, ttl=300)
+
+        assert probe.call_count == 2
+
+    def test_keys_are_independent(self, cache):
+        cache.get("clamscan", lambda: ((True, "scan"), ()), ttl=300)
+        cache.get("freshclam", lambda: ((False, "missing"), ()), ttl=300)
+
+        assert cache.get("clamscan", MagicMock(), ttl=300) == (True, "scan")
+        assert cache.get("freshclam", MagicMock(), ttl=300) == (False, "missing")
+
+
+class TestBinaryChecks:
+    """Tests for the cached binary checks."""
+
+    def test_check_runs_once(self):
+        with (
+            patch.object(
+                backend_probe.clamav_detection,
+                "check_clamav_installed",
+                return_value=(True, "ClamAV 1.0"),
+            ) as check,
+            patch.object(backend_probe, "which_host_command", return_value=None),
+        ):
+            assert backend_probe.check_clamav_installed() == (True, "ClamAV 1.0")
+            assert backend_probe.check_clamav_installed() == (True, "ClamAV 1.0")
+
+        check.assert_called_once_with()
+
+
+class TestClamdConnection:
+    """Tests for the cached daemon connection check."""
+
+    @pytest.fixture(autouse=True)
+    def no_system_clamd(self):
+        with (
+            patch.object(backend_probe, "resolve_clamd_address", return_value=None),
+            patch.object(backend_probe, "which_host_command", return_value=None),
+        ):
+            yield
+
+    def test_socket_ping_needs_no_clamdscan(self, fake_clamd):
+        settings = MagicMock()
+        settings.get.return_value = fake_clamd.socket_path
+
+        with patch.object(backend_probe.clamav_detection, "check_clamd_connection") as fallback:
+            result = backend_probe.check_clamd_connection(settings_manager=settings)
+            backend_probe.check_clamd_connection(settings_manager=settings)
+
+        assert result == (True, "PONG")
+        fallback.assert_not_called()
+        assert fake_clamd.commands == ["zPING"]
+
+    def test_falls_back_to_clamdscan(self):
+        with patch.object(
+            backend_probe.clamav_detection,
+            "check_clamd_connection",
+            return_value=(False, "Daemon not responding"),
+        ) as fallback:
+            assert backend_probe.check_clamd_connection() == (False, "Daemon not responding")
+            assert backend_probe.check_clamd_connection() == (False, "Daemon not responding")
+
+        fallback.assert_called_once_with(None)
+
+    def test_restarted_daemon_is_noticed(self, fake_clamd):
+        settings = MagicMock()
+        settings.get.return_value = fake_clamd.socket_path
+        backend_probe.check_clamd_connection(settings_manager=settings)
+
+        fake_clamd.stop()
+        os.unlink(fake_clamd.socket_path)
+
+        with patch.object(
+            backend_probe.clamav_detection,
+            "check_clamd_connection",
+            return_value=(False, "Could not find clamd socket"),
+        ):
+            result = backend_probe.check_clamd_connection(settings_manager=settings)
+
+        assert result == (False, "Could not find clamd socket")
+
+    def test_non_string_setting_ignored(self):
+        settings = MagicMock()
+        with patch.object(
+            backend_probe.clamav_detection, "check_clamd_connection", return_value=(False, "x")
+        ):
+            assert backend_probe.check_clamd_connection(settings_manager=settings) == (False, "x")
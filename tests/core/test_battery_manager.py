@@ -185,6 +185,30 @@ class TestBatteryManagerShouldSkipScan:
             assert manager.should_skip_scan(skip_on_battery=True) is False
 
 
+class TestBatteryManagerPollPowerChange:
+    """Tests for BatteryManager.poll_power_change()."""
+
+    def test_first_poll_records_state(self):
+        """Test the first poll reports no change."""
+        manager = BatteryManager()
+
+        with mock.patch.object(manager, "is_on_battery", return_value=True):
+            assert manager.poll_power_change() is None
+
+    def test_switch_to_battery_and_back(self):
+        """Test switches are reported once each."""
+        manager = BatteryManager()
+
+        with mock.patch.object(
+            manager, "is_on_battery", side_effect=[False, True, True, False, False]
+        ):
+            assert manager.poll_power_change() is None
+            assert manager.poll_power_change() is True
+            assert manager.poll_power_change() is None
+            assert manager.poll_power_change() is False
+            assert manager.poll_power_change() is None
+
+
 class TestBatteryManagerProperties:
     """Tests for BatteryManager properties."""
 
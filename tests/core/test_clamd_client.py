@@ -0,0 +1,416 @@
+# ClamUI Clamd Client Tests
+"""Unit tests for the native clamd protocol client."""
+
+import os
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.clamd_client import (
+    ClamdAddress,
+    ClamdClient,
+    ClamdError,
+    ClamdReplyStatus,
+    ClamdSession,
+    ClamdSessionPool,
+    get_clamd_thread_limits,
+    parse_address,
+    parse_clamd_reply,
+    resolve_clamd_address,
+)
+from tests.conftest import EICAR_STRING
+
+
+@pytest.fixture
+def client(fake_clamd):
+    """Create a ClamdClient connected to the fake daemon."""
+    return ClamdClient(ClamdAddress(socket_path=fake_clamd.socket_path))
+
+
+class TestParseAddress:
+    """Tests for parse_address()."""
+
+    def test_unix_path(self):
+        assert parse_address("/run/clamav/clamd.ctl") == ClamdAddress(
+            socket_path="/run/clamav/clamd.ctl"
+        )
+
+    def test_unix_url(self):
+        assert parse_address("unix:///tmp/clamd.sock").socket_path == "/tmp/clamd.sock"
+
+    def test_host_port(self):
+        address = parse_address("127.0.0.1:3310")
+        assert address.host == "127.0.0.1"
+        assert address.port == 3310
+        assert address.is_unix is False
+
+    def test_tcp_url(self):
+        address = parse_address("tcp://scanner.local:3310")
+        assert address.host == "scanner.local"
+        assert address.port == 3310
+
+    def test_empty_and_invalid(self):
+        assert parse_address("") is None
+        assert parse_address("   ") is None
+        assert parse_address("not-an-address") is None
+        assert parse_address("host:port") is None
+
+
+class TestResolveClamdAddress:
+    """Tests for resolve_clamd_address()."""
+
+    def test_setting_takes_precedence(self, fake_clamd):
+        settings = MagicMock()
+        settings.get.return_value = fake_clamd.socket_path
+
+        address = resolve_clamd_address(settings)
+
+        assert address == ClamdAddress(socket_path=fake_clamd.socket_path)
+
+    def test_missing_configured_socket_falls_through(self, tmp_path):
+        settings = MagicMock()
+        settings.get.return_value = str(tmp_path / "missing.sock")
+
+        with (
+            patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", []),
+            patch("src.core.clamd_client.get_clamd_socket_path", return_value=None),
+        ):
+            assert resolve_clamd_address(settings) is None
+
+    def test_reads_local_socket_from_config(self, fake_clamd, tmp_path):
+        config = tmp_path / "clamd.conf"
+        config.write_text(f"LocalSocket {fake_clamd.socket_path}\nMaxThreads 4\n")
+
+        with patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", [str(config)]):
+            address = resolve_clamd_address()
+
+        assert address.socket_path == fake_clamd.socket_path
+
+    def test_reads_tcp_socket_from_config(self, tmp_path):
+        config = tmp_path / "clamd.conf"
+        config.write_text("TCPSocket 3310\nTCPAddr 127.0.0.1\n")
+
+        with patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", [str(config)]):
+            address = resolve_clamd_address()
+
+        assert address == ClamdAddress(host="127.0.0.1", port=3310)
+
+    def test_falls_back_to_well_known_socket(self):
+        with (
+            patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", []),
+            patch(
+                "src.core.clamd_client.get_clamd_socket_path",
+                return_value="/run/clamav/clamd.ctl",
+            ),
+        ):
+            address = resolve_clamd_address()
+
+        assert address.socket_path == "/run/clamav/clamd.ctl"
+
+
+class TestParseClamdReply:
+    """Tests for parse_clamd_reply()."""
+
+    def test_ok_reply(self):
+        result = parse_clamd_reply("/home/user/file.txt: OK")
+        assert result.status == ClamdReplyStatus.OK
+        assert result.path == "/home/user/file.txt"
+
+    def test_found_reply(self):
+        result = parse_clamd_reply("/tmp/evil: Win.Trojan.Agent-123 FOUND")
+        assert result.is_infected
+        assert result.path == "/tmp/evil"
+        assert result.signature == "Win.Trojan.Agent-123"
+
+    def test_found_reply_path_with_colon(self):
+        result = parse_clamd_reply("/tmp/a: b.exe: Eicar-Test-Signature FOUND")
+        assert result.path == "/tmp/a: b.exe"
+        assert result.signature == "Eicar-Test-Signature"
+
+    def test_error_reply(self):
+        result = parse_clamd_reply("fd[7]: lstat() failed: No such file. ERROR")
+        assert result.is_error
+        assert result.error == "lstat() failed: No such file."
+
+    def test_error_reply_for_path_with_colon(self):
+        result = parse_clamd_reply("/tmp/a: b: Access denied. ERROR", path="/tmp/a: b")
+        assert result.path == "/tmp/a: b"
+        assert result.error == "Access denied."
+
+    def test_fd_reply_reports_real_path(self):
+        result = parse_clamd_reply("fd[12]: OK", path="/home/user/doc.pdf")
+        assert result.path == "/home/user/doc.pdf"
+
+    def test_unexpected_reply_is_error(self):
+        result = parse_clamd_reply("UNKNOWN COMMAND")
+        assert result.is_error
+        assert result.error == "UNKNOWN COMMAND"
+
+    def test_to_output_line_matches_clamdscan(self):
+        result = parse_clamd_reply("fd[3]: Eicar-Test-Signature FOUND", path="/x")
+        assert result.to_output_line() == "/x: Eicar-Test-Signature FOUND"
+
+
+class TestClamdClientCommands:
+    """Tests for one-shot commands against a fake clamd."""
+
+    def test_ping(self, client):
+        assert client.ping() is True
+
+    def test_ping_unreachable_returns_false(self, tmp_path):
+        client = ClamdClient(ClamdAddress(socket_path=str(tmp_path / "none.sock")))
+        assert client.ping() is False
+
+    def test_version(self, client):
+        assert client.version().startswith("ClamAV 1.0.0")
+
+    def test_stats_strips_end_marker(self, client):
+        stats = client.stats()
+        assert "THREADS" in stats
+        assert not stats.endswith("END")
+
+    def test_connect_error_raises_clamd_error(self, tmp_path):
+        client = ClamdClient(ClamdAddress(socket_path=str(tmp_path / "none.sock")))
+        with pytest.raises(ClamdError):
+            client.version()
+
+    def test_instream_clean_and_infected(self, client, tmp_path):
+        clean = tmp_path / "clean.txt"
+        clean.write_text("hello")
+        infected = tmp_path / "eicar.com"
+        infected.write_text(EICAR_STRING)
+
+        assert client.instream(str(clean)).status == ClamdReplyStatus.OK
+        result = client.instream(str(infected), chunk_size=8)
+        assert result.is_infected
+        assert result.path == str(infected)
+
+    def test_scan_fd(self, client, tmp_path):
+        infected = tmp_path / "eicar.com"
+        infected.write_text(EICAR_STRING)
+
+        fd = os.open(infected, os.O_RDONLY)
+        try:
+            result = client.scan_fd(fd, str(infected))
+        finally:
+            os.close(fd)
+
+        assert result.is_infected
+        assert result.path == str(infected)
+
+    def test_scan_fd_requires_unix_socket(self):
+        client = ClamdClient(ClamdAddress(host="127.0.0.1", port=3310))
+        with pytest.raises(ClamdError, match="Unix socket"):
+            client.scan_fd(0)
+
+    def test_multiscan_reports_infected_files(self, client, tmp_path):
+        (tmp_path / "clean.txt").write_text("hello")
+        (tmp_path / "eicar.com").write_text(EICAR_STRING)
+
+        results = list(client.multiscan(str(tmp_path)))
+
+        assert len(results) == 1
+        assert results[0].path == str(tmp_path / "eicar.com")
+        assert results[0].signature == "Eicar-Test-Signature"
+
+    def test_contscan_clean_tree(self, client, tmp_path):
+        (tmp_path / "clean.txt").write_text("hello")
+
+        results = list(client.contscan(str(tmp_path)))
+
+        assert [r.status for r in results] == [ClamdReplyStatus.OK]
+
+
+class TestClamdSession:
+    """Tests for pipelined FILDES scanning over IDSESSION."""
+
+    def test_scan_files_reports_every_file(self, client, tmp_path, fake_clamd):
+        paths = []
+        for i in range(40):
+            file_path = tmp_path / f"file{i}.txt"
+            file_path.write_text(EICAR_STRING if i % 10 == 0 else "clean")
+            paths.append(str(file_path))
+
+        results = []
+        with client.session() as session:
+            cancelled = session.scan_files(paths, results.append, max_pending=4)
+
+        assert cancelled is False
+        assert sorted(r.path for r in results) == sorted(paths)
+        infected = sorted(r.path for r in results if r.is_infected)
+        assert infected == sorted(paths[::10])
+        assert fake_clamd.sessions == 1
+
+    def test_scan_files_reports_unopenable_files(self, client, tmp_path):
+        results = []
+        with client.session() as session:
+            session.scan_files([str(tmp_path / "missing")], results.append)
+
+        assert len(results) == 1
+        assert results[0].is_error
+        assert results[0].error.startswith("Failed to open file")
+
+    def test_scan_files_honours_cancellation(self, client, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("clean")
+
+        results = []
+        with client.session() as session:
+            cancelled = session.scan_files([str(file_path)], results.append, lambda: True)
+
+        assert cancelled is True
+        assert results == []
+
+    def test_scan_files_by_path(self, client, tmp_path, fake_clamd):
+        clean = tmp_path / "clean.txt"
+        clean.write_text("clean")
+        infected = tmp_path / "eicar.com"
+        infected.write_text(EICAR_STRING)
+
+        results = []
+        with client.session() as session:
+            session.scan_files([str(clean), str(infected)], results.append, use_fildes=False)
+
+        assert {r.path: r.is_infected for r in results} == {
+            str(clean): False,
+            str(infected): True,
+        }
+        assert f"zSCAN {clean}" in fake_clamd.commands
+        assert "zFILDES" not in fake_clamd.commands
+
+    def test_closed_session_raises(self, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("clean")
+        server_sock, client_sock = socket.socketpair()
+        server_sock.close()
+
+        with pytest.raises(ClamdError):
+            session = ClamdSession(client_sock)
+            session.scan_files([str(file_path)], MagicMock())
+
+
+class TestGetClamdThreadLimits:
+    """Tests for get_clamd_thread_limits()."""
+
+    def test_reads_limits_from_config(self, tmp_path):
+        config = tmp_path / "clamd.conf"
+        config.write_text("MaxThreads 6\nMaxQueue 40\n")
+
+        with patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", [str(config)]):
+            assert get_clamd_thread_limits() == (6, 40)
+
+    def test_defaults_when_unset(self, tmp_path):
+        config = tmp_path / "clamd.conf"
+        config.write_text("LocalSocket /run/clamav/clamd.ctl\nMaxThreads zero\n")
+
+        with patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", [str(config)]):
+            assert get_clamd_thread_limits() == (10, 100)
+
+    def test_defaults_without_config(self):
+        with patch("src.core.clamd_client.CLAMD_CONFIG_PATHS", []):
+            assert get_clamd_thread_limits() == (10, 100)
+
+
+class TestClamdSessionPool:
+    """Tests for concurrent scanning over several sessions."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(60):
+            file_path = tmp_path / f"file{i}.txt"
+            file_path.write_text(EICAR_STRING if i % 20 == 0 else "clean")
+            paths.append(str(file_path))
+        return paths
+
+    def test_from_clamd_config_sizes_pool(self, client):
+        with patch("src.core.clamd_client.get_clamd_thread_limits", return_value=(4, 20)):
+            pool = ClamdSessionPool.from_clamd_config(client)
+
+        assert pool.size == 4
+        # Total in-flight requests stay below MaxQueue
+        assert pool.size * pool._max_pending < 20
+
+    def test_from_clamd_config_splits_between_shares(self, client):
+        with patch("src.core.clamd_client.get_clamd_thread_limits", return_value=(10, 100)):
+            pool = ClamdSessionPool.from_clamd_config(client, shares=3)
+
+        assert pool.size == 3
+        # The pools together stay below MaxQueue
+        assert 3 * pool.size * pool._max_pending < 100
+
+    def test_scan_files_uses_every_session(self, client, files, fake_clamd):
+        results = []
+        pool = ClamdSessionPool(client, size=3, max_pending=2)
+
+        cancelled = pool.scan_files(iter(files), results.append)
+
+        assert cancelled is False
+        assert sorted(r.path for r in results) == sorted(files)
+        assert sorted(r.path for r in results if r.is_infected) == sorted(files[::20])
+        assert fake_clamd.sessions == 3
+
+    def test_results_delivered_on_calling_thread(self, client, files):
+        import threading
+
+        threads = set()
+        pool = ClamdSessionPool(client, size=2)
+
+        pool.scan_files(files, lambda _r: threads.add(threading.get_ident()))
+
+        assert threads == {threading.get_ident()}
+
+    def test_cancellation_stops_all_sessions(self, client, files):
+        results = []
+        pool = ClamdSessionPool(client, size=2, max_pending=1)
+
+        cancelled = pool.scan_files(files, results.append, lambda: len(results) >= 5)
+
+        assert cancelled is True
+        assert len(results) < len(files)
+
+    def test_pause_ends_sessions_until_resumed(self, client, files, fake_clamd):
+        import threading
+
+        results = []
+        paused = threading.Event()
+        pool = ClamdSessionPool(client, size=1, max_pending=1)
+
+        def on_result(result):
+            results.append(result)
+            if len(results) == 5:
+                paused.set()
+                threading.Timer(0.3, paused.clear).start()
+
+        pool.scan_files(files, on_result, is_paused=paused.is_set)
+
+        assert sorted(r.path for r in results) == sorted(files)
+        # The paused session was ended and a fresh one opened on resume
+        assert fake_clamd.sessions == 2
+
+    def test_session_limit_idles_extra_sessions(self, client, files, fake_clamd):
+        results = []
+        pool = ClamdSessionPool(client, size=4, max_pending=2)
+
+        pool.scan_files(files, results.append, session_limit=lambda size: size // 4)
+
+        assert sorted(r.path for r in results) == sorted(files)
+        assert fake_clamd.sessions == 1
+
+    def test_session_failure_raises(self, tmp_path, files):
+        client = ClamdClient(ClamdAddress(socket_path=str(tmp_path / "none.sock")))
+        pool = ClamdSessionPool(client, size=2)
+
+        with pytest.raises(ClamdError):
+            pool.scan_files(files, MagicMock())
+
+    def test_walk_error_raises(self, client):
+        def broken_walk():
+            yield "/nonexistent/file"
+            raise RuntimeError("walk failed")
+
+        pool = ClamdSessionPool(client, size=2)
+
+        with pytest.raises(ClamdError, match="walk failed"):
+            pool.scan_files(broken_walk(), MagicMock())
@@ -1,16 +1,32 @@
 # ClamUI Daemon Scanner Tests
 """Unit tests for the daemon scanner module."""
 
+import signal
 import subprocess
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 # Import directly - daemon_scanner uses GLib only for idle_add in async methods,
 # and those methods are not tested here (unit tests mock the async behavior)
+from src.core.clamd_client import ClamdAddress, ClamdClient, ClamdError
 from src.core.daemon_scanner import DaemonScanner
 from src.core.scanner import ScanStatus
 from src.core.threat_classifier import categorize_threat, classify_threat_severity_str
+from tests.conftest import EICAR_STRING
+
+
+@pytest.fixture(autouse=True)
+def no_native_clamd():
+    """
+    Hide any real clamd socket so tests exercise the clamdscan path by default.
+
+    Tests for the native protocol path patch resolve_clamd_address themselves.
+    """
+    with patch("src.core.daemon_scanner.resolve_clamd_address", return_value=None):
+        yield
 
 
 @pytest.fixture
@@ -314,6 +330,34 @@ class TestDaemonScannerCancel:
         assert scanner._cancel_event.is_set() is True
 
 
+class TestDaemonScannerPause:
+    """Tests for DaemonScanner.pause and resume."""
+
+    def test_pause_stops_and_resume_continues_process(self, daemon_scanner_class):
+        """A running clamdscan is stopped and continued with signals."""
+        scanner = daemon_scanner_class()
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        scanner._current_process = mock_process
+
+        scanner.pause()
+        assert scanner.is_paused is True
+        mock_process.send_signal.assert_called_with(signal.SIGSTOP)
+
+        scanner.resume()
+        assert scanner.is_paused is False
+        mock_process.send_signal.assert_called_with(signal.SIGCONT)
+
+    def test_cancel_ends_pause(self, daemon_scanner_class):
+        """A cancelled scan does not stay paused."""
+        scanner = daemon_scanner_class()
+        scanner.pause()
+
+        scanner.cancel()
+
+        assert scanner.is_paused is False
+
+
 class TestDaemonScannerFilterExcludedThreats:
     """Tests for DaemonScanner._filter_excluded_threats method."""
 
@@ -359,6 +403,37 @@ class TestDaemonScannerFilterExcludedThreats:
         assert filtered.infected_count == 0
         assert len(filtered.threat_details) == 0
 
+    def test_filter_keeps_mount_reports(self, daemon_scanner_class, scan_status_class):
+        """Test that the walk's mount reports survive filtering."""
+        mock_settings = MagicMock()
+        mock_settings.get.return_value = [
+            {"pattern": "/home/user/eicar.txt", "type": "file", "enabled": True},
+        ]
+        scanner = daemon_scanner_class(settings_manager=mock_settings)
+
+        from src.core.scanner import ScanResult, ThreatDetail
+
+        result = ScanResult(
+            status=scan_status_class.INFECTED,
+            path="/home/user",
+            stdout="",
+            stderr="",
+            exit_code=1,
+            infected_files=["/home/user/eicar.txt"],
+            scanned_files=1,
+            scanned_dirs=0,
+            infected_count=1,
+            error_message=None,
+            threat_details=[ThreatDetail("/home/user/eicar.txt", "Eicar", "Test", "low")],
+            skipped_mounts=["/home/user/nfs (nfs on server:/): remote filesystem"],
+            device_boundaries=["/home/user/disk (ext4 on /dev/sdb1)"],
+        )
+
+        filtered = scanner._filter_excluded_threats(result)
+
+        assert filtered.skipped_mounts == result.skipped_mounts
+        assert filtered.device_boundaries == result.device_boundaries
+
     def test_filter_keeps_non_excluded_threats(self, daemon_scanner_class, scan_status_class):
         """Test that non-excluded threats are kept."""
         mock_settings = MagicMock()
@@ -558,11 +633,12 @@ class TestDaemonScannerCountTargets:
             patch("src.core.daemon_scanner.check_clamdscan_installed") as mock_installed,
             patch("src.core.daemon_scanner.check_clamd_connection") as mock_connection,
             patch("subprocess.Popen") as mock_popen,
-            patch.object(scanner, "_count_scan_targets") as mock_count,
+            patch.object(
+                scanner, "_start_target_count", wraps=scanner._start_target_count
+            ) as mock_count,
         ):
             mock_installed.return_value = (True, "ClamAV 1.0.0")
             mock_connection.return_value = (True, "PONG")
-            mock_count.return_value = (1, 1)
 
             mock_process = MagicMock()
             mock_process.communicate.return_value = ("", "")
@@ -570,10 +646,11 @@ class TestDaemonScannerCountTargets:
             mock_popen.return_value = mock_process
 
             # Call without count_targets parameter (should default to True)
-            scanner.scan_sync(str(test_dir))
+            result = scanner.scan_sync(str(test_dir))
 
-        # _count_scan_targets should have been called
+        # The counting walk should have run alongside the scan
         mock_count.assert_called_once()
+        assert result.scanned_files == 1
 
     def test_scan_async_passes_count_targets_to_sync(self, tmp_path, daemon_scanner_class):
         """Test that scan_async passes count_targets to scan_sync."""
@@ -1036,20 +1113,28 @@ class TestDaemonScannerCancelFlagReset:
         scanner = daemon_scanner_class()
 
         # Simulate scan A being cancelled during counting phase
-        # This is what happens when user cancels during _count_scan_targets
+        # This is what happens when user cancels while the counting walk runs
+        start_target_count = scanner._start_target_count
+
         def counting_that_gets_cancelled(*args, **kwargs):
             # Simulate cancel during counting
             scanner._cancel_event.set()
-            return (0, 0)
+            return start_target_count(*args, **kwargs)
 
         with (
             patch("src.core.daemon_scanner.check_clamdscan_installed") as mock_installed,
             patch("src.core.daemon_scanner.check_clamd_connection") as mock_connection,
-            patch.object(scanner, "_count_scan_targets", side_effect=counting_that_gets_cancelled),
+            patch("subprocess.Popen") as mock_popen,
+            patch.object(scanner, "_start_target_count", side_effect=counting_that_gets_cancelled),
         ):
             mock_installed.return_value = (True, "ClamAV 1.0.0")
             mock_connection.return_value = (True, "PONG")
 
+            mock_process = MagicMock()
+            mock_process.communicate.return_value = ("", "")
+            mock_process.returncode = -15
+            mock_popen.return_value = mock_process
+
             # Scan A - should be cancelled during counting
             result_a = scanner.scan_sync(str(test_dir), count_targets=True)
 
@@ -1112,207 +1197,6 @@ class TestDaemonScannerCancelFlagReset:
         assert result.status == scan_status_class.CLEAN
 
 
-class TestDaemonScannerExclusionHelpers:
-    """Tests for DaemonScanner exclusion helper methods."""
-
-    def test_collect_exclusion_patterns_from_settings(self, daemon_scanner_class):
-        """Test collecting patterns from global settings."""
-        mock_settings = MagicMock()
-        mock_settings.get.return_value = [
-            {"pattern": "*.log", "type": "file", "enabled": True},
-            {"pattern": "*.tmp", "type": "file", "enabled": True},
-            {"pattern": "*.bak", "type": "file", "enabled": False},  # disabled
-        ]
-        scanner = daemon_scanner_class(settings_manager=mock_settings)
-
-        patterns = scanner._collect_exclusion_patterns()
-
-        assert len(patterns) == 2
-        assert "*.log" in patterns
-        assert "*.tmp" in patterns
-        assert "*.bak" not in patterns
-
-    def test_collect_exclusion_patterns_from_profile(self, daemon_scanner_class):
-        """Test collecting patterns from profile exclusions."""
-        mock_settings = MagicMock()
-        mock_settings.get.return_value = []
-        scanner = daemon_scanner_class(settings_manager=mock_settings)
-
-        profile_exclusions = {"patterns": ["*.cache", "*.swp", ""], "paths": []}
-        patterns = scanner._collect_exclusion_patterns(profile_exclusions)
-
-        assert len(patterns) == 2
-        assert "*.cache" in patterns
-        assert "*.swp" in patterns
-
-    def test_collect_exclusion_patterns_combines_sources(self, daemon_scanner_class):
-        """Test that patterns from settings and profile are combined."""
-        mock_settings = MagicMock()
-        mock_settings.get.return_value = [
-            {"pattern": "*.log", "type": "file", "enabled": True},
-        ]
-        scanner = daemon_scanner_class(settings_manager=mock_settings)
-
-        profile_exclusions = {"patterns": ["*.cache"], "paths": []}
-        patterns = scanner._collect_exclusion_patterns(profile_exclusions)
-
-        assert len(patterns) == 2
-        assert "*.log" in patterns
-        assert "*.cache" in patterns
-
-    def test_collect_exclusion_patterns_empty_when_no_settings(self, daemon_scanner_class):
-        """Test that empty list is returned when no settings manager."""
-        scanner = daemon_scanner_class()
-
-        patterns = scanner._collect_exclusion_patterns()
-
-        assert patterns == []
-
-    def test_collect_exclusion_paths_from_profile(self, daemon_scanner_class, tmp_path):
-        """Test collecting paths from profile exclusions."""
-        mock_settings = MagicMock()
-        mock_settings.get.return_value = []
-        scanner = daemon_scanner_class(settings_manager=mock_settings)
-
-        excluded_dir = tmp_path / "excluded"
-        excluded_dir.mkdir()
-
-        profile_exclusions = {"patterns": [], "paths": [str(excluded_dir), ""]}
-        paths = scanner._collect_exclusion_paths(profile_exclusions)
-
-        assert len(paths) == 1
-        assert paths[0] == excluded_dir.resolve()
-
-    def test_collect_exclusion_paths_expands_tilde(
-        self, daemon_scanner_class, monkeypatch, tmp_path
-    ):
-        """Test that tilde paths are expanded."""
-        mock_settings = MagicMock()
-        mock_settings.get.return_value = []
-        scanner = daemon_scanner_class(settings_manager=mock_settings)
-
-        fake_home = tmp_path / "fakehome"
-        cache_dir = fake_home / ".cache"
-        cache_dir.mkdir(parents=True)
-        monkeypatch.setenv("HOME", str(fake_home))
-
-        profile_exclusions = {"patterns": [], "paths": ["~/.cache"]}
-        paths = scanner._collect_exclusion_paths(profile_exclusions)
-
-        assert len(paths) == 1
-        assert str(paths[0]).endswith(".cache")
-
-    def test_collect_exclusion_paths_empty_when_no_profile(self, daemon_scanner_class):
-        """Test that empty list is returned when no profile exclusions."""
-        scanner = daemon_scanner_class()
-
-        paths = scanner._collect_exclusion_paths()
-
-        assert paths == []
-
-    def test_matches_exclusion_pattern_exact_match(self, daemon_scanner_class):
-        """Test exact path matching."""
-        scanner = daemon_scanner_class()
-
-        patterns = ["/home/user/eicar.txt"]
-        assert scanner._matches_exclusion_pattern("/home/user/eicar.txt", patterns) is True
-        assert scanner._matches_exclusion_pattern("/home/user/other.txt", patterns) is False
-
-    def test_matches_exclusion_pattern_glob_pattern(self, daemon_scanner_class):
-        """Test glob pattern matching."""
-        scanner = daemon_scanner_class()
-
-        patterns = ["*.log", "*.tmp"]
-        assert scanner._matches_exclusion_pattern("/var/log/test.log", patterns) is True
-        assert scanner._matches_exclusion_pattern("/tmp/file.tmp", patterns) is True
-        assert scanner._matches_exclusion_pattern("/home/user/file.txt", patterns) is False
-
-    def test_matches_exclusion_pattern_with_tilde(
-        self, daemon_scanner_class, monkeypatch, tmp_path
-    ):
-        """Test pattern matching with tilde expansion."""
-        fake_home = tmp_path / "fakehome"
-        fake_home.mkdir()
-        monkeypatch.setenv("HOME", str(fake_home))
-
-        scanner = daemon_scanner_class()
-
-        patterns = ["~/.cache/*"]
-        # After tilde expansion, the pattern becomes the full path
-        assert scanner._matches_exclusion_pattern(str(fake_home / ".cache/file"), patterns) is True
-
-    def test_matches_exclusion_pattern_empty_patterns(self, daemon_scanner_class):
-        """Test that empty patterns list returns False."""
-        scanner = daemon_scanner_class()
-
-        assert scanner._matches_exclusion_pattern("/some/file.txt", []) is False
-
-    def test_matches_exclusion_path_direct_match(self, daemon_scanner_class, tmp_path):
-        """Test direct path matching."""
-        scanner = daemon_scanner_class()
-
-        excluded_dir = tmp_path / "excluded"
-        excluded_dir.mkdir()
-        exclude_paths = [excluded_dir.resolve()]
-
-        # File is exactly the excluded path (edge case, but valid)
-        assert scanner._matches_exclusion_path(str(excluded_dir), exclude_paths) is True
-
-    def test_matches_exclusion_path_subdirectory(self, daemon_scanner_class, tmp_path):
-        """Test subdirectory path matching."""
-        scanner = daemon_scanner_class()
-
-        excluded_dir = tmp_path / "excluded"
-        excluded_dir.mkdir()
-        subdir = excluded_dir / "subdir"
-        subdir.mkdir()
-        file_in_subdir = subdir / "file.txt"
-        file_in_subdir.touch()
-
-        exclude_paths = [excluded_dir.resolve()]
-
-        assert scanner._matches_exclusion_path(str(file_in_subdir), exclude_paths) is True
-
-    def test_matches_exclusion_path_outside_excluded(self, daemon_scanner_class, tmp_path):
-        """Test that files outside excluded paths don't match."""
-        scanner = daemon_scanner_class()
-
-        excluded_dir = tmp_path / "excluded"
-        excluded_dir.mkdir()
-        other_dir = tmp_path / "other"
-        other_dir.mkdir()
-        file_in_other = other_dir / "file.txt"
-        file_in_other.touch()
-
-        exclude_paths = [excluded_dir.resolve()]
-
-        assert scanner._matches_exclusion_path(str(file_in_other), exclude_paths) is False
-
-    def test_matches_exclusion_path_empty_paths(self, daemon_scanner_class):
-        """Test that empty paths list returns False."""
-        scanner = daemon_scanner_class()
-
-        assert scanner._matches_exclusion_path("/some/file.txt", []) is False
-
-    def test_matches_exclusion_path_similar_prefix_not_matched(
-        self, daemon_scanner_class, tmp_path
-    ):
-        """Test that paths with similar prefixes are not incorrectly matched."""
-        scanner = daemon_scanner_class()
-
-        excluded_dir = tmp_path / "excluded"
-        excluded_dir.mkdir()
-        similar_dir = tmp_path / "excluded_other"
-        similar_dir.mkdir()
-        file_in_similar = similar_dir / "file.txt"
-        file_in_similar.touch()
-
-        exclude_paths = [excluded_dir.resolve()]
-
-        # Should NOT match because "excluded_other" is not under "excluded"
-        assert scanner._matches_exclusion_path(str(file_in_similar), exclude_paths) is False
-
-
 class TestDaemonScannerFlatpakSupport:
     """Tests for DaemonScanner Flatpak mode support."""
 
@@ -1390,3 +1274,313 @@ class TestDaemonScannerFlatpakSupport:
         assert cmd[2] == "clamdscan"
         # The path should be at the end
         assert str(test_file) in cmd
+
+
+class TestDaemonScannerNativeClient:
+    """Tests for scanning through the native clamd socket protocol."""
+
+    @pytest.fixture
+    def native_address(self, fake_clamd):
+        """Point DaemonScanner at the fake clamd socket."""
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+        with patch("src.core.daemon_scanner.resolve_clamd_address", return_value=address):
+            yield address
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        """Create a small tree with one infected file."""
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        (root / "clean1.txt").write_text("clean")
+        (root / "sub" / "clean2.txt").write_text("clean")
+        (root / "sub" / "eicar.com").write_text(EICAR_STRING)
+        return root
+
+    def test_check_available_uses_socket_ping(self, daemon_scanner, native_address):
+        """check_available succeeds via PING without running clamdscan."""
+        with patch("src.core.daemon_scanner.check_clamdscan_installed") as mock_installed:
+            available, _msg = daemon_scanner.check_available()
+
+        assert available is True
+        mock_installed.assert_not_called()
+
+    def test_scan_sync_does_not_spawn_processes(self, daemon_scanner, native_address, scan_tree):
+        """Native scans return structured results without clamdscan."""
+        with patch("subprocess.Popen") as mock_popen:
+            result = daemon_scanner.scan_sync(str(scan_tree))
+
+        mock_popen.assert_not_called()
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 3
+        assert result.scanned_dirs == 2
+        assert result.infected_files == [str(scan_tree / "sub" / "eicar.com")]
+        assert result.threat_details[0].threat_name == "Eicar-Test-Signature"
+        assert result.exit_code == 1
+
+    def test_paused_scan_waits_and_excludes_pause(self, native_address, scan_tree):
+        """A paused scan sends nothing until resumed; the pause is not logged as duration."""
+        log_manager = MagicMock()
+        scanner = DaemonScanner(log_manager=log_manager)
+        scanner.pause()
+        threading.Timer(0.5, scanner.resume).start()
+
+        start = time.monotonic()
+        result = scanner.scan_sync(str(scan_tree))
+        elapsed = time.monotonic() - start
+
+        assert result.status == ScanStatus.INFECTED
+        assert elapsed >= 0.5
+        assert log_manager.save_log.call_args[0][0].duration < elapsed - 0.4
+
+    def test_scan_sync_clean_single_file(self, daemon_scanner, native_address, tmp_path):
+        """A single clean file is scanned via FILDES."""
+        test_file = tmp_path / "clean.txt"
+        test_file.write_text("clean")
+
+        result = daemon_scanner.scan_sync(str(test_file))
+
+        assert result.status == ScanStatus.CLEAN
+        assert result.scanned_files == 1
+        assert result.exit_code == 0
+
+    def test_scan_sync_reports_progress(self, daemon_scanner, native_address, scan_tree):
+        """clamd verdicts are reported as coalesced progress deltas."""
+        updates = []
+
+        result = daemon_scanner.scan_sync(str(scan_tree), progress_callback=updates.append)
+
+        assert result.status == ScanStatus.INFECTED
+        assert 1 <= len(updates) <= 3
+        assert [f for u in updates for f in u.new_infected_files] == result.infected_files
+        assert updates[-1].files_scanned == 3
+        assert updates[-1].files_total == 3
+        assert updates[-1].infected_count == 1
+
+    def test_scan_sync_skips_symlinks(self, daemon_scanner, native_address, scan_tree):
+        """Symlinks are not followed, matching clamdscan defaults."""
+        (scan_tree / "link.txt").symlink_to(scan_tree / "clean1.txt")
+
+        result = daemon_scanner.scan_sync(str(scan_tree))
+
+        assert result.scanned_files == 3
+        assert result.skipped_count == 0
+
+    def test_scan_sync_applies_exclusions(
+        self, daemon_scanner, native_address, scan_tree, fake_clamd
+    ):
+        """Excluded directories are skipped by the walk and never sent to clamd."""
+        result = daemon_scanner.scan_sync(
+            str(scan_tree), profile_exclusions={"paths": [str(scan_tree / "sub")]}
+        )
+
+        assert result.status == ScanStatus.CLEAN
+        assert result.infected_count == 0
+        assert result.scanned_files == 1
+        assert result.scanned_dirs == 1
+        assert fake_clamd.commands.count("zFILDES") == 1
+
+    def test_scan_sync_by_path_over_tcp(self, daemon_scanner, native_address, scan_tree):
+        """Without descriptor passing, walked files are named in SCAN requests."""
+        with patch.object(ClamdClient, "supports_fd_passing", False):
+            result = daemon_scanner.scan_sync(
+                str(scan_tree), profile_exclusions={"patterns": ["clean*"]}
+            )
+
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 1
+        assert result.infected_files == [str(scan_tree / "sub" / "eicar.com")]
+
+    def test_scan_sync_cancelled(self, daemon_scanner, native_address, scan_tree):
+        """Cancelling during the scan returns a cancelled result."""
+
+        def cancel_on_progress(_progress):
+            daemon_scanner.cancel()
+
+        result = daemon_scanner.scan_sync(str(scan_tree), progress_callback=cancel_on_progress)
+
+        assert result.status == ScanStatus.CANCELLED
+
+    def test_falls_back_to_clamdscan_when_socket_dies(self, daemon_scanner, tmp_path):
+        """A failing native scan falls back to the clamdscan subprocess."""
+        test_file = tmp_path / "clean.txt"
+        test_file.write_text("clean")
+        mock_client = MagicMock()
+        mock_client.supports_fd_passing = True
+        mock_client.session.side_effect = ClamdError("connection reset")
+
+        with (
+            patch.object(daemon_scanner, "_get_clamd_client", return_value=mock_client),
+            patch("src.core.daemon_scanner.check_clamdscan_installed") as mock_installed,
+            patch("src.core.daemon_scanner.check_clamd_connection") as mock_connection,
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            mock_installed.return_value = (True, "ClamAV 1.0.0")
+            mock_connection.return_value = (True, "PONG")
+            mock_process = MagicMock()
+            mock_process.communicate.return_value = ("", "")
+            mock_process.returncode = 0
+            mock_popen.return_value = mock_process
+
+            result = daemon_scanner.scan_sync(str(test_file))
+
+        mock_popen.assert_called_once()
+        assert result.status == ScanStatus.CLEAN
+
+    def test_no_fallback_after_progress_was_reported(
+        self, daemon_scanner, native_address, scan_tree
+    ):
+        """A native scan failing after reporting progress is not rescanned."""
+        progress = []
+
+        def fail_after_first_file(update):
+            progress.append(update)
+            raise ClamdError("connection reset")
+
+        with patch("subprocess.Popen") as mock_popen:
+            result = daemon_scanner.scan_sync(
+                str(scan_tree), progress_callback=fail_after_first_file
+            )
+
+        mock_popen.assert_not_called()
+        assert progress
+        assert result.status == ScanStatus.ERROR
+        assert "connection reset" in result.error_message
+
+
+class TestDaemonScannerClamdscanExclusions:
+    """Tests for applying exclusions before clamdscan sees the tree."""
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        """Create a tree with an excluded directory next to clean subtrees."""
+        root = tmp_path / "tree"
+        for sub in ("keep", "mixed/node_modules", "mixed/src"):
+            (root / sub).mkdir(parents=True)
+        (root / "top.txt").write_text("clean")
+        (root / "keep" / "a.txt").write_text("clean")
+        (root / "mixed" / "b.txt").write_text("clean")
+        (root / "mixed" / "node_modules" / "evil.js").write_text(EICAR_STRING)
+        (root / "mixed" / "src" / "c.txt").write_text("clean")
+        return root
+
+    def _run(self, scanner, path, **kwargs):
+        """Run scan_sync with a mocked clamdscan, returning (result, commands, listed)."""
+        commands = []
+        listed = []
+
+        def fake_popen(cmd, **_popen_kwargs):
+            commands.append(cmd)
+            for arg in cmd:
+                if arg.startswith("--file-list="):
+                    with open(arg.split("=", 1)[1], encoding="utf-8") as f:
+                        listed.extend(f.read().splitlines())
+            process = MagicMock()
+            process.communicate.return_value = ("", "")
+            process.returncode = 0
+            return process
+
+        with (
+            patch.object(scanner, "_get_clamd_client", return_value=None),
+            patch.object(scanner, "_check_clamdscan_available", return_value=(True, None)),
+            patch("src.core.daemon_scanner.wrap_host_command", side_effect=lambda cmd, **_: cmd),
+            patch("subprocess.Popen", side_effect=fake_popen),
+        ):
+            result = scanner.scan_sync(str(path), **kwargs)
+        return result, commands, listed
+
+    def test_without_exclusions_clamdscan_walks_path(self, daemon_scanner, scan_tree):
+        """Without exclusions the path itself is passed to clamdscan."""
+        _result, commands, listed = self._run(daemon_scanner, scan_tree)
+
+        assert commands[0][-1] == str(scan_tree)
+        assert listed == []
+
+    def test_clean_subtrees_listed_whole(self, daemon_scanner, scan_tree):
+        """Only paths outside the excluded directory reach clamdscan."""
+        result, commands, listed = self._run(
+            daemon_scanner, scan_tree, profile_exclusions={"paths": [], "patterns": ["evil.js"]}
+        )
+
+        assert str(scan_tree) not in commands[0]
+        assert sorted(listed) == sorted(
+            str(scan_tree / p) for p in ("top.txt", "keep", "mixed/b.txt", "mixed/src")
+        )
+        assert result.status == ScanStatus.CLEAN
+        assert result.scanned_files == 4
+        assert result.scanned_dirs == 5
+
+    def test_fully_excluded_tree_skips_clamdscan(self, daemon_scanner, scan_tree):
+        """clamdscan is not run when every entry is excluded."""
+        result, commands, _listed = self._run(
+            daemon_scanner, scan_tree, profile_exclusions={"patterns": ["*.txt", "*.js"]}
+        )
+
+        assert commands == []
+        assert result.status == ScanStatus.CLEAN
+        assert result.scanned_files == 0
+
+
+class TestDaemonScannerScanCache:
+    """Tests for incremental scans with the scan cache over the native client."""
+
+    @pytest.fixture
+    def cached_scanner(self, fake_clamd, tmp_path, monkeypatch):
+        """DaemonScanner with the scan cache enabled, talking to the fake clamd."""
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            True if key == "scan_cache_enabled" else default
+        )
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+        with patch("src.core.daemon_scanner.resolve_clamd_address", return_value=address):
+            yield DaemonScanner(log_manager=MagicMock(), settings_manager=settings)
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        """Create a small tree with one infected file."""
+        root = tmp_path / "tree"
+        root.mkdir()
+        (root / "clean1.txt").write_text("clean")
+        (root / "clean2.txt").write_text("clean")
+        (root / "eicar.com").write_text(EICAR_STRING)
+        return root
+
+    def test_unchanged_clean_files_are_skipped(self, cached_scanner, scan_tree):
+        """A second scan only sends files without a cached clean verdict."""
+        first = cached_scanner.scan_sync(str(scan_tree))
+        second = cached_scanner.scan_sync(str(scan_tree))
+
+        assert first.scanned_files == 3
+        assert first.cached_count == 0
+        assert second.scanned_files == 1
+        assert second.cached_count == 2
+        assert second.infected_files == [str(scan_tree / "eicar.com")]
+
+    def test_modified_file_is_rescanned(self, cached_scanner, scan_tree):
+        """Changing a file invalidates its cached verdict."""
+        cached_scanner.scan_sync(str(scan_tree))
+        (scan_tree / "clean1.txt").write_text("EICAR now")
+
+        result = cached_scanner.scan_sync(str(scan_tree))
+
+        assert result.cached_count == 1
+        assert str(scan_tree / "clean1.txt") in result.infected_files
+
+    def test_force_full_scan_ignores_cache(self, cached_scanner, scan_tree):
+        """force_full_scan sends every file to clamd."""
+        cached_scanner.scan_sync(str(scan_tree))
+
+        result = cached_scanner.scan_sync(str(scan_tree), force_full_scan=True)
+
+        assert result.scanned_files == 3
+        assert result.cached_count == 0
+
+    def test_cancelled_scan_caches_nothing(self, cached_scanner, scan_tree):
+        """Verdicts of a cancelled scan are not recorded."""
+        cached_scanner.scan_sync(
+            str(scan_tree), progress_callback=lambda _progress: cached_scanner.cancel()
+        )
+
+        result = cached_scanner.scan_sync(str(scan_tree))
+
+        assert result.cached_count == 0
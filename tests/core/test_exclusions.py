@@ -0,0 +1,170 @@
+# ClamUI Exclusions Tests
+"""Unit tests for the compiled ExclusionSet shared by both scanner backends."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exclusions import ExclusionSet
+
+
+def _settings(exclusions):
+    """Create a settings manager mock returning the given exclusion_patterns."""
+    settings = MagicMock()
+    settings.get.side_effect = lambda key, default=None: (
+        exclusions if key == "exclusion_patterns" else default
+    )
+    return settings
+
+
+class TestExclusionSetFromSettings:
+    """Tests for building an ExclusionSet from settings and profile exclusions."""
+
+    def test_enabled_setting_patterns_only(self):
+        exclusions = ExclusionSet.from_settings(
+            _settings(
+                [
+                    {"pattern": "*.log", "type": "file", "enabled": True},
+                    {"pattern": "*.tmp", "type": "pattern", "enabled": True},
+                    {"pattern": "*.bak", "type": "file", "enabled": False},
+                ]
+            )
+        )
+
+        assert exclusions.is_excluded("/var/log/test.log")
+        assert exclusions.is_excluded("/tmp/file.tmp")
+        assert not exclusions.is_excluded("/backup/file.bak")
+
+    def test_profile_patterns_and_paths(self, tmp_path):
+        excluded_dir = tmp_path / "excluded"
+        excluded_dir.mkdir()
+
+        exclusions = ExclusionSet.from_settings(
+            _settings([]),
+            {"patterns": ["*.cache", "*.swp", ""], "paths": [str(excluded_dir), ""]},
+        )
+
+        assert exclusions.is_excluded("/home/user/x.cache")
+        assert exclusions.is_excluded("/home/user/.x.swp")
+        assert exclusions.is_excluded(str(excluded_dir / "file.txt"))
+        assert str(excluded_dir.resolve()) in exclusions.paths
+
+    def test_combines_sources(self):
+        exclusions = ExclusionSet.from_settings(
+            _settings([{"pattern": "*.log", "type": "file", "enabled": True}]),
+            {"patterns": ["*.cache"], "paths": []},
+        )
+
+        assert exclusions.is_excluded("/a/b.log")
+        assert exclusions.is_excluded("/a/b.cache")
+
+    def test_empty_without_settings(self):
+        exclusions = ExclusionSet.from_settings(None)
+        assert not exclusions
+        assert exclusions.paths == []
+        assert not exclusions.is_excluded("/some/file.txt")
+
+    def test_directory_patterns_apply_to_directories(self):
+        exclusions = ExclusionSet.from_settings(
+            _settings([{"pattern": "node_modules", "type": "directory", "enabled": True}])
+        )
+
+        assert exclusions.is_excluded("/src/node_modules", "node_modules", is_dir=True)
+        assert not exclusions.is_excluded("/src/node_modules", "node_modules", is_dir=False)
+
+    def test_profile_path_with_tilde(self, monkeypatch, tmp_path):
+        fake_home = tmp_path / "fakehome"
+        (fake_home / ".cache").mkdir(parents=True)
+        monkeypatch.setenv("HOME", str(fake_home))
+
+        exclusions = ExclusionSet.from_settings(None, {"patterns": [], "paths": ["~/.cache"]})
+
+        assert exclusions.paths == [str(fake_home / ".cache")]
+
+
+class TestExclusionSetPaths:
+    """Tests for absolute path exclusions held in the prefix trie."""
+
+    def test_exact_file_path(self):
+        exclusions = ExclusionSet(["/home/user/eicar.txt"])
+        assert exclusions.is_excluded("/home/user/eicar.txt")
+        assert not exclusions.is_excluded("/home/user/other.txt")
+
+    def test_directory_and_everything_below(self):
+        exclusions = ExclusionSet(dir_patterns=["/data/build/"])
+        assert exclusions.is_excluded("/data/build", is_dir=True)
+        assert exclusions.is_excluded("/data/build/sub/file.o")
+
+    def test_similar_prefix_not_matched(self):
+        exclusions = ExclusionSet(dir_patterns=["/data/excluded"])
+        assert not exclusions.is_excluded("/data/excluded_other/file.txt")
+        assert not exclusions.is_excluded("/data/exc")
+
+    def test_nested_paths_collapse(self):
+        exclusions = ExclusionSet(dir_patterns=["/a/b/c", "/a/b", "/a/b/d"])
+        assert exclusions.paths == ["/a/b"]
+
+    def test_root_excludes_everything(self):
+        exclusions = ExclusionSet(dir_patterns=["/"])
+        assert exclusions.is_excluded("/any/file")
+
+    def test_symlinked_exclusion_matches_resolved_path(self, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real)
+
+        exclusions = ExclusionSet(dir_patterns=[str(link)])
+
+        assert exclusions.is_excluded(str(link / "file"))
+        assert exclusions.is_excluded(str(real / "file"))
+
+
+class TestExclusionSetGlobs:
+    """Tests for glob patterns compiled into a combined regex."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/var/log/test.log", True),
+            ("/tmp/file.tmp", True),
+            ("/tmp/file.tmp.bak", False),
+            ("/home/user/file.txt", False),
+        ],
+    )
+    def test_matches_name_or_full_path(self, path, expected):
+        exclusions = ExclusionSet(["*.log", "*.tmp"])
+        assert exclusions.is_excluded(path) is expected
+
+    def test_full_path_glob(self):
+        exclusions = ExclusionSet(["/home/*/.cache/*"])
+        assert exclusions.is_excluded("/home/user/.cache/file")
+        assert not exclusions.is_excluded("/home/user/.config/file")
+
+    def test_tilde_glob(self, monkeypatch, tmp_path):
+        fake_home = tmp_path / "fakehome"
+        fake_home.mkdir()
+        monkeypatch.setenv("HOME", str(fake_home))
+
+        exclusions = ExclusionSet(["~/.cache/*"])
+
+        assert exclusions.is_excluded(str(fake_home / ".cache" / "file"))
+
+    def test_regex_special_characters_are_literal(self):
+        exclusions = ExclusionSet(["file(1).txt"])
+        assert exclusions.is_excluded("/a/file(1).txt")
+        assert not exclusions.is_excluded("/a/file1.txt")
+
+
+class TestIsPathExcluded:
+    """Tests for filtering scan results by path."""
+
+    def test_checks_parent_directories(self):
+        exclusions = ExclusionSet(dir_patterns=["node_modules"])
+        assert exclusions.is_path_excluded("/src/node_modules/pkg/evil.js")
+        assert not exclusions.is_path_excluded("/src/lib/evil.js")
+
+    def test_file_patterns(self):
+        exclusions = ExclusionSet(["*.log"])
+        assert exclusions.is_path_excluded("/var/log/test.log")
+        assert not exclusions.is_path_excluded("/var/log.d/test.txt")
@@ -161,6 +161,21 @@ class TestWrapHostCommand:
                     assert result == ["/app/bin/clamscan", "--version"]
 
 
+class TestRunsOnHost:
+    """Tests for runs_on_host() function."""
+
+    def test_runs_on_host_for_flatpak_spawn_wrapper(self):
+        """Test a flatpak-spawn --host wrapper runs its command on the host."""
+        process = mock.MagicMock(args=["flatpak-spawn", "--host", "clamscan", "/home"])
+        assert flatpak.runs_on_host(process) is True
+
+    def test_runs_on_host_for_sandboxed_process(self):
+        """Test bundled and unwrapped commands do not run on the host."""
+        assert flatpak.runs_on_host(mock.MagicMock(args=["/app/bin/clamscan", "/home"])) is False
+        assert flatpak.runs_on_host(mock.MagicMock(args="clamscan /home")) is False
+        assert flatpak.runs_on_host(None) is False
+
+
 class TestWhichHostCommand:
     """Tests for which_host_command() function."""
 
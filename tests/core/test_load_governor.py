@@ -0,0 +1,360 @@
+# ClamUI Load Governor Tests
+"""Unit tests for system-load-aware scan throttling."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import load_governor, scanner_base
+from src.core.clamd_client import ClamdAddress
+from src.core.load_governor import (
+    MAX_DECISIONS,
+    LoadGovernor,
+    LoadLevel,
+    LoadReading,
+    LoadThresholds,
+    lower_process_priority,
+    open_load_governor,
+    read_pressure,
+    read_system_load,
+)
+from src.core.log_manager import LogEntry
+from src.core.scanner_types import ScanStatus
+
+PSI_FILE = """some avg10={some:.2f} avg60=1.00 avg300=0.50 total=123456
+full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+"""
+
+IDLE = LoadReading(cpu=1.0, io=0.5, memory=0.0, load=0.2)
+BUSY = LoadReading(cpu=30.0, io=2.0, memory=0.0, load=0.5)
+OVERLOADED = LoadReading(cpu=5.0, io=75.0, memory=0.0, load=0.5)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedLoad:
+    """Returns the given readings in turn, repeating the last one."""
+
+    def __init__(self, *readings):
+        self._readings = list(readings)
+
+    def __call__(self):
+        if len(self._readings) > 1:
+            return self._readings.pop(0)
+        return self._readings[0]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestReadLoad:
+    """Tests for reading PSI and the load average."""
+
+    def test_read_pressure(self, tmp_path):
+        (tmp_path / "io").write_text(PSI_FILE.format(some=12.5))
+
+        assert read_pressure("io", str(tmp_path)) == 12.5
+
+    def test_read_pressure_without_psi(self, tmp_path):
+        assert read_pressure("cpu", str(tmp_path)) is None
+
+    def test_read_system_load(self, tmp_path):
+        (tmp_path / "cpu").write_text(PSI_FILE.format(some=3.0))
+        (tmp_path / "memory").write_text(PSI_FILE.format(some=40.0))
+
+        with (
+            patch("os.getloadavg", return_value=(6.0, 1.0, 1.0)),
+            patch("os.cpu_count", return_value=4),
+        ):
+            reading = read_system_load(str(tmp_path))
+
+        assert reading == LoadReading(cpu=3.0, io=None, memory=40.0, load=1.5)
+        assert reading.pressure == 40.0
+        assert reading.describe() == "cpu 3.0%, memory 40.0%, load 1.50 per CPU"
+
+
+class TestLoadThresholds:
+    """Tests for choosing a level from a reading."""
+
+    def test_levels(self):
+        thresholds = LoadThresholds()
+
+        assert thresholds.level_for(IDLE, LoadLevel.NORMAL) is LoadLevel.NORMAL
+        assert thresholds.level_for(BUSY, LoadLevel.NORMAL) is LoadLevel.THROTTLED
+        assert thresholds.level_for(OVERLOADED, LoadLevel.NORMAL) is LoadLevel.PAUSED
+
+    def test_load_average_alone_without_psi(self):
+        thresholds = LoadThresholds()
+        reading = LoadReading(cpu=None, io=None, memory=None, load=2.5)
+
+        assert thresholds.level_for(reading, LoadLevel.NORMAL) is LoadLevel.PAUSED
+
+    def test_level_kept_until_load_recovers(self):
+        thresholds = LoadThresholds(throttle_pressure=20.0)
+        easing = LoadReading(cpu=18.0, io=0.0, memory=0.0, load=0.2)
+
+        assert thresholds.level_for(easing, LoadLevel.NORMAL) is LoadLevel.NORMAL
+        assert thresholds.level_for(easing, LoadLevel.THROTTLED) is LoadLevel.THROTTLED
+        assert thresholds.level_for(IDLE, LoadLevel.THROTTLED) is LoadLevel.NORMAL
+
+    def test_overrides(self):
+        thresholds = LoadThresholds().with_overrides(
+            {"throttle_pressure": 5, "pause_load": "high", "max_pause": -1, "enabled": True}
+        )
+
+        assert thresholds.throttle_pressure == 5.0
+        assert thresholds.pause_load == LoadThresholds.pause_load
+        assert thresholds.max_pause == LoadThresholds.max_pause
+
+
+class TestLoadGovernor:
+    """Tests for LoadGovernor."""
+
+    def test_level_changes_are_recorded(self, clock):
+        on_change = MagicMock()
+        governor = LoadGovernor(LoadThresholds(), ScriptedLoad(IDLE, BUSY, BUSY, IDLE), clock=clock)
+        governor._on_change = on_change
+
+        for _ in range(4):
+            governor.sample()
+            clock.now += 5
+
+        assert [call.args[0] for call in on_change.call_args_list] == [
+            LoadLevel.THROTTLED,
+            LoadLevel.NORMAL,
+        ]
+        assert governor.describe_decisions() == [
+            "+0s normal (cpu 1.0%, io 0.5%, memory 0.0%, load 0.20 per CPU)",
+            "+5s throttled (cpu 30.0%, io 2.0%, memory 0.0%, load 0.50 per CPU)",
+            "+15s normal (cpu 1.0%, io 0.5%, memory 0.0%, load 0.20 per CPU)",
+        ]
+
+    def test_nothing_logged_when_never_throttled(self, clock):
+        governor = LoadGovernor(LoadThresholds(), ScriptedLoad(IDLE), clock=clock)
+
+        governor.sample()
+        governor.sample()
+
+        assert len(governor.decisions) == 1
+        assert governor.describe_decisions() == []
+
+    def test_session_limit(self, clock):
+        governor = LoadGovernor(LoadThresholds(), ScriptedLoad(BUSY, OVERLOADED), clock=clock)
+        assert governor.session_limit(4) == 4
+
+        governor.sample()
+        assert governor.session_limit(4) == 2
+        assert governor.session_limit(1) == 1
+
+        governor.sample()
+        assert governor.is_paused()
+        assert governor.session_limit(4) == 0
+
+    def test_pause_is_limited(self, clock):
+        governor = LoadGovernor(LoadThresholds(max_pause=60), ScriptedLoad(OVERLOADED), clock=clock)
+
+        governor.sample()
+        clock.now += 59
+        assert governor.sample() is LoadLevel.PAUSED
+        clock.now += 1
+        assert governor.sample() is LoadLevel.THROTTLED
+        clock.now += 5
+        assert governor.sample() is LoadLevel.THROTTLED
+
+        assert governor.decisions[-1].reason == "paused for 60s, continuing"
+
+    def test_decisions_are_capped(self, clock):
+        governor = LoadGovernor(
+            LoadThresholds(), ScriptedLoad(*[BUSY, IDLE] * MAX_DECISIONS), clock=clock
+        )
+
+        for _ in range(2 * MAX_DECISIONS):
+            governor.sample()
+
+        lines = governor.describe_decisions()
+        assert len(lines) == MAX_DECISIONS + 1
+        assert lines[-1] == f"{MAX_DECISIONS} later level change(s) not recorded"
+
+    def test_start_samples_until_stopped(self):
+        on_change = MagicMock()
+        governor = LoadGovernor(LoadThresholds(), ScriptedLoad(BUSY, IDLE), interval=0.02)
+
+        governor.start(on_change)
+        try:
+            assert on_change.call_args_list[0].args == (LoadLevel.THROTTLED,)
+            deadline = time.monotonic() + 5
+            while governor.level is not LoadLevel.NORMAL and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            governor.stop()
+
+        assert [call.args[0] for call in on_change.call_args_list] == [
+            LoadLevel.THROTTLED,
+            LoadLevel.NORMAL,
+        ]
+        assert governor._thread is None
+
+
+class TestOpenLoadGovernor:
+    """Tests for open_load_governor."""
+
+    def _settings(self, **values):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+        return settings
+
+    def test_disabled_by_default(self):
+        assert open_load_governor(self._settings()) is None
+        assert open_load_governor(None) is None
+
+    def test_settings_thresholds(self):
+        settings = self._settings(load_governor_enabled=True, load_governor_throttle_pressure=10.0)
+
+        governor = open_load_governor(settings)
+
+        assert governor.thresholds.throttle_pressure == 10.0
+
+    def test_profile_overrides_settings(self):
+        settings = self._settings(load_governor_throttle_pressure=10.0)
+
+        governor = open_load_governor(settings, {"enabled": True, "throttle_pressure": 5})
+
+        assert governor.thresholds.throttle_pressure == 5.0
+        assert (
+            open_load_governor(self._settings(load_governor_enabled=True), {"enabled": False})
+            is None
+        )
+
+
+class TestProcessControl:
+    """Tests for applying levels to scanner processes."""
+
+    def test_apply_load_level(self):
+        process = MagicMock()
+        process.poll.return_value = None
+
+        with patch.object(scanner_base, "lower_process_priority") as lower:
+            scanner_base.apply_load_level(process, LoadLevel.PAUSED, user_paused=False)
+            process.send_signal.assert_called_once_with(signal.SIGSTOP)
+
+            process.send_signal.reset_mock()
+            scanner_base.apply_load_level(process, LoadLevel.THROTTLED, user_paused=False)
+            process.send_signal.assert_called_once_with(signal.SIGCONT)
+            lower.assert_called_once_with(process)
+
+            process.send_signal.reset_mock()
+            scanner_base.apply_load_level(process, LoadLevel.NORMAL, user_paused=True)
+            process.send_signal.assert_not_called()
+
+    def test_host_process_under_flatpak_not_governed(self):
+        process = MagicMock(args=["flatpak-spawn", "--host", "clamdscan", "/home"])
+        process.poll.return_value = None
+
+        with (
+            patch.object(load_governor.os, "setpriority") as setpriority,
+            patch.object(load_governor.subprocess, "run") as run,
+        ):
+            scanner_base.apply_load_level(process, LoadLevel.PAUSED, user_paused=False)
+            scanner_base.apply_load_level(process, LoadLevel.THROTTLED, user_paused=False)
+            lower_process_priority(process)
+
+        process.send_signal.assert_not_called()
+        setpriority.assert_not_called()
+        run.assert_not_called()
+
+    def test_lower_process_priority(self):
+        sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            with patch.object(load_governor.shutil, "which", return_value=None):
+                lower_process_priority(sleeper)
+
+            assert os.getpriority(os.PRIO_PROCESS, sleeper.pid) >= load_governor.THROTTLED_NICE
+        finally:
+            sleeper.kill()
+            sleeper.wait()
+
+
+class TestGovernedDaemonScan:
+    """Tests for a native clamd scan under the load governor."""
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        for index in range(10):
+            (root / f"clean{index}.txt").write_text("clean")
+        return root
+
+    def _scan(self, fake_clamd, scan_tree, governor):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key in ("scan_cache_enabled", "scan_checkpoints_enabled") else default
+        )
+        log_manager = MagicMock()
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+        with (
+            patch.object(daemon_scanner_module, "resolve_clamd_address", return_value=address),
+            patch.object(daemon_scanner_module, "open_load_governor", return_value=governor),
+        ):
+            scanner = daemon_scanner_module.DaemonScanner(
+                log_manager=log_manager, settings_manager=settings
+            )
+            result = scanner.scan_sync(str(scan_tree))
+        return result, log_manager.save_log.call_args[0][0]
+
+    def test_paused_scan_continues_when_load_drops(self, fake_clamd, scan_tree):
+        governor = LoadGovernor(
+            LoadThresholds(), ScriptedLoad(OVERLOADED, OVERLOADED, IDLE), interval=0.05
+        )
+
+        result, logged = self._scan(fake_clamd, scan_tree, governor)
+
+        assert result.status == ScanStatus.CLEAN
+        assert result.scanned_files == 10
+        assert [decision.level for decision in governor.decisions] == [
+            LoadLevel.PAUSED,
+            LoadLevel.NORMAL,
+        ]
+        assert "Load governor:" in logged.details
+        assert "paused (cpu 5.0%, io 75.0%" in logged.details
+
+    def test_unthrottled_scan_logs_nothing(self, fake_clamd, scan_tree):
+        governor = LoadGovernor(LoadThresholds(), ScriptedLoad(IDLE), interval=0.05)
+
+        result, logged = self._scan(fake_clamd, scan_tree, governor)
+
+        assert result.scanned_files == 10
+        assert "Load governor" not in logged.details
+
+
+class TestLogDetails:
+    """Tests for governor decisions in scan logs."""
+
+    def test_decisions_follow_details(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="clean",
+            path="/home",
+            duration=3.0,
+            scanned_files=5,
+            load_decisions=["+0s throttled (load 1.20 per CPU)"],
+        )
+
+        assert entry.details == (
+            "Scanned: 5 files, 0 directories\nLoad governor:\n  - +0s throttled (load 1.20 per CPU)"
+        )
@@ -0,0 +1,201 @@
+# ClamUI Log Database Tests
+"""Unit tests for storing logs in SQLite and migrating JSON logs into it."""
+
+import json
+import sqlite3
+from unittest import mock
+
+import pytest
+
+from src.core.log_database import LogDatabase, open_log_database
+from src.core.log_manager import INDEX_FILENAME, LogEntry, LogManager, parse_scan_counts
+
+
+def make_entry(index: int, **fields) -> LogEntry:
+    """A scan log with a distinct timestamp."""
+    entry = LogEntry.create(
+        log_type=fields.pop("log_type", "scan"),
+        status=fields.pop("status", "clean"),
+        summary=f"Scan {index}",
+        details=f"Scanned: {index} files",
+        **fields,
+    )
+    entry.timestamp = f"2026-01-01T00:00:{index:02d}"
+    return entry
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = LogDatabase(str(tmp_path / "logs.db"))
+    yield database
+    database.close()
+
+
+class TestLogDatabase:
+    """Tests for LogDatabase."""
+
+    def test_round_trip(self, db):
+        entry = make_entry(
+            1,
+            path="/home",
+            scheduled=True,
+            scanned_bytes=2048,
+            backend="daemon",
+            scanned_files=3,
+            scanned_dirs=1,
+            infected_count=0,
+            skipped_count=2,
+            timings={"walk": 0.5},
+        )
+
+        assert db.add_entries([entry.to_dict()])
+
+        assert LogEntry.from_dict(db.get_entry(entry.id)) == entry
+        assert db.get_entry("missing") is None
+
+    def test_details_stored_apart(self, db):
+        entry = make_entry(1)
+        db.add_entries([entry.to_dict()])
+
+        with sqlite3.connect(db.db_path) as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(logs)")]
+            details = conn.execute("SELECT details FROM log_details").fetchall()
+
+        assert "details" not in columns
+        assert details == [("Scanned: 1 files",)]
+
+    def test_newest_first_with_filters(self, db):
+        entries = [
+            make_entry(1),
+            make_entry(2, status="infected", path="/tmp"),
+            make_entry(3, log_type="update", status="success"),
+            make_entry(4, scheduled=True),
+        ]
+        db.add_entries(entry.to_dict() for entry in entries)
+
+        def ids(**filters):
+            return [row["id"] for row in db.get_entries(**filters)]
+
+        assert ids() == [entries[3].id, entries[2].id, entries[1].id, entries[0].id]
+        assert ids(limit=2) == [entries[3].id, entries[2].id]
+        assert ids(log_type="scan", scheduled=False) == [entries[1].id, entries[0].id]
+        assert ids(status="infected") == ids(path="/tmp") == [entries[1].id]
+
+    def test_without_details(self, db):
+        entry = make_entry(1)
+        db.add_entries([entry.to_dict()])
+
+        assert db.get_entries(with_details=False)[0]["details"] == ""
+        assert db.get_entries()[0]["details"] == "Scanned: 1 files"
+
+    def test_delete_and_clear(self, db):
+        first, second = make_entry(1), make_entry(2)
+        db.add_entries([first.to_dict(), second.to_dict()])
+
+        assert db.has_entry(first.id)
+        assert db.delete_entry(first.id)
+        assert not db.delete_entry(first.id)
+        assert not db.has_entry(first.id)
+        assert db.count() == 1
+
+        assert db.clear()
+        assert db.count() == 0
+
+    def test_cannot_open(self, tmp_path):
+        (tmp_path / "logs.db").mkdir()
+
+        assert open_log_database(str(tmp_path / "logs.db")) is None
+
+
+class TestBackfill:
+    """Tests for storing the counts of scan logs saved without them."""
+
+    def test_counts_parsed_once(self, db):
+        scan = make_entry(1, status="infected")
+        scan.summary = "Found 2 threat(s) in /home"
+        scan.details = "Scanned: 40 files, 3 directories\nThreats found: 2"
+        update = make_entry(2, log_type="update", status="success")
+        db.add_entries([scan.to_dict(), update.to_dict()])
+        parse = mock.Mock(wraps=parse_scan_counts)
+
+        assert db.backfill_scan_counts(parse) == 1
+        assert db.backfill_scan_counts(parse) == 0
+
+        assert parse.call_count == 1
+        counts = LogEntry.from_dict(db.get_entry(scan.id))
+        assert (counts.scanned_files, counts.scanned_dirs, counts.infected_count) == (40, 3, 2)
+        assert LogEntry.from_dict(db.get_entry(update.id)).scanned_files is None
+
+    def test_columns_added_to_earlier_database(self, tmp_path):
+        path = tmp_path / "logs.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE logs (id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, "
+                "type TEXT NOT NULL, status TEXT NOT NULL, summary TEXT NOT NULL, path TEXT, "
+                "duration REAL NOT NULL DEFAULT 0, scheduled INTEGER NOT NULL DEFAULT 0, "
+                "scanned_bytes INTEGER NOT NULL DEFAULT 0, backend TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO logs (id, timestamp, type, status, summary) "
+                "VALUES ('old', '2025-01-01T00:00:00', 'scan', 'clean', 'Scanned 7 files')"
+            )
+        conn.close()
+
+        manager = LogManager(log_dir=str(tmp_path))
+
+        assert manager.get_log_by_id("old").scanned_files == 7
+
+
+class TestMigration:
+    """Tests for moving JSON logs written by earlier versions into the database."""
+
+    @pytest.fixture
+    def json_logs(self, tmp_path):
+        """Three logs written as JSON files, with an index."""
+        manager = LogManager(log_dir=str(tmp_path), use_database=False)
+        entries = [make_entry(index) for index in range(3)]
+        for entry in entries:
+            manager.save_log(entry)
+        return entries
+
+    def test_logs_are_moved(self, tmp_path, json_logs):
+        manager = LogManager(log_dir=str(tmp_path))
+
+        assert [entry.id for entry in manager.get_logs()] == [entry.id for entry in json_logs[::-1]]
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_failed_migration_is_retried(self, tmp_path, json_logs):
+        manager = LogManager(log_dir=str(tmp_path))
+
+        with mock.patch.object(LogDatabase, "add_entries", return_value=False):
+            assert manager.get_logs() == []
+
+        assert [entry.id for entry in manager.get_logs()] == [entry.id for entry in json_logs[::-1]]
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_unreadable_files_are_kept(self, tmp_path, json_logs):
+        (tmp_path / "broken.json").write_text("{not json")
+        manager = LogManager(log_dir=str(tmp_path))
+
+        assert manager.get_log_count() == 3
+        assert sorted(path.name for path in tmp_path.glob("*.json")) == [
+            "broken.json",
+            INDEX_FILENAME,
+        ]
+
+    def test_migrated_before_writing(self, tmp_path, json_logs):
+        manager = LogManager(log_dir=str(tmp_path))
+
+        manager.save_log(make_entry(9))
+
+        assert manager.get_log_count() == 4
+
+    def test_falls_back_to_json_files(self, tmp_path, json_logs):
+        (tmp_path / "logs.db").mkdir()
+        manager = LogManager(log_dir=str(tmp_path))
+        entry = make_entry(9)
+
+        assert manager.save_log(entry)
+
+        assert manager.get_log_count() == 4
+        assert json.loads((tmp_path / f"{entry.id}.json").read_text())["id"] == entry.id
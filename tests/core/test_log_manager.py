@@ -4,6 +4,7 @@
 import csv
 import io
 import json
+import multiprocessing
 import os
 import tempfile
 import threading
@@ -13,10 +14,12 @@ from unittest import mock
 
 import pytest
 
+from src.core import log_manager as log_manager_module
 from src.core.log_manager import (
     DaemonStatus,
     LogEntry,
     LogManager,
+    LogSummary,
     LogType,
 )
 
@@ -153,6 +156,57 @@ class TestLogEntry:
         assert restored.path == original.path
         assert restored.duration == original.duration
 
+    def test_roundtrip_scanned_bytes_and_backend(self):
+        """Test the scanned size and backend used for ETA history are kept."""
+        original = LogEntry.create(
+            log_type="scan",
+            status="clean",
+            summary="Clean",
+            details="",
+            scanned_bytes=123456,
+            backend="daemon",
+        )
+        restored = LogEntry.from_dict(original.to_dict())
+
+        assert restored.scanned_bytes == 123456
+        assert restored.backend == "daemon"
+
+    def test_from_dict_ignores_invalid_scanned_bytes(self):
+        """Test older or malformed entries default to no scanned size."""
+        entry = LogEntry.from_dict({"summary": "Old entry", "scanned_bytes": "lots"})
+
+        assert entry.scanned_bytes == 0
+        assert entry.backend is None
+
+    def test_from_scan_result_data_stores_counts(self):
+        """Test scan counts and phase timings are kept as typed fields."""
+        entry = LogEntry.from_scan_result_data(
+            scan_status="infected",
+            path="/home",
+            duration=3.0,
+            scanned_files=40,
+            scanned_dirs=3,
+            infected_count=2,
+            skipped_count=1,
+            timings={"walk": 0.25},
+        )
+        restored = LogEntry.from_dict(json.loads(json.dumps(entry.to_dict())))
+
+        assert (restored.scanned_files, restored.scanned_dirs) == (40, 3)
+        assert (restored.infected_count, restored.skipped_count) == (2, 1)
+        assert restored.timings == {"walk": 0.25}
+
+    def test_from_dict_older_entry_has_no_counts(self):
+        """Test entries saved before the count fields, or tampered with, have none."""
+        entry = LogEntry.from_dict(
+            {"summary": "Old entry", "infected_count": -1, "skipped_count": True, "timings": []}
+        )
+
+        assert entry.scanned_files is None
+        assert entry.infected_count is None
+        assert entry.skipped_count is None
+        assert entry.timings == {}
+
     # Sanitization Tests
 
     def test_create_sanitizes_summary_newlines(self):
@@ -580,17 +634,15 @@ class TestLogManager:
         result = log_manager.save_log(entry)
 
         assert result is True
-        log_file = Path(temp_log_dir) / f"{entry.id}.json"
-        assert log_file.exists()
+        assert (Path(temp_log_dir) / "logs.db").exists()
+        assert not (Path(temp_log_dir) / f"{entry.id}.json").exists()
 
         # Verify content
-        with open(log_file) as f:
-            data = json.load(f)
-        assert data["id"] == entry.id
-        assert data["type"] == "scan"
+        loaded = log_manager.get_log_by_id(entry.id)
+        assert loaded == entry
 
     def test_save_log_sets_restrictive_permissions(self, log_manager, temp_log_dir):
-        """Test that save_log sets 0o600 permissions on log files."""
+        """Test that the log database has 0o600 permissions."""
         entry = LogEntry.create(
             log_type="scan",
             status="clean",
@@ -600,7 +652,7 @@ class TestLogManager:
         result = log_manager.save_log(entry)
 
         assert result is True
-        log_file = Path(temp_log_dir) / f"{entry.id}.json"
+        log_file = Path(temp_log_dir) / "logs.db"
         assert log_file.exists()
 
         # Verify file permissions are owner read/write only (0o600)
@@ -740,13 +792,12 @@ class TestLogManager:
         log_manager.save_log(entry)
 
         # Verify it exists
-        log_file = Path(temp_log_dir) / f"{entry.id}.json"
-        assert log_file.exists()
+        assert log_manager.get_log_by_id(entry.id) is not None
 
         # Delete it
         result = log_manager.delete_log(entry.id)
         assert result is True
-        assert not log_file.exists()
+        assert log_manager.get_log_count() == 0
 
         # Should return None now
         assert log_manager.get_log_by_id(entry.id) is None
@@ -768,19 +819,15 @@ class TestLogManager:
             )
             log_manager.save_log(entry)
 
-        # Verify they exist (5 log files + 1 index file = 6 total)
-        assert len(list(Path(temp_log_dir).glob("*.json"))) == 6
+        # Verify they exist
+        assert log_manager.get_log_count() == 5
 
         # Clear all
         result = log_manager.clear_logs()
         assert result is True
 
-        # Verify log files are gone (only index file may remain)
-        json_files = list(Path(temp_log_dir).glob("*.json"))
-        # Either no files or just the index file
-        assert len(json_files) <= 1
-        if json_files:
-            assert json_files[0].name == "log_index.json"
+        # Verify the logs are gone
+        assert log_manager.get_log_count() == 0
         assert log_manager.get_logs() == []
 
     def test_clear_logs_empty_directory(self, log_manager):
@@ -805,11 +852,45 @@ class TestLogManager:
 
     def test_get_log_count_nonexistent_directory(self, temp_log_dir):
         """Test get_log_count handles missing directory."""
-        manager = LogManager(log_dir=os.path.join(temp_log_dir, "nonexistent"))
+        manager = LogManager(log_dir=os.path.join(temp_log_dir, "nonexistent"), use_database=False)
         # Delete the created directory
         os.rmdir(manager._log_dir)
         assert manager.get_log_count() == 0
 
+    def test_attach_output_stores_file_with_log(self, log_manager, temp_log_dir):
+        """Test a scan's full output is kept next to its log entry."""
+        entry = LogEntry.create(log_type="scan", status="clean", summary="Scan", details="")
+        log_manager.save_log(entry)
+        output_path = log_manager.create_output_file()
+        assert output_path is not None
+        assert os.path.dirname(output_path) == temp_log_dir
+
+        assert log_manager.attach_output(entry.id, output_path) is True
+
+        stored = log_manager.get_log_output_path(entry.id)
+        assert stored == str(Path(temp_log_dir) / f"{entry.id}.output.gz")
+        assert not os.path.exists(output_path)
+
+    def test_get_log_output_path_missing(self, log_manager):
+        """Test logs without a kept output have no output path."""
+        assert log_manager.get_log_output_path("no-such-id") is None
+
+    def test_delete_and_clear_remove_output_files(self, log_manager):
+        """Test output files are removed together with their log entries."""
+        entries = []
+        for i in range(2):
+            entry = LogEntry.create(log_type="scan", status="clean", summary=f"{i}", details="")
+            log_manager.save_log(entry)
+            log_manager.attach_output(entry.id, log_manager.create_output_file())
+            entries.append(entry)
+
+        log_manager.delete_log(entries[0].id)
+        assert log_manager.get_log_output_path(entries[0].id) is None
+        assert log_manager.get_log_output_path(entries[1].id) is not None
+
+        log_manager.clear_logs()
+        assert log_manager.get_log_output_path(entries[1].id) is None
+
 
 class TestLogManagerDaemonStatus:
     """Tests for daemon status detection in LogManager."""
@@ -1141,6 +1222,120 @@ class TestLogManagerAsync:
 
         assert thread_info.get("daemon") is True
 
+    @pytest.mark.parametrize("use_database", [True, False])
+    def test_get_log_summaries_async_leaves_out_details(self, temp_log_dir, use_database):
+        """Test logs are listed without their details, which get_log_by_id loads."""
+        log_manager = LogManager(log_dir=temp_log_dir, use_database=use_database)
+        entry = LogEntry.create(
+            log_type="scan",
+            status="clean",
+            summary="Test scan\x1b[31m",
+            details="Raw output",
+            path="/home/user",
+            duration=2.5,
+        )
+        log_manager.save_log(entry)
+        callback_results = []
+        callback_event = threading.Event()
+
+        def mock_callback(summaries):
+            callback_results.append(summaries)
+            callback_event.set()
+
+        with mock.patch("src.core.log_manager.GLib") as mock_glib:
+            mock_glib.idle_add.side_effect = lambda func, *args: func(*args)
+
+            log_manager.get_log_summaries_async(mock_callback, log_type="scan")
+            callback_event.wait(timeout=5)
+
+        assert callback_results == [
+            [
+                LogSummary(
+                    id=entry.id,
+                    timestamp=entry.timestamp,
+                    type="scan",
+                    status="clean",
+                    summary="Test scan",
+                    path="/home/user",
+                    duration=2.5,
+                )
+            ]
+        ]
+        assert log_manager.get_log_by_id(entry.id).details == "Raw output"
+
+    @pytest.mark.parametrize("use_database", [True, False])
+    def test_get_logs_without_details_keeps_counts(self, temp_log_dir, use_database):
+        """Test logs read without details keep their counts, or details to count from."""
+        older = {
+            "id": "older-log",
+            "timestamp": "2024-01-01T10:00:00",
+            "type": "scan",
+            "status": "clean",
+            "summary": "Scan",
+            "details": "Scanned files: 7",
+        }
+        with open(Path(temp_log_dir) / "older-log.json", "w", encoding="utf-8") as f:
+            json.dump(older, f)
+        log_manager = LogManager(log_dir=temp_log_dir, use_database=use_database)
+        counted = LogEntry.from_scan_result_data(
+            scan_status="clean", path="/home/user", duration=2.0, scanned_files=42
+        )
+        counted.timestamp = "2024-01-01T11:00:00"
+        log_manager.save_log(counted)
+
+        newest, oldest = log_manager.get_logs(log_type="scan", with_details=False)
+
+        assert (newest.id, newest.scanned_files, newest.details) == (counted.id, 42, "")
+        if use_database:
+            # Moved into the database, which stored its counts
+            assert (oldest.scanned_files, oldest.details) == (7, "")
+        else:
+            assert (oldest.scanned_files, oldest.details) == (None, "Scanned files: 7")
+
+    @pytest.mark.parametrize("use_database", [True, False])
+    def test_get_newer_log_summaries_async(self, temp_log_dir, use_database):
+        """Test newer logs are listed unless logs known to the caller were deleted."""
+        log_manager = LogManager(log_dir=temp_log_dir, use_database=use_database)
+        first, second, third = (
+            LogEntry.create(log_type="scan", status="clean", summary=f"Scan {i}", details="")
+            for i in range(3)
+        )
+        first.timestamp, second.timestamp = "2024-01-01T10:00:00", "2024-01-01T11:00:00"
+        third.timestamp = "2024-01-01T12:00:00"
+        for entry in (first, second):
+            log_manager.save_log(entry)
+        newest = LogSummary.from_dict(second.to_dict())
+
+        def query(known_count):
+            results = []
+            done = threading.Event()
+
+            def callback(summaries):
+                results.append(summaries)
+                done.set()
+
+            with mock.patch("src.core.log_manager.GLib") as mock_glib:
+                mock_glib.idle_add.side_effect = lambda func, *args: func(*args)
+                log_manager.get_newer_log_summaries_async(
+                    callback, newest=newest, known_count=known_count
+                )
+                done.wait(timeout=5)
+            return results[0]
+
+        log_manager.save_log(third)
+        # Checking that newest still exists does not load its details
+        with mock.patch.object(log_manager, "get_log_by_id") as get_log_by_id:
+            assert [summary.id for summary in query(2)] == [third.id]
+        get_log_by_id.assert_not_called()
+        assert log_manager.has_log(second.id)
+
+        log_manager.delete_log(first.id)
+        assert query(3) is None
+
+        log_manager.delete_log(second.id)
+        assert not log_manager.has_log(second.id)
+        assert query(1) is None
+
 
 class TestLogManagerThreadSafety:
     """Tests for thread safety in LogManager."""
@@ -1207,7 +1402,7 @@ class TestLogManagerIndexInfrastructure:
     @pytest.fixture
     def log_manager(self, temp_log_dir):
         """Create a LogManager with a temporary directory."""
-        return LogManager(log_dir=temp_log_dir)
+        return LogManager(log_dir=temp_log_dir, use_database=False)
 
     def test_load_index_empty_state(self, log_manager):
         """Test _load_index returns empty structure when no index file exists."""
@@ -1328,7 +1523,7 @@ class TestLogManagerIndexInfrastructure:
         """Test _save_index creates parent directory if needed."""
         # Create manager with non-existent directory
         log_dir = Path(temp_log_dir) / "subdir" / "logs"
-        manager = LogManager(log_dir=str(log_dir))
+        manager = LogManager(log_dir=str(log_dir), use_database=False)
 
         # Delete the directory that was created by __init__
         import shutil
@@ -1509,7 +1704,7 @@ class TestLogManagerIndexInfrastructure:
         """Test rebuild_index handles non-existent directory gracefully."""
         # Create manager with directory, then remove it
         log_dir = Path(temp_log_dir) / "nonexistent"
-        manager = LogManager(log_dir=str(log_dir))
+        manager = LogManager(log_dir=str(log_dir), use_database=False)
 
         # Delete the directory
         import shutil
@@ -1616,7 +1811,7 @@ class TestLogManagerIndexMaintenance:
     @pytest.fixture
     def log_manager(self, temp_log_dir):
         """Create a LogManager with a temporary directory."""
-        return LogManager(log_dir=temp_log_dir)
+        return LogManager(log_dir=temp_log_dir, use_database=False)
 
     def test_save_log_updates_index(self, log_manager):
         """Test that save_log adds entry metadata to index."""
@@ -2117,7 +2312,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_valid_index(self, tmp_path):
         """Test that _validate_index returns True for a valid index."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create some log entries
         for i in range(5):
@@ -2137,7 +2332,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_empty_index_and_empty_directory(self, tmp_path):
         """Test that _validate_index returns True for empty index with no logs."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Empty index
         index_data = {"version": 1, "entries": []}
@@ -2147,7 +2342,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_entry_count_mismatch_extra_entries(self, tmp_path):
         """Test that _validate_index returns False when index has more entries than files."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 3 log entries
         for i in range(3):
@@ -2173,7 +2368,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_entry_count_mismatch_fewer_entries(self, tmp_path):
         """Test that _validate_index returns False when index has fewer entries than files."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 5 log entries
         for i in range(5):
@@ -2194,7 +2389,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_missing_files_above_threshold(self, tmp_path):
         """Test that _validate_index returns False when >20% of files are missing."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 10 log entries
         log_ids = []
@@ -2221,7 +2416,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_missing_files_below_threshold(self, tmp_path):
         """Test that _validate_index returns False even with few missing files due to count mismatch."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 10 log entries
         log_ids = []
@@ -2249,7 +2444,7 @@ class TestLogManagerIndexValidation:
     def test_validate_index_with_nonexistent_directory(self, tmp_path):
         """Test that _validate_index handles non-existent directory gracefully."""
         # Create log manager with non-existent directory
-        log_manager = LogManager(str(tmp_path / "nonexistent"))
+        log_manager = LogManager(str(tmp_path / "nonexistent"), use_database=False)
 
         # Index with entries (but directory doesn't exist)
         index_data = {
@@ -2262,7 +2457,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_with_large_index_uses_sampling(self, tmp_path):
         """Test that _validate_index uses sampling for large indices (>50 entries)."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 60 log entries
         log_ids = []
@@ -2296,7 +2491,7 @@ class TestLogManagerIndexValidation:
 
     def test_get_logs_triggers_rebuild_on_stale_index_count_mismatch(self, tmp_path):
         """Test that get_logs() triggers automatic rebuild when index has count mismatch."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 5 log entries
         for i in range(5):
@@ -2328,7 +2523,7 @@ class TestLogManagerIndexValidation:
 
     def test_get_logs_triggers_rebuild_on_missing_files(self, tmp_path):
         """Test that get_logs() triggers automatic rebuild when many files are missing."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 10 log entries
         log_ids = []
@@ -2359,7 +2554,7 @@ class TestLogManagerIndexValidation:
 
     def test_get_logs_handles_validation_error_gracefully(self, tmp_path):
         """Test that get_logs() handles validation errors gracefully."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create some log entries
         for i in range(3):
@@ -2397,7 +2592,7 @@ class TestLogManagerIndexValidation:
         """
         import time
 
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 1000 log files directly (faster than using save_log)
         log_ids = []
@@ -2434,7 +2629,7 @@ class TestLogManagerIndexValidation:
 
     def test_validate_index_set_lookup_detects_missing_files(self, tmp_path):
         """Test that set-based lookup correctly detects missing files."""
-        log_manager = LogManager(str(tmp_path))
+        log_manager = LogManager(str(tmp_path), use_database=False)
 
         # Create 100 log files
         log_ids = []
@@ -2480,7 +2675,7 @@ class TestLogManagerOptimizedGetLogs:
     @pytest.fixture
     def log_manager(self, temp_log_dir):
         """Create a LogManager with a temporary directory."""
-        return LogManager(log_dir=temp_log_dir)
+        return LogManager(log_dir=temp_log_dir, use_database=False)
 
     def test_get_logs_uses_index_when_available(self, log_manager):
         """Test that get_logs() uses index for retrieval when available."""
@@ -2889,7 +3084,7 @@ class TestLogManagerOptimizedGetLogs:
         """Test that get_logs() returns empty list when directory doesn't exist."""
         # Create manager, then delete directory
         log_dir = Path(temp_log_dir) / "nonexistent"
-        manager = LogManager(log_dir=str(log_dir))
+        manager = LogManager(log_dir=str(log_dir), use_database=False)
 
         # Delete the directory
         import shutil
@@ -2947,12 +3142,12 @@ class TestLogManagerAutoMigration:
     @pytest.fixture
     def log_manager(self, temp_log_dir):
         """Create a LogManager with a temporary directory."""
-        return LogManager(log_dir=temp_log_dir)
+        return LogManager(log_dir=temp_log_dir, use_database=False)
 
     def test_auto_migration_when_logs_exist_without_index(self, temp_log_dir):
         """Test that index is automatically created when logs exist but no index."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Manually create log files without using save_log() (simulates old installation)
         log_dir = Path(temp_log_dir)
@@ -2979,7 +3174,7 @@ class TestLogManagerAutoMigration:
         assert not index_path.exists()
 
         # Create a NEW LogManager instance to ensure fresh state
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # First get_logs() call should trigger auto-migration
         logs = manager.get_logs()
@@ -3005,7 +3200,7 @@ class TestLogManagerAutoMigration:
     def test_auto_migration_only_happens_once(self, temp_log_dir):
         """Test that auto-migration check only happens on first get_logs() call."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create a log file manually
         log_dir = Path(temp_log_dir)
@@ -3063,7 +3258,7 @@ class TestLogManagerAutoMigration:
         time.sleep(0.01)
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Call get_logs (should not rebuild index since it exists)
         logs = manager.get_logs()
@@ -3081,7 +3276,7 @@ class TestLogManagerAutoMigration:
     def test_no_migration_when_no_logs_exist(self, temp_log_dir):
         """Test that no migration happens when no log files exist."""
         # Create LogManager with empty directory
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Call get_logs on empty directory
         logs = manager.get_logs()
@@ -3099,7 +3294,7 @@ class TestLogManagerAutoMigration:
     def test_migration_handles_corrupted_files_gracefully(self, temp_log_dir):
         """Test that migration skips corrupted log files gracefully."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create log directory
         log_dir = Path(temp_log_dir)
@@ -3133,7 +3328,7 @@ class TestLogManagerAutoMigration:
             json.dump(entry2.to_dict(), f, indent=2)
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # First get_logs() call should trigger migration and skip corrupted file
         manager.get_logs()
@@ -3156,7 +3351,7 @@ class TestLogManagerAutoMigration:
     def test_migration_handles_missing_fields_gracefully(self, temp_log_dir):
         """Test that migration skips log files with missing required fields."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create log directory
         log_dir = Path(temp_log_dir)
@@ -3190,7 +3385,7 @@ class TestLogManagerAutoMigration:
             )
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # First get_logs() call should trigger migration and skip incomplete file
         manager.get_logs()
@@ -3209,7 +3404,7 @@ class TestLogManagerAutoMigration:
     def test_migration_failure_does_not_break_get_logs(self, temp_log_dir):
         """Test that get_logs() still works even if migration fails."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create a valid log file
         log_dir = Path(temp_log_dir)
@@ -3226,7 +3421,7 @@ class TestLogManagerAutoMigration:
             json.dump(entry.to_dict(), f, indent=2)
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Mock _save_index to fail (simulates permission error during migration)
         original_save = manager._save_index
@@ -3255,7 +3450,7 @@ class TestLogManagerAutoMigration:
         log_dir = Path(temp_log_dir) / "nonexistent"
 
         # Create LogManager (directory won't exist yet)
-        manager = LogManager(log_dir=str(log_dir))
+        manager = LogManager(log_dir=str(log_dir), use_database=False)
 
         # Call get_logs (should handle gracefully)
         logs = manager.get_logs()
@@ -3273,7 +3468,7 @@ class TestLogManagerAutoMigration:
     def test_migration_creates_index_with_correct_structure(self, temp_log_dir):
         """Test that migration creates index with correct structure."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create log directory and files manually
         log_dir = Path(temp_log_dir)
@@ -3295,7 +3490,7 @@ class TestLogManagerAutoMigration:
                 json.dump(entry.to_dict(), f, indent=2)
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Trigger migration
         manager.get_logs()
@@ -3324,7 +3519,7 @@ class TestLogManagerAutoMigration:
     def test_migration_skips_index_file_itself(self, temp_log_dir):
         """Test that migration doesn't try to process the index file as a log."""
         # Create LogManager
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create log directory
         log_dir = Path(temp_log_dir)
@@ -3362,7 +3557,7 @@ class TestLogManagerAutoMigration:
         index_path.unlink()
 
         # Create a NEW LogManager instance
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Trigger migration
         manager.get_logs()
@@ -3388,7 +3583,7 @@ class TestLogManagerOptimizedGetLogCount:
 
     def test_get_log_count_uses_index(self, temp_log_dir):
         """Test get_log_count uses index for O(1) performance."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create some log entries
         for i in range(5):
@@ -3409,8 +3604,7 @@ class TestLogManagerOptimizedGetLogCount:
         assert count == 5
 
         # Verify index was actually used by checking it has correct data
-        with open(index_path, encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = manager._load_index()
         assert len(index_data["entries"]) == 5
 
     def test_get_log_count_fallback_without_index(self, temp_log_dir):
@@ -3435,7 +3629,7 @@ class TestLogManagerOptimizedGetLogCount:
         assert not index_path.exists()
 
         # Create manager and get count - should fall back to directory scan
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         count = manager.get_log_count()
         assert count == 3
 
@@ -3465,13 +3659,13 @@ class TestLogManagerOptimizedGetLogCount:
         json_files = list(log_dir.glob("*.json"))
         assert len(json_files) == 3
 
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         count = manager.get_log_count()
         assert count == 2  # Should exclude index file
 
     def test_get_log_count_with_stale_index(self, temp_log_dir):
         """Test get_log_count rebuilds stale index and returns correct count."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         log_dir = Path(temp_log_dir)
 
         # Create logs through manager (creates index)
@@ -3517,19 +3711,19 @@ class TestLogManagerOptimizedGetLogCount:
             f.write("{ invalid json")
 
         # get_log_count should handle corrupted index and fall back
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         count = manager.get_log_count()
         assert count == 3
 
     def test_get_log_count_empty_directory(self, temp_log_dir):
         """Test get_log_count returns 0 for empty directory."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         count = manager.get_log_count()
         assert count == 0
 
     def test_get_log_count_nonexistent_directory(self, temp_log_dir):
         """Test get_log_count handles nonexistent directory."""
-        manager = LogManager(log_dir=os.path.join(temp_log_dir, "nonexistent"))
+        manager = LogManager(log_dir=os.path.join(temp_log_dir, "nonexistent"), use_database=False)
         # Delete the created directory
         os.rmdir(manager._log_dir)
         count = manager.get_log_count()
@@ -3558,13 +3752,13 @@ class TestLogManagerOptimizedGetLogCount:
             json.dump({"version": 1}, f)  # Missing 'entries' key
 
         # get_log_count should handle invalid structure and fall back
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         count = manager.get_log_count()
         assert count == 2
 
     def test_get_log_count_large_index(self, temp_log_dir):
         """Test get_log_count performance with large index."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create a moderate number of log entries
         for i in range(20):
@@ -3582,7 +3776,7 @@ class TestLogManagerOptimizedGetLogCount:
 
     def test_get_log_count_after_delete(self, temp_log_dir):
         """Test get_log_count updates correctly after delete_log."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create logs
         entries = []
@@ -3606,7 +3800,7 @@ class TestLogManagerOptimizedGetLogCount:
 
     def test_get_log_count_after_clear(self, temp_log_dir):
         """Test get_log_count returns 0 after clear_logs."""
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Create logs
         for i in range(3):
@@ -3678,7 +3872,7 @@ class TestLogManagerMigrationIntegration:
         assert not index_path.exists()
 
         # Step 2: Create LogManager (triggers migration on first get_logs)
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Step 3: Retrieve logs (should trigger migration)
         logs = manager.get_logs()
@@ -3698,8 +3892,7 @@ class TestLogManagerMigrationIntegration:
         assert result is True
 
         # Step 5: Verify index was updated
-        with open(index_path, encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = manager._load_index()
         assert len(index_data["entries"]) == 6
 
         # Step 6: Retrieve logs again (should use index)
@@ -3711,8 +3904,7 @@ class TestLogManagerMigrationIntegration:
         assert result is True
 
         # Step 8: Verify index was updated
-        with open(index_path, encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = manager._load_index()
         assert len(index_data["entries"]) == 5
 
         # Step 9: Verify get_logs returns correct count
@@ -3726,7 +3918,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=10)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Test filtering by scan type
         scan_logs = manager.get_logs(log_type="scan")
@@ -3748,7 +3940,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=20)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Test various limits
         logs_5 = manager.get_logs(limit=5)
@@ -3770,7 +3962,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=20)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Test combined filters
         scan_logs = manager.get_logs(log_type="scan", limit=3)
@@ -3787,7 +3979,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=7)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Trigger migration by calling get_logs
         logs = manager.get_logs()
@@ -3803,7 +3995,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=5)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         logs = manager.get_logs()
         assert len(logs) == 5
 
@@ -3832,7 +4024,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=5)
 
         # Create first manager and trigger migration
-        manager1 = LogManager(log_dir=temp_log_dir)
+        manager1 = LogManager(log_dir=temp_log_dir, use_database=False)
         logs1 = manager1.get_logs()
         assert len(logs1) == 5
 
@@ -3841,7 +4033,7 @@ class TestLogManagerMigrationIntegration:
         assert index_path.exists()
 
         # Create second manager (should use existing index)
-        manager2 = LogManager(log_dir=temp_log_dir)
+        manager2 = LogManager(log_dir=temp_log_dir, use_database=False)
         logs2 = manager2.get_logs()
         assert len(logs2) == 5
 
@@ -3855,7 +4047,7 @@ class TestLogManagerMigrationIntegration:
         manager1.save_log(new_entry)
 
         # Create third manager (should see updated index)
-        manager3 = LogManager(log_dir=temp_log_dir)
+        manager3 = LogManager(log_dir=temp_log_dir, use_database=False)
         logs3 = manager3.get_logs()
         assert len(logs3) == 6
 
@@ -3865,7 +4057,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=10)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         results = []
         errors = []
@@ -3921,7 +4113,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=5)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         logs = manager.get_logs()
         assert len(logs) == 5
 
@@ -3934,7 +4126,7 @@ class TestLogManagerMigrationIntegration:
         assert not index_path.exists()
 
         # Create new LogManager instance
-        manager2 = LogManager(log_dir=temp_log_dir)
+        manager2 = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # get_logs should still work (fallback or validation triggers rebuild)
         logs2 = manager2.get_logs()
@@ -3950,7 +4142,7 @@ class TestLogManagerMigrationIntegration:
         entries = self._create_manual_log_files(temp_log_dir, count=5)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         logs = manager.get_logs()
 
         # Verify all data is preserved
@@ -3991,7 +4183,7 @@ class TestLogManagerMigrationIntegration:
             json.dump({"id": "missing-fields"}, f)  # Missing required fields
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         logs = manager.get_logs()
 
         # Should retrieve only valid logs
@@ -4005,7 +4197,7 @@ class TestLogManagerMigrationIntegration:
     def test_migration_empty_directory_then_add_logs(self, temp_log_dir):
         """Test migration behavior when starting with empty directory."""
         # Create LogManager with empty directory
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # First get_logs on empty directory
         logs = manager.get_logs()
@@ -4038,7 +4230,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=100)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
 
         # Migration should complete successfully
         logs = manager.get_logs(limit=10)
@@ -4067,7 +4259,7 @@ class TestLogManagerMigrationIntegration:
         self._create_manual_log_files(temp_log_dir, count=5)
 
         # Create LogManager and trigger migration
-        manager = LogManager(log_dir=temp_log_dir)
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
         logs = manager.get_logs()
         assert len(logs) == 5
 
@@ -4091,6 +4283,258 @@ class TestLogManagerMigrationIntegration:
         assert len(logs_after) == 5
 
 
+class TestLogManagerIndexJournal:
+    """Tests for the append-only index journal."""
+
+    @pytest.fixture
+    def temp_log_dir(self):
+        """Create a temporary directory for log storage."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def log_manager(self, temp_log_dir):
+        """Create a LogManager keeping JSON log files."""
+        return LogManager(log_dir=temp_log_dir, use_database=False)
+
+    def _save(self, log_manager, count):
+        entries = [
+            LogEntry.create(log_type="scan", status="clean", summary=f"Scan {i}", details="")
+            for i in range(count)
+        ]
+        for entry in entries:
+            log_manager.save_log(entry)
+        return entries
+
+    def test_save_log_appends_instead_of_rewriting(self, log_manager, temp_log_dir):
+        """Test only the first save writes the index file."""
+        index_path = Path(temp_log_dir) / "log_index.json"
+        journal_path = Path(temp_log_dir) / "log_index.journal"
+        self._save(log_manager, 1)
+        snapshot = index_path.read_text()
+
+        entries = self._save(log_manager, 2)
+
+        assert index_path.read_text() == snapshot
+        assert len(journal_path.read_text().splitlines()) == 2
+        assert journal_path.stat().st_mode & 0o777 == 0o600
+        assert [e["id"] for e in log_manager._load_index()["entries"][1:]] == [
+            entry.id for entry in entries
+        ]
+
+    def test_delete_is_journaled(self, log_manager):
+        """Test deleted logs are dropped when replaying the journal."""
+        first, second = self._save(log_manager, 2)
+
+        log_manager.delete_log(first.id)
+
+        assert [e["id"] for e in log_manager._load_index()["entries"]] == [second.id]
+
+    def test_journal_is_compacted(self, log_manager, temp_log_dir):
+        """Test the journal is folded into the index file once it is large."""
+        with mock.patch("src.core.log_manager.INDEX_JOURNAL_COMPACT_BYTES", 300):
+            self._save(log_manager, 5)
+
+        with open(Path(temp_log_dir) / "log_index.json", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        journal_path = Path(temp_log_dir) / "log_index.journal"
+        journal_lines = journal_path.read_text().splitlines() if journal_path.exists() else []
+        assert len(snapshot["entries"]) + len(journal_lines) == 5
+        assert len(journal_lines) < 4
+
+    def test_torn_journal_line_is_skipped(self, log_manager, temp_log_dir):
+        """Test a record cut short by a crash does not break loading."""
+        entries = self._save(log_manager, 2)
+        with open(Path(temp_log_dir) / "log_index.journal", "a", encoding="utf-8") as f:
+            f.write('{"id": "cut-sh')
+
+        assert [e["id"] for e in log_manager._load_index()["entries"]] == [
+            entry.id for entry in entries
+        ]
+
+    def test_index_file_has_one_entry_per_line(self, log_manager, temp_log_dir):
+        """Test the index file stays JSON with an entry on each line."""
+        index_data = {
+            "version": 1,
+            "entries": [
+                {"id": "a", "timestamp": "2024-01-01T10:00:00", "type": "scan"},
+                {"id": "b\nc", "timestamp": "2024-01-01T11:00:00", "type": "update"},
+            ],
+        }
+        log_manager._save_index(index_data)
+
+        index_path = Path(temp_log_dir) / "log_index.json"
+        assert json.loads(index_path.read_text()) == index_data
+        assert len(index_path.read_text().splitlines()) == 4
+        assert log_manager._load_index() == index_data
+
+    def test_indented_index_file_is_read(self, log_manager, temp_log_dir):
+        """Test index files written with indent=2 by older versions still load."""
+        index_data = {"version": 1, "entries": [{"id": "a", "type": "scan"}]}
+        with open(Path(temp_log_dir) / "log_index.json", "w", encoding="utf-8") as f:
+            json.dump(index_data, f, indent=2)
+
+        assert log_manager._load_index() == index_data
+
+    def test_truncated_index_file_is_empty(self, log_manager, temp_log_dir):
+        """Test an index file cut short loads as an empty index."""
+        log_manager._save_index({"version": 1, "entries": [{"id": "a"}, {"id": "b"}]})
+        index_path = Path(temp_log_dir) / "log_index.json"
+        index_path.write_text("".join(index_path.read_text().splitlines(True)[:2]))
+
+        assert log_manager._load_index() == {"version": 1, "entries": []}
+
+    def test_validate_index_skips_listing_unchanged_directory(self, log_manager, temp_log_dir):
+        """Test the directory is only listed again once it changed."""
+        self._save(log_manager, 3)
+        index = log_manager._load_index()
+        past = time.time_ns() - 60_000_000_000
+        os.utime(temp_log_dir, ns=(past, past))
+        assert log_manager._validate_index(index) is True
+
+        with mock.patch.object(Path, "glob", side_effect=AssertionError("listed")):
+            assert log_manager._validate_index(index) is True
+
+        self._save(log_manager, 1)
+        assert log_manager._validate_index(log_manager._load_index()) is True
+
+
+class TestLogManagerCrossProcess:
+    """Tests for sharing the logs between the GUI and scheduled scans."""
+
+    @pytest.fixture
+    def temp_log_dir(self):
+        """Create a temporary directory for log storage."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def test_store_lock_excludes_other_managers(self, temp_log_dir):
+        """Test a save waits while another manager holds the directory lock."""
+        holder = LogManager(log_dir=temp_log_dir, use_database=False)
+        writer = LogManager(log_dir=temp_log_dir, use_database=False)
+        entry = LogEntry.create(log_type="scan", status="clean", summary="Scan", details="")
+
+        with holder._store_lock():
+            thread = threading.Thread(target=writer.save_log, args=(entry,))
+            thread.start()
+            thread.join(timeout=0.3)
+            assert thread.is_alive()
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert writer.get_log_by_id(entry.id) is not None
+
+    def test_database_reads_do_not_wait_for_store_lock(self, temp_log_dir):
+        """Test reads from the database go on while another manager holds the lock."""
+        holder = LogManager(log_dir=temp_log_dir)
+        reader = LogManager(log_dir=temp_log_dir)
+        entry = LogEntry.create(log_type="scan", status="clean", summary="Scan", details="")
+        holder.save_log(entry)
+        reader.get_log_count()
+
+        results = []
+        with holder._store_lock():
+            thread = threading.Thread(
+                target=lambda: results.extend(
+                    [reader.get_log_count(), reader.get_log_by_id(entry.id), reader.get_logs()]
+                )
+            )
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+        count, found, logs = results
+        assert count == 1
+        assert found.id == entry.id
+        assert [log.id for log in logs] == [entry.id]
+
+    def test_concurrent_processes_keep_index(self, temp_log_dir):
+        """Test processes saving at once neither lose nor invalidate index entries."""
+        context = multiprocessing.get_context("fork")
+
+        def save_logs(worker):
+            manager = LogManager(log_dir=temp_log_dir, use_database=False)
+            for i in range(15):
+                manager.save_log(
+                    LogEntry.create(
+                        log_type="scan", status="clean", summary=f"{worker}-{i}", details=""
+                    )
+                )
+
+        with mock.patch("src.core.log_manager.INDEX_JOURNAL_COMPACT_BYTES", 500):
+            workers = [context.Process(target=save_logs, args=(n,)) for n in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=30)
+
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
+        index = manager._load_index()
+        assert len(index["entries"]) == 60
+        assert manager._validate_index(index) is True
+
+    @pytest.mark.parametrize("use_database", [True, False])
+    def test_get_logs_since(self, temp_log_dir, use_database):
+        """Test only logs newer than a timestamp are returned."""
+        manager = LogManager(log_dir=temp_log_dir, use_database=use_database)
+        entries = []
+        for second in range(3):
+            entry = LogEntry.create(log_type="scan", status="clean", summary="Scan", details="")
+            entry.timestamp = f"2024-01-15T10:30:0{second}"
+            manager.save_log(entry)
+            entries.append(entry)
+
+        newer = manager.get_logs(since=entries[0].timestamp)
+
+        assert [entry.id for entry in newer] == [entries[2].id, entries[1].id]
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("logs.db", True),
+            ("logs.db-wal", True),
+            ("7a3b9f12-4e56-7890-abcd-ef1234567890.json", True),
+            ("log_index.json", False),
+            ("log_index_x1y2z3.json", False),
+            ("log_index.journal", False),
+            ("logs.db-shm", False),
+            ("7a3b9f12-4e56-7890-abcd-ef1234567890.output.gz", False),
+        ],
+    )
+    def test_is_log_store_file(self, name, expected):
+        """Test which changes in the log directory are reported."""
+        assert log_manager_module._is_log_store_file(name) is expected
+
+    def test_monitor_changes_collects_bursts(self, temp_log_dir):
+        """Test a burst of changes results in one delayed callback."""
+        manager = LogManager(log_dir=temp_log_dir, use_database=False)
+        callback = mock.MagicMock()
+
+        with (
+            mock.patch.object(log_manager_module, "Gio") as gio,
+            mock.patch.object(log_manager_module, "GLib") as glib,
+        ):
+            glib.timeout_add.return_value = 7
+            monitor = manager.monitor_changes(callback)
+            on_changed = monitor.connect.call_args[0][1]
+
+            def change(name):
+                changed_file = mock.MagicMock()
+                changed_file.get_basename.return_value = name
+                on_changed(monitor, changed_file, None, None)
+
+            change("log_index.json")
+            glib.timeout_add.assert_not_called()
+            change("logs.db-wal")
+            change("logs.db")
+
+        assert monitor is gio.File.new_for_path.return_value.monitor_directory.return_value
+        glib.timeout_add.assert_called_once()
+        notify = glib.timeout_add.call_args[0][1]
+        assert notify() is False
+        callback.assert_called_once_with()
+
+
 class TestLogManagerExport:
     """Tests for LogManager export functionality (CSV and JSON)."""
 
@@ -5205,7 +5649,7 @@ class TestIndexRebuildPerformance:
         log_dir = tmp_path / "logs"
         log_dir.mkdir()
 
-        manager = LogManager(str(log_dir))
+        manager = LogManager(str(log_dir), use_database=False)
 
         # Create 100 log files with varying sizes
         for i in range(100):
@@ -5287,7 +5731,7 @@ class TestIndexRebuildPerformance:
         content += '  "type": "scan"\n}'
         log_file.write_text(content, encoding="utf-8")
 
-        manager = LogManager(str(log_dir))
+        manager = LogManager(str(log_dir), use_database=False)
         result = manager.rebuild_index()
 
         assert result is True
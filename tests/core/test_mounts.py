@@ -0,0 +1,280 @@
+# ClamUI Mounts Tests
+"""Unit tests for mount-table parsing and filesystem-aware traversal."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import scanner as scanner_module
+from src.core.log_manager import LogEntry
+from src.core.mounts import (
+    REASON_FUSE,
+    REASON_OTHER_FILESYSTEM,
+    REASON_PSEUDO,
+    REASON_REMOTE,
+    MountInfo,
+    MountPolicy,
+    filesystem_kind,
+    parse_mountinfo,
+    read_mounts,
+)
+from src.core.scan_walker import ScanWalker
+
+MOUNTINFO = """\
+22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+23 22 0:21 / /proc rw,nosuid shared:12 - proc proc rw
+24 22 0:22 / /sys rw,nosuid shared:7 - sysfs sysfs rw
+40 22 8:17 / /mnt/My\\040Disk rw,relatime shared:30 - ext4 /dev/sdb1 rw
+41 22 0:50 / /mnt/share rw,relatime shared:31 - nfs4 server:/export rw
+42 22 0:51 / /run/user/1000/doc rw,nosuid shared:32 master:1 - fuse.portal portal rw
+43 22 8:33 / /media/usb rw,relatime shared:33 - fuseblk /dev/sdc1 rw
+not a mountinfo line
+"""
+
+
+def make_tree(tmp_path):
+    """Create a scan target with a pseudo, a remote and a local disk mount."""
+    root = tmp_path / "root"
+    for directory in ("proc", "share", "disk/sub", "home"):
+        (root / directory).mkdir(parents=True)
+    (root / "proc" / "status").write_text("kernel")
+    (root / "share" / "remote.txt").write_text("remote")
+    (root / "disk" / "sub" / "a.txt").write_text("disk")
+    (root / "disk" / "b.txt").write_text("disk")
+    (root / "home" / "c.txt").write_text("home")
+    (root / "top.txt").write_text("top")
+    mounts = [
+        MountInfo("/", "8:1", "ext4", "/dev/sda1"),
+        MountInfo(str(root / "proc"), "0:21", "proc", "proc"),
+        MountInfo(str(root / "share"), "0:50", "nfs", "server:/export"),
+        MountInfo(str(root / "disk"), "8:17", "ext4", "/dev/sdb1"),
+    ]
+    return root, mounts
+
+
+def walk(root, mounts, policy=None, **kwargs):
+    """Walk root with a mount filter built from the given table."""
+    mount_filter = (policy or MountPolicy()).filter_for(str(root), mounts)
+    walker = ScanWalker(str(root), mounts=mount_filter, **kwargs)
+    return walker, sorted(walker)
+
+
+class TestMountTable:
+    """Tests for reading the mount table."""
+
+    def test_parse_mountinfo(self):
+        mounts = parse_mountinfo(MOUNTINFO)
+
+        assert len(mounts) == 7
+        assert mounts[0] == MountInfo("/", "8:1", "ext4", "/dev/sda1")
+        assert mounts[3].mount_point == "/mnt/My Disk"
+        assert mounts[5].fstype == "fuse.portal"
+        assert mounts[3].describe() == "/mnt/My Disk (ext4 on /dev/sdb1)"
+
+    def test_read_mounts(self, tmp_path):
+        (tmp_path / "mountinfo").write_text(MOUNTINFO)
+
+        assert len(read_mounts(str(tmp_path / "mountinfo"))) == 7
+        assert read_mounts(str(tmp_path / "missing")) == []
+
+    def test_filesystem_kind(self):
+        assert filesystem_kind("proc") == REASON_PSEUDO
+        assert filesystem_kind("cgroup2") == REASON_PSEUDO
+        assert filesystem_kind("nfs4") == REASON_REMOTE
+        assert filesystem_kind("cifs") == REASON_REMOTE
+        assert filesystem_kind("fuse.sshfs") == REASON_FUSE
+        assert filesystem_kind("fuseblk") is None
+        assert filesystem_kind("btrfs") is None
+
+
+class TestMountPolicy:
+    """Tests for deciding which mounts are entered."""
+
+    def test_defaults_skip_pseudo_and_remote(self):
+        policy = MountPolicy()
+        mounts = parse_mountinfo(MOUNTINFO)
+
+        assert [policy.skip_reason(mount) for mount in mounts[1:]] == [
+            REASON_PSEUDO,
+            REASON_PSEUDO,
+            None,
+            REASON_REMOTE,
+            REASON_FUSE,
+            None,
+        ]
+
+    def test_one_file_system(self):
+        policy = MountPolicy(one_file_system=True)
+
+        assert policy.skip_reason(MountInfo("/home", "8:2", "ext4", "/dev/sda2")) == (
+            REASON_OTHER_FILESYSTEM
+        )
+
+    def test_from_settings(self):
+        settings = MagicMock()
+        values = {"scan_skip_remote_filesystems": False, "scan_one_file_system": True}
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+
+        assert MountPolicy.from_settings(settings) == MountPolicy(True, False, True)
+        assert MountPolicy.from_settings(settings, one_file_system=False) == MountPolicy(
+            True, False, False
+        )
+        assert MountPolicy.from_settings(None) == MountPolicy()
+
+    def test_filter_needs_directory_and_mount_table(self, tmp_path):
+        (tmp_path / "file.txt").write_text("data")
+
+        assert MountPolicy().filter_for(str(tmp_path / "file.txt")) is None
+        assert MountPolicy().filter_for(str(tmp_path), []) is None
+
+    def test_filter(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+
+        mount_filter = MountPolicy().filter_for(str(root), mounts)
+
+        assert mount_filter.root_device == "8:1"
+        assert mount_filter.devices == {"8:1", "8:17"}
+        assert sorted(mount_filter.skipped) == [str(root / "proc"), str(root / "share")]
+        assert mount_filter.check(str(root / "home")) == (None, None)
+        assert mount_filter.check(str(root / "proc")) == (mounts[1], REASON_PSEUDO)
+
+    def test_filter_through_symlink(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+        link = tmp_path / "link"
+        link.symlink_to(root)
+
+        mount_filter = MountPolicy().filter_for(str(link), mounts)
+
+        assert mount_filter.check(str(link / "proc"))[1] == REASON_PSEUDO
+
+
+class TestMountAwareWalk:
+    """Tests for ScanWalker with a mount filter."""
+
+    def test_skips_pseudo_and_remote_mounts(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+
+        walker, files = walk(root, mounts)
+
+        assert files == sorted(
+            str(root / name) for name in ("disk/sub/a.txt", "disk/b.txt", "home/c.txt", "top.txt")
+        )
+        assert sorted(walker.skipped_mounts) == [
+            f"{root / 'proc'} (proc on proc): pseudo filesystem",
+            f"{root / 'share'} (nfs on server:/export): remote filesystem",
+        ]
+        assert walker.device_boundaries == [f"{root / 'disk'} (ext4 on /dev/sdb1)"]
+        assert walker.files_found == 4
+        assert walker.finished
+
+    def test_one_file_system(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+
+        walker, files = walk(root, mounts, MountPolicy(one_file_system=True))
+
+        assert files == [str(root / "home" / "c.txt"), str(root / "top.txt")]
+        assert len(walker.skipped_mounts) == 3
+        assert walker.device_boundaries == []
+
+    def test_policy_can_enter_everything(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+
+        walker, files = walk(root, mounts, MountPolicy(skip_pseudo=False, skip_remote=False))
+
+        assert len(files) == 6
+        assert walker.skipped_mounts == []
+
+    def test_devices_are_walked_on_their_own_threads(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+        threads = set()
+
+        def is_excluded(path, name, is_dir):
+            threads.add((path.startswith(f"{root / 'disk'}/"), threading.current_thread().name))
+            return False
+
+        walk(root, mounts, exclude=is_excluded)
+
+        assert {name for on_disk, name in threads if on_disk} == {"clamui-walk-8:17"}
+        assert {name for on_disk, name in threads if not on_disk} == {"clamui-walk-8:1"}
+
+    def test_device_walk_errors_reach_the_consumer(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+
+        def is_excluded(path, name, is_dir):
+            if name == "sub":
+                raise RuntimeError("broken exclusion")
+            return False
+
+        with pytest.raises(RuntimeError, match="broken exclusion"):
+            walk(root, mounts, exclude=is_excluded)
+
+    def test_device_walks_stop_when_iteration_stops(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+        for index in range(2 * ScanWalker.DEVICE_QUEUE_SIZE):
+            (root / "disk" / f"many{index}.txt").write_text("x")
+        walker = ScanWalker(str(root), mounts=MountPolicy().filter_for(str(root), mounts))
+
+        paths = iter(walker)
+        next(paths)
+        paths.close()
+
+        assert not walker.finished
+        for thread in threading.enumerate():
+            if thread.name.startswith("clamui-walk-"):
+                thread.join(timeout=5)
+                assert not thread.is_alive()
+
+    def test_iter_roots_does_not_cover_skipped_mounts(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+        walker = ScanWalker(str(root), mounts=MountPolicy().filter_for(str(root), mounts))
+
+        roots = sorted(walker.iter_roots())
+
+        assert str(root) not in roots
+        assert str(root / "proc") not in roots
+        assert str(root / "share") not in roots
+        assert str(root / "disk") in roots
+        assert len(walker.skipped_mounts) == 2
+
+
+class TestClamscanMounts:
+    """Tests for applying the mount policy to clamscan's own walk."""
+
+    def test_build_command(self, tmp_path):
+        root, mounts = make_tree(tmp_path)
+        mount_filter = MountPolicy(one_file_system=True).filter_for(str(root), mounts)
+
+        with (
+            patch.object(scanner_module, "get_clamav_path", return_value="clamscan"),
+            patch.object(scanner_module, "get_clamav_database_dir", return_value=None),
+            patch.object(scanner_module, "wrap_host_command", side_effect=lambda cmd: cmd),
+        ):
+            cmd = scanner_module.Scanner(log_manager=MagicMock())._build_command(
+                str(root), True, mounts=mount_filter
+            )
+
+        assert "--cross-fs=no" in cmd
+        excluded = [cmd[index + 1] for index, arg in enumerate(cmd) if arg == "--exclude-dir"]
+        assert len(excluded) == 3
+        assert excluded[0].startswith("^") and excluded[0].endswith("$")
+
+
+class TestLogDetails:
+    """Tests for mount reports in scan logs."""
+
+    def test_mount_sections(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="clean",
+            path="/",
+            duration=3.0,
+            scanned_files=5,
+            skipped_mounts=["/proc (proc on proc): pseudo filesystem"],
+            device_boundaries=["/home (ext4 on /dev/sdb1)"],
+        )
+
+        assert entry.details == (
+            "Scanned: 5 files, 0 directories\n"
+            "Skipped mounts:\n  - /proc (proc on proc): pseudo filesystem\n"
+            "Filesystems crossed:\n  - /home (ext4 on /dev/sdb1)"
+        )
@@ -0,0 +1,183 @@
+# ClamUI Package Allowlist Tests
+"""Unit tests for skipping files unmodified since their package installed them."""
+
+import hashlib
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from src.core import package_allowlist
+from src.core.log_manager import LogEntry
+from src.core.package_allowlist import (
+    PackageAllowlist,
+    PackageFile,
+    load_dpkg_files,
+    load_package_allowlist,
+    load_rpm_files,
+    open_package_allowlist,
+)
+from src.core.scan_walker import ScanWalker
+
+
+@pytest.fixture
+def installed(tmp_path):
+    """A file as a package installed it, and its MD5 digest."""
+    path = tmp_path / "usr" / "bin" / "tool"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"#!/bin/sh\necho tool\n")
+    return path, hashlib.md5(path.read_bytes()).digest()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    package_allowlist._cached = None
+    yield
+    package_allowlist._cached = None
+
+
+class TestDpkg:
+    """Tests for dpkg checksums."""
+
+    def test_load_dpkg_files(self, tmp_path):
+        info = tmp_path / "info"
+        info.mkdir()
+        (info / "tool.md5sums").write_text(
+            "0123456789abcdef0123456789abcdef  usr/bin/tool\n"
+            "not-hex  usr/bin/broken\n"
+            "fedcba9876543210fedcba9876543210  bin/sh\n"
+        )
+        (info / "tool.list").write_text("/usr/bin/tool\n")
+        unpacked = int(os.stat(info / "tool.list").st_mtime) + 1
+
+        with patch.object(package_allowlist, "_usr_merged_prefixes", return_value=["/bin"]):
+            files = load_dpkg_files(str(info))
+
+        assert files["/usr/bin/tool"] == PackageFile(
+            bytes.fromhex("0123456789abcdef0123456789abcdef"), None, unpacked
+        )
+        assert "/usr/bin/broken" not in files
+        assert files["/usr/bin/sh"] == files["/bin/sh"]
+
+    def test_untouched_file_is_not_hashed(self, installed):
+        path, digest = installed
+        unpacked = int(os.stat(path).st_ctime) + 1
+        allowlist = PackageAllowlist({str(path): PackageFile(b"\0" * 16, None, unpacked)})
+
+        with patch.object(package_allowlist, "file_digest") as file_digest:
+            assert allowlist.is_trusted(str(path), os.lstat(path))
+
+        file_digest.assert_not_called()
+
+    def test_changed_file_is_verified(self, installed):
+        path, digest = installed
+        allowlist = PackageAllowlist({str(path): PackageFile(digest, None, 0)})
+
+        assert allowlist.is_trusted(str(path), os.lstat(path))
+
+        path.write_bytes(b"#!/bin/sh\nevil\n")
+        assert not allowlist.is_trusted(str(path), os.lstat(path))
+
+    def test_unknown_file(self, installed):
+        path, _digest = installed
+
+        assert not PackageAllowlist({}).is_trusted(str(path), os.lstat(path))
+
+
+class TestRpm:
+    """Tests for RPM digests."""
+
+    def test_load_rpm_files(self):
+        output = (
+            "1024\t1700000000\t" + "ab" * 32 + "\t/usr/bin/tool\n"
+            "0\t1700000000\t\t/usr/share/doc\n"
+            "garbage\n"
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=output, stderr="")
+
+        with (
+            patch.object(package_allowlist.shutil, "which", return_value="/usr/bin/rpm"),
+            patch.object(package_allowlist.os.path, "isdir", return_value=True),
+            patch.object(package_allowlist.subprocess, "run", return_value=completed),
+        ):
+            files = load_rpm_files()
+
+        assert files == {"/usr/bin/tool": PackageFile(bytes.fromhex("ab" * 32), 1024, 1700000000)}
+
+    def test_without_rpm(self):
+        with patch.object(package_allowlist.shutil, "which", return_value=None):
+            assert load_rpm_files() == {}
+
+    def test_size_and_mtime(self, installed):
+        path, _digest = installed
+        st = os.lstat(path)
+        sha256 = hashlib.sha256(path.read_bytes()).digest()
+
+        matching = PackageAllowlist(
+            {str(path): PackageFile(b"\0" * 32, st.st_size, int(st.st_mtime))}
+        )
+        resized = PackageAllowlist(
+            {str(path): PackageFile(sha256, st.st_size + 1, int(st.st_mtime))}
+        )
+        touched = PackageAllowlist({str(path): PackageFile(sha256, st.st_size, 0)})
+
+        assert matching.is_trusted(str(path), st)
+        assert not resized.is_trusted(str(path), st)
+        assert touched.is_trusted(str(path), st)
+
+
+class TestLoading:
+    """Tests for building and caching the allowlist."""
+
+    def test_disabled_or_empty(self):
+        assert open_package_allowlist(False) is None
+        assert open_package_allowlist(None) is None
+        with (
+            patch.object(package_allowlist, "load_dpkg_files", return_value={}),
+            patch.object(package_allowlist, "load_rpm_files", return_value={}),
+        ):
+            assert open_package_allowlist(True) is None
+
+    def test_rebuilt_when_packages_change(self):
+        entry = PackageFile(b"\0" * 16, None, 0)
+        with (
+            patch.object(package_allowlist, "load_dpkg_files", return_value={"/a": entry}) as dpkg,
+            patch.object(package_allowlist, "load_rpm_files", return_value={}),
+            patch.object(package_allowlist, "_database_state", side_effect=[(1,), (1,), (2,)]),
+        ):
+            first = load_package_allowlist()
+            assert load_package_allowlist() is first
+            assert load_package_allowlist() is not first
+
+        assert dpkg.call_count == 2
+
+
+class TestScan:
+    """Tests for skipping trusted files during a walk."""
+
+    def test_walker_skips_trusted_files(self, installed):
+        path, digest = installed
+        (path.parent / "dropped").write_text("not from a package")
+        allowlist = PackageAllowlist({str(path): PackageFile(digest, None, 0)})
+        walker = ScanWalker(str(path.parent), trusted=allowlist)
+
+        files = list(walker)
+
+        assert files == [str(path.parent / "dropped")]
+        assert walker.trusted_count == 1
+        assert walker.trusted_bytes == path.stat().st_size
+
+    def test_log_details(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="clean",
+            path="/usr",
+            duration=1.0,
+            scanned_files=2,
+            trusted_files=3,
+            trusted_bytes=2048,
+        )
+
+        assert entry.details == (
+            "Scanned: 2 files, 0 directories\nUnmodified package files skipped: 3 files (2.0 KB)"
+        )
@@ -0,0 +1,184 @@
+# ClamUI Risk Order Tests
+"""Unit tests for scanning likely threats first."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import risk_order
+from src.core.clamd_client import ClamdAddress
+from src.core.log_manager import LogEntry
+from src.core.risk_order import RiskOrder, open_risk_order, read_magic, risk_score
+from src.core.scan_walker import ScanWalker
+from src.core.scanner_types import ScanStatus
+from tests.conftest import EICAR_STRING
+
+YEAR = 365 * 24 * 3600
+
+
+@pytest.fixture(autouse=True)
+def downloads_only():
+    """Score only Downloads, since pytest's tmp_path lives below /tmp."""
+    with patch.object(risk_order, "LOCATION_SCORES", (("/Downloads/", 40),)):
+        yield
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A tree with one file of each risk: plain, script, ELF in Downloads."""
+    root = tmp_path / "home"
+    (root / "Downloads").mkdir(parents=True)
+    (root / "notes.txt").write_text("shopping list")
+    script = root / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+    (root / "Downloads" / "setup.bin").write_bytes(b"\x7fELF" + b"\0" * 60)
+    return root
+
+
+class TestScore:
+    """Tests for risk_score."""
+
+    def test_components_add_up(self, tmp_path):
+        path = tmp_path / "Downloads" / "tool"
+        path.parent.mkdir()
+        path.write_bytes(b"MZ" + b"\0" * 10)
+        path.chmod(0o755)
+        st = os.lstat(path)
+
+        score = risk_score(str(path), st, read_magic(str(path)), st.st_mtime + 60)
+
+        # Location, executable bit, PE header and changed within a day
+        assert score == 40 + 20 + 30 + 25
+
+    def test_plain_old_file_scores_nothing(self, tree):
+        path = tree / "notes.txt"
+        st = os.lstat(path)
+
+        assert risk_score(str(path), st, read_magic(str(path)), time.time() + YEAR) == 0
+
+    def test_unreadable_file_has_no_magic(self, tmp_path):
+        assert read_magic(str(tmp_path / "missing")) == b""
+
+
+class TestOrder:
+    """Tests for RiskOrder.order."""
+
+    def test_highest_risk_first(self, tree):
+        paths = sorted(str(path) for path in tree.rglob("*") if path.is_file())
+
+        ordered = list(RiskOrder().order(paths))
+
+        assert ordered == [
+            str(tree / "Downloads" / "setup.bin"),
+            str(tree / "run.sh"),
+            str(tree / "notes.txt"),
+        ]
+
+    def test_ties_keep_walk_order(self, tmp_path):
+        paths = []
+        for name in ("c", "a", "b"):
+            (tmp_path / name).write_text("same")
+            paths.append(str(tmp_path / name))
+
+        assert list(RiskOrder().order(paths)) == paths
+
+    def test_top_n_forgets_the_rest(self, tree):
+        paths = sorted(str(path) for path in tree.rglob("*") if path.is_file())
+        forgotten = []
+
+        ordered = list(RiskOrder(top_n=2).order(paths, lambda path, size: forgotten.append(path)))
+
+        assert ordered == [str(tree / "Downloads" / "setup.bin"), str(tree / "run.sh")]
+        assert forgotten == [str(tree / "notes.txt")]
+
+    def test_time_budget(self, tree):
+        paths = sorted(str(path) for path in tree.rglob("*") if path.is_file())
+        clock = iter([0.0, 5.0, 10.0])
+        forgotten = []
+        order = RiskOrder(time_budget=10, elapsed=lambda: next(clock))
+
+        ordered = list(order.order(paths, lambda path, size: forgotten.append(path)))
+
+        assert len(ordered) == 2
+        assert forgotten == [str(tree / "notes.txt")]
+        assert order.budget_reached
+
+
+class TestOpenRiskOrder:
+    """Tests for reading the profile option."""
+
+    def test_disabled(self):
+        assert open_risk_order(None) is None
+        assert open_risk_order({}) is None
+        assert open_risk_order({"enabled": False, "top_n": 10}) is None
+        assert open_risk_order({"enabled": "yes"}) is None
+
+    def test_caps(self):
+        order = open_risk_order({"enabled": True, "top_n": 100, "time_budget": 30})
+
+        assert order.top_n == 100
+        assert order.time_budget == 30.0
+
+    def test_invalid_caps_are_ignored(self):
+        order = open_risk_order({"enabled": True, "top_n": 0, "time_budget": "soon"})
+
+        assert order.top_n is None
+        assert order.time_budget is None
+
+
+class TestScan:
+    """Tests for walking and scanning in risk order."""
+
+    def test_walker_totals_exclude_unscanned(self, tree):
+        walker = ScanWalker(str(tree))
+
+        paths = walker.iter_ahead(order=RiskOrder(top_n=1))
+        try:
+            files = list(paths)
+        finally:
+            paths.close()
+
+        assert files == [str(tree / "Downloads" / "setup.bin")]
+        assert sorted(walker.unscanned) == [str(tree / "notes.txt"), str(tree / "run.sh")]
+        assert walker.files_found == 1
+        assert walker.bytes_found == 64
+
+    def test_daemon_scan_reports_unscanned(self, fake_clamd, tree):
+        eicar = tree / "Downloads" / "eicar.com"
+        eicar.write_text(EICAR_STRING)
+        eicar.chmod(0o755)
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key in ("scan_cache_enabled", "scan_checkpoints_enabled") else default
+        )
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+
+        with patch.object(daemon_scanner_module, "resolve_clamd_address", return_value=address):
+            scanner = daemon_scanner_module.DaemonScanner(
+                log_manager=MagicMock(), settings_manager=settings
+            )
+            result = scanner.scan_sync(str(tree), risk_order_options={"enabled": True, "top_n": 2})
+
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 2
+        assert result.unscanned_count == 2
+        assert result.warning_message == (
+            "2 lower-risk file(s) were not scanned (scan cap reached)"
+        )
+
+    def test_log_details(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="clean",
+            path="/home",
+            duration=1.0,
+            scanned_files=2,
+            unscanned_files=5,
+        )
+
+        assert entry.details == (
+            "Scanned: 2 files, 0 directories\nNot scanned (scan cap reached): 5 files"
+        )
@@ -0,0 +1,206 @@
+# ClamUI Scan Cache Tests
+"""Unit tests for the incremental scan cache."""
+
+import os
+import stat
+from unittest import mock
+
+import pytest
+
+from src.core.scan_cache import (
+    ScanCache,
+    file_identity,
+    get_database_version,
+    open_scan_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Provide an open ScanCache in a temporary directory."""
+    scan_cache = ScanCache(str(tmp_path / "cache" / "scan_cache.db"))
+    assert scan_cache.open("db-1")
+    yield scan_cache
+    scan_cache.close()
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Create a file to cache verdicts for."""
+    path = tmp_path / "sample.txt"
+    path.write_text("clean content")
+    return path
+
+
+class TestFileIdentity:
+    """Tests for file_identity()."""
+
+    def test_identity_fields(self, sample_file):
+        st = os.stat(sample_file)
+        assert file_identity(st) == (
+            st.st_dev,
+            st.st_ino,
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+        )
+
+
+class TestScanCache:
+    """Tests for ScanCache verdict storage."""
+
+    def test_unknown_file_is_not_clean(self, cache, sample_file):
+        assert cache.is_clean(os.stat(sample_file)) is False
+
+    def test_committed_file_is_clean(self, cache, sample_file):
+        cache.add_pending(str(sample_file), os.stat(sample_file))
+        assert cache.commit() == 1
+        assert cache.is_clean(os.stat(sample_file)) is True
+
+    def test_failed_paths_are_not_cached(self, cache, tmp_path, sample_file):
+        infected = tmp_path / "infected.bin"
+        infected.write_text("bad")
+        cache.add_pending(str(sample_file), os.stat(sample_file))
+        cache.add_pending(str(infected), os.stat(infected))
+
+        assert cache.commit([str(infected)]) == 1
+        assert cache.is_clean(os.stat(sample_file)) is True
+        assert cache.is_clean(os.stat(infected)) is False
+
+    def test_modified_file_is_not_clean(self, cache, sample_file):
+        cache.add_pending(str(sample_file), os.stat(sample_file))
+        cache.commit()
+
+        st = os.stat(sample_file)
+        os.utime(sample_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache.is_clean(os.stat(sample_file)) is False
+
+    def test_discard_drops_pending(self, cache, sample_file):
+        cache.add_pending(str(sample_file), os.stat(sample_file))
+        cache.discard()
+        assert cache.commit() == 0
+        assert cache.is_clean(os.stat(sample_file)) is False
+
+    def test_pending_is_flushed_in_batches(self, cache, tmp_path):
+        cache.PENDING_BATCH_SIZE = 2
+        files = []
+        for i in range(5):
+            path = tmp_path / f"f{i}"
+            path.write_text(str(i))
+            files.append(path)
+            cache.add_pending(str(path), os.stat(path))
+
+        assert cache.pending_count == 5
+        assert cache.commit() == 5
+        assert all(cache.is_clean(os.stat(f)) for f in files)
+
+    def test_verdicts_persist_across_instances(self, tmp_path, sample_file):
+        db_path = str(tmp_path / "scan_cache.db")
+        with ScanCache(db_path) as first:
+            first.open("db-1")
+            first.add_pending(str(sample_file), os.stat(sample_file))
+            first.commit()
+
+        with ScanCache(db_path) as second:
+            assert second.open("db-1")
+            assert second.is_clean(os.stat(sample_file)) is True
+
+    def test_database_update_invalidates_cache(self, tmp_path, sample_file):
+        db_path = str(tmp_path / "scan_cache.db")
+        with ScanCache(db_path) as first:
+            first.open("db-1")
+            first.add_pending(str(sample_file), os.stat(sample_file))
+            first.commit()
+
+        with ScanCache(db_path) as second:
+            assert second.open("db-2")
+            assert second.is_clean(os.stat(sample_file)) is False
+
+    def test_clear_removes_verdicts(self, cache, sample_file):
+        cache.add_pending(str(sample_file), os.stat(sample_file))
+        cache.commit()
+        assert cache.clear() is True
+        assert cache.is_clean(os.stat(sample_file)) is False
+
+    def test_closed_cache_is_inert(self, tmp_path, sample_file):
+        scan_cache = ScanCache(str(tmp_path / "scan_cache.db"))
+        scan_cache.add_pending(str(sample_file), os.stat(sample_file))
+        assert scan_cache.is_open is False
+        assert scan_cache.is_clean(os.stat(sample_file)) is False
+        assert scan_cache.commit() == 0
+
+    def test_database_file_permissions(self, cache):
+        mode = stat.S_IMODE(os.stat(cache.db_path).st_mode)
+        assert mode == ScanCache.DB_FILE_PERMISSIONS
+
+    def test_default_path_uses_xdg_data_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+        assert ScanCache().db_path == tmp_path / "clamui" / "scan_cache.db"
+
+    def test_open_fails_gracefully(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        scan_cache = ScanCache(str(blocker / "scan_cache.db"))
+        assert scan_cache.open("db-1") is False
+
+
+class TestGetDatabaseVersion:
+    """Tests for get_database_version()."""
+
+    def test_includes_database_files(self, tmp_path):
+        (tmp_path / "daily.cld").write_text("daily")
+        (tmp_path / "main.cvd").write_text("main")
+        (tmp_path / "freshclam.dat").write_text("ignored")
+
+        with mock.patch("src.core.scan_cache._DEFAULT_DATABASE_DIR", tmp_path):
+            version = get_database_version("ClamAV 1.0.0/27000")
+
+        assert version.startswith("ClamAV 1.0.0/27000|daily.cld:")
+        assert "main.cvd:" in version
+        assert "freshclam.dat" not in version
+
+    def test_changes_when_database_updates(self, tmp_path):
+        daily = tmp_path / "daily.cld"
+        daily.write_text("daily")
+
+        with mock.patch("src.core.scan_cache._DEFAULT_DATABASE_DIR", tmp_path):
+            before = get_database_version("ClamAV 1.0.0")
+            daily.write_text("daily updated")
+            after = get_database_version("ClamAV 1.0.0")
+
+        assert before != after
+
+    def test_none_without_any_information(self, tmp_path):
+        with mock.patch("src.core.scan_cache._DEFAULT_DATABASE_DIR", tmp_path / "missing"):
+            assert get_database_version(None) is None
+
+
+class TestOpenScanCache:
+    """Tests for open_scan_cache()."""
+
+    @pytest.fixture(autouse=True)
+    def data_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    def _settings(self, enabled=True):
+        settings = mock.MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            enabled if key == "scan_cache_enabled" else default
+        )
+        return settings
+
+    def test_opens_cache(self):
+        scan_cache = open_scan_cache(self._settings(), "db-1")
+        assert scan_cache is not None
+        assert scan_cache.is_open
+        scan_cache.close()
+
+    def test_force_full_scan_bypasses_cache(self):
+        assert open_scan_cache(self._settings(), "db-1", force_full_scan=True) is None
+
+    def test_disabled_setting(self):
+        assert open_scan_cache(self._settings(enabled=False), "db-1") is None
+
+    def test_requires_settings_and_version(self):
+        assert open_scan_cache(None, "db-1") is None
+        assert open_scan_cache(self._settings(), None) is None
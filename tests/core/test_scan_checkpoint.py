@@ -0,0 +1,393 @@
+# ClamUI Scan Checkpoint Tests
+"""Unit tests for resumable scans and their on-disk checkpoints."""
+
+import json
+import os
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import scan_checkpoint
+from src.core.clamd_client import ClamdAddress
+from src.core.scan_checkpoint import (
+    CheckpointTracker,
+    ScanCheckpoint,
+    discard_checkpoint,
+    find_checkpoint,
+    load_checkpoint,
+    open_checkpoint,
+)
+from src.core.scan_walker import ScanWalker
+from src.core.scanner_types import ScanResult, ScanStatus
+from tests.conftest import EICAR_STRING
+
+
+@pytest.fixture(autouse=True)
+def data_home(tmp_path, monkeypatch):
+    """Keep checkpoints in a temporary data directory."""
+    path = tmp_path / "data"
+    monkeypatch.setenv("XDG_DATA_HOME", str(path))
+    return path
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _result(**kwargs) -> ScanResult:
+    values = {
+        "status": ScanStatus.CLEAN,
+        "path": "/data",
+        "stdout": "",
+        "stderr": "",
+        "exit_code": 0,
+        "infected_files": [],
+        "scanned_files": 0,
+        "scanned_dirs": 0,
+        "infected_count": 0,
+        "error_message": None,
+        "threat_details": [],
+    }
+    values.update(kwargs)
+    return ScanResult(**values)
+
+
+def _walk(tracker, directory, files=(), subdirs=()):
+    """Report a directory to the tracker the way ScanWalker does."""
+    for name in files:
+        tracker.file_queued(f"{directory.rstrip('/')}/{name}", 10)
+    tracker.dir_listed(directory, [f"{directory.rstrip('/')}/{name}" for name in subdirs])
+
+
+class TestCheckpointTracker:
+    """Tests for tracking the scanned part of a walk."""
+
+    def test_partly_scanned_directory_keeps_its_files(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+        _walk(tracker, "/data", ["a", "b"])
+
+        tracker.file_done("/data/a")
+
+        checkpoint = tracker.snapshot()
+        assert checkpoint.completed_files == ["/data/a"]
+        assert checkpoint.completed_dirs == []
+        assert checkpoint.scanned_files == 1
+        assert checkpoint.scanned_bytes == 10
+        assert not tracker.finished
+
+    def test_complete_directory_replaces_its_entries(self):
+        tracker = CheckpointTracker("/data/", None, "db-1")
+        _walk(tracker, "/data/", ["top"], ["sub"])
+        _walk(tracker, "/data/sub", ["a", "b"], ["inner"])
+        _walk(tracker, "/data/sub/inner", ["c"])
+
+        for path in ("/data/sub/a", "/data/sub/inner/c"):
+            tracker.file_done(path)
+        checkpoint = tracker.snapshot()
+        assert checkpoint.completed_dirs == ["/data/sub/inner"]
+        assert checkpoint.completed_files == ["/data/sub/a"]
+        tracker.file_done("/data/sub/b")
+
+        checkpoint = tracker.snapshot()
+        assert checkpoint.completed_dirs == ["/data/sub"]
+        assert checkpoint.completed_files == []
+        assert checkpoint.scanned_dirs == 3
+        assert not tracker.finished
+
+    def test_file_done_before_listing_finished(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+        tracker.file_queued("/data/a", 1)
+        tracker.file_done("/data/a")
+        assert not tracker.finished
+
+        tracker.dir_listed("/data", [])
+
+        assert tracker.finished
+
+    def test_whole_tree_finishes(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+        _walk(tracker, "/data", ["a"], ["sub"])
+        _walk(tracker, "/data/sub")
+
+        tracker.file_done("/data/a")
+
+        assert tracker.finished
+
+    def test_unqueued_files_are_ignored(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+        _walk(tracker, "/data", ["a"])
+
+        tracker.file_done("/data/unknown", "Eicar")
+
+        assert tracker.snapshot().scanned_files == 0
+
+    def test_threats_recorded(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+        _walk(tracker, "/data", ["bad", "other"])
+
+        tracker.file_done("/data/bad", "Eicar-Test-Signature")
+
+        assert tracker.snapshot().threats == [("/data/bad", "Eicar-Test-Signature")]
+
+    def test_checkpoint_written_after_interval(self):
+        clock = FakeClock()
+        tracker = CheckpointTracker("/data", None, "db-1", interval=30, clock=clock)
+        _walk(tracker, "/data", ["a", "b", "c"])
+
+        tracker.file_done("/data/a")
+        assert find_checkpoint("/data") is None
+
+        clock.now += 31
+        tracker.file_done("/data/b")
+        assert find_checkpoint("/data").scanned_files == 2
+
+    def test_resumed_totals_include_previous_runs(self):
+        previous = ScanCheckpoint(
+            path="/data",
+            db_version="db-1",
+            completed_files=["/data/a"],
+            scanned_files=5,
+            scanned_dirs=2,
+            scanned_bytes=50,
+            threats=[("/data/old", "Eicar")],
+            duration=12.0,
+        )
+        tracker = CheckpointTracker("/data", None, "db-1", previous, duration=lambda: 3.0)
+        _walk(tracker, "/data", ["b", "c"])
+        tracker.file_done("/data/b", "Trojan")
+
+        checkpoint = tracker.snapshot()
+
+        assert checkpoint.completed_files == ["/data/a", "/data/b"]
+        assert checkpoint.scanned_files == 6
+        assert checkpoint.scanned_bytes == 60
+        assert checkpoint.threats == [("/data/old", "Eicar"), ("/data/b", "Trojan")]
+        assert checkpoint.duration == 15.0
+        assert tracker.previous_duration == 12.0
+
+
+class TestCheckpointFiles:
+    """Tests for writing, finding and discarding checkpoints."""
+
+    def test_round_trip(self, data_home):
+        tracker = CheckpointTracker("/data", {"patterns": ["*.iso"]}, "db-1")
+        _walk(tracker, "/data", ["a", "b"])
+        tracker.file_done("/data/a", "Eicar")
+
+        assert tracker.save() is True
+
+        checkpoint = load_checkpoint("/data", {"patterns": ["*.iso"]}, "db-1")
+        assert checkpoint.completed_files == ["/data/a"]
+        assert checkpoint.threats == [("/data/a", "Eicar")]
+        files = list((data_home / "clamui" / "checkpoints").iterdir())
+        assert len(files) == 1
+        assert stat.S_IMODE(files[0].stat().st_mode) == 0o600
+
+    def test_profile_must_match(self):
+        CheckpointTracker("/data", {"patterns": ["*.iso"]}, "db-1").save()
+
+        assert find_checkpoint("/data") is None
+        assert find_checkpoint("/other", {"patterns": ["*.iso"]}) is None
+
+    def test_database_must_match(self):
+        CheckpointTracker("/data", None, "db-1").save()
+
+        assert load_checkpoint("/data", None, "db-2") is None
+        assert find_checkpoint("/data") is not None
+
+    def test_invalid_checkpoint_ignored(self, data_home):
+        CheckpointTracker("/data", None, "db-1").save()
+        checkpoint_file = next((data_home / "clamui" / "checkpoints").iterdir())
+        checkpoint_file.write_text(json.dumps({"version": 99}))
+
+        assert find_checkpoint("/data") is None
+
+    def test_discard(self):
+        CheckpointTracker("/data", None, "db-1").save()
+
+        discard_checkpoint("/data")
+
+        assert find_checkpoint("/data") is None
+
+    def test_finish_keeps_checkpoint_of_interrupted_scan(self):
+        tracker = CheckpointTracker("/data", None, "db-1")
+
+        tracker.finish(_result(status=ScanStatus.CANCELLED), completed=False)
+        assert find_checkpoint("/data") is not None
+
+        tracker.finish(_result(), completed=True)
+        assert find_checkpoint("/data") is None
+
+
+class TestOpenCheckpoint:
+    """Tests for open_checkpoint()."""
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: default
+        return settings
+
+    def test_directory_scans_only(self, settings, tmp_path):
+        target = tmp_path / "file.txt"
+        target.write_text("x")
+
+        assert open_checkpoint(settings, str(tmp_path), None, "db-1") is not None
+        assert open_checkpoint(settings, str(target), None, "db-1") is None
+        assert open_checkpoint(settings, str(tmp_path), None, None) is None
+        assert open_checkpoint(None, str(tmp_path), None, "db-1") is None
+
+    def test_disabled_by_setting(self, tmp_path):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key == "scan_checkpoints_enabled" else default
+        )
+
+        assert open_checkpoint(settings, str(tmp_path), None, "db-1") is None
+
+    def test_resume_loads_matching_checkpoint(self, settings, tmp_path):
+        CheckpointTracker(str(tmp_path), None, "db-1").save()
+
+        assert open_checkpoint(settings, str(tmp_path), None, "db-1").previous is None
+        assert open_checkpoint(settings, str(tmp_path), None, "db-1", resume=True).previous
+
+
+class TestMergeInto:
+    """Tests for ScanCheckpoint.merge_into()."""
+
+    def test_earlier_threats_make_result_infected(self):
+        checkpoint = ScanCheckpoint(
+            path="/data",
+            db_version="db-1",
+            scanned_files=10,
+            scanned_dirs=3,
+            scanned_bytes=100,
+            threats=[("/data/bad", "Eicar-Test-Signature")],
+        )
+        result = _result(scanned_files=2, scanned_dirs=1, scanned_bytes=20)
+
+        checkpoint.merge_into(result)
+
+        assert result.status == ScanStatus.INFECTED
+        assert result.exit_code == 1
+        assert result.scanned_files == 12
+        assert result.scanned_dirs == 4
+        assert result.scanned_bytes == 120
+        assert result.infected_files == ["/data/bad"]
+        assert result.infected_count == 1
+        assert result.threat_details[0].threat_name == "Eicar-Test-Signature"
+
+
+class TestWalkerResume:
+    """Tests for ScanWalker skipping what a checkpoint covers."""
+
+    def test_scanned_entries_are_skipped(self, tmp_path):
+        (tmp_path / "done").mkdir()
+        (tmp_path / "done" / "a.txt").write_text("a")
+        (tmp_path / "todo").mkdir()
+        (tmp_path / "todo" / "b.txt").write_text("b")
+        (tmp_path / "c.txt").write_text("c")
+        (tmp_path / "d.txt").write_text("d")
+        previous = ScanCheckpoint(
+            path=str(tmp_path),
+            db_version="db-1",
+            completed_dirs=[str(tmp_path / "done")],
+            completed_files=[str(tmp_path / "c.txt")],
+        )
+        tracker = CheckpointTracker(str(tmp_path), None, "db-1", previous)
+
+        walked = sorted(ScanWalker(str(tmp_path), checkpoint=tracker))
+
+        assert walked == [str(tmp_path / "d.txt"), str(tmp_path / "todo" / "b.txt")]
+
+    def test_walk_reports_to_checkpoint(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        tracker = CheckpointTracker(str(tmp_path), None, "db-1")
+
+        for path in ScanWalker(str(tmp_path), checkpoint=tracker):
+            if path.endswith("a.txt"):
+                tracker.file_done(path)
+
+        checkpoint = tracker.snapshot()
+        assert checkpoint.completed_dirs == [str(tmp_path / "sub")]
+        assert checkpoint.completed_files == []
+
+
+class TestDaemonScannerResume:
+    """Tests for resuming a native clamd scan from its checkpoint."""
+
+    @pytest.fixture
+    def scanner(self, fake_clamd):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key == "scan_cache_enabled" else default
+        )
+        log_manager = MagicMock()
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+        with patch.object(daemon_scanner_module, "resolve_clamd_address", return_value=address):
+            yield daemon_scanner_module.DaemonScanner(
+                log_manager=log_manager, settings_manager=settings
+            )
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        for index in range(20):
+            (root / f"clean{index}.txt").write_text("clean")
+        (root / "sub" / "eicar.com").write_text(EICAR_STRING)
+        (root / "sub" / "clean.txt").write_text("clean")
+        return root
+
+    def _interrupt(self, scanner, scan_tree):
+        """Scan until the first progress event, then cancel."""
+        result = scanner.scan_sync(
+            str(scan_tree), progress_callback=lambda _progress: scanner.cancel()
+        )
+        assert result.status == ScanStatus.CANCELLED
+        return result
+
+    def test_resumed_scan_sends_only_the_rest(self, scanner, scan_tree, fake_clamd):
+        first = self._interrupt(scanner, scan_tree)
+        assert find_checkpoint(str(scan_tree)).scanned_files == first.scanned_files
+        fake_clamd.commands.clear()
+
+        result = scanner.scan_sync(str(scan_tree), resume=True)
+
+        assert fake_clamd.commands.count("zFILDES") == 22 - first.scanned_files
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 22
+        assert result.infected_files == [str(scan_tree / "sub" / "eicar.com")]
+        assert find_checkpoint(str(scan_tree)) is None
+        logged = scanner._log_manager.save_log.call_args[0][0]
+        assert logged.status == "infected"
+
+    def test_without_resume_scan_starts_over(self, scanner, scan_tree):
+        self._interrupt(scanner, scan_tree)
+
+        result = scanner.scan_sync(str(scan_tree))
+
+        assert result.scanned_files == 22
+        assert find_checkpoint(str(scan_tree)) is None
+
+    def test_changed_database_scans_everything(self, scanner, scan_tree):
+        self._interrupt(scanner, scan_tree)
+        checkpoint_file = next(scan_checkpoint.get_checkpoint_dir().iterdir())
+        data = json.loads(checkpoint_file.read_text())
+        data["db_version"] = "clamd:older"
+        checkpoint_file.write_text(json.dumps(data))
+
+        result = scanner.scan_sync(str(scan_tree), resume=True)
+
+        assert result.scanned_files == 22
+        assert os.listdir(scan_checkpoint.get_checkpoint_dir()) == []
@@ -0,0 +1,238 @@
+# ClamUI Scan Dedup Tests
+"""Unit tests for hardlink and content deduplication during scans."""
+
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import scan_dedup
+from src.core.clamd_client import ClamdAddress
+from src.core.log_manager import LogEntry
+from src.core.result_formatters import format_results_as_csv
+from src.core.scan_dedup import FileDedup, open_file_dedup
+from src.core.scan_walker import ScanWalker
+from src.core.scanner_types import ScanResult, ScanStatus, ThreatDetail
+from tests.conftest import EICAR_STRING
+
+
+def walk(path, dedup):
+    """Walk path and return the yielded files, sorted."""
+    return sorted(ScanWalker(str(path), dedup=dedup))
+
+
+@pytest.fixture
+def linked_tree(tmp_path):
+    """A tree holding one file under three hardlinked paths."""
+    root = tmp_path / "tree"
+    (root / "backup").mkdir(parents=True)
+    original = root / "data.bin"
+    original.write_text("payload")
+    os.link(original, root / "backup" / "data.bin")
+    os.link(original, root / "copy.bin")
+    (root / "other.txt").write_text("other")
+    return root
+
+
+class TestHardlinks:
+    """Tests for scanning each inode once."""
+
+    def test_inode_is_walked_once(self, linked_tree):
+        dedup = FileDedup()
+
+        files = walk(linked_tree, dedup)
+
+        linked = [path for path in files if path.endswith(".bin")]
+        assert len(linked) == 1
+        assert len(files) == 2
+        assert dedup.alias_count == 2
+        assert len(dedup.aliases_of(linked[0])) == 2
+
+    def test_walker_counts_exclude_aliases(self, linked_tree):
+        walker = ScanWalker(str(linked_tree), dedup=FileDedup())
+
+        walker.count()
+
+        assert walker.files_found == 2
+        assert walker.bytes_found == len("payload") + len("other")
+
+    def test_without_dedup_every_path_is_walked(self, linked_tree):
+        assert len(walk(linked_tree, None)) == 4
+
+    def test_hardlinks_disabled(self, linked_tree):
+        assert len(walk(linked_tree, FileDedup(hardlinks=False))) == 4
+
+
+class TestContent:
+    """Tests for scanning identical content once."""
+
+    def test_identical_files_are_walked_once(self, tmp_path):
+        for name in ("a", "b", "c"):
+            (tmp_path / name).write_text("same content")
+        (tmp_path / "d").write_text("diff content")
+        dedup = FileDedup(content=True)
+
+        files = walk(tmp_path, dedup)
+
+        assert len(files) == 2
+        assert dedup.alias_count == 2
+
+    def test_unique_sizes_are_not_hashed(self, tmp_path):
+        (tmp_path / "a").write_text("short")
+        (tmp_path / "b").write_text("a little longer")
+
+        with patch.object(scan_dedup, "content_digest") as digest:
+            files = walk(tmp_path, FileDedup(content=True))
+
+        assert len(files) == 2
+        digest.assert_not_called()
+
+    def test_large_and_empty_files_are_not_compared(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.big").write_text("x" * 64)
+            (tmp_path / f"{name}.empty").write_text("")
+
+        with patch.object(scan_dedup, "CONTENT_MAX_SIZE", 32):
+            files = walk(tmp_path, FileDedup(content=True))
+
+        assert len(files) == 4
+
+    def test_hashing_does_not_block_other_walks(self, tmp_path):
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / name).write_text("same size" if name < "c" else "othersize")
+        dedup = FileDedup(content=True)
+        hashing = threading.Event()
+        release = threading.Event()
+        real_digest = scan_dedup.content_digest
+
+        def slow_digest(path):
+            if path.endswith("b"):
+                hashing.set()
+                release.wait(timeout=5)
+            return real_digest(path)
+
+        def check(name):
+            path = str(tmp_path / name)
+            return dedup.primary_for(path, os.lstat(path))
+
+        with patch.object(scan_dedup, "content_digest", side_effect=slow_digest):
+            check("a")
+            thread = threading.Thread(target=check, args=("b",))
+            thread.start()
+            assert hashing.wait(timeout=5)
+            check("c")
+            assert check("d") == str(tmp_path / "c")
+            release.set()
+            thread.join(timeout=5)
+
+        assert dedup.aliases_of(str(tmp_path / "a")) == [str(tmp_path / "b")]
+
+
+class TestResults:
+    """Tests for applying verdicts to aliases."""
+
+    def _result(self, path):
+        return ScanResult(
+            status=ScanStatus.INFECTED,
+            path="/",
+            stdout="",
+            stderr="",
+            exit_code=1,
+            infected_files=[path],
+            scanned_files=1,
+            scanned_dirs=0,
+            infected_count=1,
+            error_message=None,
+            threat_details=[ThreatDetail(path, "Eicar-Signature", "Test", "low")],
+        )
+
+    def test_add_aliases(self, linked_tree):
+        dedup = FileDedup()
+        primary = [path for path in walk(linked_tree, dedup) if path.endswith(".bin")][0]
+        result = self._result(primary)
+
+        dedup.add_aliases(result)
+
+        assert len(result.threat_details[0].aliases) == 2
+        assert result.duplicate_count == 2
+
+    def test_csv_lists_aliases(self):
+        result = self._result("/a")
+        result.threat_details[0].aliases = ["/b"]
+
+        rows = format_results_as_csv(result, timestamp="now").splitlines()
+
+        assert rows[1:] == ["/a,Eicar-Signature,Test,low,now", "/b,Eicar-Signature,Test,low,now"]
+
+    def test_log_details(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="infected",
+            path="/srv",
+            duration=1.0,
+            scanned_files=3,
+            infected_count=1,
+            threat_details=[
+                {"file_path": "/srv/a", "threat_name": "Eicar-Signature", "aliases": ["/srv/b"]}
+            ],
+            duplicate_files=1,
+        )
+
+        assert entry.details == (
+            "Scanned: 3 files, 0 directories\n"
+            "Duplicates of scanned files: 1 files\n"
+            "Threats found: 1\n"
+            "  - /srv/a: Eicar-Signature\n"
+            "    also at /srv/b"
+        )
+
+
+class TestOpenFileDedup:
+    """Tests for open_file_dedup."""
+
+    def _settings(self, **values):
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+        return settings
+
+    def test_hardlinks_by_default(self):
+        assert open_file_dedup(self._settings()) is not None
+        assert open_file_dedup(None) is not None
+
+    def test_disabled(self):
+        assert open_file_dedup(self._settings(scan_dedup_hardlinks=False)) is None
+        assert (
+            open_file_dedup(self._settings(scan_dedup_hardlinks=False, scan_dedup_content=True))
+            is not None
+        )
+
+
+class TestDaemonScan:
+    """Tests for a native clamd scan of hardlinked malware."""
+
+    def test_threat_lists_aliases(self, fake_clamd, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        (root / "eicar.com").write_text(EICAR_STRING)
+        os.link(root / "eicar.com", root / "eicar-link.com")
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key in ("scan_cache_enabled", "scan_checkpoints_enabled") else default
+        )
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+
+        with patch.object(daemon_scanner_module, "resolve_clamd_address", return_value=address):
+            scanner = daemon_scanner_module.DaemonScanner(
+                log_manager=MagicMock(), settings_manager=settings
+            )
+            result = scanner.scan_sync(str(root))
+
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 1
+        assert result.duplicate_count == 1
+        (threat,) = result.threat_details
+        assert {threat.file_path, *threat.aliases} == {
+            str(root / "eicar.com"),
+            str(root / "eicar-link.com"),
+        }
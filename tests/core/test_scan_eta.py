@@ -0,0 +1,150 @@
+# ClamUI Scan ETA Tests
+"""Unit tests for scan time-remaining estimates."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.log_manager import LogEntry
+from src.core.scan_eta import (
+    MIN_HISTORY_BYTES,
+    ScanEtaEstimator,
+    format_eta,
+    historical_throughput,
+)
+
+
+def _scan_log(scanned_bytes, duration, backend="daemon", status="clean"):
+    """Create a scan log entry with the fields used for throughput history."""
+    return LogEntry.create(
+        log_type="scan",
+        status=status,
+        summary="Scan",
+        details="",
+        duration=duration,
+        scanned_bytes=scanned_bytes,
+        backend=backend,
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHistoricalThroughput:
+    """Tests for the typical throughput of past scans."""
+
+    def test_median_of_matching_scans(self):
+        size = MIN_HISTORY_BYTES
+        log_manager = MagicMock()
+        log_manager.get_logs.return_value = [
+            _scan_log(size, 1.0),
+            _scan_log(size, 2.0, status="infected"),
+            _scan_log(size, 4.0),
+            _scan_log(size, 0.1, backend="clamscan"),
+            _scan_log(size, 0.1, status="error"),
+        ]
+
+        assert historical_throughput(log_manager, "daemon") == size / 2.0
+        log_manager.get_logs.assert_called_once_with(limit=50, log_type="scan", with_details=False)
+
+    def test_ignores_small_and_short_scans(self):
+        log_manager = MagicMock()
+        log_manager.get_logs.return_value = [
+            _scan_log(MIN_HISTORY_BYTES - 1, 10.0),
+            _scan_log(MIN_HISTORY_BYTES, 0.5),
+            _scan_log(0, 10.0),
+        ]
+
+        assert historical_throughput(log_manager, "daemon") is None
+
+    def test_unreadable_logs(self):
+        log_manager = MagicMock()
+        log_manager.get_logs.side_effect = OSError("disk error")
+
+        assert historical_throughput(log_manager, "daemon") is None
+
+
+class TestScanEtaEstimator:
+    """Tests for blending live and historical throughput."""
+
+    def test_unknown_total(self):
+        assert ScanEtaEstimator(1000.0).estimate(0, None) is None
+
+    def test_historical_rate_before_live_measurement(self):
+        clock = FakeClock()
+        estimator = ScanEtaEstimator(1000.0, clock=clock)
+
+        assert estimator.estimate(0, 10_000) == pytest.approx(10.0)
+
+    def test_no_estimate_without_history_until_measured(self):
+        clock = FakeClock()
+        estimator = ScanEtaEstimator(clock=clock)
+
+        assert estimator.estimate(0, 10_000) is None
+        clock.now += 1.0
+        assert estimator.estimate(500, 10_000) is None
+        clock.now += 1.0
+        # 1000 bytes in 2 seconds
+        assert estimator.estimate(1000, 10_000) == pytest.approx(18.0)
+
+    def test_live_rate_takes_over(self):
+        clock = FakeClock()
+        estimator = ScanEtaEstimator(1000.0, clock=clock)
+        estimator.estimate(0, 10_000)
+
+        # A tenth done: weight 0.4 on the live rate of 250 bytes/s
+        clock.now += 4.0
+        assert estimator.estimate(1000, 10_000) == pytest.approx(9000 / 700)
+
+        # Past LIVE_WEIGHT_FRACTION only the live rate counts
+        clock.now += 6.0
+        assert estimator.estimate(5000, 10_000) == pytest.approx(10.0)
+
+    def test_cached_bytes_do_not_inflate_live_rate(self):
+        clock = FakeClock()
+        estimator = ScanEtaEstimator(clock=clock)
+
+        # Half the bytes were skipped through the scan cache before the first sample
+        estimator.estimate(5000, 10_000)
+        clock.now += 2.0
+        assert estimator.estimate(6000, 10_000) == pytest.approx(8.0)
+
+    def test_paused_time_not_counted(self):
+        clock = FakeClock()
+        estimator = ScanEtaEstimator(clock=clock)
+        estimator.estimate(0, 10_000)
+
+        clock.now += 1.0
+        estimator.pause()
+        clock.now += 60.0
+        estimator.resume()
+        clock.now += 1.0
+
+        # 1000 bytes in the 2 seconds not paused
+        assert estimator.estimate(1000, 10_000) == pytest.approx(18.0)
+
+    def test_finished(self):
+        assert ScanEtaEstimator().estimate(10_000, 10_000) == 0.0
+
+
+class TestFormatEta:
+    """Tests for displaying the time left."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (10, "less than a minute left"),
+            (60, "about 1 minute left"),
+            (600, "about 10 minutes left"),
+            (3600 + 25 * 60, "about 1 h 25 min left"),
+        ],
+    )
+    def test_format(self, seconds, expected):
+        assert format_eta(seconds) == expected
@@ -0,0 +1,296 @@
+# ClamUI Scan Executor Tests
+"""Unit tests for parallel multi-target scanning."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.scan_executor import (
+    CLAMSCAN_MEMORY_BYTES,
+    CombinedProgress,
+    MultiTargetScan,
+    group_by_device,
+)
+from src.core.scanner_types import ScanProgress, ScanResult, ScanStatus
+
+
+def _result(path, files=1, status=ScanStatus.CLEAN):
+    """Create a scan result for one target."""
+    return ScanResult(
+        status=status,
+        path=path,
+        stdout="",
+        stderr="",
+        exit_code=0,
+        infected_files=[],
+        scanned_files=files,
+        scanned_dirs=0,
+        infected_count=0,
+        error_message=None,
+        threat_details=[],
+    )
+
+
+class FakeScanner:
+    """Scanner recording its scans; scan_sync may block until released."""
+
+    def __init__(self, backend="daemon", block=None):
+        self.backend = backend
+        self.block = block
+        self.scanned: list[str] = []
+        self.workers: list[FakeScanner] = []
+        self.pool_shares = 1
+        self.cancel_calls = 0
+        self.is_paused = False
+        self._cancelled = threading.Event()
+
+    def get_active_backend(self):
+        return self.backend
+
+    def create_worker(self, pool_shares=1):
+        worker = FakeScanner(self.backend, self.block)
+        worker.pool_shares = pool_shares
+        self.workers.append(worker)
+        return worker
+
+    def scan_sync(self, path, recursive=True, progress_callback=None, **kwargs):
+        self.scanned.append(path)
+        if progress_callback is not None:
+            progress_callback(ScanProgress(path, 1, 2, 0, bytes_scanned=10, bytes_total=20))
+        if self.block is not None:
+            while not self.block.is_set():
+                if self._cancelled.wait(0.01):
+                    return _result(path, status=ScanStatus.CANCELLED)
+        return _result(path)
+
+    def cancel(self):
+        self.cancel_calls += 1
+        self._cancelled.set()
+
+    def pause(self):
+        self.is_paused = True
+
+    def resume(self):
+        self.is_paused = False
+
+
+@pytest.fixture
+def separate_devices():
+    """Put every target on its own device."""
+    with patch(
+        "src.core.scan_executor.group_by_device",
+        side_effect=lambda targets: [[i] for i in range(len(targets))],
+    ):
+        yield
+
+
+class TestGroupByDevice:
+    """Tests for grouping targets into per-device lanes."""
+
+    def test_same_device_shares_a_lane(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        assert group_by_device([str(tmp_path / "a"), str(tmp_path / "b")]) == [[0, 1]]
+
+    def test_devices_in_order_of_appearance(self):
+        devices = {"/a": 1, "/b": 2, "/c": 1}
+        with patch(
+            "src.core.scan_executor.os.stat",
+            side_effect=lambda path: MagicMock(st_dev=devices[path]),
+        ):
+            assert group_by_device(["/a", "/b", "/c"]) == [[0, 2], [1]]
+
+    def test_missing_targets_grouped_together(self):
+        assert group_by_device(["/nonexistent/a", "/nonexistent/b"]) == [[0, 1]]
+
+
+class TestSequentialScan:
+    """Tests for targets scanned one after another on the caller's scanner."""
+
+    def test_scans_in_order_with_a_callback_per_target(self, tmp_path):
+        targets = [str(tmp_path), str(tmp_path)]
+        scanner = FakeScanner()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        started = []
+
+        scan = MultiTargetScan(scanner, targets)
+        results = scan.run(factory, lambda index, target: started.append(index))
+
+        assert scan.parallel is False
+        assert scanner.scanned == targets
+        assert scanner.workers == []
+        assert factory.call_count == 2
+        assert started == [0, 1]
+        assert [target for target, _result in results] == targets
+
+    def test_cancel_skips_remaining_targets(self):
+        cancelled = False
+        scanner = FakeScanner()
+
+        def on_finished(index, target, result):
+            nonlocal cancelled
+            cancelled = True
+
+        scan = MultiTargetScan(scanner, ["/a", "/b"], is_cancelled=lambda: cancelled)
+        results = scan.run(on_target_finished=on_finished)
+
+        assert len(results) == 1
+        assert scanner.scanned == ["/a"]
+
+    def test_scan_options_passed_through(self):
+        scanner = MagicMock()
+        scanner.scan_sync.return_value = _result("/a")
+
+        MultiTargetScan(scanner, ["/a"], force_full_scan=True).run()
+
+        scanner.scan_sync.assert_called_once_with(
+            "/a", recursive=True, progress_callback=None, force_full_scan=True
+        )
+
+
+class TestParallelScan:
+    """Tests for targets on different devices scanned side by side."""
+
+    def test_workers_share_the_pool(self, separate_devices):
+        scanner = FakeScanner()
+        events = []
+
+        scan = MultiTargetScan(scanner, ["/a", "/b", "/c"])
+        results = scan.run(lambda: events.append)
+
+        assert scan.workers == 3
+        assert [target for target, _result in results] == ["/a", "/b", "/c"]
+        assert scanner.scanned == []
+        assert [w.pool_shares for w in scanner.workers] == [3, 3, 3]
+        assert sorted(p for w in scanner.workers for p in w.scanned) == ["/a", "/b", "/c"]
+        # The merged progress ends with every target complete
+        assert events[-1].files_scanned == 6
+        assert events[-1].percentage == 100.0
+
+    def test_setting_limits_workers(self, separate_devices):
+        settings = MagicMock()
+        settings.get.return_value = 2
+
+        scan = MultiTargetScan(FakeScanner(), ["/a", "/b", "/c"], settings)
+        scan.run()
+
+        assert scan.workers == 2
+
+    def test_setting_of_one_scans_sequentially(self, separate_devices):
+        settings = MagicMock()
+        settings.get.return_value = 1
+
+        assert MultiTargetScan(FakeScanner(), ["/a", "/b"], settings).parallel is False
+
+    def test_clamscan_limited_by_memory(self, separate_devices):
+        with patch(
+            "src.core.scan_executor.get_available_memory",
+            return_value=2 * CLAMSCAN_MEMORY_BYTES + 1,
+        ):
+            scan = MultiTargetScan(FakeScanner("clamscan"), ["/a", "/b", "/c", "/d"])
+
+        assert scan.workers == 2
+
+    def test_clamscan_without_memory_info_is_sequential(self, separate_devices):
+        with patch("src.core.scan_executor.get_available_memory", return_value=None):
+            scan = MultiTargetScan(FakeScanner("clamscan"), ["/a", "/b"])
+
+        assert scan.parallel is False
+
+    def test_cancel_all_cancels_every_worker(self, separate_devices):
+        block = threading.Event()
+        scanner = FakeScanner(block=block)
+        cancel = threading.Event()
+
+        def on_started(index, target):
+            if index == 1:
+                cancel.set()
+
+        settings = MagicMock()
+        settings.get.return_value = 2
+        scan = MultiTargetScan(scanner, ["/a", "/b", "/c"], settings, cancel.is_set)
+        results = scan.run(on_target_started=on_started)
+
+        assert all(result.status == ScanStatus.CANCELLED for _target, result in results)
+        assert "/c" not in [target for target, _result in results]
+        assert all(worker.cancel_calls > 0 for worker in scanner.workers)
+
+    def test_pause_is_passed_to_workers(self, separate_devices):
+        block = threading.Event()
+        scanner = FakeScanner(block=block)
+        seen = []
+
+        def on_started(index, target):
+            scanner.pause()
+
+        def watch():
+            while len(scanner.workers) < 2 or not all(w.is_paused for w in scanner.workers):
+                time.sleep(0.01)
+            seen.append("paused")
+            scanner.resume()
+            while any(w.is_paused for w in scanner.workers):
+                time.sleep(0.01)
+            seen.append("resumed")
+            block.set()
+
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        MultiTargetScan(scanner, ["/a", "/b"]).run(on_target_started=on_started)
+        watcher.join(5)
+
+        assert seen == ["paused", "resumed"]
+
+    def test_worker_error_is_raised(self, separate_devices):
+        scanner = FakeScanner()
+        scanner.create_worker = MagicMock(return_value=MagicMock())
+        scanner.create_worker.return_value.scan_sync.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            MultiTargetScan(scanner, ["/a", "/b"]).run()
+
+
+class TestCombinedProgress:
+    """Tests for merging the progress of parallel targets."""
+
+    def test_totals_are_estimates_until_every_target_reports(self):
+        events = []
+        combined = CombinedProgress(events.append, 2)
+
+        combined.for_target(0)(ScanProgress("/a/1", 1, 4, 1, new_infected_files=["/a/1"]))
+        assert events[-1].total_is_estimate is True
+        assert events[-1].new_infected_files == ["/a/1"]
+
+        combined.for_target(1)(ScanProgress("/b/1", 2, 4, 0))
+        assert events[-1].percentage == pytest.approx(37.5)
+        assert events[-1].infected_count == 1
+        assert events[-1].new_infected_files == []
+
+    def test_finished_target_without_events(self):
+        events = []
+        combined = CombinedProgress(events.append, 2)
+
+        combined.for_target(0)(ScanProgress("/a/1", 1, 2, 0))
+        combined.target_finished(1, _result("/b", files=0, status=ScanStatus.ERROR))
+
+        assert events[-1].total_is_estimate is False
+        assert events[-1].percentage == 50.0
+
+    def test_finished_target_reports_unsent_infections(self):
+        events = []
+        combined = CombinedProgress(events.append, 2)
+        early = _result("/a", files=1, status=ScanStatus.INFECTED)
+        early.infected_files, early.infected_count = ["/a/1"], 1
+        late = _result("/b", files=2, status=ScanStatus.INFECTED)
+        late.infected_files, late.infected_count = ["/b/1", "/b/2"], 2
+
+        combined.target_finished(0, early)
+        assert events[-1].infected_count == 1
+        assert events[-1].new_infected_files == ["/a/1"]
+
+        combined.for_target(1)(ScanProgress("/b/1", 1, 2, 1, new_infected_files=["/b/1"]))
+        combined.target_finished(1, late)
+
+        assert events[-1].infected_count == 3
+        assert events[-1].new_infected_files == ["/b/2"]
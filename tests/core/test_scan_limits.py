@@ -0,0 +1,173 @@
+# ClamUI Scan Limits Tests
+"""Unit tests for per-profile scan resource limits."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import scanner as scanner_module
+from src.core.clamd_client import ClamdAddress
+from src.core.log_manager import LogEntry
+from src.core.scan_limits import MIB, ScanLimits, open_scan_limits
+from src.core.scan_walker import ScanWalker
+from src.core.scanner_types import ScanStatus
+from tests.conftest import EICAR_STRING
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A tree two folders deep with files of several types and sizes."""
+    root = tmp_path / "tree"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "setup.exe").write_bytes(b"MZ" + b"\0" * 30)
+    (root / "big.exe").write_bytes(b"\0" * (MIB + 1))
+    (root / "notes.txt").write_text("notes")
+    (root / "a" / "tool.exe").write_bytes(b"MZ")
+    (root / "a" / "b" / "deep.exe").write_bytes(b"MZ")
+    return root
+
+
+class TestSchema:
+    """Tests for reading and writing the "limits" option."""
+
+    def test_round_trip(self):
+        options = {
+            "max_filesize": 50,
+            "max_recursion": 4,
+            "include_types": ["*.exe", "*.pdf"],
+            "scan_pdf": False,
+            "temp_dir": "/var/tmp",
+        }
+
+        limits = ScanLimits.from_options(options)
+
+        assert limits.include_types == ("*.exe", "*.pdf")
+        assert limits.to_options() == options
+
+    def test_empty(self):
+        assert not ScanLimits.from_options(None)
+        assert not ScanLimits.from_options({})
+        assert ScanLimits().to_options() == {}
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            ["max_filesize"],
+            {"max_filesize": -1},
+            {"max_files": True},
+            {"max_scansize": 1.5},
+            {"scan_archive": "no"},
+            {"include_types": "*.exe"},
+            {"include_types": ["*.exe", ""]},
+            {"temp_dir": ""},
+            {"max_depth": 3},
+        ],
+    )
+    def test_invalid(self, options):
+        with pytest.raises(ValueError):
+            ScanLimits.from_options(options)
+
+        assert open_scan_limits(options) is None
+
+    def test_narrows_scan(self):
+        assert not ScanLimits(
+            max_filesize=10, max_dir_depth=2, include_types=("*.exe",)
+        ).narrows_scan
+        assert ScanLimits(max_scansize=10).narrows_scan
+        assert ScanLimits(scan_ole2=False).narrows_scan
+
+
+class TestClamscan:
+    """Tests for passing limits to clamscan."""
+
+    def test_clamscan_args(self):
+        limits = ScanLimits(
+            max_filesize=50,
+            max_scansize=200,
+            max_recursion=4,
+            max_files=1000,
+            max_dir_depth=3,
+            include_types=("*.exe",),
+            scan_archive=False,
+            temp_dir="/var/tmp",
+        )
+
+        assert limits.clamscan_args() == [
+            "--max-filesize=50M",
+            "--max-scansize=200M",
+            "--max-recursion=4",
+            "--max-files=1000",
+            "--max-dir-recursion=3",
+            "--include=^.*\\.exe$",
+            "--scan-archive=no",
+            "--tempdir=/var/tmp",
+        ]
+
+    def test_build_command(self, tmp_path):
+        scanner = scanner_module.Scanner(log_manager=MagicMock())
+
+        with (
+            patch.object(scanner_module, "get_clamav_path", return_value="/usr/bin/clamscan"),
+            patch.object(scanner_module, "wrap_host_command", side_effect=lambda cmd: cmd),
+        ):
+            cmd = scanner._build_command(
+                str(tmp_path), recursive=True, limits=ScanLimits(scan_pdf=False)
+            )
+
+        assert cmd[-2:] == ["--scan-pdf=no", str(tmp_path)]
+
+
+class TestWalk:
+    """Tests for applying limits while walking."""
+
+    def test_depth_size_and_types(self, tree):
+        limits = ScanLimits(max_filesize=1, max_dir_depth=1, include_types=("*.exe",))
+        walker = ScanWalker(str(tree), limits=limits)
+
+        files = sorted(walker)
+
+        assert files == [str(tree / "a" / "tool.exe"), str(tree / "setup.exe")]
+        assert walker.limited_count == 2
+        assert walker.files_found == 2
+
+    def test_zero_file_size_is_unlimited(self, tree):
+        walker = ScanWalker(str(tree), limits=ScanLimits(max_filesize=0))
+
+        assert len(list(walker)) == 5
+
+    def test_log_details(self):
+        entry = LogEntry.from_scan_result_data(
+            scan_status="clean",
+            path="/home",
+            duration=1.0,
+            scanned_files=2,
+            limited_files=3,
+        )
+
+        assert entry.details == (
+            "Scanned: 2 files, 0 directories\nOutside the profile's limits: 3 files"
+        )
+
+
+class TestDaemonScan:
+    """Tests for native clamd scans with limits."""
+
+    def test_limits_applied_while_walking(self, fake_clamd, tmp_path):
+        (tmp_path / "eicar.com").write_text(EICAR_STRING)
+        (tmp_path / "eicar.txt").write_text(EICAR_STRING)
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            False if key in ("scan_cache_enabled", "scan_checkpoints_enabled") else default
+        )
+        address = ClamdAddress(socket_path=fake_clamd.socket_path)
+
+        with patch.object(daemon_scanner_module, "resolve_clamd_address", return_value=address):
+            scanner = daemon_scanner_module.DaemonScanner(
+                log_manager=MagicMock(), settings_manager=settings
+            )
+            result = scanner.scan_sync(str(tmp_path), limits_options={"include_types": ["*.com"]})
+
+        assert result.status == ScanStatus.INFECTED
+        assert result.infected_files == [str(tmp_path / "eicar.com")]
+        assert result.limited_count == 1
@@ -0,0 +1,111 @@
+# ClamUI Scan Output Tests
+"""Unit tests for the bounded-memory ScanOutput parser."""
+
+import gzip
+
+from src.core.scan_output import ScanOutput
+
+
+class TestScanOutputParsing:
+    """Tests for results parsed line by line."""
+
+    def test_parses_threats_skipped_and_summary(self):
+        output = ScanOutput.from_text(
+            "/home/user/eicar.com: Win.Test.EICAR_HDB-1 FOUND\n"
+            "/home/user/secret: Failed to open file ERROR\n"
+            "/home/user/odd: Can't read ERROR\n"
+            "/home/user/clean.txt: OK\n"
+            "\n"
+            "----------- SCAN SUMMARY -----------\n"
+            "Scanned directories: 3\n"
+            "Scanned files: 42\n"
+        )
+
+        assert output.threats == [("/home/user/eicar.com", "Win.Test.EICAR_HDB-1")]
+        assert output.skipped_files == ["/home/user/secret"]
+        assert output.failed_paths == [
+            "/home/user/eicar.com",
+            "/home/user/secret",
+            "/home/user/odd",
+        ]
+        assert output.scanned_dirs == 3
+        assert output.scanned_files == 42
+
+    def test_path_with_colon(self):
+        output = ScanOutput.from_text("C:\\Users\\test\\file.exe: Trojan.Agent FOUND")
+        assert output.threats == [("C:\\Users\\test\\file.exe", "Trojan.Agent")]
+
+    def test_feed_joins_lines_split_across_chunks(self):
+        output = ScanOutput()
+        output.feed("/a/file: Eicar")
+        output.feed("-Signature FOUND\n/b/fi")
+        output.feed("le: OK")
+        output.finish()
+
+        assert output.lines_total == 2
+        assert output.threats == [("/a/file", "Eicar-Signature")]
+        assert output.text == "/a/file: Eicar-Signature FOUND\n/b/file: OK"
+
+    def test_from_text_keeps_everything(self):
+        text = "\n".join(f"/file{i}: OK" for i in range(1000))
+        output = ScanOutput.from_text(text)
+        assert not output.truncated
+        assert output.text == text
+
+
+class TestScanOutputTail:
+    """Tests for the bounded in-memory tail."""
+
+    def test_tail_is_bounded(self):
+        output = ScanOutput(tail_chars=100)
+        for i in range(1000):
+            output.add_line(f"/data/file{i:04d}: OK")
+        output.add_line("/data/last: Eicar FOUND")
+        output.finish()
+
+        assert output.truncated
+        assert output.lines_total == 1001
+        lines = output.text.splitlines()
+        assert lines[0].startswith(f"[{output.lines_dropped} earlier line(s) omitted")
+        assert lines[-1] == "/data/last: Eicar FOUND"
+        assert sum(len(line) + 1 for line in lines[1:]) <= 100
+        # Results from dropped lines are still known
+        assert output.threats == [("/data/last", "Eicar")]
+
+    def test_single_long_line_is_kept(self):
+        output = ScanOutput(tail_chars=10)
+        output.add_line("x" * 50)
+        assert output.text == "x" * 50
+
+
+class TestScanOutputSpill:
+    """Tests for the compressed full-output spill file."""
+
+    def test_spill_holds_full_output(self, tmp_path):
+        spill = tmp_path / "scan.output.gz"
+        output = ScanOutput(tail_chars=20, spill_path=str(spill))
+        lines = [f"/data/file{i}: OK" for i in range(50)]
+        output.feed("\n".join(lines))
+        output.finish()
+
+        assert output.spill_path == str(spill)
+        assert "kept with the scan log" in output.text
+        with gzip.open(spill, "rt") as f:
+            assert f.read().splitlines() == lines
+
+    def test_discard_spill_removes_file(self, tmp_path):
+        spill = tmp_path / "scan.output.gz"
+        output = ScanOutput(spill_path=str(spill))
+        output.add_line("/data/file: OK")
+        output.discard_spill()
+
+        assert output.spill_path is None
+        assert not spill.exists()
+
+    def test_unwritable_spill_is_ignored(self, tmp_path):
+        output = ScanOutput(spill_path=str(tmp_path / "missing" / "scan.output.gz"))
+        output.add_line("/data/file: OK")
+        output.finish()
+
+        assert output.spill_path is None
+        assert output.text == "/data/file: OK"
@@ -0,0 +1,223 @@
+# ClamUI Scan Walker Tests
+"""Unit tests for the single-pass scan walker and the clamscan file list pipe."""
+
+import os
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core.scan_cache import ScanCache
+from src.core.scan_walker import FileListPipe, ScanWalker
+
+
+@pytest.fixture
+def scan_tree(tmp_path):
+    """Create a small tree with a nested directory and a symlink."""
+    root = tmp_path / "tree"
+    (root / "sub" / "deep").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "b.log").write_text("b")
+    (root / "sub" / "c.txt").write_text("c")
+    (root / "sub" / "deep" / "d.txt").write_text("d")
+    (root / "link.txt").symlink_to(root / "a.txt")
+    return root
+
+
+class TestScanWalker:
+    """Tests for ScanWalker."""
+
+    def test_walks_regular_files_once(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+        paths = sorted(walker)
+
+        assert paths == sorted(
+            str(scan_tree / p) for p in ("a.txt", "b.log", "sub/c.txt", "sub/deep/d.txt")
+        )
+        assert walker.files_found == 4
+        assert walker.dirs_found == 3
+        assert walker.finished is True
+
+    def test_single_file(self, scan_tree):
+        walker = ScanWalker(str(scan_tree / "a.txt"))
+        assert list(walker) == [str(scan_tree / "a.txt")]
+        assert walker.count() == (1, 0)
+
+    def test_exclusions_prune_directories_and_files(self, scan_tree):
+        def exclude(path, name, is_dir):
+            return (is_dir and name == "sub") or (not is_dir and name.endswith(".log"))
+
+        walker = ScanWalker(str(scan_tree), exclude=exclude)
+
+        assert list(walker) == [str(scan_tree / "a.txt")]
+        assert walker.dirs_found == 1
+
+    def test_cancelled_walk_is_not_finished(self, scan_tree):
+        walker = ScanWalker(str(scan_tree), is_cancelled=lambda: True)
+        assert list(walker) == []
+        assert walker.finished is False
+        assert walker.walk_duration == 0.0
+
+    def test_walk_duration(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+
+        with patch("src.core.scan_walker.time.monotonic", side_effect=[10.0, 12.5]):
+            list(walker)
+
+        assert walker.walk_duration == 2.5
+
+    def test_cached_files_are_counted_not_yielded(self, scan_tree, tmp_path):
+        with ScanCache(str(tmp_path / "scan_cache.db")) as cache:
+            cache.open("db-1")
+            list(ScanWalker(str(scan_tree), cache=cache))
+            cache.commit([str(scan_tree / "b.log")])
+
+            walker = ScanWalker(str(scan_tree), cache=cache)
+            assert list(walker) == [str(scan_tree / "b.log")]
+            assert walker.cached_count == 3
+            assert walker.files_total == 4
+
+    def test_byte_totals(self, scan_tree):
+        (scan_tree / "sub" / "c.txt").write_text("c" * 100)
+        walker = ScanWalker(str(scan_tree), track_sizes=True)
+        list(walker)
+
+        assert walker.bytes_found == 103
+        assert walker.bytes_total == 103
+        assert walker.take_size(str(scan_tree / "sub" / "c.txt")) == 100
+        # Untracked paths are measured on demand
+        assert walker.take_size(str(scan_tree / "link.txt")) > 0
+        assert walker.take_size(str(scan_tree / "missing")) == 0
+
+    def test_cached_bytes_counted_separately(self, scan_tree, tmp_path):
+        with ScanCache(str(tmp_path / "scan_cache.db")) as cache:
+            cache.open("db-1")
+            list(ScanWalker(str(scan_tree), cache=cache))
+            cache.commit([str(scan_tree / "b.log")])
+
+            walker = ScanWalker(str(scan_tree), cache=cache)
+            list(walker)
+            assert walker.bytes_found == 1
+            assert walker.cached_bytes == 3
+            assert walker.bytes_total == 4
+
+    def test_count_in_background(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+        walker.count_in_background()
+        assert walker.wait() == (4, 3)
+
+
+class TestReadAhead:
+    """Tests for ScanWalker.iter_ahead()."""
+
+    def test_yields_walk_order(self, scan_tree):
+        expected = list(ScanWalker(str(scan_tree)))
+        paths = ScanWalker(str(scan_tree)).iter_ahead()
+        assert list(paths) == expected
+
+    def test_walk_runs_ahead_of_consumer(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+        paths = walker.iter_ahead()
+        first = next(paths)
+        paths._thread.join(timeout=5)
+
+        assert first
+        assert walker.finished is True
+        assert walker.files_found == 4
+        paths.close()
+
+    def test_peek_does_not_consume(self, scan_tree):
+        paths = ScanWalker(str(scan_tree)).iter_ahead()
+        first = paths.peek()
+        assert next(paths) == first
+        paths.close()
+
+    def test_peek_empty_tree(self, tmp_path):
+        paths = ScanWalker(str(tmp_path)).iter_ahead()
+        assert paths.peek() is None
+        paths.close()
+
+    def test_close_stops_bounded_walk(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+        paths = walker.iter_ahead(max_ahead=1)
+        next(paths)
+        paths.close()
+        assert walker.finished is False
+
+
+class TestFileListPipe:
+    """Tests for FileListPipe."""
+
+    def test_streams_paths_to_reader(self, tmp_path):
+        paths = [str(tmp_path / f"file{i}") for i in range(1000)]
+        with FileListPipe(str(tmp_path)) as pipe:
+            process = subprocess.Popen(["cat", pipe.path], stdout=subprocess.PIPE)
+            pipe.start(iter(paths), lambda: process.poll() is not None)
+            output, _ = process.communicate(timeout=10)
+
+        assert output.decode().splitlines() == paths
+        assert pipe.completed is True
+
+    def test_unlistable_paths_are_reported(self, tmp_path):
+        paths = ["/ok", "/bad\nname", "/" + "x" * 2000, "/also-ok"]
+        with FileListPipe(str(tmp_path)) as pipe:
+            process = subprocess.Popen(["cat", pipe.path], stdout=subprocess.PIPE)
+            pipe.start(iter(paths), lambda: process.poll() is not None)
+            output, _ = process.communicate(timeout=10)
+
+        assert output.decode().splitlines() == ["/ok", "/also-ok"]
+        assert pipe.unlisted == paths[1:3]
+
+    def test_stops_without_reader(self, tmp_path):
+        stop = threading.Event()
+        pipe = FileListPipe(str(tmp_path))
+        pipe.start(iter(["/a"]), stop.is_set)
+        stop.set()
+        pipe.close()
+        assert pipe.completed is False
+
+    def test_close_removes_pipe(self, tmp_path):
+        pipe = FileListPipe(str(tmp_path))
+        assert os.path.exists(pipe.path)
+        pipe.close()
+        assert not os.path.exists(os.path.dirname(pipe.path))
+
+
+class TestScanWalkerRoots:
+    """Tests for ScanWalker.iter_roots()."""
+
+    def test_clean_tree_yields_root(self, scan_tree):
+        walker = ScanWalker(str(scan_tree))
+        assert list(walker.iter_roots()) == [str(scan_tree)]
+        assert walker.files_found == 4
+        assert walker.finished is True
+
+    def test_exclusion_splits_enclosing_directories(self, scan_tree):
+        (scan_tree / "other").mkdir()
+        (scan_tree / "other" / "e.txt").write_text("e")
+
+        def exclude(path, name, is_dir):
+            return is_dir and name == "deep"
+
+        walker = ScanWalker(str(scan_tree), exclude=exclude)
+        roots = sorted(walker.iter_roots())
+
+        assert roots == sorted(str(scan_tree / p) for p in ("a.txt", "b.log", "other", "sub/c.txt"))
+        assert walker.files_found == 4
+        assert walker.dirs_found == 3
+
+    def test_excluded_file_is_not_yielded(self, scan_tree):
+        def exclude(path, name, is_dir):
+            return name == "d.txt"
+
+        roots = sorted(ScanWalker(str(scan_tree), exclude=exclude).iter_roots())
+
+        assert roots == sorted(str(scan_tree / p) for p in ("a.txt", "b.log", "sub/c.txt"))
+
+    def test_single_file(self, scan_tree):
+        assert list(ScanWalker(str(scan_tree / "a.txt")).iter_roots()) == [str(scan_tree / "a.txt")]
+
+    def test_iter_ahead_roots(self, scan_tree):
+        paths = ScanWalker(str(scan_tree)).iter_ahead(roots=True)
+        assert list(paths) == [str(scan_tree)]
@@ -1,6 +1,7 @@
 # ClamUI Scanner Tests
 """Unit tests for the scanner module, including Flatpak integration."""
 
+import os
 import subprocess
 import sys
 from unittest import mock
@@ -2172,3 +2173,383 @@ class TestScannerBackendSelection:
         backend = scanner._get_backend()
 
         assert backend == "auto"
+
+
+class TestScannerUserDaemon:
+    """Tests for auto mode starting ClamUI's private clamd."""
+
+    @pytest.fixture
+    def settings(self):
+        values = {"scan_backend": "auto", "user_daemon_enabled": True}
+        settings = mock.MagicMock()
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+        settings.values = values
+        return settings
+
+    @pytest.fixture
+    def user_clamd(self):
+        user_clamd = mock.MagicMock()
+        user_clamd.check_available.return_value = (True, None)
+        user_clamd.acquire.return_value = (True, None)
+        with mock.patch("src.core.user_clamd.get_user_clamd", return_value=user_clamd):
+            yield user_clamd
+
+    def test_active_backend_without_system_daemon(self, settings, user_clamd):
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+        with mock.patch("src.core.scanner.check_clamd_connection", return_value=(False, "")):
+            assert scanner.get_active_backend() == "user_daemon"
+
+    def test_system_daemon_preferred(self, settings, user_clamd):
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+        with mock.patch("src.core.scanner.check_clamd_connection", return_value=(True, "PONG")):
+            assert scanner.get_active_backend() == "daemon"
+
+    def test_disabled_falls_back_to_clamscan(self, settings, user_clamd):
+        settings.values["user_daemon_enabled"] = False
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+        with mock.patch("src.core.scanner.check_clamd_connection", return_value=(False, "")):
+            assert scanner.get_active_backend() == "clamscan"
+
+    def test_unavailable_falls_back_to_clamscan(self, settings, user_clamd):
+        user_clamd.check_available.return_value = (False, "clamd is not installed")
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+        with mock.patch("src.core.scanner.check_clamd_connection", return_value=(False, "")):
+            assert scanner.get_active_backend() == "clamscan"
+
+    def test_scan_holds_private_daemon(self, settings, user_clamd, tmp_path):
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+        daemon_scanner = mock.MagicMock()
+        daemon_scanner.scan_sync.return_value = "result"
+
+        with (
+            mock.patch("src.core.scanner.check_clamd_connection", return_value=(False, "")),
+            mock.patch(
+                "src.core.daemon_scanner.DaemonScanner", return_value=daemon_scanner
+            ) as daemon_class,
+        ):
+            assert scanner.scan_sync(str(tmp_path)) == "result"
+
+        assert daemon_class.call_args.kwargs["user_clamd"] is user_clamd
+        user_clamd.acquire.assert_called_once()
+        user_clamd.release.assert_called_once_with()
+
+    def test_failed_start_falls_back_to_clamscan(self, settings, user_clamd, tmp_path):
+        user_clamd.acquire.return_value = (False, "clamd failed to start")
+        scanner = Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+
+        with (
+            mock.patch("src.core.scanner.check_clamd_connection", return_value=(False, "")),
+            mock.patch.object(scanner, "_run_clamscan", return_value="clamscan") as run_clamscan,
+            mock.patch("src.core.scanner.check_clamav_installed", return_value=(True, "1.0")),
+            mock.patch("src.core.scanner.open_scan_cache", return_value=None),
+        ):
+            assert scanner.scan_sync(str(tmp_path)) == "clamscan"
+
+        run_clamscan.assert_called_once()
+        user_clamd.release.assert_not_called()
+
+
+class TestScannerIncrementalScan:
+    """Tests for incremental clamscan scans through --file-list."""
+
+    @pytest.fixture
+    def cached_scanner(self, tmp_path, monkeypatch):
+        """Scanner with the scan cache enabled and the clamscan backend selected."""
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+        settings = mock.MagicMock()
+        settings.get.side_effect = lambda key, default=None: {
+            "scan_backend": "clamscan",
+            "scan_cache_enabled": True,
+            "scan_checkpoints_enabled": False,
+            "exclusion_patterns": [],
+        }.get(key, default)
+        return Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        """Create a tree with two files."""
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.txt").write_text("a")
+        (root / "sub" / "b.txt").write_text("b")
+        return root
+
+    def _run(self, scanner, path, stdout="", exit_code=0, **kwargs):
+        """Run scan_sync with a mocked clamscan, returning (result, commands, listed_files)."""
+        commands = []
+        listed = []
+
+        def fake_popen(cmd, **_popen_kwargs):
+            commands.append(cmd)
+            for arg in cmd:
+                if arg.startswith("--file-list="):
+                    with open(arg.split("=", 1)[1], encoding="utf-8") as f:
+                        listed.extend(f.read().splitlines())
+            process = mock.MagicMock()
+            process.communicate.return_value = (stdout, "")
+            process.returncode = exit_code
+            return process
+
+        with (
+            mock.patch("src.core.scanner.get_clamav_path", return_value="/usr/bin/clamscan"),
+            mock.patch("src.core.scanner.wrap_host_command", side_effect=lambda x: x),
+            mock.patch("src.core.scanner.check_clamav_installed", return_value=(True, "1.0.0")),
+            mock.patch("src.core.scanner.get_database_version", return_value="db-1"),
+            mock.patch("subprocess.Popen", side_effect=fake_popen),
+        ):
+            result = scanner.scan_sync(str(path), **kwargs)
+        return result, commands, listed
+
+    def test_first_scan_lists_all_files(self, cached_scanner, scan_tree):
+        """The first scan passes every walked file through --file-list."""
+        result, commands, listed = self._run(cached_scanner, scan_tree)
+
+        assert len(commands) == 1
+        assert "-r" not in commands[0]
+        assert str(scan_tree) not in commands[0]
+        assert sorted(listed) == [str(scan_tree / "a.txt"), str(scan_tree / "sub" / "b.txt")]
+        assert result.status == ScanStatus.CLEAN
+        assert result.scanned_dirs == 2
+
+    def test_unchanged_files_skip_clamscan(self, cached_scanner, scan_tree):
+        """When every file is cached clean, clamscan is not run at all."""
+        self._run(cached_scanner, scan_tree)
+
+        result, commands, _listed = self._run(cached_scanner, scan_tree)
+
+        assert commands == []
+        assert result.status == ScanStatus.CLEAN
+        assert result.cached_count == 2
+        assert result.scanned_files == 0
+
+    def test_infected_files_are_rescanned(self, cached_scanner, scan_tree):
+        """Files reported as infected never get a cached verdict."""
+        infected = str(scan_tree / "a.txt")
+        self._run(cached_scanner, scan_tree, stdout=f"{infected}: Eicar FOUND\n", exit_code=1)
+
+        result, _commands, listed = self._run(cached_scanner, scan_tree)
+
+        assert listed == [infected]
+        assert result.cached_count == 1
+
+    def test_error_scan_caches_nothing(self, cached_scanner, scan_tree):
+        """A failed clamscan run does not record any verdicts."""
+        self._run(cached_scanner, scan_tree, exit_code=2)
+
+        _result, _commands, listed = self._run(cached_scanner, scan_tree)
+
+        assert len(listed) == 2
+
+    def test_force_full_scan_lists_every_file(self, cached_scanner, scan_tree):
+        """force_full_scan passes cached files to clamscan again."""
+        self._run(cached_scanner, scan_tree)
+
+        result, _commands, listed = self._run(cached_scanner, scan_tree, force_full_scan=True)
+
+        assert len(listed) == 2
+        assert result.cached_count == 0
+
+    def test_file_list_is_removed(self, cached_scanner, scan_tree):
+        """The file list pipe is deleted after the scan."""
+        _result, commands, _listed = self._run(cached_scanner, scan_tree)
+
+        file_list = next(a for a in commands[0] if a.startswith("--file-list="))
+        assert not os.path.exists(os.path.dirname(file_list.split("=", 1)[1]))
+
+    def test_excluded_files_are_not_listed(self, cached_scanner, scan_tree):
+        """Exclusions are applied by the walk that builds the file list."""
+        result, _commands, listed = self._run(
+            cached_scanner, scan_tree, profile_exclusions={"paths": [str(scan_tree / "sub")]}
+        )
+
+        assert listed == [str(scan_tree / "a.txt")]
+        assert result.scanned_dirs == 1
+
+    def test_progress_total_comes_from_walk(self, cached_scanner, scan_tree):
+        """Progress totals come from the walk instead of a separate count."""
+        updates = []
+        stdout = f"Scanning {scan_tree / 'a.txt'}\nScanning {scan_tree / 'sub' / 'b.txt'}\n"
+
+        def fake_stream(process, is_cancelled, on_line, output=None):
+            for line in stdout.splitlines():
+                if output is not None:
+                    output.add_line(line)
+                on_line(line)
+            return stdout, "", False
+
+        with mock.patch("src.core.scanner.stream_process_output", side_effect=fake_stream):
+            self._run(cached_scanner, scan_tree, progress_callback=updates.append)
+
+        assert [u.files_scanned for u in updates] == [1, 2]
+        assert all(u.files_total == 2 for u in updates)
+        assert updates[-1].percentage == 100
+
+
+class TestScannerCheckpoint:
+    """Tests for resumable clamscan scans."""
+
+    @pytest.fixture
+    def scanner(self, tmp_path, monkeypatch):
+        """Scanner with the clamscan backend and checkpoints in a temporary directory."""
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+        settings = mock.MagicMock()
+        settings.get.side_effect = lambda key, default=None: {
+            "scan_backend": "clamscan",
+            "scan_cache_enabled": False,
+            "exclusion_patterns": [],
+        }.get(key, default)
+        return Scanner(log_manager=mock.MagicMock(), settings_manager=settings)
+
+    @pytest.fixture
+    def scan_tree(self, tmp_path):
+        """Create a tree with two files."""
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.txt").write_text("a")
+        (root / "sub" / "b.txt").write_text("b")
+        return root
+
+    def _run(self, scanner, path, verdicts, cancelled=False, **kwargs):
+        """
+        Run scan_sync with a mocked clamscan that reports the given verdicts.
+
+        Returns (result, commands, listed_files).
+        """
+        commands = []
+        listed = []
+
+        def fake_popen(cmd, **_popen_kwargs):
+            commands.append(cmd)
+            for arg in cmd:
+                if arg.startswith("--file-list="):
+                    with open(arg.split("=", 1)[1], encoding="utf-8") as f:
+                        listed.extend(f.read().splitlines())
+            process = mock.MagicMock()
+            process.returncode = 0
+            return process
+
+        def fake_stream(process, is_cancelled, on_line, output=None):
+            lines = [f"{p}: {verdicts[p]}" for p in listed if p in verdicts]
+            lines.append(f"Scanned files: {len(lines)}")
+            for line in lines:
+                output.add_line(line)
+                on_line(line)
+            return "\n".join(lines), "", cancelled
+
+        with (
+            mock.patch("src.core.scanner.get_clamav_path", return_value="/usr/bin/clamscan"),
+            mock.patch("src.core.scanner.wrap_host_command", side_effect=lambda x: x),
+            mock.patch("src.core.scanner.check_clamav_installed", return_value=(True, "1.0.0")),
+            mock.patch("src.core.scanner.get_database_version", return_value="db-1"),
+            mock.patch("src.core.scanner.stream_process_output", side_effect=fake_stream),
+            mock.patch("subprocess.Popen", side_effect=fake_popen),
+        ):
+            result = scanner.scan_sync(str(path), **kwargs)
+        return result, commands, listed
+
+    def test_resumed_scan_lists_only_the_rest(self, scanner, scan_tree):
+        """An interrupted scan resumes with the files it had not scanned."""
+        infected = str(scan_tree / "a.txt")
+        remaining = str(scan_tree / "sub" / "b.txt")
+        first, commands, _listed = self._run(
+            scanner, scan_tree, {infected: "Eicar-Test-Signature FOUND"}, cancelled=True
+        )
+        assert first.status == ScanStatus.CANCELLED
+        assert "-i" not in commands[0]
+
+        result, _commands, listed = self._run(scanner, scan_tree, {remaining: "OK"}, resume=True)
+
+        assert listed == [remaining]
+        assert result.status == ScanStatus.INFECTED
+        assert result.scanned_files == 2
+        assert result.infected_files == [infected]
+        assert result.threat_details[0].threat_name == "Eicar-Test-Signature"
+
+    def test_finished_scan_removes_checkpoint(self, scanner, scan_tree):
+        """After a complete scan there is nothing left to resume."""
+        a_txt = str(scan_tree / "a.txt")
+        self._run(scanner, scan_tree, {a_txt: "OK"}, cancelled=True)
+
+        verdicts = {a_txt: "OK", str(scan_tree / "sub" / "b.txt"): "OK"}
+        self._run(scanner, scan_tree, verdicts)
+        _result, _commands, listed = self._run(scanner, scan_tree, verdicts, resume=True)
+
+        assert len(listed) == 2
+
+
+class TestScannerPause:
+    """Tests for pausing and resuming scans."""
+
+    def test_pause_stops_clamscan_process(self):
+        import signal
+
+        scanner = Scanner(log_manager=mock.MagicMock())
+        process = mock.MagicMock()
+        process.poll.return_value = None
+        scanner._current_process = process
+
+        scanner.pause()
+        assert scanner.is_paused is True
+        process.send_signal.assert_called_with(signal.SIGSTOP)
+
+        scanner.resume()
+        assert scanner.is_paused is False
+        process.send_signal.assert_called_with(signal.SIGCONT)
+
+    def test_pause_forwarded_to_daemon_scanner(self):
+        scanner = Scanner(log_manager=mock.MagicMock())
+        daemon_scanner = scanner._get_daemon_scanner()
+
+        scanner.pause()
+        assert daemon_scanner.is_paused is True
+
+        scanner.resume()
+        assert daemon_scanner.is_paused is False
+
+    def test_scan_run_on_host_under_flatpak_cannot_pause(self):
+        scanner = Scanner(log_manager=mock.MagicMock())
+        assert scanner.can_pause is True
+
+        daemon_process = mock.MagicMock(args=["flatpak-spawn", "--host", "clamdscan", "/home"])
+        scanner._get_daemon_scanner()._current_process = daemon_process
+        assert scanner.can_pause is False
+
+        scanner._daemon_scanner._current_process = None
+        scanner._current_process = mock.MagicMock(
+            args=["flatpak-spawn", "--host", "clamscan", "/home"]
+        )
+        assert scanner.can_pause is False
+
+    def test_scanners_created_while_paused_start_paused(self):
+        scanner = Scanner(log_manager=mock.MagicMock())
+        scanner.pause()
+
+        assert scanner._get_daemon_scanner().is_paused is True
+        assert scanner.create_worker().is_paused is True
+
+    def test_process_started_while_paused_is_stopped(self, tmp_path):
+        import signal
+
+        (tmp_path / "file.txt").write_text("clean")
+        scanner = Scanner(log_manager=mock.MagicMock())
+        scanner.pause()
+        process = mock.MagicMock()
+        process.poll.return_value = None
+        process.returncode = 0
+        process.communicate.return_value = ("", "")
+
+        with (
+            mock.patch("src.core.scanner.check_clamav_installed", return_value=(True, "1.0")),
+            mock.patch("src.core.scanner.subprocess.Popen", return_value=process),
+        ):
+            scanner.scan_sync(str(tmp_path / "file.txt"))
+
+        process.send_signal.assert_any_call(signal.SIGSTOP)
+
+    def test_cancel_ends_pause(self):
+        scanner = Scanner(log_manager=mock.MagicMock())
+        scanner.pause()
+
+        scanner.cancel()
+
+        assert scanner.is_paused is False
@@ -2,17 +2,27 @@
 """Unit tests for the scanner_base module."""
 
 import subprocess
+import sys
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from src.core.scan_output import ScanOutput
 from src.core.scanner_base import (
     KILL_WAIT_TIMEOUT,
     STREAM_POLL_TIMEOUT,
     TERMINATE_GRACE_TIMEOUT,
+    ProgressReporter,
+    ScanPause,
     cleanup_process,
     communicate_with_cancel_check,
+    continue_process,
     create_cancelled_result,
     create_error_result,
+    create_progress_reporter,
     stream_process_output,
+    suspend_process,
     terminate_process_gracefully,
 )
 from src.core.scanner_types import ScanStatus
@@ -227,6 +237,36 @@ class TestStreamProcessOutput:
         assert "/path/file2.txt: OK" in lines
         assert "/path/file3.txt: FOUND" in lines
 
+    def test_stream_output_collected_into_scan_output(self):
+        """Test output lines are parsed into a ScanOutput instead of accumulated."""
+        mock_process = MagicMock()
+        mock_process.poll.side_effect = [None, None, 0]
+        mock_process.stdout.fileno.return_value = 1
+        mock_process.stderr.fileno.return_value = 2
+        output = ScanOutput(tail_chars=40)
+
+        with (
+            patch("src.core.scanner_base.select.select", return_value=([1], [], [])),
+            patch(
+                "src.core.scanner_base.os.read",
+                side_effect=[
+                    b"/path/file1.txt: OK\n/path/file2.txt: Eicar-Test-Signature FOUND\n",
+                    b"/path/file3.txt: OK",  # final line without a line break
+                    b"",
+                    b"",
+                ],
+            ),
+        ):
+            stdout, _stderr, _cancelled = stream_process_output(
+                mock_process, lambda: False, lambda _: None, output=output
+            )
+
+        assert output.lines_total == 3
+        assert output.threats == [("/path/file2.txt", "Eicar-Test-Signature")]
+        assert stdout == output.text
+        assert stdout.endswith("/path/file3.txt: OK")
+        assert "/path/file1.txt" not in stdout
+
 
 class TestCleanupProcess:
     """Tests for cleanup_process function."""
@@ -324,6 +364,108 @@ class TestTerminateProcessGracefully:
         terminate_process_gracefully(mock_process)
 
 
+def _process_state(process: subprocess.Popen) -> str:
+    """Get the state letter of a process from /proc (T while stopped)."""
+    with open(f"/proc/{process.pid}/stat") as f:
+        return f.read().rsplit(")", 1)[1].split()[0]
+
+
+@pytest.fixture
+def sleeper():
+    """A child process that sleeps until killed."""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+class TestSuspendProcess:
+    """Tests for suspend_process and continue_process."""
+
+    def test_suspend_and_continue(self, sleeper):
+        suspend_process(sleeper)
+        deadline = time.monotonic() + 5
+        while _process_state(sleeper) != "T" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _process_state(sleeper) == "T"
+
+        continue_process(sleeper)
+        deadline = time.monotonic() + 5
+        while _process_state(sleeper) == "T" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _process_state(sleeper) != "T"
+
+    def test_none_and_finished_processes_ignored(self):
+        finished = MagicMock()
+        finished.poll.return_value = 0
+
+        suspend_process(None)
+        continue_process(None)
+        suspend_process(finished)
+        continue_process(finished)
+
+        finished.send_signal.assert_not_called()
+
+    def test_host_process_under_flatpak_not_signalled(self):
+        host = MagicMock(args=["flatpak-spawn", "--host", "clamscan", "/home"])
+        host.poll.return_value = None
+
+        suspend_process(host)
+        continue_process(host)
+
+        host.send_signal.assert_not_called()
+
+    def test_suspended_process_can_be_terminated(self, sleeper):
+        suspend_process(sleeper)
+
+        terminate_process_gracefully(sleeper)
+
+        assert sleeper.returncode is not None
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestScanPause:
+    """Tests for ScanPause."""
+
+    def test_paused_time_excluded_from_duration(self):
+        clock = FakeClock()
+        pause = ScanPause(clock)
+        start_time = clock.now
+
+        clock.now += 10
+        assert pause.pause() is True
+        assert pause.pause() is False
+        clock.now += 30
+        assert pause.paused_seconds() == 30
+        assert pause.resume() is True
+        assert pause.resume() is False
+        clock.now += 5
+
+        assert pause.is_paused() is False
+        assert pause.active_duration(start_time) == 15
+
+    def test_start_scan_keeps_pause_but_resets_time(self):
+        clock = FakeClock()
+        pause = ScanPause(clock)
+        pause.pause()
+        clock.now += 30
+
+        pause.start_scan()
+        clock.now += 5
+
+        assert pause.is_paused() is True
+        assert pause.paused_seconds() == 5
+
+
 class TestCreateErrorResult:
     """Tests for create_error_result function."""
 
@@ -400,6 +542,126 @@ class TestCreateCancelledResult:
         assert result.threat_details == [mock_threat]
 
 
+class TestProgressReporter:
+    """Tests for coalesced, delta-based progress reporting."""
+
+    def test_first_event_sent_and_rest_coalesced(self):
+        """Test updates within the interval are held until flush()."""
+        events = []
+        reporter = ProgressReporter(events.append, interval=3600)
+
+        for i in range(100):
+            reporter.file_scanned(f"/data/file{i}")
+        assert len(events) == 1
+        assert events[0].files_scanned == 1
+
+        reporter.flush()
+        assert len(events) == 2
+        assert events[1].files_scanned == 100
+        assert events[1].current_file == "/data/file99"
+
+        reporter.flush()
+        assert len(events) == 2
+
+    def test_events_carry_only_new_infections(self):
+        """Test each event lists the infections found since the previous one."""
+        events = []
+        reporter = ProgressReporter(events.append, interval=0)
+
+        reporter.file_scanned("/a", infected=True)
+        reporter.file_scanned("/b")
+        reporter.infection_found("/b")
+        reporter.file_scanned("/c")
+
+        assert [e.new_infected_files for e in events] == [["/a"], [], ["/b"], []]
+        assert [e.infected_count for e in events] == [1, 1, 2, 2]
+        assert [e.files_scanned for e in events] == [1, 2, 2, 3]
+        assert reporter.infected_files == ["/a", "/b"]
+
+    def test_coalesced_infections_are_not_lost(self):
+        """Test infections found between events arrive with the next event."""
+        events = []
+        reporter = ProgressReporter(events.append, interval=3600)
+
+        reporter.file_scanned("/a")
+        reporter.file_scanned("/b", infected=True)
+        reporter.file_scanned("/c", infected=True)
+        reporter.flush()
+
+        assert [f for e in events for f in e.new_infected_files] == ["/b", "/c"]
+        assert events[-1].infected_count == 2
+
+    def test_totals_from_walker(self):
+        """Test totals come from the walker, optionally counting cached files."""
+        walker = MagicMock(files_found=8, files_total=10, cached_count=2, finished=False)
+        events = []
+
+        ProgressReporter(events.append, walker=walker).file_scanned("/a")
+        ProgressReporter(events.append, walker=walker, include_cached=True).file_scanned("/a")
+
+        assert (events[0].files_scanned, events[0].files_total) == (1, 8)
+        assert (events[1].files_scanned, events[1].files_total) == (3, 10)
+        assert all(e.total_is_estimate for e in events)
+
+    def test_bytes_from_walker_sizes(self):
+        """Test scanned bytes come from the sizes recorded by the walker."""
+        sizes = {"/a": 100, "/b": 300}
+        walker = MagicMock(
+            files_found=2, files_total=2, cached_count=0, bytes_found=400, finished=True
+        )
+        walker.take_size.side_effect = sizes.get
+        events = []
+        reporter = ProgressReporter(events.append, interval=0, walker=walker)
+
+        reporter.file_scanned("/a")
+        reporter.file_scanned("/b")
+
+        assert [(e.bytes_scanned, e.bytes_total) for e in events] == [(100, 400), (400, 400)]
+        assert events[-1].percentage == 100.0
+
+    def test_reports_start_credits_bytes_when_next_file_starts(self):
+        """Test a started file's bytes count only once it is finished."""
+        sizes = {"/a": 100, "/b": 300}
+        walker = MagicMock(
+            files_found=2, files_total=2, cached_count=0, bytes_found=400, finished=True
+        )
+        walker.take_size.side_effect = sizes.get
+        events = []
+        reporter = ProgressReporter(events.append, interval=0, walker=walker, reports_start=True)
+
+        reporter.file_scanned("/a")
+        reporter.file_scanned("/b")
+        reporter.flush()
+
+        assert [e.bytes_scanned for e in events] == [0, 100, 400]
+
+    def test_create_progress_reporter_uses_interval_setting(self):
+        """Test the event interval comes from the progress_update_interval_ms setting."""
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            0 if key == "progress_update_interval_ms" else default
+        )
+        events = []
+        reporter = create_progress_reporter(events.append, settings)
+
+        reporter.file_scanned("/a")
+        reporter.file_scanned("/b")
+
+        assert len(events) == 2
+
+    def test_create_progress_reporter_ignores_invalid_interval(self):
+        """Test an invalid interval setting falls back to the default."""
+        settings = MagicMock()
+        settings.get.return_value = "fast"
+        events = []
+        reporter = create_progress_reporter(events.append, settings)
+
+        reporter.file_scanned("/a")
+        reporter.file_scanned("/b")
+
+        assert len(events) == 1
+
+
 class TestConstants:
     """Tests for module constants."""
 
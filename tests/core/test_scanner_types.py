@@ -3,7 +3,13 @@
 
 import pytest
 
-from src.core.scanner_types import ScanProgress, ScanResult, ScanStatus, ThreatDetail
+from src.core.scanner_types import (
+    ScanProgress,
+    ScanProgressState,
+    ScanResult,
+    ScanStatus,
+    ThreatDetail,
+)
 
 
 class TestScanStatus:
@@ -69,14 +75,14 @@ class TestScanProgress:
             files_scanned=50,
             files_total=100,
             infected_count=2,
-            infected_files=["/path/infected1.exe", "/path/infected2.dll"],
+            new_infected_files=["/path/infected1.exe", "/path/infected2.dll"],
             bytes_scanned=1024000,
         )
         assert progress.current_file == "/path/to/current/file.txt"
         assert progress.files_scanned == 50
         assert progress.files_total == 100
         assert progress.infected_count == 2
-        assert progress.infected_files == ["/path/infected1.exe", "/path/infected2.dll"]
+        assert progress.new_infected_files == ["/path/infected1.exe", "/path/infected2.dll"]
         assert progress.bytes_scanned == 1024000
 
     def test_scan_progress_default_bytes_scanned(self):
@@ -86,7 +92,7 @@ class TestScanProgress:
             files_scanned=10,
             files_total=20,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.bytes_scanned == 0
 
@@ -97,7 +103,7 @@ class TestScanProgress:
             files_scanned=10,
             files_total=None,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.files_total is None
 
@@ -108,7 +114,7 @@ class TestScanProgress:
             files_scanned=25,
             files_total=100,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage == 25.0
 
@@ -119,7 +125,7 @@ class TestScanProgress:
             files_scanned=0,
             files_total=100,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage == 0.0
 
@@ -130,7 +136,7 @@ class TestScanProgress:
             files_scanned=100,
             files_total=100,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage == 100.0
 
@@ -141,7 +147,7 @@ class TestScanProgress:
             files_scanned=50,
             files_total=None,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage is None
 
@@ -152,7 +158,7 @@ class TestScanProgress:
             files_scanned=0,
             files_total=0,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage is None
 
@@ -163,7 +169,7 @@ class TestScanProgress:
             files_scanned=1,
             files_total=3,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
         assert progress.percentage == pytest.approx(33.333, rel=0.01)
 
@@ -174,7 +180,7 @@ class TestScanProgress:
             files_scanned=10,
             files_total=20,
             infected_count=1,
-            infected_files=["/infected.exe"],
+            new_infected_files=["/infected.exe"],
             bytes_scanned=5000,
         )
         progress2 = ScanProgress(
@@ -182,11 +188,16 @@ class TestScanProgress:
             files_scanned=10,
             files_total=20,
             infected_count=1,
-            infected_files=["/infected.exe"],
+            new_infected_files=["/infected.exe"],
             bytes_scanned=5000,
         )
         assert progress1 == progress2
 
+    def test_scan_progress_default_new_infected_files(self):
+        """Test that new_infected_files defaults to an empty list."""
+        progress = ScanProgress("/file.txt", 1, 10, 0)
+        assert progress.new_infected_files == []
+
     def test_scan_progress_with_empty_infected_list(self):
         """Test ScanProgress with empty infected files list."""
         progress = ScanProgress(
@@ -194,12 +205,55 @@ class TestScanProgress:
             files_scanned=100,
             files_total=100,
             infected_count=0,
-            infected_files=[],
+            new_infected_files=[],
         )
-        assert progress.infected_files == []
+        assert progress.new_infected_files == []
         assert progress.infected_count == 0
 
 
+class TestScanProgressState:
+    """Tests for rebuilding scan progress from delta events."""
+
+    def test_initial_state(self):
+        state = ScanProgressState()
+        assert state.files_scanned == 0
+        assert state.infected_files == []
+        assert state.infected_count == 0
+        assert state.percentage is None
+
+    def test_apply_accumulates_new_infections(self):
+        state = ScanProgressState()
+        state.apply(ScanProgress("/a", 1, 4, 1, new_infected_files=["/a"]))
+        state.apply(ScanProgress("/b", 2, 4, 1))
+        state.apply(ScanProgress("/d", 4, 4, 3, new_infected_files=["/c", "/d"]))
+
+        assert state.current_file == "/d"
+        assert state.files_scanned == 4
+        assert state.files_total == 4
+        assert state.infected_files == ["/a", "/c", "/d"]
+        assert state.infected_count == 3
+        assert state.percentage == 100.0
+
+    def test_percentage_unknown_while_total_is_estimate(self):
+        state = ScanProgressState()
+        state.apply(ScanProgress("/a", 1, 4, 0, total_is_estimate=True))
+        assert state.percentage is None
+
+        state.apply(ScanProgress("/b", 2, 4, 0))
+        assert state.percentage == 50.0
+
+    def test_percentage_weighted_by_bytes(self):
+        state = ScanProgressState()
+        state.apply(ScanProgress("/big", 1, 4, 0, bytes_scanned=900, bytes_total=1000))
+        assert state.percentage == 90.0
+        assert state.bytes_total == 1000
+
+    def test_percentage_falls_back_to_files_without_bytes(self):
+        state = ScanProgressState()
+        state.apply(ScanProgress("/a", 1, 4, 0, bytes_scanned=0, bytes_total=0))
+        assert state.percentage == 25.0
+
+
 class TestScanResult:
     """Tests for ScanResult dataclass."""
 
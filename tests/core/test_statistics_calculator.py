@@ -1319,6 +1319,24 @@ class TestStatisticsCalculatorFilesScannedExtraction:
         result = calculator._extract_files_scanned(entry)
         assert result == 1000000
 
+    def test_typed_counts_take_precedence(self, calculator):
+        """Test counts stored in the entry are used without parsing its text."""
+        entry = LogEntry(
+            id="test",
+            timestamp="2024-01-15T10:00:00",
+            type="scan",
+            status="infected",
+            summary="Found 9 threat(s) in 500 files",
+            details="Scanned: 500 files, 20 directories",
+            scanned_files=42,
+            scanned_dirs=3,
+            infected_count=2,
+        )
+
+        assert calculator._extract_files_scanned(entry) == 42
+        assert calculator._extract_directories_scanned(entry) == 3
+        assert calculator._extract_threats_found(entry) == 2
+
 
 class TestStatisticsCalculatorThreatsExtraction:
     """Tests for extracting threats count from log entries."""
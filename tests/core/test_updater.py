@@ -638,6 +638,34 @@ class TestFreshclamUpdaterUpdateSync:
                             assert result.status == UpdateStatus.UP_TO_DATE
                             assert result.databases_updated == 0
 
+    @pytest.mark.parametrize(
+        "stdout, reloaded",
+        [
+            ("daily.cvd updated (version: 27150, sigs: 2050000, f-level: 90)", True),
+            ("daily.cvd database is up-to-date (version: 27150)", False),
+        ],
+    )
+    def test_new_signatures_reload_private_daemon(self, updater_module, stdout, reloaded):
+        """Test a private clamd is told to reload only when databases changed."""
+        FreshclamUpdater = updater_module["FreshclamUpdater"]
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (stdout, "")
+        mock_process.returncode = 0
+
+        with (
+            patch("src.core.updater.check_freshclam_installed", return_value=(True, "1.0.0")),
+            patch("src.core.updater.get_freshclam_path", return_value="freshclam"),
+            patch("src.core.updater.get_pkexec_path", return_value=None),
+            patch("src.core.updater.wrap_host_command", side_effect=lambda x: x),
+            patch("subprocess.Popen", return_value=mock_process),
+            patch("src.core.updater.reload_user_clamd") as mock_reload,
+        ):
+            updater = FreshclamUpdater(log_manager=MagicMock())
+            with patch.object(updater, "_check_freshclam_running", return_value=(False, None)):
+                updater.update_sync(prefer_service=False)
+
+        assert mock_reload.called is reloaded
+
     def test_error_return_code(self, updater_module):
         """Test error handling for non-zero return code."""
         FreshclamUpdater = updater_module["FreshclamUpdater"]
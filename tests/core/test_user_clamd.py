@@ -0,0 +1,360 @@
+# ClamUI User Daemon Tests
+"""Unit tests for the private on-demand clamd."""
+
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import daemon_scanner as daemon_scanner_module
+from src.core import user_clamd as user_clamd_module
+from src.core.clamd_client import ClamdAddress, ClamdClient
+from src.core.user_clamd import UserClamd, get_user_clamd_dir, reload_user_clamd
+from tests.conftest import EICAR_STRING, FakeClamd
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Stand-in for clamd: serves the fake daemon on the configured LocalSocket
+FAKE_CLAMD_SCRIPT = """\
+import signal, sys, time
+sys.path.insert(0, {root!r})
+from tests.conftest import FakeClamd
+
+config = sys.argv[1].split("=", 1)[1]
+for line in open(config):
+    if line.startswith("LocalSocket "):
+        socket_path = line.split(" ", 1)[1].strip()
+if {fail!r}:
+    for line in open(config):
+        if line.startswith("LogFile "):
+            open(line.split(" ", 1)[1].strip(), "w").write("ERROR: Can't open database\\n")
+    sys.exit(1)
+time.sleep({delay!r})
+daemon = FakeClamd(socket_path)
+signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+while not daemon._stopped:
+    time.sleep(0.05)
+"""
+
+
+@pytest.fixture
+def runtime_dir():
+    """A short private runtime directory (AF_UNIX paths are limited to ~108 bytes)."""
+    path = Path(tempfile.mkdtemp(prefix="xdg"))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def database_dir(tmp_path):
+    """A database directory holding one signature file."""
+    path = tmp_path / "db"
+    path.mkdir()
+    (path / "main.cvd").write_bytes(b"signatures")
+    with patch.object(user_clamd_module, "get_database_dir", return_value=path):
+        yield path
+
+
+def _fake_clamd(tmp_path, fail=False, delay=0.0):
+    """Write a fake clamd executable and make find_clamd_binary return it."""
+    script = tmp_path / "clamd"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        + FAKE_CLAMD_SCRIPT.format(root=str(REPO_ROOT), fail=fail, delay=delay)
+    )
+    script.chmod(0o755)
+    return patch.object(user_clamd_module, "find_clamd_binary", return_value=str(script))
+
+
+@pytest.fixture
+def daemon(runtime_dir, database_dir, tmp_path):
+    """A UserClamd started through the fake clamd executable."""
+    user_clamd = UserClamd(runtime_dir=runtime_dir / "clamui", idle_timeout=60)
+    with _fake_clamd(tmp_path):
+        try:
+            yield user_clamd
+        finally:
+            user_clamd.stop()
+
+
+class TestUserClamdDir:
+    """Tests for get_user_clamd_dir()."""
+
+    def test_below_runtime_dir(self, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert get_user_clamd_dir() == Path("/run/user/1000/clamui")
+
+    def test_none_without_runtime_dir(self, monkeypatch):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert get_user_clamd_dir() is None
+
+
+class TestUserClamdAvailability:
+    """Tests for UserClamd.check_available()."""
+
+    def test_requires_runtime_dir(self, monkeypatch):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        is_available, error = UserClamd().check_available()
+        assert is_available is False
+        assert "XDG_RUNTIME_DIR" in error
+
+    def test_requires_clamd(self, runtime_dir, database_dir):
+        with patch.object(user_clamd_module, "find_clamd_binary", return_value=None):
+            is_available, error = UserClamd(runtime_dir=runtime_dir).check_available()
+        assert is_available is False
+        assert "clamd" in error
+
+    def test_requires_database(self, runtime_dir, tmp_path):
+        with (
+            patch.object(user_clamd_module, "find_clamd_binary", return_value="/usr/sbin/clamd"),
+            patch.object(user_clamd_module, "get_database_dir", return_value=tmp_path),
+        ):
+            is_available, error = UserClamd(runtime_dir=runtime_dir).check_available()
+        assert is_available is False
+        assert str(tmp_path) in error
+
+    def test_available(self, runtime_dir, database_dir):
+        with patch.object(user_clamd_module, "find_clamd_binary", return_value="/usr/sbin/clamd"):
+            assert UserClamd(runtime_dir=runtime_dir).check_available() == (True, None)
+
+
+class TestUserClamdLifecycle:
+    """Tests for starting, reusing and stopping the daemon."""
+
+    def test_acquire_starts_daemon(self, daemon, runtime_dir, database_dir):
+        assert daemon.acquire() == (True, None)
+
+        assert daemon.is_running
+        assert daemon.get_client() is not None
+        config = Path(daemon.config_path).read_text()
+        assert f"LocalSocket {daemon.socket_path}" in config
+        assert f"DatabaseDirectory {database_dir}" in config
+        assert "LocalSocketMode 600" in config
+        assert (Path(daemon.socket_path).parent.stat().st_mode & 0o777) == 0o700
+        daemon.release()
+
+    def test_later_scans_reuse_daemon(self, daemon):
+        with patch("subprocess.Popen", wraps=user_clamd_module.subprocess.Popen) as popen:
+            daemon.acquire()
+            daemon.release()
+            daemon.acquire()
+            daemon.release()
+
+        assert popen.call_count == 1
+
+    def test_idle_timeout_stops_daemon(self, daemon):
+        daemon.idle_timeout = 0.1
+        daemon.acquire()
+        daemon.release()
+
+        deadline = time.monotonic() + 5
+        while daemon.is_running and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert not daemon.is_running
+        assert daemon.get_client() is None
+
+    def test_held_daemon_is_not_stopped(self, daemon):
+        daemon.idle_timeout = 0.1
+        daemon.acquire()
+        daemon.acquire()
+        daemon.release()
+        time.sleep(0.3)
+
+        assert daemon.is_running
+        daemon.release()
+
+    def test_restarts_after_exit(self, daemon):
+        daemon.acquire()
+        daemon.release()
+        daemon._process.kill()
+        daemon._process.wait()
+
+        assert daemon.acquire() == (True, None)
+        assert daemon.get_client() is not None
+        daemon.release()
+
+    def test_failed_start_reports_log(self, runtime_dir, database_dir, tmp_path):
+        user_clamd = UserClamd(runtime_dir=runtime_dir / "clamui")
+        with _fake_clamd(tmp_path, fail=True):
+            is_running, error = user_clamd.acquire()
+
+        assert is_running is False
+        assert "Can't open database" in error
+        assert not user_clamd.is_running
+
+    def test_cancelled_start(self, runtime_dir, database_dir, tmp_path):
+        user_clamd = UserClamd(runtime_dir=runtime_dir / "clamui")
+        with _fake_clamd(tmp_path, delay=30):
+            is_running, error = user_clamd.acquire(lambda: True)
+
+        assert is_running is False
+        assert "Cancelled" in error
+        assert not user_clamd.is_running
+
+    def test_adopts_running_daemon(self, runtime_dir, database_dir):
+        socket_dir = runtime_dir / "clamui"
+        socket_dir.mkdir()
+        leftover = FakeClamd(str(socket_dir / "clamd.sock"))
+        user_clamd = UserClamd(runtime_dir=socket_dir)
+
+        with (
+            patch.object(user_clamd_module, "find_clamd_binary", return_value="/usr/sbin/clamd"),
+            patch("subprocess.Popen") as popen,
+        ):
+            assert user_clamd.acquire() == (True, None)
+            user_clamd.release()
+            user_clamd.stop()
+
+        deadline = time.monotonic() + 5
+        while "zSHUTDOWN" not in leftover.commands and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        popen.assert_not_called()
+        assert "zSHUTDOWN" in leftover.commands
+
+    def test_daemon_used_by_another_process_is_not_stopped(self, daemon, runtime_dir):
+        # A second UserClamd on the same directory stands in for another process
+        other = UserClamd(runtime_dir=runtime_dir / "clamui", idle_timeout=60)
+        assert daemon.acquire() == (True, None)
+        assert other.acquire() == (True, None)
+        daemon.release()
+
+        # The adopting process stops while the spawning one still scans
+        other.release()
+        daemon.acquire()
+        other.stop()
+        assert daemon._process.poll() is None
+        daemon.release()
+
+        # The spawning process stops while the adopting one scans
+        other.acquire()
+        daemon.stop()
+        assert other.get_client() is not None
+        other.release()
+
+        # The last user shuts the daemon down
+        other.stop()
+        deadline = time.monotonic() + 5
+        while other.get_client() is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert other.get_client() is None
+
+    def test_processes_starting_at_once_spawn_one_daemon(self, runtime_dir, database_dir, tmp_path):
+        # Two UserClamd on the same directory stand in for two processes
+        first = UserClamd(runtime_dir=runtime_dir / "clamui", idle_timeout=60)
+        second = UserClamd(runtime_dir=runtime_dir / "clamui", idle_timeout=60)
+        results = []
+        with (
+            _fake_clamd(tmp_path, delay=0.5),
+            patch("subprocess.Popen", wraps=user_clamd_module.subprocess.Popen) as popen,
+        ):
+            threads = [
+                threading.Thread(target=lambda u=u: results.append(u.acquire()))
+                for u in (first, second)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+
+        try:
+            assert results == [(True, None), (True, None)]
+            assert popen.call_count == 1
+        finally:
+            for user_clamd in (first, second):
+                user_clamd.release()
+            second.stop()
+            first.stop()
+
+    def test_start_does_not_block_other_calls(self, runtime_dir, database_dir, tmp_path):
+        user_clamd = UserClamd(runtime_dir=runtime_dir / "clamui")
+        results = []
+        with _fake_clamd(tmp_path, delay=30):
+            thread = threading.Thread(target=lambda: results.append(user_clamd.acquire()))
+            thread.start()
+            deadline = time.monotonic() + 5
+            while not user_clamd._starting and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            started = time.monotonic()
+            assert not user_clamd.is_running
+            user_clamd.stop()
+            thread.join(timeout=5)
+
+        assert time.monotonic() - started < 5
+        assert results == [(False, "Cancelled while clamd was starting")]
+        assert user_clamd.get_client() is None
+
+
+class TestUserClamdReload:
+    """Tests for reloading the database after an update."""
+
+    def test_reload_running_daemon(self, daemon):
+        daemon.acquire()
+        daemon.release()
+
+        assert daemon.reload() is True
+
+    def test_reload_without_daemon(self, runtime_dir):
+        assert UserClamd(runtime_dir=runtime_dir).reload() is False
+
+    def test_reload_shared_daemon(self):
+        shared = MagicMock()
+        with patch.object(user_clamd_module, "_shared", shared):
+            assert reload_user_clamd() is shared.reload.return_value
+        shared.reload.assert_called_once_with()
+
+    def test_reload_without_shared_daemon(self):
+        with patch.object(user_clamd_module, "_shared", None):
+            assert reload_user_clamd() is False
+
+
+class TestDaemonScannerWithUserClamd:
+    """Tests for DaemonScanner scanning through the private daemon."""
+
+    @pytest.fixture
+    def user_clamd(self, fake_clamd):
+        user_clamd = MagicMock()
+        user_clamd.get_client.side_effect = lambda: ClamdClient(
+            ClamdAddress(socket_path=fake_clamd.socket_path)
+        )
+        user_clamd.thread_limits = (2, 100)
+        return user_clamd
+
+    def test_scans_with_private_daemon(self, user_clamd, tmp_path):
+        (tmp_path / "clean.txt").write_text("clean")
+        (tmp_path / "eicar.com").write_text(EICAR_STRING)
+        log_manager = MagicMock()
+        scanner = daemon_scanner_module.DaemonScanner(
+            log_manager=log_manager, user_clamd=user_clamd
+        )
+
+        with patch.object(daemon_scanner_module, "resolve_clamd_address") as resolve:
+            result = scanner.scan_sync(str(tmp_path))
+
+        resolve.assert_not_called()
+        assert result.status == daemon_scanner_module.ScanStatus.INFECTED
+        assert result.infected_count == 1
+        assert scanner.backend == "user_daemon"
+        assert log_manager.save_log.call_args[0][0].backend == "user_daemon"
+
+    def test_no_clamdscan_fallback(self, tmp_path):
+        user_clamd = MagicMock()
+        user_clamd.get_client.return_value = None
+        scanner = daemon_scanner_module.DaemonScanner(
+            log_manager=MagicMock(), user_clamd=user_clamd
+        )
+
+        with patch.object(daemon_scanner_module, "check_clamdscan_installed") as installed:
+            result = scanner.scan_sync(str(tmp_path))
+
+        installed.assert_not_called()
+        assert result.status == daemon_scanner_module.ScanStatus.ERROR
@@ -5,6 +5,7 @@ import json
 import os
 import tempfile
 import threading
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -395,6 +396,16 @@ class TestProfileManagerCRUD:
                 exclusions={},
             )
 
+    def test_create_profile_invalid_limits_raises(self, manager):
+        """Test that invalid scan limits raise ValueError."""
+        with pytest.raises(ValueError, match="max_filesize"):
+            manager.create_profile(
+                name="Limited",
+                targets=["/home"],
+                exclusions={},
+                options={"limits": {"max_filesize": "big"}},
+            )
+
     def test_create_profile_duplicate_name_raises(self, manager):
         """Test that duplicate name raises ValueError."""
         manager.create_profile(
@@ -571,6 +582,23 @@ class TestProfileManagerCRUD:
         assert updated.name == "Keep Same"
         assert updated.description == "New description"
 
+    def test_update_profile_keeps_unchanged_invalid_limits(self, manager):
+        """Test a profile with invalid limits in its file can still be edited."""
+        profile = manager.create_profile(
+            name="Limited",
+            targets=["/home"],
+            exclusions={},
+        )
+        options = {"limits": {"max_files": -1}}
+        manager._profiles[profile.id] = replace(profile, options=options)
+
+        updated = manager.update_profile(profile.id, name="Renamed", options=dict(options))
+
+        assert updated.name == "Renamed"
+        assert updated.options == options
+        with pytest.raises(ValueError, match="max_files"):
+            manager.update_profile(profile.id, options={"limits": {"max_files": -2}})
+
     def test_delete_profile(self, manager):
         """Test deleting a profile."""
         profile = manager.create_profile(
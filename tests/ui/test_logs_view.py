@@ -27,7 +27,7 @@ import pytest
 def mock_log_manager():
     """Create a mock LogManager."""
     manager = mock.MagicMock()
-    manager.get_logs_async = mock.MagicMock()
+    manager.get_log_summaries_async = mock.MagicMock()
     manager.get_log_by_id = mock.MagicMock()
     manager.clear_logs = mock.MagicMock()
     manager.get_daemon_status = mock.MagicMock(return_value=("RUNNING", "Running"))
@@ -92,6 +92,7 @@ def mock_logs_view(logs_view_class, mock_log_manager):
     view._selected_log = None
     view._daemon_refresh_id = None
     view._is_loading = False
+    view._changes_pending = False
     view._all_log_entries = []
 
     # Set up mock pagination controller (used by backward compatibility properties)
@@ -222,6 +223,7 @@ class TestLogsViewLoadingState:
         """Test that setting loading True shows spinner."""
         view = object.__new__(logs_view_class)
         view._is_loading = False
+        view._changes_pending = False
         view._logs_spinner = mock.MagicMock()
         view._refresh_button = mock.MagicMock()
         view._clear_button = mock.MagicMock()
@@ -760,6 +762,59 @@ class TestLogsViewRefresh:
             view.refresh_logs()
 
 
+class TestLogsViewChangeNotification:
+    """Tests for showing logs written while the view is open."""
+
+    def test_loads_only_newer_logs(self, mock_logs_view):
+        """Test a change loads the logs newer than the newest shown."""
+        newest = mock.MagicMock(timestamp="2024-01-15T10:30:00")
+        mock_logs_view._all_log_entries = [newest, mock.MagicMock()]
+
+        mock_logs_view._on_logs_changed()
+
+        assert mock_logs_view._is_loading is True
+        mock_logs_view._log_manager.get_newer_log_summaries_async.assert_called_once_with(
+            callback=mock_logs_view._on_new_logs_loaded,
+            newest=newest,
+            known_count=2,
+            limit=100,
+        )
+
+    def test_new_logs_are_prepended(self, mock_logs_view):
+        """Test new logs are added above the list without reloading it."""
+        new_entry = mock.MagicMock()
+        mock_logs_view._is_loading = True
+        mock_logs_view._pagination.all_entries = [new_entry]
+
+        mock_logs_view._on_new_logs_loaded([new_entry])
+
+        mock_logs_view._pagination.prepend_entries.assert_called_once_with([new_entry])
+        mock_logs_view._pagination.set_entries.assert_not_called()
+        assert mock_logs_view._all_log_entries == [new_entry]
+        assert mock_logs_view._is_loading is False
+
+    def test_deleted_logs_reload_the_list(self, mock_logs_view):
+        """Test the list is reloaded when logs shown were deleted elsewhere."""
+        mock_logs_view._is_loading = True
+
+        mock_logs_view._on_new_logs_loaded(None)
+
+        mock_logs_view._pagination.prepend_entries.assert_not_called()
+        mock_logs_view._load_logs_async.assert_called_once()
+        assert mock_logs_view._is_loading is False
+
+    def test_change_during_load_is_handled_after_it(self, mock_logs_view):
+        """Test a change arriving during a load is handled once it is done."""
+        mock_logs_view._is_loading = True
+
+        mock_logs_view._on_logs_changed()
+        mock_logs_view._log_manager.get_newer_log_summaries_async.assert_not_called()
+
+        mock_logs_view._on_new_logs_loaded([])
+
+        mock_logs_view._load_logs_async.assert_called_once()
+
+
 class TestLogsViewDisplayLogDetails:
     """Tests for log detail display."""
 
@@ -1207,6 +1262,7 @@ class TestLogsViewExportButtonState:
         """Test that export all buttons are disabled during loading."""
         view = object.__new__(logs_view_class)
         view._is_loading = False
+        view._changes_pending = False
         view._logs_spinner = mock.MagicMock()
         view._refresh_button = mock.MagicMock()
         view._clear_button = mock.MagicMock()
@@ -1404,21 +1460,24 @@ class TestLogsViewContentFormatters:
         lines = result.strip().split("\n")
         assert len(lines) == 1
 
-    def test_format_all_logs_as_json(self, logs_view_class, mock_log_entry):
-        """Test that _format_all_logs_as_json produces valid JSON array."""
+    def test_format_all_logs_as_json(self, logs_view_class, mock_log_entry, mock_log_manager):
+        """Test that _format_all_logs_as_json loads the details of the listed logs."""
         import json
 
         view = object.__new__(logs_view_class)
         view._all_log_entries = [mock_log_entry, mock_log_entry]
+        view._log_manager = mock_log_manager
+        mock_log_manager.get_log_by_id.side_effect = [mock_log_entry, None]
 
         result = view._format_all_logs_as_json()
 
-        # Should be valid JSON array
+        # Should be valid JSON array, without logs deleted since they were listed
         data = json.loads(result)
         assert isinstance(data, list)
-        assert len(data) == 2
+        assert len(data) == 1
         assert data[0]["id"] == mock_log_entry.id
-        assert data[1]["id"] == mock_log_entry.id
+        assert data[0]["details"] == mock_log_entry.details
+        mock_log_manager.get_log_by_id.assert_called_with(mock_log_entry.id)
 
     def test_format_all_logs_as_json_empty(self, logs_view_class):
         """Test that _format_all_logs_as_json handles empty list."""
@@ -700,6 +700,23 @@ class TestPaginationControllerSetEntries:
         assert pagination_controller._all_entries == second_entries
         assert pagination_controller._displayed_count == 3
 
+    def test_prepend_entries_adds_rows_on_top(
+        self, pagination_controller, mock_listbox, mock_row_factory
+    ):
+        """Test that prepend_entries shows new entries first without clearing."""
+        pagination_controller.set_entries(["old"])
+        mock_row_factory.side_effect = lambda entry: f"row-{entry}"
+
+        pagination_controller.prepend_entries(["new1", "new2"])
+
+        assert pagination_controller.all_entries == ["new1", "new2", "old"]
+        assert pagination_controller.displayed_count == 3
+        assert mock_listbox.prepend.call_args_list == [
+            mock.call("row-new2"),
+            mock.call("row-new1"),
+        ]
+        mock_listbox.remove.assert_not_called()
+
 
 # Module-level test function for verification
 def test_pagination_display_batch_basic(mock_gi_modules):
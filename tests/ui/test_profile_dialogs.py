@@ -256,6 +256,53 @@ class TestProfileDialogGetProfileData:
         assert data["exclusions"] == {}
 
 
+class TestProfileDialogLimits:
+    """Tests for the scan limits of ProfileDialog."""
+
+    @pytest.fixture
+    def make_dialog(self):
+        """Return a factory of dialogs editing a profile with the given limits."""
+        from src.ui.profile_dialogs import ProfileDialog
+
+        class MockProfile:
+            def __init__(self, limits):
+                self.id = "test-profile-123"
+                self.name = "Test Profile"
+                self.description = ""
+                self.targets = ["/home/user/documents"]
+                self.exclusions = {}
+                self.options = {"limits": limits}
+                self.is_default = False
+
+        def make_dialog(limits):
+            return ProfileDialog(profile=MockProfile(limits))
+
+        return make_dialog
+
+    def test_zero_limit_is_kept(self, make_dialog):
+        """Test that a limit of 0, shown like an unset limit, is saved again."""
+        dialog = make_dialog({"max_dir_depth": 0, "max_files": 10})
+        assert dialog._get_options()["limits"] == {"max_dir_depth": 0, "max_files": 10}
+
+    def test_edited_limit_replaces_only_itself(self, make_dialog):
+        """Test that editing one limit keeps the others from the profile file."""
+        dialog = make_dialog({"max_dir_depth": 0, "max_files": 10})
+        dialog._limit_spins["max_files"].set_value(20)
+        assert dialog._get_options()["limits"] == {"max_dir_depth": 0, "max_files": 20}
+
+    def test_invalid_limits_are_kept_with_warning(self, make_dialog):
+        """Test that invalid limits are kept and the user is warned."""
+        dialog = make_dialog({"max_files": -1})
+        assert dialog._limits_warning_label.get_visible()
+        assert dialog._get_options()["limits"] == {"max_files": -1}
+
+    def test_editing_invalid_limits_saves_the_form(self, make_dialog):
+        """Test that editing a limit replaces invalid limits with the form."""
+        dialog = make_dialog({"max_files": -1})
+        dialog._limit_spins["max_recursion"].set_value(5)
+        assert dialog._get_options()["limits"] == {"max_recursion": 5}
+
+
 class TestProfileDialogCallback:
     """Tests for ProfileDialog callback management."""
 
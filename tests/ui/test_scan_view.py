@@ -87,6 +87,7 @@ def mock_scan_view(scan_view_class):
     view._status_banner = mock.MagicMock()
     view._scan_button = mock.MagicMock()
     view._cancel_button = mock.MagicMock()
+    view._pause_button = mock.MagicMock()
     view._eicar_button = mock.MagicMock()
     view._progress_section = mock.MagicMock()
     view._progress_bar = mock.MagicMock()
@@ -101,6 +102,15 @@ def mock_scan_view(scan_view_class):
     # Mock scanner
     view._scanner = mock.MagicMock()
     view._scanner.get_active_backend.return_value = "clamscan"
+    view._scanner.is_paused = False
+    view._historical_throughput = None
+    view._parallel_targets = False
+
+    # Pause state
+    view._battery_manager = mock.MagicMock()
+    view._paused_on_battery = False
+    view._power_poll_id = None
+    view._on_scan_paused = None
 
     # Mock quarantine manager
     view._quarantine_manager = mock.MagicMock()
@@ -1059,6 +1069,158 @@ class TestMultiTargetScanning:
                 assert call_kwargs["scanned_files"] == 35  # 10 + 20 + 5
                 assert call_kwargs["infected_count"] == 1
 
+    def test_parallel_targets_share_merged_progress(self, mock_scan_view):
+        """Test targets on different devices are scanned at once and aggregated."""
+        self._setup_multi_scan_mocks(mock_scan_view)
+        from src.core.scanner_types import ScanResult as RealScanResult
+        from src.core.scanner_types import ScanStatus as RealScanStatus
+
+        def make_result(path, files, infected):
+            return RealScanResult(
+                status=RealScanStatus.INFECTED if infected else RealScanStatus.CLEAN,
+                path=path,
+                stdout="",
+                stderr="",
+                exit_code=1 if infected else 0,
+                infected_files=[f"{path}/evil"] * infected,
+                scanned_files=files,
+                scanned_dirs=1,
+                infected_count=infected,
+                error_message=None,
+                threat_details=[],
+            )
+
+        worker = mock.MagicMock()
+        worker.scan_sync.side_effect = lambda path, **kwargs: make_result(
+            path, 10, 1 if path == "/path2" else 0
+        )
+        mock_scan_view._scanner.create_worker.return_value = worker
+        mock_scan_view._settings_manager.get.side_effect = lambda key, default=None: default
+        mock_scan_view._selected_paths = ["/path1", "/path2"]
+        mock_scan_view._cancel_all_requested = False
+        captured = []
+
+        with (
+            mock.patch(
+                "src.core.scan_executor.group_by_device",
+                side_effect=lambda targets: [[i] for i in range(len(targets))],
+            ),
+            mock.patch("src.ui.scan_view.GLib") as mock_glib,
+            mock.patch("src.ui.scan_view.ScanStatus", RealScanStatus),
+            mock.patch("src.ui.scan_view.ScanResult", RealScanResult),
+        ):
+            mock_glib.idle_add.side_effect = lambda callback, *args: captured.append(
+                (callback, args)
+            )
+            mock_scan_view._scan_worker()
+
+        callbacks = [callback for callback, _args in captured]
+        assert mock_scan_view._start_parallel_progress in callbacks
+        assert mock_scan_view._update_scan_progress not in callbacks
+        mock_scan_view._scanner.scan_sync.assert_not_called()
+        assert worker.scan_sync.call_count == 2
+
+        result = captured[-1][1][0]
+        assert result.status == RealScanStatus.INFECTED
+        assert result.scanned_files == 20
+        assert result.infected_files == ["/path2/evil"]
+
+    def test_start_parallel_progress(self, mock_scan_view):
+        """Test the merged progress display for parallel targets."""
+        mock_scan_view._pulse_timeout_id = None
+
+        with mock.patch("src.ui.scan_view.GLib"):
+            mock_scan_view._start_parallel_progress(3)
+
+        assert mock_scan_view._parallel_targets is True
+        assert mock_scan_view._total_target_count == 3
+        label = mock_scan_view._progress_label.set_label.call_args[0][0]
+        assert "3 targets" in label
+
+
+class TestPauseScan:
+    """Tests for pausing and resuming the running scan."""
+
+    @pytest.fixture
+    def scanning_view(self, mock_scan_view):
+        """A view with a running scan and a scanner that tracks its pause state."""
+        scanner = mock_scan_view._scanner
+        scanner.pause.side_effect = lambda: setattr(scanner, "is_paused", True)
+        scanner.resume.side_effect = lambda: setattr(scanner, "is_paused", False)
+        mock_scan_view._is_scanning = True
+        mock_scan_view._live_progress = mock.MagicMock(percentage=None)
+        mock_scan_view._eta_estimator = mock.MagicMock()
+        mock_scan_view._eta = None
+        mock_scan_view._on_scan_paused = mock.MagicMock()
+        mock_scan_view._show_toast = mock.MagicMock()
+        return mock_scan_view
+
+    def test_pause_click_toggles(self, scanning_view):
+        """Test the pause button pauses and then resumes the scan."""
+        scanning_view._on_pause_clicked(mock.MagicMock())
+
+        scanning_view._scanner.pause.assert_called_once()
+        scanning_view._eta_estimator.pause.assert_called_once()
+        scanning_view._pause_button.set_label.assert_called_with("Resume")
+        scanning_view._on_scan_paused.assert_called_with(True)
+
+        scanning_view._on_pause_clicked(mock.MagicMock())
+
+        scanning_view._scanner.resume.assert_called_once()
+        scanning_view._eta_estimator.resume.assert_called_once()
+        scanning_view._pause_button.set_label.assert_called_with("Pause")
+        scanning_view._on_scan_paused.assert_called_with(False)
+
+    def test_scan_that_cannot_pause_disables_button(self, scanning_view):
+        """Test a scan run on the host under Flatpak is not paused."""
+        scanning_view._scanner.can_pause = False
+
+        scanning_view._update_pause_button()
+        scanning_view._on_pause_clicked(mock.MagicMock())
+
+        scanning_view._pause_button.set_sensitive.assert_called_with(False)
+        scanning_view._scanner.pause.assert_not_called()
+        assert not scanning_view.is_scan_paused
+
+    def test_pause_without_scan_is_ignored(self, scanning_view):
+        """Test nothing is paused when no scan runs."""
+        scanning_view._is_scanning = False
+
+        scanning_view.pause_scan()
+
+        scanning_view._scanner.pause.assert_not_called()
+
+    def test_battery_pauses_and_ac_resumes(self, scanning_view):
+        """Test switching to battery pauses the scan and AC power resumes it."""
+        scanning_view._battery_manager.poll_power_change.return_value = True
+        assert scanning_view._on_power_poll() is True
+        assert scanning_view.is_scan_paused
+
+        scanning_view._battery_manager.poll_power_change.return_value = False
+        scanning_view._on_power_poll()
+        assert not scanning_view.is_scan_paused
+
+    def test_ac_does_not_resume_manual_pause(self, scanning_view):
+        """Test a scan paused by the user stays paused when plugged in."""
+        scanning_view.pause_scan()
+
+        scanning_view._battery_manager.poll_power_change.return_value = False
+        scanning_view._on_power_poll()
+
+        assert scanning_view.is_scan_paused
+
+    def test_power_polling_follows_setting(self, scanning_view):
+        """Test the power source is only watched with pause_scans_on_battery."""
+        scanning_view._settings_manager.get.return_value = False
+        with mock.patch("src.ui.scan_view.GLib") as mock_glib:
+            scanning_view._start_power_polling()
+        mock_glib.timeout_add_seconds.assert_not_called()
+
+        scanning_view._settings_manager.get.return_value = True
+        with mock.patch("src.ui.scan_view.GLib") as mock_glib:
+            scanning_view._start_power_polling()
+        mock_glib.timeout_add_seconds.assert_called_once()
+
 
 class TestCancelScan:
     """Tests for scan cancellation functionality."""
@@ -1461,6 +1623,105 @@ class TestProgressUpdates:
         assert "..." in label or len(label) < len(long_path) + 20
 
 
+class TestLiveProgress:
+    """Tests for rebuilding live progress from scanner progress events."""
+
+    def _setup(self, mock_scan_view):
+        from src.core.scan_eta import ScanEtaEstimator
+        from src.core.scanner_types import ScanProgressState
+
+        mock_scan_view._live_progress = ScanProgressState()
+        mock_scan_view._eta_estimator = ScanEtaEstimator()
+        mock_scan_view._on_scan_progress = mock.MagicMock()
+        mock_scan_view._updates_paused = False
+        mock_scan_view._update_live_progress = mock.MagicMock()
+
+    def test_apply_progress_accumulates_deltas(self, mock_scan_view):
+        """Test every event is applied, so no infection is lost."""
+        from src.core.scanner_types import ScanProgress
+
+        self._setup(mock_scan_view)
+
+        mock_scan_view._apply_progress(ScanProgress("/a", 1, 3, 1, new_infected_files=["/a"]))
+        result = mock_scan_view._apply_progress(
+            ScanProgress("/c", 3, 3, 2, new_infected_files=["/c"])
+        )
+
+        state = mock_scan_view._live_progress
+        assert result is False
+        assert state.infected_files == ["/a", "/c"]
+        assert state.files_scanned == 3
+        mock_scan_view._on_scan_progress.assert_called_with(state, None)
+        mock_scan_view._update_live_progress.assert_called_with(state, None)
+
+    def test_apply_progress_while_hidden_only_updates_state(self, mock_scan_view):
+        """Test hidden views keep the state current without touching widgets."""
+        from src.core.scanner_types import ScanProgress
+
+        self._setup(mock_scan_view)
+        mock_scan_view._updates_paused = True
+
+        mock_scan_view._apply_progress(ScanProgress("/a", 1, 3, 1, new_infected_files=["/a"]))
+
+        assert mock_scan_view._live_progress.infected_count == 1
+        mock_scan_view._update_live_progress.assert_not_called()
+
+    def test_progress_callback_forwards_every_event(self, mock_scan_view):
+        """Test the callback does not drop events; the scanner coalesces them."""
+        with mock.patch("src.ui.scan_view.GLib") as mock_glib:
+            callback = mock_scan_view._create_progress_callback()
+            callback("event-1")
+            callback("event-2")
+
+        assert mock_glib.idle_add.call_count == 2
+        mock_glib.idle_add.assert_called_with(mock_scan_view._apply_progress, "event-2")
+
+    def test_apply_progress_estimates_time_left(self, mock_scan_view):
+        """Test byte counts are turned into an ETA for the label and the callback."""
+        from src.core.scan_eta import ScanEtaEstimator
+        from src.core.scanner_types import ScanProgress
+
+        self._setup(mock_scan_view)
+        mock_scan_view._eta_estimator = ScanEtaEstimator(historical_rate=1000.0)
+
+        mock_scan_view._apply_progress(
+            ScanProgress("/a", 1, 4, 0, bytes_scanned=1000, bytes_total=5000)
+        )
+
+        assert mock_scan_view._eta == pytest.approx(4.0)
+        mock_scan_view._on_scan_progress.assert_called_with(mock_scan_view._live_progress, 4.0)
+
+    def test_update_live_progress_shows_eta(self, mock_scan_view):
+        """Test the progress label names the estimated time left."""
+        from src.core.scanner_types import ScanProgressState
+
+        state = ScanProgressState(
+            files_scanned=1, files_total=4, bytes_scanned=1000, bytes_total=5000
+        )
+
+        mock_scan_view._pulse_timeout_id = None
+        mock_scan_view._total_target_count = 1
+        mock_scan_view._file_label = None
+        mock_scan_view._stats_label = None
+
+        mock_scan_view._update_live_progress(state, eta=300)
+
+        label = mock_scan_view._progress_label.set_text.call_args[0][0]
+        assert "about 5 minutes left" in label
+
+    def test_new_target_resets_progress(self, mock_scan_view):
+        """Test a new target starts from an empty progress state."""
+        self._setup(mock_scan_view)
+        mock_scan_view._live_progress.infected_files.append("/old")
+        mock_scan_view._pulse_timeout_id = None
+
+        with mock.patch("src.ui.scan_view.GLib"):
+            mock_scan_view._update_scan_progress(2, 2, "/next")
+
+        # ScanProgressState comes from the mocked scanner module here
+        assert "/old" not in getattr(mock_scan_view._live_progress, "infected_files", [])
+
+
 class TestStartScanning:
     """Tests for the _start_scanning method that initiates scans."""
 
@@ -1774,6 +2035,14 @@ class TestScanStateCallbacks:
 
         assert mock_scan_view._on_scan_state_changed == callback
 
+    def test_set_on_scan_progress(self, mock_scan_view):
+        """Test setting the live progress callback."""
+        callback = mock.MagicMock()
+
+        mock_scan_view.set_on_scan_progress(callback)
+
+        assert mock_scan_view._on_scan_progress == callback
+
 
 class TestSelectedProfile:
     """Tests for profile selection getters and setters."""
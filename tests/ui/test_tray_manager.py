@@ -193,6 +193,19 @@ class TestTrayManagerHandleMenuAction:
 
         callback.assert_called_once()
 
+    def test_handle_toggle_pause_action(self, mock_gtk_modules):
+        """Test handling toggle_pause action invokes callback."""
+        from src.ui.tray_manager import TrayManager
+
+        manager = TrayManager()
+
+        callback = mock.Mock()
+        manager.set_pause_toggle_callback(callback)
+
+        manager._handle_menu_action("toggle_pause", {})
+
+        callback.assert_called_once()
+
     def test_handle_select_profile_action(self, mock_gtk_modules):
         """Test handling select_profile action invokes callback with profile_id."""
         from src.ui.tray_manager import TrayManager
@@ -365,6 +378,19 @@ class TestTrayManagerUpdateMethods:
 
             mock_send.assert_called_once_with({"action": "update_progress", "percentage": 75})
 
+    def test_update_scan_progress_sends_eta(self, mock_gtk_modules):
+        """Test update_scan_progress includes the time left when given."""
+        from src.ui.tray_manager import TrayManager
+
+        manager = TrayManager()
+
+        with mock.patch.object(manager, "_send_command") as mock_send:
+            manager.update_scan_progress(40, "about 1 minute left")
+
+            mock_send.assert_called_once_with(
+                {"action": "update_progress", "percentage": 40, "eta": "about 1 minute left"}
+            )
+
     def test_update_window_menu_label_sends_command(self, mock_gtk_modules):
         """Test update_window_menu_label sends correct command."""
         from src.ui.tray_manager import TrayManager
@@ -376,6 +402,19 @@ class TestTrayManagerUpdateMethods:
 
             mock_send.assert_called_once_with({"action": "update_window_visible", "visible": True})
 
+    def test_update_scan_state_sends_command(self, mock_gtk_modules):
+        """Test update_scan_state sends correct command."""
+        from src.ui.tray_manager import TrayManager
+
+        manager = TrayManager()
+
+        with mock.patch.object(manager, "_send_command") as mock_send:
+            manager.update_scan_state(True, paused=True)
+
+            mock_send.assert_called_once_with(
+                {"action": "update_scan_state", "scanning": True, "paused": True}
+            )
+
     def test_update_profiles_sends_command(self, mock_gtk_modules):
         """Test update_profiles sends correct command with profiles list."""
         from src.ui.tray_manager import TrayManager
@@ -85,6 +85,8 @@ def tray_service(tray_service_class):
     service._current_status = "protected"
     service._window_visible = True
     service._progress_label = ""
+    service._scan_active = False
+    service._scan_paused = False
 
     # Profile state
     service._profiles = []
@@ -215,6 +217,13 @@ class TestUpdateProgress:
         tray_service.update_progress(50)
         assert tray_service._progress_label == "50%"
 
+    def test_update_progress_with_eta(self, tray_service):
+        """Test the time left is appended to the progress label."""
+        tray_service._emit_signal = mock.MagicMock()
+
+        tray_service.update_progress(50, "about 3 minutes left")
+        assert tray_service._progress_label == "50%, about 3 minutes left"
+
     def test_update_progress_zero_clears_label(self, tray_service):
         """Test progress of 0 clears the label."""
         tray_service._emit_signal = mock.MagicMock()
@@ -268,6 +277,37 @@ class TestUpdateWindowVisible:
         tray_service._rebuild_menu.assert_called_once()
 
 
+class TestUpdateScanState:
+    """Tests for update_scan_state method."""
+
+    def test_update_scan_state_sets_state(self, tray_service):
+        """Test update_scan_state records whether a scan runs and is paused."""
+        tray_service._rebuild_menu = mock.MagicMock()
+
+        tray_service.update_scan_state(True, paused=True)
+        assert tray_service._scan_active is True
+        assert tray_service._scan_paused is True
+
+        tray_service.update_scan_state(False, paused=True)
+        assert tray_service._scan_active is False
+        assert tray_service._scan_paused is False
+
+    def test_update_scan_state_rebuilds_menu(self, tray_service):
+        """Test update_scan_state rebuilds the menu for the Pause/Resume item."""
+        tray_service._rebuild_menu = mock.MagicMock()
+
+        tray_service.update_scan_state(True)
+        tray_service._rebuild_menu.assert_called_once()
+
+    def test_paused_scan_shown_in_tooltip(self, tray_service):
+        """Test a paused scan is mentioned in the tooltip."""
+        tray_service._rebuild_menu = mock.MagicMock()
+
+        tray_service.update_scan_state(True, paused=True)
+
+        assert "Paused" in tray_service._get_tooltip()
+
+
 class TestUpdateProfiles:
     """Tests for update_profiles method."""
 
@@ -321,7 +361,20 @@ class TestHandleCommand:
         ):
             tray_service.handle_command({"action": "update_progress", "percentage": 75})
 
-        tray_service.update_progress.assert_called_with(75)
+        tray_service.update_progress.assert_called_with(75, "")
+
+    def test_handle_update_progress_command_with_eta(self, tray_service):
+        """Test update_progress command forwards the time left."""
+        tray_service.update_progress = mock.MagicMock()
+
+        with mock.patch(
+            "src.ui.tray_service.GLib.idle_add", side_effect=lambda fn, *args: fn(*args)
+        ):
+            tray_service.handle_command(
+                {"action": "update_progress", "percentage": 75, "eta": "about 2 minutes left"}
+            )
+
+        tray_service.update_progress.assert_called_with(75, "about 2 minutes left")
 
     def test_handle_update_window_visible_command(self, tray_service):
         """Test handling update_window_visible command."""
@@ -334,6 +387,19 @@ class TestHandleCommand:
 
         tray_service.update_window_visible.assert_called_with(False)
 
+    def test_handle_update_scan_state_command(self, tray_service):
+        """Test handling update_scan_state command."""
+        tray_service.update_scan_state = mock.MagicMock()
+
+        with mock.patch(
+            "src.ui.tray_service.GLib.idle_add", side_effect=lambda fn, *args: fn(*args)
+        ):
+            tray_service.handle_command(
+                {"action": "update_scan_state", "scanning": True, "paused": True}
+            )
+
+        tray_service.update_scan_state.assert_called_with(True, True)
+
     def test_handle_update_profiles_command(self, tray_service):
         """Test handling update_profiles command."""
         tray_service.update_profiles = mock.MagicMock()